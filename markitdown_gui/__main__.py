@@ -0,0 +1,11 @@
+"""
+`python -m markitdown_gui` 진입점
+"""
+
+import sys
+
+from .cli import main
+
+
+if __name__ == "__main__":
+    sys.exit(main())
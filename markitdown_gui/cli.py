@@ -0,0 +1,466 @@
+"""
+명령줄 인터페이스
+`python -m markitdown_gui <command>` 형태의 헤드리스 실행 진입점
+
+GUI(main.py)와 달리 QApplication을 생성하지 않으며 PyQt6 없이 동작한다.
+"""
+
+import sys
+import json
+import argparse
+from contextlib import contextmanager
+from pathlib import Path
+from typing import List, Optional, Dict, Any, TextIO
+
+from . import __version__
+
+
+EXIT_OK = 0
+EXIT_FAILURES = 1
+EXIT_USAGE = 2
+EXIT_INTERRUPTED = 130
+
+
+class JsonLineWriter:
+    """레코드를 한 줄에 하나씩 JSON으로 출력 (즉시 flush)"""
+
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+
+    def __call__(self, record: Dict[str, Any]):
+        self.stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.stream.flush()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """명령줄 파서 생성"""
+    parser = argparse.ArgumentParser(
+        prog="python -m markitdown_gui",
+        description="MarkItDown GUI Converter - headless commands"
+    )
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    parser.add_argument("--config-dir", type=Path, default=Path("config"),
+                        help="settings.ini가 있는 설정 디렉토리 (기본값: ./config)")
+    subparsers = parser.add_subparsers(dest="command")
+
+    batch = subparsers.add_parser(
+        "batch",
+        help="디렉토리를 스캔하여 변환하고 파일별 결과를 JSONL로 출력"
+    )
+    batch.add_argument("directories", nargs="+", type=Path,
+                       help="스캔할 디렉토리")
+    batch.add_argument("--workers", type=int, default=None,
+                       help="동시 변환 수 (기본값: 설정의 max_workers)")
+    batch.add_argument("--incremental", action="store_true",
+                       help="출력 파일이 원본보다 최신이면 건너뛰기")
+    batch.add_argument("--output", type=Path, default=None,
+                       help="출력 디렉토리 (지정 시 원본 디렉토리 저장 설정 무시)")
+    batch.add_argument("--summary-interval", type=float, default=None,
+                       help="처리량 요약 출력 간격(초), 0이면 최종 요약만 출력")
+    batch.add_argument("--trace", type=Path, default=None,
+                       help="단계별 추적을 Chrome trace JSON으로 저장 (chrome://tracing, Perfetto)")
+    _add_metrics_arguments(batch)
+    batch.set_defaults(handler=run_batch)
+
+    serve = subparsers.add_parser(
+        "serve",
+        help="로컬 HTTP 변환 서비스 실행 (영속 작업 큐, 공유 워커 풀)"
+    )
+    serve.add_argument("--host", default=None, help="바인딩 주소 (기본값: 127.0.0.1, 인증이 없으므로 loopback 주소만 사용)")
+    serve.add_argument("--port", type=int, default=None, help="포트 (기본값: 8765)")
+    serve.add_argument("--data-dir", type=Path, default=None,
+                       help="작업 큐/업로드/결과 저장 디렉토리 (기본값: ./service_data)")
+    serve.add_argument("--workers", type=int, default=None,
+                       help="워커 스레드 수 (기본값: 설정의 max_workers)")
+    # 메트릭 엔드포인트는 서비스 포트의 GET /metrics로 항상 제공
+    _add_metrics_arguments(serve, endpoint=False)
+    serve.set_defaults(handler=run_serve)
+
+    distributed = subparsers.add_parser(
+        "distributed",
+        help="공유 작업 디렉토리를 통해 여러 호스트가 하나의 배치를 나누어 변환"
+    )
+    actions = distributed.add_subparsers(dest="action", required=True)
+
+    create = actions.add_parser("create", help="디렉토리를 스캔하여 공유 배치 생성")
+    create.add_argument("job_dir", type=Path, help="공유 작업 디렉토리")
+    create.add_argument("directories", nargs="+", type=Path, help="스캔할 디렉토리")
+    create.add_argument("--output", type=Path, default=None,
+                        help="공유 출력 디렉토리 (기본값: 설정의 저장 위치)")
+
+    work = actions.add_parser("work", help="배치가 모두 처리될 때까지 항목 처리")
+    work.add_argument("job_dir", type=Path, help="공유 작업 디렉토리")
+    work.add_argument("--workers", type=int, default=None,
+                      help="노드 내 동시 변환 수 (기본값: 설정의 max_workers)")
+    work.add_argument("--node-id", default=None, help="노드 ID (기본값: 호스트명-PID)")
+    work.add_argument("--lease-timeout", type=float, default=None,
+                      help="하트비트 없이 임대가 유지되는 시간(초)")
+    _add_metrics_arguments(work)
+
+    report = actions.add_parser("report", help="병합된 결과 보고서 출력")
+    report.add_argument("job_dir", type=Path, help="공유 작업 디렉토리")
+
+    distributed.set_defaults(handler=run_distributed)
+
+    benchmark = subparsers.add_parser(
+        "benchmark",
+        help="성능 벤치마크 실행 및 저장된 기준값과 비교"
+    )
+    suites = benchmark.add_subparsers(dest="suite", required=True)
+
+    startup = suites.add_parser(
+        "startup",
+        help="모듈 import 시간, 첫 창 표시 시간, 변환기 준비 시간 측정"
+    )
+    startup.add_argument("--runs", type=int, default=None,
+                         help="항목별 측정 횟수 (중앙값 사용, 기본값: 3)")
+    startup.add_argument("--baseline", type=Path, default=None,
+                         help="비교할 기준값 JSON 파일")
+    startup.add_argument("--update-baseline", action="store_true",
+                         help="측정 결과를 --baseline 파일에 기준값으로 저장")
+    startup.add_argument("--tolerance", type=float, default=None,
+                         help="기준값 대비 허용 회귀 비율 (기본값: 기준값 파일의 tolerance)")
+    startup.add_argument("--no-window", action="store_true",
+                         help="main.py 첫 창 표시 측정 생략")
+
+    throughput = suites.add_parser(
+        "throughput",
+        help="합성 코퍼스로 워커 수/캐시 상태별 변환 처리량 측정"
+    )
+    throughput.add_argument("--work-dir", type=Path, default=Path("benchmark_data"),
+                            help="코퍼스와 변환 결과를 둘 디렉토리 (기본값: ./benchmark_data)")
+    throughput.add_argument("--seed", type=int, default=None, help="코퍼스 시드")
+    throughput.add_argument("--formats", default=None,
+                            help="쉼표로 구분한 형식 (기본값: txt,csv,json,html,docx,xlsx,pdf)")
+    throughput.add_argument("--files-per-format", type=int, default=None,
+                            help="형식별 파일 수 (기본값: 10)")
+    throughput.add_argument("--size-kb", type=int, default=None,
+                            help="파일당 대략적인 크기(KB) (기본값: 64)")
+    throughput.add_argument("--workers", default="1,2,4",
+                            help="쉼표로 구분한 워커 수 목록 (기본값: 1,2,4)")
+    throughput.add_argument("--cache", default="cold,warm",
+                            help="측정할 캐시 상태 (기본값: cold,warm)")
+    throughput.add_argument("--report", type=Path, default=None,
+                            help="보고서 JSON을 저장할 파일")
+    throughput.add_argument("--in-process", action="store_true",
+                            help="시나리오를 현재 프로세스에서 실행 (최대 RSS가 누적됨)")
+    benchmark.set_defaults(handler=run_benchmark)
+
+    return parser
+
+
+def _add_metrics_arguments(parser: argparse.ArgumentParser, endpoint: bool = True):
+    """Prometheus 메트릭 내보내기 옵션"""
+    parser.add_argument("--metrics-file", type=Path, default=None,
+                        help="Prometheus 텍스트 형식 메트릭을 주기적으로 저장할 파일 "
+                             "(node_exporter textfile collector용)")
+    parser.add_argument("--metrics-interval", type=float, default=None,
+                        help="메트릭 파일 갱신 간격(초, 기본값: 15)")
+    if endpoint:
+        parser.add_argument("--metrics-port", type=int, default=None,
+                            help="지정 시 127.0.0.1:<포트>/metrics 엔드포인트 제공")
+
+
+@contextmanager
+def _metrics_export(args: argparse.Namespace):
+    """명령 실행 동안 메트릭 파일/엔드포인트 내보내기 (종료 시 파일에 최종 값 기록)"""
+    from .core.metrics import MetricsFileExporter, MetricsServer
+    from .core.constants import METRICS_EXPORT_INTERVAL
+
+    exporter = server = None
+    if args.metrics_file is not None:
+        exporter = MetricsFileExporter(args.metrics_file,
+                                       interval=args.metrics_interval or METRICS_EXPORT_INTERVAL)
+        exporter.start()
+    if getattr(args, "metrics_port", None) is not None:
+        try:
+            server = MetricsServer(port=args.metrics_port)
+        except OSError as e:
+            print(f"메트릭 엔드포인트를 시작할 수 없습니다: {e}", file=sys.stderr)
+        else:
+            server.start()
+            print(f"메트릭 엔드포인트: {server.url}", file=sys.stderr)
+    try:
+        yield
+    finally:
+        if server is not None:
+            server.stop()
+        if exporter is not None:
+            exporter.stop()
+
+
+def _load_config(config_dir: Path):
+    """GUI와 동일한 설정 로드"""
+    from .core.config_manager import ConfigManager
+
+    config_manager = ConfigManager(config_dir)
+    config_manager.load_config()
+    return config_manager
+
+
+def _setup_headless_logging():
+    """stdout은 레코드 출력 전용으로 두고 로그는 stderr로 보냄"""
+    from .core.logger import setup_logging
+
+    setup_logging(console_stream=sys.stderr)
+
+
+def run_batch(args: argparse.Namespace, stdout: TextIO) -> int:
+    """batch 명령 실행"""
+    from .core.batch_runner import BatchRunner
+    from .core.constants import BATCH_SUMMARY_INTERVAL
+    from .core.tracing import Tracer
+
+    missing = [str(d) for d in args.directories if not d.is_dir()]
+    if missing:
+        print(f"디렉토리를 찾을 수 없습니다: {', '.join(missing)}", file=sys.stderr)
+        return EXIT_USAGE
+    if args.workers is not None and args.workers < 1:
+        print("--workers는 1 이상이어야 합니다", file=sys.stderr)
+        return EXIT_USAGE
+
+    _setup_headless_logging()
+    tracer = Tracer("batch") if args.trace else None
+    runner = BatchRunner(
+        _load_config(args.config_dir),
+        output_directory=args.output,
+        workers=args.workers,
+        incremental=args.incremental,
+        summary_interval=(BATCH_SUMMARY_INTERVAL if args.summary_interval is None
+                          else args.summary_interval),
+        sink=JsonLineWriter(stdout),
+        tracer=tracer
+    )
+
+    try:
+        with _metrics_export(args):
+            stats = runner.run(args.directories)
+    except KeyboardInterrupt:
+        return EXIT_INTERRUPTED
+    finally:
+        if tracer is not None:
+            print(f"추적 저장: {tracer.export(args.trace)}", file=sys.stderr)
+
+    return EXIT_FAILURES if stats.failed else EXIT_OK
+
+
+def run_serve(args: argparse.Namespace, stdout: TextIO) -> int:
+    """serve 명령 실행 (Ctrl+C로 종료)"""
+    from .core.conversion_service import ConversionService, ConversionServer
+    from .core.constants import SERVICE_DEFAULT_HOST, SERVICE_DEFAULT_PORT, SERVICE_DATA_DIR
+
+    if args.workers is not None and args.workers < 1:
+        print("--workers는 1 이상이어야 합니다", file=sys.stderr)
+        return EXIT_USAGE
+
+    _setup_headless_logging()
+    service = ConversionService(_load_config(args.config_dir),
+                                args.data_dir or Path(SERVICE_DATA_DIR),
+                                workers=args.workers)
+    try:
+        server = ConversionServer(service, args.host or SERVICE_DEFAULT_HOST,
+                                  SERVICE_DEFAULT_PORT if args.port is None else args.port)
+    except OSError as e:
+        print(f"서버를 시작할 수 없습니다: {e}", file=sys.stderr)
+        service.close()
+        return EXIT_FAILURES
+
+    service.start()
+    JsonLineWriter(stdout)({"type": "listening", "url": server.url})
+    try:
+        with _metrics_export(args):
+            server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+    return EXIT_OK
+
+
+def run_distributed(args: argparse.Namespace, stdout: TextIO) -> int:
+    """distributed 명령 실행"""
+    from .core import distributed
+    from .core.batch_runner import BatchRunner
+    from .core.constants import DISTRIBUTED_LEASE_TIMEOUT
+
+    write = JsonLineWriter(stdout)
+
+    if args.action == "report":
+        try:
+            report = distributed.merge_report(args.job_dir)
+        except FileNotFoundError as e:
+            print(str(e), file=sys.stderr)
+            return EXIT_USAGE
+        write(report)
+        return EXIT_FAILURES if report["counts"].get("failed") else EXIT_OK
+
+    if args.action == "create":
+        missing = [str(d) for d in args.directories if not d.is_dir()]
+        if missing:
+            print(f"디렉토리를 찾을 수 없습니다: {', '.join(missing)}", file=sys.stderr)
+            return EXIT_USAGE
+
+        _setup_headless_logging()
+        scanner = BatchRunner(_load_config(args.config_dir), output_directory=args.output)
+        files = scanner.scan(args.directories)
+        try:
+            manifest = distributed.create_batch(
+                args.job_dir, [f.path for f in files],
+                output_directory=scanner.output_directory,
+                save_to_original_dir=scanner.save_to_original_dir
+            )
+        except FileExistsError as e:
+            print(str(e), file=sys.stderr)
+            return EXIT_USAGE
+        write(dict(manifest, type="batch"))
+        return EXIT_OK
+
+    if args.workers is not None and args.workers < 1:
+        print("--workers는 1 이상이어야 합니다", file=sys.stderr)
+        return EXIT_USAGE
+
+    _setup_headless_logging()
+    try:
+        worker = distributed.DistributedWorker(
+            args.job_dir, _load_config(args.config_dir),
+            node_id=args.node_id, workers=args.workers,
+            lease_timeout=args.lease_timeout or DISTRIBUTED_LEASE_TIMEOUT,
+            sink=write
+        )
+    except FileNotFoundError as e:
+        print(str(e), file=sys.stderr)
+        return EXIT_USAGE
+
+    try:
+        with _metrics_export(args):
+            stats = worker.run()
+    except KeyboardInterrupt:
+        return EXIT_INTERRUPTED
+
+    write({"type": "node_summary", "node": worker.node_id, "committed": stats.committed,
+           "succeeded": stats.succeeded, "failed": stats.failed,
+           "lost_leases": stats.lost_leases, "reclaimed": stats.reclaimed})
+    return EXIT_FAILURES if stats.failed else EXIT_OK
+
+
+def run_benchmark(args: argparse.Namespace, stdout: TextIO) -> int:
+    """benchmark 명령 실행"""
+    if args.suite == "throughput":
+        return _run_throughput_benchmark(args, stdout)
+    return _run_startup_benchmark(args, stdout)
+
+
+def _parse_list(value: str, convert=str) -> List:
+    return [convert(item.strip()) for item in value.split(",") if item.strip()]
+
+
+def _run_throughput_benchmark(args: argparse.Namespace, stdout: TextIO) -> int:
+    """처리량 벤치마크 실행 및 JSON 보고"""
+    from dataclasses import replace
+    from .core import throughput_benchmark
+
+    try:
+        worker_counts = _parse_list(args.workers, int)
+        cache_states = _parse_list(args.cache)
+    except ValueError:
+        print("--workers는 쉼표로 구분한 정수여야 합니다", file=sys.stderr)
+        return EXIT_USAGE
+    if not worker_counts or min(worker_counts) < 1:
+        print("--workers는 1 이상이어야 합니다", file=sys.stderr)
+        return EXIT_USAGE
+    unknown = set(cache_states) - set(throughput_benchmark.CACHE_STATES)
+    if unknown or not cache_states:
+        print(f"--cache는 {','.join(throughput_benchmark.CACHE_STATES)} 중에서 선택해야 합니다",
+              file=sys.stderr)
+        return EXIT_USAGE
+
+    spec = throughput_benchmark.CorpusSpec()
+    overrides = {"seed": args.seed, "files_per_format": args.files_per_format,
+                 "size_kb": args.size_kb,
+                 "formats": _parse_list(args.formats) if args.formats else None}
+    spec = replace(spec, **{k: v for k, v in overrides.items() if v is not None})
+
+    _setup_headless_logging()
+    try:
+        report = throughput_benchmark.run_throughput_benchmark(
+            args.work_dir / "corpus", args.work_dir / "output", spec,
+            worker_counts=worker_counts, cache_states=cache_states,
+            isolate=not args.in_process
+        )
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        return EXIT_USAGE
+    except RuntimeError as e:
+        print(str(e), file=sys.stderr)
+        return EXIT_FAILURES
+
+    if args.report is not None:
+        args.report.parent.mkdir(parents=True, exist_ok=True)
+        args.report.write_text(json.dumps(report, indent=2, ensure_ascii=False) + "\n",
+                               encoding="utf-8")
+    JsonLineWriter(stdout)(report)
+    return EXIT_OK
+
+
+def _run_startup_benchmark(args: argparse.Namespace, stdout: TextIO) -> int:
+    """시작 시간 벤치마크 실행 (예산 초과 시 종료 코드 1)"""
+    from .core import startup_benchmark
+    from .core.constants import STARTUP_BENCHMARK_RUNS
+
+    runs = STARTUP_BENCHMARK_RUNS if args.runs is None else args.runs
+    if runs < 1:
+        print("--runs는 1 이상이어야 합니다", file=sys.stderr)
+        return EXIT_USAGE
+    if args.update_baseline and args.baseline is None:
+        print("--update-baseline에는 --baseline이 필요합니다", file=sys.stderr)
+        return EXIT_USAGE
+
+    try:
+        results = startup_benchmark.run_startup_benchmarks(runs=runs, include_window=not args.no_window)
+    except startup_benchmark.BenchmarkError as e:
+        print(str(e), file=sys.stderr)
+        return EXIT_FAILURES
+
+    metrics = results["metrics"]
+    report = {
+        "type": "startup_benchmark",
+        "metrics": {name: metric.to_dict() for name, metric in metrics.items()},
+        "slowest_imports": results["slowest_imports"],
+        "environment": results["environment"],
+    }
+
+    violations = []
+    if args.baseline is not None:
+        previous = (startup_benchmark.load_baseline(args.baseline)
+                    if args.baseline.exists() else None)
+        if args.update_baseline:
+            startup_benchmark.save_baseline(args.baseline, metrics, previous)
+        elif previous is None:
+            print(f"기준값 파일을 찾을 수 없습니다: {args.baseline}", file=sys.stderr)
+            return EXIT_USAGE
+        else:
+            violations = startup_benchmark.check_budgets(metrics, previous, args.tolerance)
+            report["violations"] = [v.to_dict() for v in violations]
+
+    JsonLineWriter(stdout)(report)
+    for violation in violations:
+        print(f"예산 초과 - {violation}", file=sys.stderr)
+    return EXIT_FAILURES if violations else EXIT_OK
+
+
+def main(argv: Optional[List[str]] = None, stdout: Optional[TextIO] = None) -> int:
+    """
+    CLI 진입점
+
+    Returns:
+        종료 코드 (0: 성공, 1: 실패한 파일 있음, 2: 잘못된 사용, 130: 중단됨)
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if not getattr(args, "handler", None):
+        parser.print_help(sys.stderr)
+        return EXIT_USAGE
+
+    return args.handler(args, stdout or sys.stdout)
@@ -18,7 +18,7 @@ from PyQt6.QtWidgets import (
     QSlider, QProgressBar, QTabWidget, QGroupBox, QScrollArea
 )
 from PyQt6.QtCore import (
-    QObject, pyqtSignal, QSettings, QTimer, QRect, QPoint, QSize,
+    QObject, pyqtSignal, QSettings, QRect, QPoint, QSize,
     QPropertyAnimation, QEasingCurve, Qt, QEvent, QModelIndex
 )
 from PyQt6.QtGui import (
@@ -388,6 +388,7 @@ class AccessibilityManager(QObject):
         
         # 접근성 검증기
         self.validator = None
+        self.background_validator = None
         
         # 등록된 위젯들
         self.registered_widgets: Dict[str, QWidget] = {}
@@ -414,15 +415,6 @@ class AccessibilityManager(QObject):
         self.current_font_scale = 1.0
         self.reduced_animations = False
         
-        # 타이머들
-        self.validation_timer = QTimer()
-        self.validation_timer.timeout.connect(self._periodic_validation)
-        self.validation_timer.setInterval(30000)  # 30초마다 검증
-        
-        self.focus_timer = QTimer()
-        self.focus_timer.timeout.connect(self._check_focus_changes)
-        self.focus_timer.setInterval(100)  # 0.1초마다 포커스 체크
-        
         # 초기화
         self._init_accessibility_framework()
         self._load_settings()
@@ -784,9 +776,6 @@ class AccessibilityManager(QObject):
             # 키보드 단축키 활성화
             self._setup_global_shortcuts()
             
-            # 포커스 타이머 시작
-            self.focus_timer.start()
-            
             return True
         except Exception as e:
             logger.error(f"Failed to activate keyboard navigation: {e}")
@@ -968,6 +957,11 @@ class AccessibilityManager(QObject):
         """포커스 변경 이벤트 처리"""
         try:
             if new_widget:
+                # 키보드 네비게이션 중 등록되지 않은 위젯이 포커스를 받으면 자동 등록
+                if (AccessibilityFeature.KEYBOARD_NAVIGATION in self.accessibility_settings.enabled_features
+                        and new_widget not in self.registered_widgets.values()):
+                    self.register_widget(new_widget)
+                
                 # 포커스 히스토리 업데이트
                 if new_widget not in self.focus_history:
                     self.focus_history.append(new_widget)
@@ -1050,39 +1044,46 @@ class AccessibilityManager(QObject):
         
         return ""
     
-    def _check_focus_changes(self):
-        """포커스 변경 주기적 체크"""
+    def start_background_validation(self):
+        """바뀐 위젯만 유휴 시간에 나눠 검증하는 백그라운드 검증 시작"""
         try:
-            current_focus = self.app.focusWidget()
-            if current_focus and current_focus not in self.registered_widgets.values():
-                # 등록되지 않은 위젯이 포커스를 받은 경우 자동 등록
-                self.register_widget(current_focus)
+            if not self.validator:
+                from .accessibility_validator import AccessibilityValidator
+                self.validator = AccessibilityValidator(self)
+            
+            if not self.background_validator:
+                from .accessibility_validator import IncrementalValidator
+                self.background_validator = IncrementalValidator(self.validator, parent=self)
+                self.background_validator.pass_completed.connect(self._on_validation_pass)
+            
+            self.background_validator.start()
         except Exception as e:
-            logger.error(f"Error checking focus changes: {e}")
+            logger.error(f"Failed to start background validation: {e}")
     
-    def _periodic_validation(self):
-        """주기적 접근성 검증"""
+    def stop_background_validation(self):
+        """백그라운드 검증 중지"""
+        if self.background_validator:
+            self.background_validator.stop()
+    
+    def _on_validation_pass(self, report):
+        """백그라운드 검증 한 차례 완료"""
         try:
-            if self.validator:
-                report = self.validator.validate_application()
-                self.compliance_updated.emit(report.score)
-                
-                # 심각한 문제가 발견된 경우 로그
-                critical_issues = [issue for issue in report.issues if issue.get("severity") == "critical"]
-                if critical_issues:
-                    logger.warning(f"Critical accessibility issues found: {len(critical_issues)}")
+            self.compliance_updated.emit(report.score)
+            
+            # 심각한 문제가 발견된 경우 로그
+            if report.critical_issues:
+                logger.warning(f"Critical accessibility issues found: {len(report.critical_issues)}")
         
         except Exception as e:
             logger.error(f"Error during periodic validation: {e}")
     
     def validate_compliance(self) -> AccessibilityReport:
-        """접근성 규정 준수 검증"""
+        """접근성 규정 준수 검증 (처음 이후에는 바뀐 위젯만 다시 검증)"""
         try:
-            if not self.validator:
-                from .accessibility_validator import AccessibilityValidator
-                self.validator = AccessibilityValidator(self)
+            if not self.background_validator or not self.background_validator.is_running:
+                self.start_background_validation()
             
-            return self.validator.validate_application()
+            return self.background_validator.flush()
             
         except Exception as e:
             logger.error(f"Failed to validate compliance: {e}")
@@ -1195,6 +1196,10 @@ class AccessibilityManager(QObject):
     def eventFilter(self, obj: QObject, event: QEvent) -> bool:
         """애플리케이션 이벤트 필터"""
         try:
+            # 증분 검증용 위젯 변경 추적
+            if self.background_validator is not None:
+                self.background_validator.handle_event(obj, event)
+            
             # 키보드 이벤트 필터링
             if event.type() == QEvent.Type.KeyPress:
                 if self._handle_global_keyboard_event(event):
@@ -1278,16 +1283,10 @@ class AccessibilityManager(QObject):
     def cleanup(self):
         """정리"""
         try:
-            # 타이머 정지 및 정리
-            if hasattr(self, 'validation_timer') and self.validation_timer:
-                self.validation_timer.stop()
-                self.validation_timer.deleteLater()
-                self.validation_timer = None
-                
-            if hasattr(self, 'focus_timer') and self.focus_timer:
-                self.focus_timer.stop()
-                self.focus_timer.deleteLater()
-                self.focus_timer = None
+            # 백그라운드 검증 정지
+            if self.background_validator:
+                self.background_validator.stop()
+                self.background_validator = None
             
             # 포커스 인디케이터들 정리
             for indicator in list(self.focus_indicators.values()):
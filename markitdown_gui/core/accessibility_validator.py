@@ -5,6 +5,8 @@ WCAG 2.1 AA compliance validation for PyQt6 applications
 
 import json
 import math
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Callable, Set, Tuple, Union
 from enum import Enum
@@ -18,13 +20,15 @@ from PyQt6.QtWidgets import (
     QTabWidget, QGroupBox, QListWidget, QTreeWidget, QTableWidget,
     QScrollArea, QSplitter, QStackedWidget, QFrame, QToolButton
 )
-from PyQt6.QtCore import QObject, QSettings, Qt, QRect, QSize, QTimer
+from PyQt6 import sip
+from PyQt6.QtCore import QObject, QSettings, Qt, QRect, QSize, QTimer, QEvent, pyqtSignal
 from PyQt6.QtGui import (
     QColor, QPalette, QFont, QFontMetrics, QPainter, QPixmap, QImage
 )
 # Import accessibility classes from compatibility layer
 from .qt_compatibility import QAccessible, is_accessibility_available
 
+from .constants import ACCESSIBILITY_VALIDATION_DELAY_MS, ACCESSIBILITY_VALIDATION_SLICE_MS
 from .logger import get_logger
 
 
@@ -145,21 +149,25 @@ class ColorContrastValidator:
     
     @staticmethod
     def calculate_contrast_ratio(color1: QColor, color2: QColor) -> float:
-        """두 색상 간 대비율 계산"""
+        """두 색상 간 대비율 계산 (색상 쌍별로 기억)"""
         try:
-            l1 = ColorContrastValidator._get_relative_luminance(color1)
-            l2 = ColorContrastValidator._get_relative_luminance(color2)
-            
-            # 더 밝은 색을 분자에
-            lighter = max(l1, l2)
-            darker = min(l1, l2)
-            
-            return (lighter + 0.05) / (darker + 0.05)
-            
+            return ColorContrastValidator._contrast_ratio_rgb(color1.rgb() & 0xFFFFFF, color2.rgb() & 0xFFFFFF)
         except Exception as e:
             logger.error(f"Error calculating contrast ratio: {e}")
             return 1.0
     
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _contrast_ratio_rgb(rgb1: int, rgb2: int) -> float:
+        l1 = ColorContrastValidator._get_relative_luminance(QColor(rgb1))
+        l2 = ColorContrastValidator._get_relative_luminance(QColor(rgb2))
+        
+        # 더 밝은 색을 분자에
+        lighter = max(l1, l2)
+        darker = min(l1, l2)
+        
+        return (lighter + 0.05) / (darker + 0.05)
+    
     @staticmethod
     def _get_relative_luminance(color: QColor) -> float:
         """상대적 휘도 계산"""
@@ -779,25 +787,8 @@ class AccessibilityValidator:
                     total_widgets += widget_count
                     tested_widgets += tested_count
             
-            # 전체 점수 계산
-            score = self._calculate_overall_score(all_issues, tested_widgets)
-            
-            # 레벨별 점수 계산
-            level_scores = self._calculate_level_scores(all_issues, tested_widgets)
-            
-            # 원칙별 점수 계산  
-            principle_scores = self._calculate_principle_scores(all_issues, tested_widgets)
-            
-            result = ValidationResult(
-                total_widgets=total_widgets,
-                tested_widgets=tested_widgets,
-                issues=all_issues,
-                score=score,
-                level_scores=level_scores,
-                principle_scores=principle_scores
-            )
-            
-            logger.info(f"Accessibility validation completed: {score:.1f}% score, {len(all_issues)} issues")
+            result = self.build_result(all_issues, total_widgets, tested_widgets)
+            logger.info(f"Accessibility validation completed: {result.score:.1f}% score, {len(all_issues)} issues")
             return result
             
         except Exception as e:
@@ -809,6 +800,17 @@ class AccessibilityValidator:
                 score=0.0
             )
     
+    def build_result(self, issues: List[ValidationIssue], total_widgets: int, tested_widgets: int) -> ValidationResult:
+        """이슈 목록으로 점수를 계산해 검증 결과 생성"""
+        return ValidationResult(
+            total_widgets=total_widgets,
+            tested_widgets=tested_widgets,
+            issues=issues,
+            score=self._calculate_overall_score(issues, tested_widgets),
+            level_scores=self._calculate_level_scores(issues, tested_widgets),
+            principle_scores=self._calculate_principle_scores(issues, tested_widgets)
+        )
+    
     def validate_widget(self, widget: QWidget) -> List[ValidationIssue]:
         """단일 위젯 접근성 검증"""
         issues = []
@@ -1069,4 +1071,132 @@ class AccessibilityValidator:
             "enabled_validators": self.enabled_validators.copy(),
             "ignore_hidden_widgets": self.ignore_hidden_widgets,
             "max_issues_per_widget": self.max_issues_per_widget
-        }
\ No newline at end of file
+        }
+
+class IncrementalValidator(QObject):
+    """
+    바뀐 위젯만 시간 분할로 다시 검증하는 백그라운드 검증기
+    
+    앱 이벤트 필터가 handle_event로 넘긴 표시/팔레트/글꼴/크기 변경을 모아 두었다가, 변경이
+    잠잠해지면 이벤트 루프 한 번에 slice_ms까지만 검증하고 나머지는 다음 차례로 넘긴다.
+    위젯별 결과를 보관하므로 전체 보고서는 위젯 트리를 다시 순회하지 않고 합친다.
+    """
+    
+    pass_completed = pyqtSignal(object)  # ValidationResult
+    
+    # 위젯을 다시 검증해야 하는 이벤트
+    DIRTY_EVENTS = frozenset({
+        QEvent.Type.Show, QEvent.Type.PaletteChange, QEvent.Type.FontChange,
+        QEvent.Type.StyleChange, QEvent.Type.Resize, QEvent.Type.EnabledChange
+    })
+    
+    def __init__(self, validator: AccessibilityValidator,
+                 slice_ms: int = ACCESSIBILITY_VALIDATION_SLICE_MS,
+                 delay_ms: int = ACCESSIBILITY_VALIDATION_DELAY_MS, parent=None):
+        super().__init__(parent)
+        self.validator = validator
+        self.slice_ms = slice_ms
+        self._results: Dict[QWidget, List[ValidationIssue]] = {}
+        # 삽입 순서를 유지하는 집합
+        self._dirty: Dict[QWidget, None] = {}
+        self._running = False
+        
+        # 변경이 몰릴 때 (파일 목록 채우기 등) 한 번에 모아서 검증
+        self._delay_timer = QTimer(self)
+        self._delay_timer.setSingleShot(True)
+        self._delay_timer.setInterval(delay_ms)
+        self._delay_timer.timeout.connect(self._process_slice)
+        
+        # 남은 작업은 대기 중인 이벤트를 먼저 처리한 뒤 이어서
+        self._slice_timer = QTimer(self)
+        self._slice_timer.setSingleShot(True)
+        self._slice_timer.setInterval(0)
+        self._slice_timer.timeout.connect(self._process_slice)
+    
+    @property
+    def is_running(self) -> bool:
+        return self._running
+    
+    @property
+    def pending_count(self) -> int:
+        return len(self._dirty)
+    
+    def start(self):
+        """표시 중인 모든 위젯을 검증 대기열에 넣고 감시 시작"""
+        if self._running:
+            return
+        self._running = True
+        app = QApplication.instance()
+        for top_level_widget in app.topLevelWidgets():
+            if top_level_widget.isVisible():
+                self._dirty[top_level_widget] = None
+                for child in top_level_widget.findChildren(QWidget):
+                    self._dirty[child] = None
+        self._delay_timer.start()
+    
+    def stop(self):
+        """감시 중지 (보관한 결과는 버림)"""
+        self._running = False
+        self._delay_timer.stop()
+        self._slice_timer.stop()
+        self._dirty.clear()
+        self._results.clear()
+    
+    def mark_dirty(self, widget: QWidget):
+        """위젯을 다시 검증하도록 표시"""
+        if not self._running:
+            return
+        self._dirty[widget] = None
+        if not self._slice_timer.isActive():
+            self._delay_timer.start()
+    
+    def handle_event(self, obj: QObject, event: QEvent):
+        """앱 이벤트 필터에서 호출"""
+        if not self._running:
+            return
+        event_type = event.type()
+        if event_type in self.DIRTY_EVENTS:
+            if isinstance(obj, QWidget):
+                self.mark_dirty(obj)
+        elif event_type == QEvent.Type.Hide and isinstance(obj, QWidget):
+            self._results.pop(obj, None)
+            self._dirty.pop(obj, None)
+    
+    def _validate_next(self) -> bool:
+        """대기열의 위젯 하나 검증 (대기열이 비어 있으면 False)"""
+        if not self._dirty:
+            return False
+        widget = next(iter(self._dirty))
+        del self._dirty[widget]
+        if sip.isdeleted(widget) or (self.validator.ignore_hidden_widgets and not widget.isVisible()):
+            self._results.pop(widget, None)
+        else:
+            self._results[widget] = self.validator.validate_widget(widget)
+        return True
+    
+    def _process_slice(self):
+        deadline = time.perf_counter() + self.slice_ms / 1000
+        while self._validate_next():
+            if time.perf_counter() >= deadline:
+                break
+        
+        if self._dirty:
+            self._slice_timer.start()
+        elif self._running:
+            self.pass_completed.emit(self.result())
+    
+    def flush(self) -> ValidationResult:
+        """남은 대기열을 바로 검증하고 결과 반환"""
+        self._delay_timer.stop()
+        self._slice_timer.stop()
+        while self._validate_next():
+            pass
+        return self.result()
+    
+    def result(self) -> ValidationResult:
+        """보관한 위젯별 결과를 합친 검증 결과"""
+        for widget in [w for w in self._results if sip.isdeleted(w)]:
+            del self._results[widget]
+        issues = [issue for widget_issues in self._results.values() for issue in widget_issues]
+        tested_widgets = len(self._results)
+        return self.validator.build_result(issues, tested_widgets, tested_widgets)
@@ -7,10 +7,9 @@ import asyncio
 import time
 import json
 import base64
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Union, TYPE_CHECKING
 from pathlib import Path
 from dataclasses import asdict
-import aiohttp
 import logging
 from datetime import datetime, timedelta
 from collections import deque
@@ -21,6 +20,9 @@ from .models import (
 )
 from .logger import get_logger
 
+if TYPE_CHECKING:
+    import aiohttp  # 실제 import는 세션 생성 시점 (시작 시간 단축)
+
 
 logger = get_logger(__name__)
 
@@ -76,7 +78,7 @@ class APIClient:
         """
         self.config = config
         self.rate_limiter = RateLimiter()
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.session: Optional["aiohttp.ClientSession"] = None
         
         # 재시도 설정
         self.max_retries = config.max_retries
@@ -85,6 +87,7 @@ class APIClient:
     async def __aenter__(self):
         """비동기 컨텍스트 매니저 진입"""
         if self.session is None:
+            import aiohttp
             timeout = aiohttp.ClientTimeout(total=self.config.timeout)
             self.session = aiohttp.ClientSession(timeout=timeout)
         return self
@@ -122,6 +125,8 @@ class APIClient:
         if self.session is None:
             raise RuntimeError("API client session not initialized")
         
+        import aiohttp
+        
         await self.rate_limiter.acquire()
         
         for attempt in range(self.max_retries + 1):
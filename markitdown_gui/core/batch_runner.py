@@ -0,0 +1,382 @@
+"""
+헤드리스 배치 실행기
+QApplication 없이 디렉토리 스캔과 변환을 수행하고 결과를 레코드로 보고
+
+파이프라인 스케줄러에서 호출하는 `python -m markitdown_gui batch`의 본체이며,
+GUI와 동일한 settings.ini(ConfigManager)를 읽고 ConversionEngine으로 변환한다.
+"""
+
+import json
+import time
+import threading
+from pathlib import Path
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import List, Optional, Dict, Any, Callable
+
+from .models import FileInfo, ConversionResult, ConversionStatus
+from .config_manager import ConfigManager
+from .conversion_engine import ConversionEngine
+from .file_conflict_handler import FileConflictHandler
+from .memory_optimizer import MemoryOptimizer
+from .tracing import Tracer
+from .constants import BATCH_SUMMARY_INTERVAL, BATCH_OUTPUT_MANIFEST_FILE, MAX_WORKER_THREADS
+from .utils import scan_directory, create_file_info, resolve_markdown_output_path, atomic_write_text
+from .logger import get_logger
+
+
+logger = get_logger(__name__)
+
+# 배치 레코드 수신자 (JSON 직렬화 가능한 dict)
+RecordSink = Callable[[Dict[str, Any]], None]
+
+STATUS_UP_TO_DATE = "up_to_date"
+
+
+@dataclass
+class BatchStatistics:
+    """배치 처리량 통계"""
+    total_files: int = 0
+    completed: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    cancelled: int = 0
+    up_to_date: int = 0
+    bytes_processed: int = 0
+    start_time: float = field(default_factory=time.monotonic)
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.start_time
+
+    @property
+    def files_per_second(self) -> float:
+        elapsed = self.elapsed
+        return self.completed / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        elapsed = self.elapsed
+        return self.bytes_processed / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta_seconds(self) -> Optional[float]:
+        rate = self.files_per_second
+        if rate <= 0:
+            return None
+        return (self.total_files - self.completed) / rate
+
+    def record(self, result: ConversionResult):
+        """변환 결과 반영"""
+        self.completed += 1
+        self.bytes_processed += result.file_info.size
+        if result.status == ConversionStatus.SUCCESS:
+            self.succeeded += 1
+        elif result.status == ConversionStatus.CANCELLED:
+            self.cancelled += 1
+        else:
+            self.failed += 1
+
+    def to_record(self, final: bool = False) -> Dict[str, Any]:
+        """요약 레코드 생성"""
+        eta = self.eta_seconds
+        return {
+            "type": "summary",
+            "final": final,
+            "total": self.total_files,
+            "completed": self.completed,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "cancelled": self.cancelled,
+            "up_to_date": self.up_to_date,
+            "elapsed": round(self.elapsed, 3),
+            "files_per_sec": round(self.files_per_second, 3),
+            "bytes_per_sec": round(self.bytes_per_second, 1),
+            "eta": round(eta, 1) if eta is not None and not final else None,
+        }
+
+
+def result_to_record(result: ConversionResult) -> Dict[str, Any]:
+    """변환 결과를 JSON 직렬화 가능한 레코드로 변환"""
+    return {
+        "type": "file",
+        "path": str(result.file_info.path),
+        "status": result.status.value,
+        "output_path": str(result.output_path) if result.output_path else None,
+        "error": result.error_message,
+        "size": result.file_info.size,
+        "duration": round(result.conversion_time or 0.0, 4),
+    }
+
+
+class OutputManifest:
+    """
+    원본 -> 출력 경로 매니페스트
+    
+    같은 줄기의 원본(a1.csv, a1.txt)은 서로 다른 고유 이름으로 저장되므로, 증분 모드는
+    이름 규칙으로 출력을 추측하지 않고 실제로 기록한 경로로 최신 여부를 판단한다.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._entries: Dict[str, str] = {}
+        self._dirty = False
+
+    @staticmethod
+    def _key(source: Path) -> str:
+        return str(Path(source).resolve())
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            data = {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"배치 매니페스트 로드 실패 ({self.path}): {e}")
+            data = {}
+        self._entries = {str(k): str(v) for k, v in data.items()} if isinstance(data, dict) else {}
+        self._dirty = False
+
+    def get(self, source: Path) -> Optional[Path]:
+        output = self._entries.get(self._key(source))
+        return Path(output) if output else None
+
+    def set(self, source: Path, output: Path):
+        key = self._key(source)
+        value = str(output)
+        if self._entries.get(key) != value:
+            self._entries[key] = value
+            self._dirty = True
+
+    def save(self):
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_text(self.path, json.dumps(self._entries, ensure_ascii=False, indent=2))
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"배치 매니페스트 저장 실패 ({self.path}): {e}")
+
+
+class BatchRunner:
+    """QApplication 없이 디렉토리를 스캔하고 변환하는 배치 실행기"""
+
+    def __init__(self, config_manager: ConfigManager,
+                 output_directory: Optional[Path] = None,
+                 workers: Optional[int] = None,
+                 incremental: bool = False,
+                 summary_interval: float = BATCH_SUMMARY_INTERVAL,
+                 sink: Optional[RecordSink] = None,
+                 tracer: Optional[Tracer] = None):
+        """
+        Args:
+            config_manager: 설정을 로드한 ConfigManager
+            output_directory: 출력 디렉토리 (지정 시 원본 디렉토리 저장 설정보다 우선)
+            workers: 동시 변환 수 (기본값: 설정의 max_workers)
+            incremental: 출력이 원본보다 최신인 파일 건너뛰기
+            summary_interval: 처리량 요약 레코드 간격(초), 0이면 최종 요약만 출력
+            sink: 레코드 수신자
+            tracer: 파일별 단계 구간을 기록할 Tracer (None이면 추적 안 함)
+        """
+        self.config_manager = config_manager
+        config = config_manager.get_config()
+
+        if output_directory is not None:
+            self.output_directory = Path(output_directory)
+            self.save_to_original_dir = False
+        else:
+            self.output_directory = Path(config.output_directory)
+            self.save_to_original_dir = config.save_to_original_directory
+
+        self.workers = max(1, min(workers or config.max_workers, MAX_WORKER_THREADS))
+        self.incremental = incremental
+        self.summary_interval = summary_interval
+        self.sink = sink or (lambda record: None)
+        self.tracer = tracer
+
+        # 워커 스레드 간 공유 (캐시, 충돌 처리 통계)
+        self._memory_optimizer = MemoryOptimizer()
+        self._conflict_handler = FileConflictHandler(config_manager.get_file_conflict_config())
+        self._local = threading.local()
+        self._engines: List[ConversionEngine] = []
+        self._engines_lock = threading.Lock()
+        self._cancel_event = threading.Event()
+        self.manifest = OutputManifest(Path(config_manager.config_dir) / BATCH_OUTPUT_MANIFEST_FILE)
+
+    def scan(self, directories: List[Path]) -> List[FileInfo]:
+        """설정의 확장자/크기 제한으로 디렉토리 스캔 (중복 경로 제거)"""
+        config = self.config_manager.get_config()
+        seen = set()
+        files: List[FileInfo] = []
+
+        for directory in directories:
+            for path in scan_directory(Path(directory).resolve(),
+                                       config.include_subdirectories,
+                                       config.supported_extensions,
+                                       config.max_file_size_mb):
+                key = path.resolve()
+                if key in seen:
+                    continue
+                seen.add(key)
+                file_info = create_file_info(path)
+                if file_info:
+                    files.append(file_info)
+
+        return files
+
+    def expected_output_path(self, file_info: FileInfo) -> Path:
+        """ConversionEngine이 사용하는 (고유화 이전의) 출력 경로"""
+        if self.save_to_original_dir:
+            return resolve_markdown_output_path(file_info.path, preserve_structure=False,
+                                                output_base_dir=file_info.path.parent,
+                                                ensure_unique=False)
+        return resolve_markdown_output_path(file_info.path, preserve_structure=True,
+                                            output_base_dir=self.output_directory,
+                                            ensure_unique=False)
+
+    def recorded_output_path(self, file_info: FileInfo) -> Optional[Path]:
+        """매니페스트에 기록된 이 원본의 출력 경로 (현재 출력 디렉토리 밖이면 None)"""
+        output_path = self.manifest.get(file_info.path)
+        if output_path is None:
+            return None
+        try:
+            if output_path.parent != self.expected_output_path(file_info).parent:
+                return None
+        except (OSError, ValueError):
+            return None
+        return output_path
+
+    def is_up_to_date(self, file_info: FileInfo) -> bool:
+        """이 원본으로 기록한 출력 파일이 원본 이후에 생성되었는지 확인"""
+        output_path = self.recorded_output_path(file_info)
+        if output_path is None:
+            return False
+        try:
+            return output_path.stat().st_mtime >= file_info.path.stat().st_mtime
+        except OSError:
+            return False
+
+    def cancel(self):
+        """남은 변환 취소"""
+        self._cancel_event.set()
+        with self._engines_lock:
+            for engine in self._engines:
+                engine.cancel()
+
+    def run(self, directories: List[Path]) -> BatchStatistics:
+        """
+        스캔 후 변환 실행
+
+        Returns:
+            최종 배치 통계
+        """
+        self._cancel_event.clear()
+        self.manifest.load()
+        files = self.scan(directories)
+        stats = BatchStatistics()
+
+        if self.incremental:
+            pending = []
+            for file_info in files:
+                if self.is_up_to_date(file_info):
+                    stats.up_to_date += 1
+                    self.sink({
+                        "type": "file",
+                        "path": str(file_info.path),
+                        "status": STATUS_UP_TO_DATE,
+                        "output_path": str(self.recorded_output_path(file_info)),
+                        "error": None,
+                        "size": file_info.size,
+                        "duration": 0.0,
+                    })
+                else:
+                    pending.append(file_info)
+            files = pending
+
+        stats.total_files = len(files)
+        logger.info(f"배치 변환 시작: {len(files)}개 파일, 워커 {self.workers}개")
+
+        try:
+            self._convert_all(files, stats)
+        finally:
+            self._memory_optimizer.cleanup()
+            self.manifest.save()
+
+        self.sink(stats.to_record(final=True))
+        logger.info(f"배치 변환 완료: 성공 {stats.succeeded}, 실패 {stats.failed}, "
+                    f"건너뜀 {stats.up_to_date}")
+        return stats
+
+    def _convert_all(self, files: List[FileInfo], stats: BatchStatistics):
+        """워커 풀에서 변환하고 완료 순서대로 레코드 출력"""
+        if not files:
+            return
+
+        with ThreadPoolExecutor(max_workers=self.workers,
+                                thread_name_prefix="BatchWorker") as executor:
+            pending = {executor.submit(self._convert_one, f) for f in files}
+            next_summary = time.monotonic() + self.summary_interval
+
+            try:
+                while pending:
+                    timeout = None
+                    if self.summary_interval > 0:
+                        timeout = max(0.0, next_summary - time.monotonic())
+                    done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+                    for future in done:
+                        if future.cancelled():
+                            continue
+                        result = future.result()
+                        stats.record(result)
+                        if result.status == ConversionStatus.SUCCESS and result.output_path:
+                            self.manifest.set(result.file_info.path, result.output_path)
+                        self.sink(result_to_record(result))
+
+                    if self.summary_interval > 0 and time.monotonic() >= next_summary:
+                        self.sink(stats.to_record())
+                        next_summary = time.monotonic() + self.summary_interval
+
+                    if self._cancel_event.is_set():
+                        for future in pending:
+                            future.cancel()
+            except BaseException:
+                # KeyboardInterrupt 등: 대기 중인 작업을 버리고 진행 중인 변환 취소
+                self.cancel()
+                for future in pending:
+                    future.cancel()
+                raise
+
+    def _convert_one(self, file_info: FileInfo) -> ConversionResult:
+        """현재 워커 스레드의 엔진으로 단일 파일 변환 (실패는 해당 파일의 FAILED 결과로 반환)"""
+        if self._cancel_event.is_set():
+            return ConversionResult(file_info=file_info, status=ConversionStatus.CANCELLED,
+                                    error_message="배치가 취소되었습니다")
+        try:
+            engine = self._get_engine()
+            # 증분 모드: 이전에 이 원본으로 기록한 출력을 그 자리에서 갱신 (없으면 고유 이름 예약)
+            output_path = self.recorded_output_path(file_info) if self.incremental else None
+            return engine.convert_file(file_info, output_path)
+        except Exception as e:
+            logger.error(f"배치 변환 실패 ({file_info.path}): {e}")
+            return ConversionResult(file_info=file_info, status=ConversionStatus.FAILED,
+                                    error_message=str(e))
+
+    def _get_engine(self) -> ConversionEngine:
+        """워커 스레드별 변환 엔진"""
+        engine = getattr(self._local, "engine", None)
+        if engine is None:
+            engine = ConversionEngine(
+                self.output_directory,
+                memory_optimizer=self._memory_optimizer,
+                conflict_handler=self._conflict_handler,
+                save_to_original_dir=self.save_to_original_dir,
+                config_manager=self.config_manager,
+                tracer=self.tracer
+            )
+            self._local.engine = engine
+            with self._engines_lock:
+                self._engines.append(engine)
+        return engine
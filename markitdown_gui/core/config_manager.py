@@ -224,6 +224,7 @@ class ConfigManager:
             ui = config_parser['UI']
             self._config.window_width = ui.getint('window_width', self._config.window_width)
             self._config.window_height = ui.getint('window_height', self._config.window_height)
+            self._config.show_thumbnails = ui.getboolean('show_thumbnails', self._config.show_thumbnails)
 
             # Recent directories 파싱
             recent_dirs_str = ui.get('recent_directories', '')
@@ -365,6 +366,7 @@ class ConfigManager:
         config_parser.add_section('UI')
         config_parser['UI']['window_width'] = str(self._config.window_width)
         config_parser['UI']['window_height'] = str(self._config.window_height)
+        config_parser['UI']['show_thumbnails'] = str(self._config.show_thumbnails)
         config_parser['UI']['recent_directories'] = ','.join(self._config.recent_directories)
 
         # OCR Enhancements section
@@ -15,7 +15,7 @@ DEFAULT_MAX_FILE_SIZE_BYTES = DEFAULT_MAX_FILE_SIZE_MB * MB
 # Image processing constants
 DEFAULT_MAX_IMAGE_SIZE = 1024
 DEFAULT_IMAGE_QUALITY = 85
-MAX_THUMBNAIL_SIZE = (800, 600)
+MAX_THUMBNAIL_SIZE = (800, 600)  # file viewer preview
 DEFAULT_THUMBNAIL_QUALITY = 75
 
 # UI Constants
@@ -77,15 +77,116 @@ DEFAULT_OUTPUT_DIRECTORY = MARKDOWN_OUTPUT_DIR
 # Progress and Status Update Intervals
 PROGRESS_UPDATE_INTERVAL = 100  # milliseconds
 STATUS_UPDATE_INTERVAL = 500   # milliseconds
+PROGRESS_FRAME_INTERVAL = 33  # milliseconds between coalesced progress updates (~30 Hz)
 
 # Thread and Processing Constants
 THREAD_POOL_SIZE = 4
 MAX_WORKER_THREADS = 16
 
+# Resource Sampling Constants
+RESOURCE_SAMPLE_INTERVAL = 0.5  # seconds
+GC_TRIGGER_MEMORY_PERCENT = 70.0
+
+# Cache namespaces and their (max entries, max memory MB) budgets
+CACHE_NAMESPACE_DEFAULT = "default"
+CACHE_NAMESPACE_CONVERSION = "conversion"
+CACHE_NAMESPACE_FILE_INFO = "file_info"
+CACHE_NAMESPACE_LLM = "llm"
+CACHE_NAMESPACE_BUDGETS = {
+    CACHE_NAMESPACE_DEFAULT: (128, 5),
+    CACHE_NAMESPACE_CONVERSION: (2048, 40),
+    CACHE_NAMESPACE_FILE_INFO: (20000, 10),
+    CACHE_NAMESPACE_LLM: (256, 5),
+}
+# Namespaces whose text/bytes values are stored compressed
+CACHE_COMPRESSED_NAMESPACES = (CACHE_NAMESPACE_CONVERSION,)
+CACHE_COMPRESSION_MIN_BYTES = 4 * KB
+
+# Headless Batch Constants
+BATCH_SUMMARY_INTERVAL = 5.0  # seconds between throughput summaries
+BATCH_OUTPUT_MANIFEST_FILE = "batch_outputs.json"  # source -> output map in the config dir
+
+# Local Conversion Service Constants
+SERVICE_DEFAULT_HOST = "127.0.0.1"
+SERVICE_DEFAULT_PORT = 8765
+SERVICE_DATA_DIR = "service_data"
+SERVICE_EVENT_TIMEOUT = 15.0  # seconds between status heartbeats on event streams
+SERVICE_MAX_JSON_BODY = 1024 * 1024  # bytes accepted for JSON request bodies
+
+# Distributed (shared job directory) Constants
+DISTRIBUTED_LEASE_TIMEOUT = 120.0  # seconds without heartbeat before a lease can be reclaimed
+DISTRIBUTED_HEARTBEAT_INTERVAL = 15.0  # seconds
+DISTRIBUTED_POLL_INTERVAL = 2.0  # seconds between checks while other nodes hold leases
+
+# Startup Benchmark Constants
+STARTUP_PROBE_ENV = "MARKITDOWN_GUI_STARTUP_PROBE"  # main.py exits after the first window is shown
+STARTUP_READY_MARKER = "MARKITDOWN_GUI_FIRST_WINDOW"
+STARTUP_BENCHMARK_RUNS = 3
+STARTUP_BUDGET_TOLERANCE = 0.5  # allowed relative regression over the stored baseline
+STARTUP_BUDGET_SLACK_MS = 50.0  # absolute headroom for very small measurements
+
+# Throughput Benchmark Constants
+THROUGHPUT_DEFAULT_SEED = 20240101
+THROUGHPUT_DEFAULT_FORMATS = ("txt", "csv", "json", "html", "docx", "xlsx", "pdf")
+THROUGHPUT_FILES_PER_FORMAT = 10
+THROUGHPUT_FILE_SIZE_KB = 64  # approximate payload size of each generated file
+
+# Pipeline Tracing Constants
+TRACE_MAX_EVENTS = 500000  # events beyond this are counted as dropped
+
+# Metrics Export Constants
+METRICS_PREFIX = "markitdown"
+METRICS_DEFAULT_HOST = "127.0.0.1"
+METRICS_DEFAULT_PORT = 9465
+METRICS_EXPORT_INTERVAL = 15.0  # seconds between textfile exports
+METRICS_LATENCY_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+# Preview Rendering Constants
+PREVIEW_HTML_CACHE_ENTRIES = 32
+PREVIEW_HTML_CACHE_MB = 64
+PREVIEW_SECTIONED_THRESHOLD = 1 * MB  # characters; larger documents render one section at a time
+PREVIEW_SECTION_MAX_CHARS = 64 * KB  # sections are split further at blank lines beyond this
+
+# Paged Text Viewer Constants
+PAGED_VIEW_PAGE_SIZE = 256 * KB  # bytes decoded per page
+PAGED_VIEW_MAX_LOADED_PAGES = 8  # pages kept in the view; older ones are dropped while scrolling
+PAGED_VIEW_PREFETCH_LINES = 100  # load the next page when this close to either end
+PAGED_VIEW_THRESHOLD = 4 * MB  # preview outputs larger than this open in the paged viewer
+ENCODING_SAMPLE_SIZE = 64 * KB
+LINE_INDEX_CHUNK_SIZE = 1 * MB  # line index keeps one checkpoint per chunk
+
+# Thumbnail Constants
+THUMBNAIL_CACHE_DIR = "thumbnail_cache"  # relative to program root
+THUMBNAIL_CACHE_MAX_MB = 256  # oldest thumbnails are pruned beyond this
+THUMBNAIL_WORKERS = 4
+THUMBNAIL_ICON_SIZE = (32, 32)  # file list icons
+
+# Full-text Search Constants
+SEARCH_INDEX_FILE = "search_index.db"  # relative to program root
+SEARCH_RESULT_LIMIT = 50
+SEARCH_SNIPPET_TOKENS = 16  # words around the match in result snippets
+SEARCH_DEBOUNCE_MS = 150
+SEARCH_MAX_HIGHLIGHTS = 2000  # preview stops highlighting after this many matches
+
+# Theme Stylesheet Constants
+STYLESHEET_CACHE_DIR = "stylesheet_cache"  # relative to the config directory
+SYSTEM_THEME_POLL_INTERVAL = 5.0  # seconds, background fallback when no change notifications exist
+
+# Accessibility Validation Constants
+ACCESSIBILITY_VALIDATION_DELAY_MS = 500  # wait for changes to settle before revalidating
+ACCESSIBILITY_VALIDATION_SLICE_MS = 4  # max validation time per event loop turn
+
+# Screen Reader Announcement Constants
+ANNOUNCEMENT_MIN_INTERVAL_MS = 1000  # min gap between speech backend calls (process spawns on Linux)
+ANNOUNCEMENT_SUMMARY_INTERVAL_MS = 5000  # batch progress summary period
+
 # Logging Constants
 LOG_MAX_FILE_SIZE = 10 * MB  # 10MB
 LOG_BACKUP_COUNT = 5
 LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+LOG_VIEW_MAX_LINES = 1000  # lines rendered in the log widget
+LOG_VIEW_BUFFER_SIZE = 10000  # entries kept for re-filtering and saving
+LOG_VIEW_FLUSH_INTERVAL = 100  # milliseconds between batched log view appends
 
 # Error Messages
 class ErrorMessages:
@@ -0,0 +1,1075 @@
+"""
+변환 엔진
+Qt에 의존하지 않는 순수 Python 변환 파이프라인
+
+검증, 충돌 처리, 변환(MarkItDown/OCR), 오류 복구, 출력 저장을 수행하며
+진행 상황은 콜백 또는 (비)동기 이터레이터 이벤트로 전달한다.
+GUI에서는 ConversionWorker가 이 엔진을 감싸 Qt 시그널로 중계하고,
+스크립트/서비스에서는 Qt 이벤트 루프 없이 직접 사용할 수 있다.
+"""
+
+import time
+import queue
+import importlib.util
+import asyncio
+import warnings
+import threading
+from contextlib import contextmanager
+from enum import Enum
+from pathlib import Path
+from datetime import datetime
+from dataclasses import dataclass
+from typing import List, Optional, Dict, Any, Callable, Iterator, AsyncIterator, TYPE_CHECKING
+
+# MarkItDown은 모든 변환기(numpy, magika, bs4 등)를 함께 로드하므로 가용성만 확인하고
+# 실제 import는 첫 변환 또는 백그라운드 워밍업 시점으로 미룬다 (load_markitdown)
+MARKITDOWN_AVAILABLE = importlib.util.find_spec("markitdown") is not None
+MarkItDown = None
+_markitdown_import_lock = threading.Lock()
+
+from .models import (
+    FileInfo, ConversionResult, ConversionStatus,
+    ConversionProgress, ConversionProgressStatus,
+    FileConflictStatus, FileConflictPolicy,
+    create_markdown_output_path  # Kept for backward compatibility and fallback
+)
+from .constants import CACHE_NAMESPACE_CONVERSION
+from .utils import create_conversion_metadata, resolve_markdown_output_path, atomic_write_text, reserve_unique_output_path
+from .file_conflict_handler import FileConflictHandler
+from .logger import get_logger
+from .memory_optimizer import MemoryOptimizer
+from .tracing import Tracer, activate_tracer, trace_span
+from .metrics import (
+    MetricsRegistry, get_metrics_registry, metric_name,
+    collect_circuit_breaker, collect_error_recovery, collect_llm_stats, collect_cache
+)
+
+# Enhanced error handling imports
+from .error_handling import (
+    CircuitBreaker, CircuitBreakerError,
+    FallbackManager, ErrorRecoveryManager,
+    ErrorReporter, ErrorReport,
+    ConversionError, FontDescriptorError,
+    MarkItDownError, categorize_exception
+)
+from .validators import DocumentValidator, ValidationLevel
+
+# OCR service (LLMManager, OCRService) imports are deferred until OCR is enabled
+from .models import LLMConfig, LLMProvider
+
+if TYPE_CHECKING:
+    from .search_index import SearchIndex  # 타입 표기 전용 (import 시 FTS5 확인으로 sqlite 연결을 엶)
+
+
+logger = get_logger(__name__)
+
+# 변환 중 발생한 경고를 스레드별로 수집 (warnings.catch_warnings는 전역 필터를 저장/복원하므로
+# 여러 워커 스레드에서 동시에 쓰면 필터가 뒤섞임)
+_warning_capture = threading.local()
+_warning_hook_lock = threading.Lock()
+_original_showwarning = None
+
+
+def _showwarning_hook(message, category, filename, lineno, file=None, line=None):
+    records = getattr(_warning_capture, "records", None)
+    if records is None:
+        _original_showwarning(message, category, filename, lineno, file, line)
+    else:
+        records.append(warnings.WarningMessage(message, category, filename, lineno, file, line))
+
+
+def _install_warning_hook():
+    """showwarning 훅과 FontBBox 경고용 필터를 한 번만 설치 (다른 경고 필터는 건드리지 않음)"""
+    global _original_showwarning
+    if warnings.showwarning is _showwarning_hook:
+        return
+    with _warning_hook_lock:
+        if warnings.showwarning is not _showwarning_hook:
+            _original_showwarning = warnings.showwarning
+            warnings.showwarning = _showwarning_hook
+            # 같은 위치의 FontBBox 경고도 파일마다 다시 보고되도록
+            warnings.filterwarnings("always", message=".*FontBBox.*")
+
+
+@contextmanager
+def capture_warnings():
+    """현재 스레드에서 발생한 경고를 목록으로 수집 (출력하지 않음)"""
+    _install_warning_hook()
+    previous = getattr(_warning_capture, "records", None)
+    records: List[warnings.WarningMessage] = []
+    _warning_capture.records = records
+    try:
+        yield records
+    finally:
+        _warning_capture.records = previous
+
+
+def load_markitdown():
+    """
+    MarkItDown 클래스 로드 (최초 호출 시 import)
+    
+    Returns:
+        MarkItDown 클래스 또는 설치되지 않은 경우 None
+    """
+    global MarkItDown, MARKITDOWN_AVAILABLE
+    if MarkItDown is None and MARKITDOWN_AVAILABLE:
+        with _markitdown_import_lock:
+            if MarkItDown is None:
+                try:
+                    from markitdown import MarkItDown as markitdown_class
+                    MarkItDown = markitdown_class
+                except ImportError as e:
+                    logger.warning(f"MarkItDown import 실패: {e}")
+                    MARKITDOWN_AVAILABLE = False
+    return MarkItDown
+
+
+class ConversionEventType(Enum):
+    """변환 이벤트 종류"""
+    PROGRESS = "progress"
+    FILE_STARTED = "file_started"
+    FILE_COMPLETED = "file_completed"
+    CONFLICT_DETECTED = "conflict_detected"
+    ERROR_REPORTED = "error_reported"
+    BATCH_COMPLETED = "batch_completed"
+    CANCELLED = "cancelled"
+    ERROR = "error"
+
+
+@dataclass
+class ConversionEvent:
+    """변환 엔진이 발생시키는 이벤트"""
+    type: ConversionEventType
+    progress: Optional[ConversionProgress] = None
+    file_info: Optional[FileInfo] = None
+    result: Optional[ConversionResult] = None
+    results: Optional[List[ConversionResult]] = None
+    conflict_info: Any = None
+    error_report: Optional[ErrorReport] = None
+    message: str = ""
+    
+    @property
+    def is_terminal(self) -> bool:
+        """배치의 마지막 이벤트인지 여부"""
+        return self.type in (ConversionEventType.BATCH_COMPLETED,
+                             ConversionEventType.CANCELLED,
+                             ConversionEventType.ERROR)
+
+
+ConversionEventListener = Callable[[ConversionEvent], None]
+
+
+class ConversionEngine:
+    """Qt-free conversion pipeline with validation, recovery and event callbacks"""
+    
+    def __init__(self, output_directory: Path,
+                 memory_optimizer: Optional[MemoryOptimizer] = None,
+                 conflict_handler: Optional[FileConflictHandler] = None,
+                 save_to_original_dir: bool = True,
+                 validation_level: ValidationLevel = ValidationLevel.STANDARD,
+                 enable_recovery: bool = True, config_manager=None,
+                 file_interval: float = 0.0, overwrite_outputs: bool = False,
+                 tracer: Optional[Tracer] = None, metrics: Optional[MetricsRegistry] = None,
+                 search_index: Optional["SearchIndex"] = None):
+        """
+        Args:
+            output_directory: 출력 디렉토리 (원본 디렉토리에 저장하지 않는 경우)
+            memory_optimizer: 공유 메모리 최적화기 (캐시 포함)
+            conflict_handler: 파일 충돌 처리기
+            save_to_original_dir: 원본 파일 옆에 저장할지 여부
+            validation_level: 변환 전 검증 수준
+            enable_recovery: 오류 복구 사용 여부
+            config_manager: OCR 설정을 읽을 ConfigManager (선택)
+            file_interval: 파일 사이 대기 시간(초) - GUI의 CPU 부하 완화용
+            overwrite_outputs: 기존 출력 파일을 고유 이름 생성/충돌 처리 없이 덮어쓰기
+                (증분 배치에서 오래된 출력을 갱신할 때 사용)
+            tracer: 단계별 구간을 기록할 Tracer (배치 단위로 설정, None이면 추적 안 함)
+            metrics: 파일별 처리량/지연 시간을 기록할 레지스트리 (기본값: 전역 레지스트리)
+            search_index: 저장한 출력을 바로 색인할 SearchIndex (None이면 색인 안 함)
+        """
+        self.output_directory = output_directory
+        self.tracer = tracer
+        self.metrics = metrics or get_metrics_registry()
+        self.file_interval = file_interval
+        self._overwrite_outputs = overwrite_outputs
+        self._cancel_event = threading.Event()
+        self._listeners: List[ConversionEventListener] = []
+        self._markitdown = None
+        self._markitdown_lock = threading.Lock()
+        self._memory_optimizer = memory_optimizer or MemoryOptimizer()
+        self._conflict_handler = conflict_handler or FileConflictHandler()
+        self._save_to_original_dir = save_to_original_dir
+        self._config_manager = config_manager
+        self._search_index = search_index
+        
+        # Enhanced error handling components
+        self._circuit_breaker = CircuitBreaker("conversion_engine")
+        self._fallback_manager = FallbackManager()
+        self._error_recovery_manager = ErrorRecoveryManager(self._fallback_manager) if enable_recovery else None
+        self._error_reporter = ErrorReporter()
+        self._document_validator = DocumentValidator(validation_level)
+        
+        # Set up error reporter callback
+        self._error_reporter.set_error_callback(self._on_error_reported)
+
+        # Initialize OCR services
+        self._llm_manager = None
+        self._ocr_service = None
+        self._initialize_ocr_services()
+        self._register_metric_sources()
+
+        # 출력 디렉토리 생성 (원본 디렉토리에 저장하지 않는 경우만)
+        if not self._save_to_original_dir:
+            self.output_directory.mkdir(parents=True, exist_ok=True)
+    
+    # Event API
+    
+    def add_listener(self, listener: ConversionEventListener):
+        """이벤트 리스너 등록"""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+    
+    def remove_listener(self, listener: ConversionEventListener):
+        """이벤트 리스너 제거"""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+    
+    def _emit(self, event: ConversionEvent):
+        """등록된 모든 리스너에 이벤트 전달 (리스너 오류는 변환을 중단하지 않음)"""
+        for listener in list(self._listeners):
+            try:
+                listener(event)
+            except Exception as e:
+                logger.error(f"Conversion event listener failed ({event.type.value}): {e}")
+    
+    def cancel(self):
+        """변환 취소"""
+        self._cancel_event.set()
+        logger.info("변환 취소 요청됨")
+    
+    def is_cancelled(self) -> bool:
+        """취소 요청 여부"""
+        return self._cancel_event.is_set()
+    
+    def _ensure_markitdown(self):
+        """MarkItDown 인스턴스 생성 (최초 사용 시)"""
+        if self._markitdown is None:
+            with self._markitdown_lock:
+                if self._markitdown is None:
+                    with trace_span("markitdown_init"):
+                        markitdown_class = load_markitdown() if MARKITDOWN_AVAILABLE else None
+                        if markitdown_class is None:
+                            raise ConversionError("MarkItDown library not available",
+                                                  error_code="MARKITDOWN_UNAVAILABLE")
+                        self._markitdown = markitdown_class()
+        return self._markitdown
+    
+    def _initialize_ocr_services(self):
+        """Initialize OCR services when enabled in config"""
+        try:
+            if not self._config_manager:
+                logger.debug("No config manager provided, skipping OCR initialization")
+                return
+
+            config = self._config_manager.get_config()
+            if not config or not hasattr(config, 'enable_llm_ocr') or not config.enable_llm_ocr:
+                logger.debug("LLM OCR not enabled in config, skipping OCR initialization")
+                return
+
+            logger.info("Initializing OCR services...")
+
+            # Create LLM configuration from app config
+            provider_name = getattr(config, 'llm_provider', 'openai')
+            provider_enum = LLMProvider.OPENAI  # default
+            try:
+                if provider_name.lower() == 'azure':
+                    provider_enum = LLMProvider.AZURE
+                elif provider_name.lower() == 'local':
+                    provider_enum = LLMProvider.LOCAL
+                elif provider_name.lower() == 'anthropic':
+                    provider_enum = LLMProvider.ANTHROPIC
+            except Exception:
+                logger.warning(f"Unknown provider '{provider_name}', using OpenAI")
+
+            llm_config = LLMConfig(
+                provider=provider_enum,
+                model=getattr(config, 'llm_model', 'gpt-4o-mini'),
+                base_url=getattr(config, 'llm_base_url', None),
+                api_version=getattr(config, 'llm_api_version', None),
+                temperature=getattr(config, 'llm_temperature', 0.1),
+                max_tokens=getattr(config, 'llm_max_tokens', 4096),
+                enable_ocr=config.enable_llm_ocr,
+                ocr_language=getattr(config, 'ocr_language', 'auto'),
+                max_image_size=getattr(config, 'max_image_size', 1024),
+                system_prompt=getattr(config, 'llm_system_prompt', ''),
+                track_usage=getattr(config, 'track_token_usage', True),
+                usage_limit_monthly=getattr(config, 'token_usage_limit_monthly', 100000)
+            )
+
+            # Get API key from secure storage
+            try:
+                api_key = self._config_manager.get_llm_api_key()
+                if not api_key:
+                    logger.warning("No API key available for LLM OCR service")
+                    return
+                llm_config.api_key = api_key
+            except Exception as e:
+                logger.warning(f"Failed to get API key for LLM OCR: {e}")
+                return
+
+            # OCR 스택(aiohttp, PIL 등)은 OCR이 활성화된 경우에만 로드
+            from .llm_manager import LLMManager
+            from .ocr_service import OCRService, OCRServiceConfig
+
+            # Initialize LLM Manager with config directory
+            config_dir = Path("config")
+            self._llm_manager = LLMManager(config_dir)
+
+            # Configure LLM Manager with LLM config
+            if not self._llm_manager.configure(llm_config):
+                logger.warning("Failed to configure LLM Manager")
+                return
+
+            logger.debug("LLM Manager initialized and configured successfully")
+
+            # Create OCR service configuration
+            ocr_config = OCRServiceConfig(
+                enabled=config.enable_llm_ocr,
+                fallback_to_tesseract=True,
+                max_image_size=getattr(config, 'max_image_size', 1024),
+                supported_formats=['jpg', 'jpeg', 'png', 'gif', 'bmp', 'tiff', 'webp'],
+                enable_preprocessing=getattr(config, 'enable_image_preprocessing', True),
+                preprocessing_config={
+                    'mode': getattr(config, 'preprocessing_mode', 'auto'),
+                    'quality_threshold': getattr(config, 'preprocessing_quality_threshold', 0.6),
+                    'enabled_enhancements': getattr(config, 'preprocessing_enabled_enhancements',
+                                                   ['deskew', 'contrast', 'brightness', 'sharpening', 'noise_reduction']),
+                    'enable_parallel_processing': getattr(config, 'preprocessing_enable_parallel', True),
+                    'cache_strategy': getattr(config, 'preprocessing_cache_strategy', 'memory')
+                }
+            )
+
+            # Initialize OCR Service
+            self._ocr_service = OCRService(self._llm_manager, ocr_config)
+            logger.info("OCR services initialized successfully")
+
+        except ImportError as e:
+            logger.info(f"OCR dependencies not available: {e}")
+        except Exception as e:
+            logger.error(f"Failed to initialize OCR services: {e}", exc_info=True)
+            # Don't raise exception - OCR is optional functionality
+            self._llm_manager = None
+            self._ocr_service = None
+
+    def _register_metric_sources(self):
+        """dict 통계만 제공하는 구성 요소를 메트릭 레지스트리에 등록"""
+        self.metrics.register_source(self._circuit_breaker, collect_circuit_breaker)
+        self.metrics.register_source(self._memory_optimizer, collect_cache)
+        if self._error_recovery_manager:
+            self.metrics.register_source(self._error_recovery_manager, collect_error_recovery)
+        if self._llm_manager is not None:
+            self.metrics.register_source(self._llm_manager, collect_llm_stats)
+
+    def _record_metrics(self, file_info: FileInfo, result: ConversionResult):
+        """파일별 처리 결과, 입력 크기, 변환 시간 기록"""
+        file_format = file_info.file_type.value
+        self.metrics.counter(
+            metric_name("conversions_total"), "Files processed by result and format",
+            ("status", "format")
+        ).inc(status=result.status.value, format=file_format)
+        self.metrics.counter(
+            metric_name("input_bytes_total"), "Input bytes processed by format", ("format",)
+        ).inc(file_info.size or 0, format=file_format)
+        if result.conversion_time is not None:
+            self.metrics.histogram(
+                metric_name("conversion_duration_seconds"), "Per-file conversion latency",
+                ("format",)
+            ).observe(result.conversion_time, format=file_format)
+
+    def run(self, files: List[FileInfo]) -> List[ConversionResult]:
+        """
+        배치 변환 실행 (호출한 스레드에서 동기 실행)
+        
+        Args:
+            files: 변환할 파일 목록
+        
+        Returns:
+            변환 결과 목록 (취소된 경우 그 시점까지의 결과)
+        """
+        results: List[ConversionResult] = []
+        self._cancel_event.clear()
+        
+        if not MARKITDOWN_AVAILABLE:
+            self._emit(ConversionEvent(ConversionEventType.ERROR,
+                                       message="MarkItDown 라이브러리가 설치되지 않았습니다."))
+            return results
+        
+        try:
+            logger.info(f"파일 변환 시작: {len(files)}개 파일")
+            
+            # 메모리 추적 시작
+            self._memory_optimizer.start_monitoring()
+            
+            # MarkItDown 인스턴스 생성
+            self._ensure_markitdown()
+            
+            total_files = len(files)
+            completed_files = 0
+            
+            # 진행률 초기화
+            progress = ConversionProgress(
+                total_files=total_files,
+                completed_files=0,
+                current_status="변환 시작",
+                current_progress_status=ConversionProgressStatus.INITIALIZING,
+                start_time=datetime.now()
+            )
+            self._emit(ConversionEvent(ConversionEventType.PROGRESS, progress=progress))
+            
+            # 순차 변환 (안정성을 위해)
+            for file_info in files:
+                if self.is_cancelled():
+                    logger.info("변환이 취소되었습니다")
+                    self._emit(ConversionEvent(ConversionEventType.CANCELLED, results=results))
+                    return results
+                
+                # 파일 변환 시작 이벤트
+                self._emit(ConversionEvent(ConversionEventType.FILE_STARTED, file_info=file_info))
+                
+                # 진행률 업데이트
+                progress.current_file = file_info.name
+                progress.current_file_id = file_info.file_id
+                progress.current_status = f"변환 중: {file_info.name}"
+                progress.current_progress_status = ConversionProgressStatus.PROCESSING
+                self._emit(ConversionEvent(ConversionEventType.PROGRESS, progress=progress))
+                
+                # 변환 실행
+                result = self.convert_file(file_info)
+                results.append(result)
+                
+                # 변환 완료 이벤트
+                self._emit(ConversionEvent(ConversionEventType.FILE_COMPLETED,
+                                           file_info=file_info, result=result))
+                
+                completed_files += 1
+                progress.completed_files = completed_files
+                progress.current_status = f"완료: {completed_files}/{total_files}"
+                self._emit(ConversionEvent(ConversionEventType.PROGRESS, progress=progress))
+                
+                # CPU 부하 완화 (취소 시 즉시 깨어남)
+                if self.file_interval > 0:
+                    self._cancel_event.wait(self.file_interval)
+            
+            logger.info(f"변환 완료: {len(results)}개 파일")
+            
+            # 메모리 사용량 로깅
+            memory_stats = self._memory_optimizer.get_memory_statistics()
+            logger.info(f"메모리 사용량 - Peak: {memory_stats['peak_memory_mb']:.1f}MB, Cache hits: {memory_stats.get('cache_stats', {}).get('hits', 0)}")
+            
+            self._emit(ConversionEvent(ConversionEventType.BATCH_COMPLETED, results=results))
+            
+        except Exception as e:
+            logger.error(f"변환 중 오류: {e}")
+            self._emit(ConversionEvent(ConversionEventType.ERROR, message=str(e), results=results))
+        finally:
+            # 메모리 정리 (변환 결과 캐시는 다음 배치를 위해 유지)
+            self._memory_optimizer.cleanup(preserve_namespaces=(CACHE_NAMESPACE_CONVERSION,))
+        
+        return results
+    
+    def iter_events(self, files: List[FileInfo]) -> Iterator[ConversionEvent]:
+        """
+        백그라운드 스레드에서 배치를 실행하며 이벤트를 순서대로 반환
+        
+        이터레이터를 끝까지 소비하지 않고 중단하면 변환이 취소된다.
+        """
+        events: "queue.Queue[Optional[ConversionEvent]]" = queue.Queue()
+        
+        def run_batch():
+            self.add_listener(events.put)
+            try:
+                self.run(files)
+            finally:
+                self.remove_listener(events.put)
+                events.put(None)
+        
+        thread = threading.Thread(target=run_batch, name="ConversionEngine", daemon=True)
+        thread.start()
+        try:
+            while True:
+                event = events.get()
+                if event is None:
+                    break
+                yield event
+        finally:
+            if thread.is_alive():
+                self.cancel()
+            thread.join()
+    
+    async def stream(self, files: List[FileInfo]) -> AsyncIterator[ConversionEvent]:
+        """
+        asyncio 환경용 이벤트 스트림
+        
+        변환은 기본 executor 스레드에서 실행되고 이벤트는 이벤트 루프로 전달된다.
+        """
+        loop = asyncio.get_running_loop()
+        events: "asyncio.Queue[Optional[ConversionEvent]]" = asyncio.Queue()
+        
+        def forward(event: ConversionEvent):
+            loop.call_soon_threadsafe(events.put_nowait, event)
+        
+        def run_batch():
+            self.add_listener(forward)
+            try:
+                self.run(files)
+            finally:
+                self.remove_listener(forward)
+                loop.call_soon_threadsafe(events.put_nowait, None)
+        
+        task = loop.run_in_executor(None, run_batch)
+        try:
+            while True:
+                event = await events.get()
+                if event is None:
+                    break
+                yield event
+        finally:
+            if not task.done():
+                self.cancel()
+            await task
+    
+    def convert_file(self, file_info: FileInfo, output_path: Optional[Path] = None) -> ConversionResult:
+        """
+        Enhanced single file conversion with validation and error recovery
+        
+        Args:
+            file_info: 변환할 파일
+            output_path: 고정 출력 경로 (지정하면 고유 이름 생성/충돌 처리 없이 이 경로를 교체)
+        """
+        tracer = self.tracer
+        if tracer is None:
+            result = self._convert_file(file_info, output_path)
+        else:
+            # OCR 서비스 등 하위 단계도 같은 Tracer에 기록되도록 컨텍스트에 활성화
+            with activate_tracer(tracer), \
+                    tracer.span("convert_file", "file", path=str(file_info.path), size=file_info.size) as span:
+                result = self._convert_file(file_info, output_path)
+                span.set(status=result.status.value)
+        self._record_metrics(file_info, result)
+        return result
+    
+    def _convert_file(self, file_info: FileInfo, fixed_output_path: Optional[Path] = None) -> ConversionResult:
+        start_time = time.time()
+        
+        try:
+            logger.debug(f"파일 변환 시작: {file_info.path}")
+            self._ensure_markitdown()
+            
+            # Pre-conversion validation
+            file_info.progress_status = ConversionProgressStatus.VALIDATING_FILE
+            with trace_span("validation"):
+                is_valid = self._validate_file_pre_conversion(file_info)
+            if not is_valid:
+                # Validation failed - try recovery if enabled
+                if self._error_recovery_manager:
+                    validation_error = ConversionError(
+                        f"File validation failed for {file_info.name}",
+                        file_info.path,
+                        error_code="VALIDATION_FAILED"
+                    )
+                    return self._attempt_error_recovery(validation_error, file_info, start_time)
+                else:
+                    return self._create_failed_result(file_info, "파일 검증 실패", start_time)
+            
+            # 메모리 체크 및 정리
+            if self._memory_optimizer.should_trigger_gc():
+                with trace_span("gc"):
+                    self._memory_optimizer.force_gc()
+            
+            # 출력 파일 경로 생성 - 새로운 보안 강화 유틸리티 사용
+            file_info.progress_status = ConversionProgressStatus.CHECKING_CONFLICTS
+            logger.debug(f"Generating output path for {file_info.path} using resolve_markdown_output_path")
+            
+            with trace_span("conflicts"):
+                if fixed_output_path is not None:
+                    output_path = fixed_output_path
+                elif self._save_to_original_dir:
+                    # 원본 디렉토리에 저장하는 경우, 구조 보존하지 않음
+                    output_path = resolve_markdown_output_path(
+                        source_path=file_info.path,
+                        preserve_structure=False,
+                        output_base_dir=file_info.path.parent,
+                        ensure_unique=not self._overwrite_outputs
+                    )
+                else:
+                    # 지정된 출력 디렉토리에 저장하는 경우, 구조 보존 설정 유지
+                    output_path = resolve_markdown_output_path(
+                        source_path=file_info.path,
+                        preserve_structure=True,
+                        output_base_dir=self.output_directory,
+                        ensure_unique=not self._overwrite_outputs
+                    )
+                
+                # 충돌 감지 및 해결
+                if fixed_output_path is not None:
+                    file_info.output_path = output_path
+                    resolved = True
+                else:
+                    resolved = self._handle_file_conflicts(file_info, output_path)
+            if not resolved:
+                return self._create_cancelled_result(file_info, output_path, start_time)
+            
+            # Update output path after conflict resolution
+            output_path = file_info.output_path
+            # 덮어쓰기로 정한 경로가 아니면 저장 시점에 이름을 원자적으로 예약 (병렬 변환 간 경쟁 방지)
+            replace_existing = (fixed_output_path is not None or self._overwrite_outputs
+                                or getattr(file_info, 'conflict_status', None) == FileConflictStatus.WILL_OVERWRITE)
+            
+            # Main conversion with circuit breaker protection
+            file_info.progress_status = ConversionProgressStatus.PROCESSING
+            
+            try:
+                # Use circuit breaker for conversion
+                conversion_result = self._circuit_breaker.call(
+                    self._perform_conversion_with_cache,
+                    file_info
+                )
+                
+                if not conversion_result or not conversion_result.strip():
+                    raise ConversionError("변환된 내용이 비어있습니다", file_info.path)
+                
+                # Successful conversion - finalize and save
+                return self._finalize_successful_conversion(file_info, conversion_result, output_path, start_time,
+                                                            replace_existing=replace_existing)
+                
+            except CircuitBreakerError as e:
+                # Circuit breaker is open - attempt fallback
+                logger.warning(f"Circuit breaker open for {file_info.name}: {e}")
+                circuit_error = ConversionError(
+                    f"Circuit breaker protection activated: {str(e)}",
+                    file_info.path,
+                    error_code="CIRCUIT_BREAKER_OPEN"
+                )
+                return self._attempt_error_recovery(circuit_error, file_info, start_time)
+                
+            except Exception as e:
+                # Handle conversion errors with recovery
+                conversion_error = self._categorize_and_handle_error(e, file_info)
+                return self._attempt_error_recovery(conversion_error, file_info, start_time)
+            
+        except Exception as e:
+            # Catch-all for unexpected errors
+            logger.error(f"Unexpected error in conversion: {e}", exc_info=True)
+            unexpected_error = ConversionError(
+                f"Unexpected conversion error: {str(e)}",
+                file_info.path,
+                is_recoverable=False,
+                error_code="UNEXPECTED_ERROR"
+            )
+            self._error_reporter.report_error(unexpected_error, file_info)
+            
+            return ConversionResult(
+                file_info=file_info,
+                status=ConversionStatus.FAILED,
+                error_message=str(unexpected_error),
+                conversion_time=time.time() - start_time,
+                progress_status=ConversionProgressStatus.ERROR,
+                progress_details=f"예상치 못한 오류: {str(e)}"
+            )
+    
+    def _validate_file_pre_conversion(self, file_info: FileInfo) -> bool:
+        """Pre-conversion validation with specific PDF FontBBox checks"""
+        try:
+            if self._document_validator.can_validate(file_info.path):
+                validation_result = self._document_validator.validate(file_info.path)
+                
+                if not validation_result.is_valid:
+                    logger.warning(f"Validation failed for {file_info.name}: {len(validation_result.critical_issues)} critical issues")
+                    
+                    # Report validation issues
+                    for issue in validation_result.critical_issues:
+                        self._error_reporter.report_error(
+                            ConversionError(issue.message, file_info.path, error_code=issue.code),
+                            file_info,
+                            "pre_conversion_validation"
+                        )
+                    
+                    return False
+                
+                # Check for font issues specifically
+                from .validators.pdf_validator import PDFValidationResult
+                if isinstance(validation_result, PDFValidationResult) and validation_result.font_issues:
+                    logger.warning(f"Font issues detected in {file_info.name}: {len(validation_result.font_issues)} issues")
+                    # Font issues don't block conversion but are noted for potential recovery
+            
+            return True
+            
+        except Exception as e:
+            logger.error(f"Validation error for {file_info.name}: {e}")
+            # Validation errors don't block conversion in standard mode
+            return True
+    
+    def _handle_file_conflicts(self, file_info: FileInfo, output_path: Path) -> bool:
+        """Handle file conflicts and update file_info"""
+        if self._overwrite_outputs:
+            file_info.output_path = output_path
+            return True
+        
+        conflict_info = self._conflict_handler.detect_conflict(file_info.path, output_path)
+        
+        if conflict_info.conflict_status == FileConflictStatus.EXISTS:
+            file_info.progress_status = ConversionProgressStatus.RESOLVING_CONFLICTS
+            file_info.conflict_status = conflict_info.conflict_status
+            
+            # 충돌 감지 이벤트 발생
+            self._emit(ConversionEvent(ConversionEventType.CONFLICT_DETECTED, conflict_info=conflict_info))
+            
+            # 충돌 해결
+            resolved_info = self._conflict_handler.resolve_conflict(conflict_info)
+            
+            if resolved_info.conflict_status == FileConflictStatus.WILL_SKIP:
+                logger.info(f"파일 건너뛰기: {file_info.path}")
+                return False
+            
+            # 해결된 경로 사용
+            if resolved_info.resolved_path:
+                output_path = resolved_info.resolved_path
+                file_info.resolved_output_path = output_path
+                file_info.conflict_status = resolved_info.conflict_status
+        
+        file_info.output_path = output_path
+        return True
+    
+    def _perform_conversion_with_cache(self, file_info: FileInfo) -> str:
+        """Perform conversion with caching and FontBBox warning capture"""
+        # Set up warning capture for FontBBox issues
+        with capture_warnings() as w:
+            
+            # 캐시에서 변환 결과 확인
+            cache_key = f"conversion_{file_info.path}_{file_info.size}_{file_info.modified_time.timestamp()}"
+            with trace_span("cache_lookup") as span:
+                cached_content = self._memory_optimizer.get_cached_result(cache_key, CACHE_NAMESPACE_CONVERSION)
+                span.set(hit=bool(cached_content))
+            
+            if cached_content:
+                logger.debug(f"캐시에서 변환 결과 사용: {file_info.path}")
+                return cached_content
+            
+            # MarkItDown으로 변환 (OCR 설정 적용)
+            try:
+                # OCR 설정 가져오기 (config_manager가 있는 경우)
+                config = None
+                if self._config_manager:
+                    config = self._config_manager.get_config()
+
+                # 이미지 파일인지 확인
+                image_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp'}
+                is_image_file = file_info.path.suffix.lower() in image_extensions
+
+                # OCR 처리 (이미지 파일이고 OCR 서비스가 사용 가능한 경우)
+                if is_image_file and config and hasattr(config, 'enable_llm_ocr') and config.enable_llm_ocr:
+                    if hasattr(self, '_ocr_service') and self._ocr_service is not None:
+                        # 우리의 OCRService 사용
+                        try:
+                            logger.info(f"Using OCRService for image file: {file_info.name}")
+                            # Use async extract_text_from_image method
+                            import asyncio
+                            with trace_span("ocr") as span:
+                                ocr_result = asyncio.run(self._ocr_service.extract_text_from_image(Path(file_info.path)))
+                                span.set(success=bool(ocr_result and ocr_result.is_success))
+
+                            if ocr_result and ocr_result.is_success and ocr_result.text:
+                                # OCR 성공 - Markdown 형식으로 포맷팅
+                                markdown_content = f"# {file_info.name}\n\n"
+                                markdown_content += "**Image OCR Result**\n\n"
+                                markdown_content += ocr_result.text
+
+                                # 품질 정보 추가 (있는 경우)
+                                if hasattr(ocr_result, 'confidence') and ocr_result.confidence:
+                                    markdown_content += f"\n\n---\n*OCR Confidence Score: {ocr_result.confidence:.2f}*"
+
+                                # 메타데이터 저장
+                                file_info.conversion_metadata = {
+                                    'ocr_method': 'OCRService',
+                                    'extraction_success': True,
+                                    'confidence': getattr(ocr_result, 'confidence', None),
+                                    'processing_time': getattr(ocr_result, 'processing_time', None)
+                                }
+
+                                logger.info(f"OCRService successfully processed {file_info.name}")
+                            else:
+                                # OCR 실패 - MarkItDown으로 폴백
+                                logger.warning(f"OCRService failed for {file_info.name}, falling back to MarkItDown")
+                                raise Exception("OCRService failed, fallback to MarkItDown")
+
+                        except Exception as ocr_error:
+                            logger.warning(f"OCRService error for {file_info.name}: {ocr_error}, falling back to MarkItDown")
+                            # MarkItDown 폴백 처리는 아래에서 수행
+                            pass
+
+                    # OCR 서비스가 없거나 실패한 경우 MarkItDown OCR 사용
+                    if 'markdown_content' not in locals():
+                        # OCR 옵션 준비 (MarkItDown 내장 OCR)
+                        conversion_kwargs = {
+                            'ocr_enabled': True,
+                            'ocr_language': getattr(config, 'ocr_language', 'auto'),
+                            'max_image_size': getattr(config, 'max_image_size', 1024)
+                        }
+                        logger.info(f"Using MarkItDown OCR for image file: {file_info.name}")
+
+                        # 변환 실행
+                        with trace_span("markitdown", ocr=True):
+                            conversion_result = self._markitdown.convert(str(file_info.path), **conversion_kwargs)
+                        markdown_content = conversion_result.text_content
+
+                        # OCR 메타데이터 저장
+                        file_info.conversion_metadata = {
+                            'ocr_method': 'MarkItDown',
+                            'metadata': getattr(conversion_result, 'metadata', {})
+                        }
+                else:
+                    # 이미지가 아니거나 OCR이 비활성화된 경우 일반 변환
+                    with trace_span("markitdown"):
+                        conversion_result = self._markitdown.convert(str(file_info.path))
+                    markdown_content = conversion_result.text_content
+
+                    # 메타데이터 저장 (이미지 파일인 경우)
+                    if is_image_file and hasattr(conversion_result, 'metadata'):
+                        file_info.conversion_metadata = getattr(conversion_result, 'metadata', {})
+                
+                # Check for FontBBox warnings
+                fontbbox_warnings = [
+                    warning for warning in w 
+                    if "FontBBox" in str(warning.message) and "None cannot be parsed as 4 floats" in str(warning.message)
+                ]
+                
+                if fontbbox_warnings:
+                    # Create FontDescriptorError from warning
+                    font_error = FontDescriptorError.from_markitdown_warning(
+                        str(fontbbox_warnings[0].message), 
+                        file_info.path
+                    )
+                    
+                    # Report the font error but continue conversion
+                    self._error_reporter.report_error(font_error, file_info, "markitdown_conversion")
+                    logger.warning(f"FontBBox warning captured for {file_info.name}: {font_error.message}")
+                
+                # 결과 캐싱
+                if markdown_content and len(markdown_content) < 10 * 1024 * 1024:  # 10MB 미만만 캐싱
+                    with trace_span("cache_store"):
+                        self._memory_optimizer.cache_result(cache_key, markdown_content, CACHE_NAMESPACE_CONVERSION)
+                
+                return markdown_content
+                
+            except Exception as e:
+                # Check if this is a FontBBox related error
+                error_message = str(e)
+                if "FontBBox" in error_message and ("None cannot be parsed" in error_message or "font descriptor" in error_message.lower()):
+                    raise FontDescriptorError.from_markitdown_warning(error_message, file_info.path)
+                else:
+                    raise MarkItDownError.wrap_exception(e, file_info.path)
+    
+    def _categorize_and_handle_error(self, error: Exception, file_info: FileInfo) -> ConversionError:
+        """Categorize exception into appropriate ConversionError type"""
+        conversion_error = categorize_exception(error, file_info.path)
+        
+        # Report the categorized error
+        self._error_reporter.report_error(conversion_error, file_info, "conversion")
+        
+        return conversion_error
+    
+    def _attempt_error_recovery(self, error: ConversionError, file_info: FileInfo, start_time: float) -> ConversionResult:
+        """Attempt error recovery using the recovery manager"""
+        if not self._error_recovery_manager:
+            return self._create_failed_result(file_info, str(error), start_time)
+        
+        try:
+            # Attempt recovery
+            with trace_span("recovery", error_code=getattr(error, 'error_code', None)) as span:
+                recovery_result = self._error_recovery_manager.recover_from_error(
+                    error, file_info, file_info.output_path, 
+                    original_converter=lambda fi: self._perform_conversion_with_cache(fi)
+                )
+                span.set(success=recovery_result.success,
+                         action=getattr(recovery_result.action_taken, 'value', None))
+            
+            if recovery_result.success and recovery_result.result:
+                logger.info(f"Recovery successful for {file_info.name} using {recovery_result.action_taken.value}")
+                return recovery_result.result
+            else:
+                logger.warning(f"Recovery failed for {file_info.name}: {recovery_result.error}")
+                return self._create_failed_result(
+                    file_info, 
+                    f"변환 실패 (복구 시도 실패: {recovery_result.action_taken.value}): {str(error)}", 
+                    start_time,
+                    recovery_details=recovery_result.recovery_details
+                )
+                
+        except Exception as recovery_exception:
+            logger.error(f"Error recovery process failed: {recovery_exception}")
+            return self._create_failed_result(file_info, str(error), start_time)
+    
+    def _finalize_successful_conversion(self, file_info: FileInfo, markdown_content: str, 
+                                      output_path: Path, start_time: float,
+                                      replace_existing: bool = True) -> ConversionResult:
+        """Finalize successful conversion"""
+        # 메타데이터 추가
+        file_info.progress_status = ConversionProgressStatus.FINALIZING
+        conversion_time = time.time() - start_time
+        with trace_span("metadata"):
+            metadata = create_conversion_metadata(file_info.path, conversion_time)
+            
+            # 메타데이터를 마크다운 헤더로 추가
+            metadata_header = self._create_metadata_header(file_info, metadata)
+            final_content = metadata_header + "\n\n" + markdown_content
+        
+        # 파일 저장
+        file_info.progress_status = ConversionProgressStatus.WRITING_OUTPUT
+        with trace_span("write", bytes=len(final_content)):
+            saved_path = self._save_converted_content(final_content, output_path, replace_existing)
+        file_info.output_path = saved_path
+        
+        if self._search_index is not None:
+            with trace_span("index"):
+                self._index_output(saved_path, final_content)
+        
+        file_info.progress_status = ConversionProgressStatus.COMPLETED
+        logger.info(f"변환 성공: {file_info.path} -> {saved_path}")
+        
+        # 충돌 해결 정보 포함
+        conflict_status = getattr(file_info, 'conflict_status', FileConflictStatus.NONE)
+        applied_policy, original_output_path = self._get_conflict_resolution_info(file_info, conflict_status)
+        
+        return ConversionResult(
+            file_info=file_info,
+            status=ConversionStatus.SUCCESS,
+            output_path=saved_path,
+            conversion_time=conversion_time,
+            metadata=metadata,
+            conflict_status=conflict_status,
+            applied_policy=applied_policy,
+            original_output_path=original_output_path,
+            progress_status=ConversionProgressStatus.COMPLETED
+        )
+    
+    def _get_conflict_resolution_info(self, file_info: FileInfo, conflict_status: FileConflictStatus) -> tuple:
+        """Get conflict resolution information"""
+        applied_policy = None
+        original_output_path = None
+        
+        if conflict_status != FileConflictStatus.NONE:
+            if conflict_status == FileConflictStatus.WILL_OVERWRITE:
+                applied_policy = FileConflictPolicy.OVERWRITE
+            elif conflict_status == FileConflictStatus.WILL_RENAME:
+                applied_policy = FileConflictPolicy.RENAME
+                # 원래 출력 경로 생성 - 새로운 보안 강화 유틸리티 사용
+                try:
+                    if self._save_to_original_dir:
+                        original_output_path = resolve_markdown_output_path(
+                            source_path=file_info.path,
+                            preserve_structure=False,
+                            output_base_dir=file_info.path.parent,
+                            ensure_unique=False
+                        )
+                    else:
+                        original_output_path = resolve_markdown_output_path(
+                            source_path=file_info.path,
+                            preserve_structure=True,
+                            output_base_dir=self.output_directory,
+                            ensure_unique=False
+                        )
+                except (ValueError, OSError) as e:
+                    logger.error(f"원본 출력 경로 생성 실패: {e}")
+                    # 폴백으로 기존 방식 사용
+                    original_output_path = create_markdown_output_path(
+                        file_info.path, 
+                        self.output_directory if not self._save_to_original_dir else None,
+                        self._save_to_original_dir
+                    )
+        
+        return applied_policy, original_output_path
+    
+    def _create_failed_result(self, file_info: FileInfo, error_message: str, start_time: float,
+                            recovery_details: Optional[Dict[str, Any]] = None) -> ConversionResult:
+        """Create a failed conversion result"""
+        file_info.progress_status = ConversionProgressStatus.ERROR
+        conversion_time = time.time() - start_time
+        
+        metadata = {"recovery_details": recovery_details} if recovery_details else {}
+        
+        return ConversionResult(
+            file_info=file_info,
+            status=ConversionStatus.FAILED,
+            error_message=error_message,
+            conversion_time=conversion_time,
+            progress_status=ConversionProgressStatus.ERROR,
+            progress_details=f"오류: {error_message}",
+            metadata=metadata
+        )
+    
+    def _create_cancelled_result(self, file_info: FileInfo, output_path: Path, start_time: float) -> ConversionResult:
+        """Create a cancelled conversion result"""
+        return ConversionResult(
+            file_info=file_info,
+            status=ConversionStatus.CANCELLED,
+            conflict_status=FileConflictStatus.WILL_SKIP,
+            applied_policy=FileConflictPolicy.SKIP,
+            original_output_path=output_path,
+            conversion_time=time.time() - start_time,
+            progress_status=ConversionProgressStatus.COMPLETED,
+            progress_details="사용자가 건너뛰기를 선택했습니다"
+        )
+    
+    def _on_error_reported(self, error_report: ErrorReport):
+        """Handle error report callback"""
+        self._emit(ConversionEvent(ConversionEventType.ERROR_REPORTED, error_report=error_report))
+    
+    def _save_converted_content(self, content: str, output_path: Path, replace_existing: bool = True) -> Path:
+        """
+        변환된 내용을 파일에 저장 (임시 파일 기록 후 교체 - 같은 경로에 동시에 써도 파일이 섞이지 않음)
+        
+        replace_existing이 False면 output_path부터 고유 이름을 원자적으로 예약해 그 경로에 저장한다.
+        """
+        reserved = None
+        try:
+            # 출력 디렉토리 생성
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            if not replace_existing:
+                output_path = reserved = reserve_unique_output_path(output_path)
+            
+            # 파일 저장
+            atomic_write_text(output_path, content)
+            
+            return output_path
+            
+        except Exception as e:
+            if reserved is not None:
+                try:
+                    reserved.unlink()
+                except OSError:
+                    pass
+            logger.error(f"파일 저장 실패 ({output_path}): {e}")
+            raise ValueError(f"파일 저장 실패: {str(e)}")
+    
+    def _index_output(self, saved_path: Path, content: str):
+        """저장한 출력을 전문 검색 색인에 반영 (실패해도 변환은 성공으로 처리)"""
+        try:
+            self._search_index.index_document(saved_path, content)
+        except Exception as e:
+            logger.warning(f"검색 색인 실패 ({saved_path}): {e}")
+    
+    def _create_metadata_header(self, file_info: FileInfo, metadata: Dict[str, Any]) -> str:
+        """메타데이터 헤더 생성"""
+        header_lines = [
+            "---",
+            "# 변환 정보",
+            f"- **원본 파일**: {file_info.name}",
+            f"- **파일 크기**: {file_info.size_formatted}",
+            f"- **파일 타입**: {file_info.file_type.value.upper()}",
+            f"- **수정일**: {file_info.modified_time.strftime('%Y-%m-%d %H:%M:%S')}",
+            f"- **변환일**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            f"- **변환 시간**: {metadata.get('conversion_time_formatted', 'N/A')}",
+            "---"
+        ]
+        return "\n".join(header_lines)
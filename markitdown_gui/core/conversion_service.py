@@ -0,0 +1,476 @@
+"""
+로컬 변환 서비스
+HTTP API로 변환 작업을 받아 공유 워커 풀에서 처리하는 서버 모드
+
+같은 호스트의 여러 데스크톱 클라이언트와 스크립트가 하나의 서비스에 작업을 제출하여
+MarkItDown/OCR 인스턴스와 변환 캐시를 공유한다. 작업은 JobQueue(SQLite)에 저장되므로
+서비스가 재시작되어도 남은 항목을 이어서 처리한다.
+
+API (JSON):
+    GET    /health                              서비스 상태
+    GET    /metrics                             Prometheus 텍스트 형식 메트릭
+    GET    /jobs                                최근 작업 목록
+    POST   /jobs                                {"paths": [...]} 경로로 작업 제출
+    POST   /jobs/upload?filename=<name>         요청 본문(파일 바이트)으로 작업 제출
+    GET    /jobs/<id>                           작업 상태 조회
+    GET    /jobs/<id>/events                    상태 변경을 NDJSON으로 스트리밍 (완료 시 종료)
+    GET    /jobs/<id>/items/<idx>/markdown      변환된 Markdown 반환
+    DELETE /jobs/<id>                           대기 항목 취소
+
+보안: API에는 인증이 없고 서비스 프로세스가 읽을 수 있는 모든 경로를 제출/변환할 수 있으므로
+반드시 loopback 주소(기본값 127.0.0.1)에만 바인딩해야 한다. 업로드 파일은 해당 작업이 끝나면
+(완료/실패/취소) 삭제된다.
+"""
+
+import re
+import json
+import time
+import shutil
+import ipaddress
+import threading
+from pathlib import Path
+from http import HTTPStatus
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+from typing import List, Optional, Dict, Any
+
+from .models import ConversionStatus
+from .config_manager import ConfigManager
+from .conversion_engine import ConversionEngine
+from .file_conflict_handler import FileConflictHandler
+from .memory_optimizer import MemoryOptimizer
+from .job_queue import JobQueue, JobItemStatus, is_finished_status
+from .metrics import (
+    MetricFamily, GAUGE, get_metrics_registry, metric_name, send_metrics_response
+)
+from .constants import (
+    SERVICE_DEFAULT_HOST, SERVICE_DEFAULT_PORT, SERVICE_EVENT_TIMEOUT, SERVICE_MAX_JSON_BODY,
+    MAX_WORKER_THREADS
+)
+from .utils import create_file_info, sanitize_filename, validate_file_extension
+from .logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class ServiceError(Exception):
+    """클라이언트 요청 오류 (HTTP 상태 코드 포함)"""
+
+    def __init__(self, message: str, status: HTTPStatus = HTTPStatus.BAD_REQUEST):
+        super().__init__(message)
+        self.status = status
+
+
+_ITEM_STATUS_MAP = {
+    ConversionStatus.SUCCESS: JobItemStatus.SUCCESS,
+    ConversionStatus.CANCELLED: JobItemStatus.CANCELLED,
+}
+
+
+class ConversionService:
+    """영속 작업 큐와 공유 워커 풀을 가진 변환 서비스"""
+
+    def __init__(self, config_manager: ConfigManager, data_dir: Path,
+                 workers: Optional[int] = None):
+        """
+        Args:
+            config_manager: 설정을 로드한 ConfigManager
+            data_dir: 큐 데이터베이스, 업로드, 변환 결과를 저장할 디렉토리
+            workers: 워커 스레드 수 (기본값: 설정의 max_workers)
+        """
+        self.config_manager = config_manager
+        self.data_dir = Path(data_dir).resolve()
+        self.upload_dir = self.data_dir / "uploads"
+        self.output_dir = self.data_dir / "output"
+        config = config_manager.get_config()
+        self.workers = max(1, min(workers or config.max_workers, MAX_WORKER_THREADS))
+
+        self.queue = JobQueue(self.data_dir / "jobs.sqlite3")
+        self._memory_optimizer = MemoryOptimizer()
+        self._conflict_handler = FileConflictHandler(config_manager.get_file_conflict_config())
+        self._local = threading.local()
+        self._threads: List[threading.Thread] = []
+        self._stop_event = threading.Event()
+        # 큐/작업 상태 변경 알림 (워커 깨우기, 이벤트 스트림)
+        self._changed = threading.Condition()
+        self._change_count = 0
+        self.metrics = get_metrics_registry()
+        self.metrics.register_source(self, _collect_service)
+
+    # Lifecycle
+
+    def start(self):
+        """중단된 항목을 복구하고 워커 스레드 시작"""
+        if self._threads:
+            return
+        self._stop_event.clear()
+        self.queue.recover()
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._worker_loop, name=f"ConversionService-{i}",
+                                      daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        logger.info(f"변환 서비스 시작: 워커 {self.workers}개, 데이터 {self.data_dir}")
+
+    def stop(self, timeout: float = 10.0):
+        """워커 종료 (진행 중인 항목은 완료까지 대기, 남은 항목은 큐에 유지)"""
+        self._stop_event.set()
+        self._notify()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads.clear()
+        logger.info("변환 서비스 종료")
+
+    def close(self):
+        """서비스 종료 및 큐 닫기"""
+        self.stop()
+        self.metrics.unregister_source(self)
+        self.queue.close()
+
+    # Job API
+
+    def submit_paths(self, paths: List[str]) -> Dict[str, Any]:
+        """로컬 파일 경로 목록으로 작업 제출"""
+        if not paths or not isinstance(paths, list):
+            raise ServiceError("'paths' must be a non-empty list")
+
+        resolved = []
+        supported = self.config_manager.get_config().supported_extensions
+        for raw_path in paths:
+            path = Path(str(raw_path)).expanduser().resolve()
+            if not path.is_file():
+                raise ServiceError(f"File not found: {raw_path}")
+            if supported and not validate_file_extension(path, supported):
+                raise ServiceError(f"Unsupported file type: {raw_path}")
+            resolved.append(path)
+
+        job_id = self.queue.submit(resolved, {"source": "paths"})
+        self._notify()
+        return self.queue.get_job(job_id)
+
+    def submit_upload(self, filename: str, data: bytes) -> Dict[str, Any]:
+        """업로드된 파일 바이트로 작업 제출"""
+        name = sanitize_filename(Path(filename or "").name)
+        if not name or not Path(name).suffix:
+            raise ServiceError("'filename' with an extension is required")
+        supported = self.config_manager.get_config().supported_extensions
+        if supported and not validate_file_extension(Path(name), supported):
+            raise ServiceError(f"Unsupported file type: {name}")
+
+        if len(data) > self.max_upload_bytes:
+            raise ServiceError("Uploaded file is too large", HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+
+        upload_dir = self.upload_dir / f"{time.time_ns():x}"
+        upload_dir.mkdir(parents=True, exist_ok=True)
+        path = upload_dir / name
+        path.write_bytes(data)
+
+        job_id = self.queue.submit([path], {"source": "upload", "filename": name})
+        self._notify()
+        return self.queue.get_job(job_id)
+
+    @property
+    def max_upload_bytes(self) -> int:
+        """업로드 허용 크기 (설정의 최대 파일 크기)"""
+        return self.config_manager.get_config().max_file_size_mb * 1024 * 1024
+
+    def get_job(self, job_id: str) -> Dict[str, Any]:
+        """작업 조회 (없으면 ServiceError)"""
+        job = self.queue.get_job(job_id)
+        if job is None:
+            raise ServiceError(f"Job not found: {job_id}", HTTPStatus.NOT_FOUND)
+        return job
+
+    def cancel_job(self, job_id: str) -> Dict[str, Any]:
+        """작업의 대기 항목 취소"""
+        if not self.queue.cancel(job_id):
+            raise ServiceError(f"Job not found: {job_id}", HTTPStatus.NOT_FOUND)
+        self._notify()
+        job = self.queue.get_job(job_id)
+        self._remove_uploads(job)
+        return job
+
+    def read_markdown(self, job_id: str, idx: int) -> str:
+        """변환된 Markdown 내용 반환"""
+        job = self.get_job(job_id)
+        items = job["items"]
+        if not 0 <= idx < len(items):
+            raise ServiceError(f"Item not found: {idx}", HTTPStatus.NOT_FOUND)
+        item = items[idx]
+        if item["status"] != JobItemStatus.SUCCESS.value or not item["output_path"]:
+            raise ServiceError(f"Item is not converted (status: {item['status']})",
+                               HTTPStatus.CONFLICT)
+        return Path(item["output_path"]).read_text(encoding="utf-8")
+
+    def wait_for_change(self, job_id: str, previous: Optional[Dict[str, Any]],
+                        timeout: float = SERVICE_EVENT_TIMEOUT) -> Dict[str, Any]:
+        """
+        작업 상태가 previous와 달라지거나 timeout이 지날 때까지 대기
+
+        Returns:
+            최신 작업 상태
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            # 조회는 잠금 밖에서 하고, 조회 중에 들어온 알림은 변경 횟수로 놓치지 않음
+            with self._changed:
+                seen = self._change_count
+            job = self.get_job(job_id)
+            remaining = deadline - time.monotonic()
+            if job != previous or remaining <= 0 or self._stop_event.is_set():
+                return job
+            with self._changed:
+                if self._change_count == seen:
+                    self._changed.wait(remaining)
+
+    def get_health(self) -> Dict[str, Any]:
+        """서비스 상태"""
+        return {
+            "status": "ok",
+            "workers": self.workers,
+            "pending_items": self.queue.pending_count(),
+            "cache": self._memory_optimizer.get_memory_statistics().get("cache_stats", {}),
+        }
+
+    # Workers
+
+    def _notify(self):
+        with self._changed:
+            self._change_count += 1
+            self._changed.notify_all()
+
+    def _worker_loop(self):
+        """대기 항목을 가져와 변환 (항목이 없으면 알림 대기)"""
+        while not self._stop_event.is_set():
+            try:
+                claimed = self.queue.claim_next()
+            except Exception as e:
+                logger.error(f"작업 큐 조회 실패: {e}")
+                claimed = None
+
+            if claimed is None:
+                with self._changed:
+                    self._changed.wait(1.0)
+                continue
+
+            job_id, idx, path = claimed
+            self._notify()
+            self._process_item(job_id, idx, path)
+            self._notify()
+
+    def _process_item(self, job_id: str, idx: int, path: Path):
+        """단일 항목 변환 및 결과 기록"""
+        start_time = time.time()
+        file_info = create_file_info(path)
+        if file_info is None:
+            self.queue.complete_item(job_id, idx, JobItemStatus.FAILED,
+                                     error=f"File not found: {path}",
+                                     duration=time.time() - start_time)
+            return
+
+        try:
+            engine = self._get_engine()
+            engine.output_directory = self.output_dir / job_id / str(idx)
+            result = engine.convert_file(file_info)
+            status = _ITEM_STATUS_MAP.get(result.status, JobItemStatus.FAILED)
+            self.queue.complete_item(job_id, idx, status, output_path=result.output_path,
+                                     error=result.error_message,
+                                     duration=result.conversion_time)
+        except Exception as e:
+            logger.error(f"서비스 변환 실패 ({path}): {e}")
+            self.queue.complete_item(job_id, idx, JobItemStatus.FAILED, error=str(e),
+                                     duration=time.time() - start_time)
+        finally:
+            self._remove_uploads(self.queue.get_job(job_id))
+
+    def _remove_uploads(self, job: Optional[Dict[str, Any]]):
+        """끝난 작업의 업로드 파일 삭제 (진행 중이면 마지막 항목을 처리한 워커가 삭제)"""
+        if job is None or not is_finished_status(job["status"]):
+            return
+        for item in job["items"]:
+            upload_dir = Path(item["path"]).parent
+            if upload_dir.parent != self.upload_dir:
+                continue
+            try:
+                shutil.rmtree(upload_dir)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"업로드 파일 삭제 실패 ({upload_dir}): {e}")
+
+    def _get_engine(self) -> ConversionEngine:
+        """워커 스레드별 변환 엔진 (캐시와 충돌 처리기는 공유)"""
+        engine = getattr(self._local, "engine", None)
+        if engine is None:
+            engine = ConversionEngine(
+                self.output_dir,
+                memory_optimizer=self._memory_optimizer,
+                conflict_handler=self._conflict_handler,
+                save_to_original_dir=False,
+                config_manager=self.config_manager
+            )
+            self._local.engine = engine
+        return engine
+
+
+def _collect_service(service: ConversionService):
+    """서비스 큐 상태 메트릭"""
+    return [
+        MetricFamily(metric_name("service_pending_items"), GAUGE,
+                     "Job items waiting in the service queue").add(service.queue.pending_count()),
+        MetricFamily(metric_name("service_workers"), GAUGE,
+                     "Conversion service worker threads").add(service.workers),
+    ]
+
+
+class ServiceRequestHandler(BaseHTTPRequestHandler):
+    """변환 서비스 HTTP 요청 처리기"""
+
+    server_version = "MarkItDownService/0.1"
+
+    _JOB_PATH = re.compile(r"^/jobs/([0-9a-f]{32})$")
+    _EVENTS_PATH = re.compile(r"^/jobs/([0-9a-f]{32})/events$")
+    _MARKDOWN_PATH = re.compile(r"^/jobs/([0-9a-f]{32})/items/(\d+)/markdown$")
+
+    @property
+    def service(self) -> ConversionService:
+        return self.server.service
+
+    def do_GET(self):
+        self._dispatch(self._handle_get)
+
+    def do_POST(self):
+        self._dispatch(self._handle_post)
+
+    def do_DELETE(self):
+        self._dispatch(self._handle_delete)
+
+    def _dispatch(self, handler):
+        try:
+            handler(urlparse(self.path))
+        except ServiceError as e:
+            self._send_json({"error": str(e)}, e.status)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        except Exception as e:
+            logger.error(f"서비스 요청 처리 오류 ({self.command} {self.path}): {e}")
+            self._send_json({"error": "Internal server error"}, HTTPStatus.INTERNAL_SERVER_ERROR)
+
+    def _handle_get(self, url):
+        if url.path == "/health":
+            return self._send_json(self.service.get_health())
+        if url.path == "/metrics":
+            return send_metrics_response(self, self.service.metrics)
+        if url.path == "/jobs":
+            return self._send_json({"jobs": self.service.queue.list_jobs()})
+
+        match = self._JOB_PATH.match(url.path)
+        if match:
+            return self._send_json(self.service.get_job(match.group(1)))
+
+        match = self._EVENTS_PATH.match(url.path)
+        if match:
+            return self._stream_events(match.group(1))
+
+        match = self._MARKDOWN_PATH.match(url.path)
+        if match:
+            content = self.service.read_markdown(match.group(1), int(match.group(2)))
+            return self._send_body(content.encode("utf-8"), "text/markdown; charset=utf-8")
+
+        raise ServiceError("Not found", HTTPStatus.NOT_FOUND)
+
+    def _handle_post(self, url):
+        if url.path == "/jobs":
+            try:
+                payload = json.loads(self._read_body(SERVICE_MAX_JSON_BODY,
+                                                     "Request body is too large") or b"{}")
+            except ValueError:
+                raise ServiceError("Request body must be JSON")
+            if not isinstance(payload, dict):
+                raise ServiceError("Request body must be a JSON object")
+            job = self.service.submit_paths(payload.get("paths"))
+            return self._send_json(job, HTTPStatus.ACCEPTED)
+
+        if url.path == "/jobs/upload":
+            body = self._read_body(self.service.max_upload_bytes, "Uploaded file is too large")
+            filename = parse_qs(url.query).get("filename", [""])[0]
+            job = self.service.submit_upload(filename, body)
+            return self._send_json(job, HTTPStatus.ACCEPTED)
+
+        raise ServiceError("Not found", HTTPStatus.NOT_FOUND)
+
+    def _handle_delete(self, url):
+        match = self._JOB_PATH.match(url.path)
+        if match:
+            return self._send_json(self.service.cancel_job(match.group(1)))
+        raise ServiceError("Not found", HTTPStatus.NOT_FOUND)
+
+    def _stream_events(self, job_id: str):
+        """작업 상태를 변경될 때마다 한 줄씩 전송 (종료 상태에서 연결 종료)"""
+        job = self.service.get_job(job_id)
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        while True:
+            self.wfile.write(json.dumps(job, ensure_ascii=False).encode("utf-8") + b"\n")
+            self.wfile.flush()
+            if is_finished_status(job["status"]):
+                return
+            job = self.service.wait_for_change(job_id, job)
+
+    def _read_body(self, limit: int, too_large_message: str) -> bytes:
+        """요청 본문 읽기 (Content-Length가 limit을 넘으면 읽지 않고 413)"""
+        raw_length = (self.headers.get("Content-Length") or "0").strip()
+        if not (raw_length.isascii() and raw_length.isdigit()):
+            raise ServiceError(f"Invalid Content-Length: {raw_length}")
+        length = int(raw_length)
+        if length > limit:
+            # 읽지 않은 본문이 남으므로 응답 후 연결을 닫음
+            self.close_connection = True
+            raise ServiceError(too_large_message, HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+        return self.rfile.read(length) if length > 0 else b""
+
+    def _send_json(self, payload: Dict[str, Any], status: HTTPStatus = HTTPStatus.OK):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self._send_body(body, "application/json; charset=utf-8", status)
+
+    def _send_body(self, body: bytes, content_type: str, status: HTTPStatus = HTTPStatus.OK):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+
+class ConversionServer(ThreadingHTTPServer):
+    """ConversionService를 노출하는 HTTP 서버"""
+
+    daemon_threads = True
+
+    def __init__(self, service: ConversionService,
+                 host: str = SERVICE_DEFAULT_HOST, port: int = SERVICE_DEFAULT_PORT):
+        self.service = service
+        super().__init__((host, port), ServiceRequestHandler)
+        if not _is_loopback(self.server_address[0]):
+            logger.warning(f"인증 없는 변환 서비스가 loopback이 아닌 주소에 바인딩됨: {host} "
+                           "(다른 호스트가 이 프로세스로 읽을 수 있는 모든 파일을 제출할 수 있음)")
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+def _is_loopback(host: str) -> bool:
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return host == "localhost"
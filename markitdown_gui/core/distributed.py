@@ -0,0 +1,522 @@
+"""
+분산 변환
+공유 파일시스템(NAS)의 작업 디렉토리를 통해 여러 변환 호스트가 하나의 배치를 나누어 처리
+
+작업 디렉토리 구조:
+    batch.json                          배치 매니페스트 (출력 설정, 항목 수)
+    pending/<item>.json                 대기 항목
+    leased/<item>.<node>.<token>.json   임대된 항목 (mtime = 마지막 하트비트)
+    done/<item>.<node>.<token>.json     완료 표시 (커밋 지점)
+    results/<item>.<node>.<token>.json  항목 변환 결과
+    nodes/<node>.json                   노드 상태
+    report.json                         병합된 결과 보고서
+
+모든 상태 전이는 같은 파일시스템 내 원자적 rename으로 수행한다.
+    - 임대: pending → leased (한 노드만 성공)
+    - 만료 회수: 하트비트가 끊긴 leased → pending (한 노드만 성공)
+    - 커밋: 결과 파일 기록 후 leased → done (임대를 잃은 노드는 실패하고 결과를 버림)
+임대 파일 이름에 노드와 토큰이 포함되므로 항목은 정확히 한 번만 커밋된다.
+"""
+
+import os
+import re
+import json
+import time
+import uuid
+import socket
+import threading
+from pathlib import Path
+from dataclasses import dataclass, field
+from typing import List, Optional, Dict, Any, Callable
+
+from .models import ConversionResult, ConversionStatus
+from .config_manager import ConfigManager
+from .conversion_engine import ConversionEngine
+from .file_conflict_handler import FileConflictHandler
+from .memory_optimizer import MemoryOptimizer
+from .batch_runner import result_to_record
+from .constants import (
+    DISTRIBUTED_LEASE_TIMEOUT, DISTRIBUTED_HEARTBEAT_INTERVAL,
+    DISTRIBUTED_POLL_INTERVAL, MAX_WORKER_THREADS
+)
+from .utils import (
+    atomic_write_text, create_file_info, resolve_markdown_output_path, sanitize_filename
+)
+from .logger import get_logger
+
+
+logger = get_logger(__name__)
+
+MANIFEST_FILE = "batch.json"
+REPORT_FILE = "report.json"
+
+_PENDING = "pending"
+_LEASED = "leased"
+_DONE = "done"
+_RESULTS = "results"
+_NODES = "nodes"
+
+
+def _atomic_write_json(path: Path, data: Dict[str, Any]):
+    """임시 파일에 기록 후 rename으로 교체"""
+    atomic_write_text(path, json.dumps(data, ensure_ascii=False, indent=2))
+
+
+def _read_json(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def default_node_id() -> str:
+    """호스트명과 PID로 노드 ID 생성"""
+    return sanitize_node_id(f"{socket.gethostname()}-{os.getpid()}")
+
+
+def sanitize_node_id(node_id: str) -> str:
+    """파일명에 사용할 수 있도록 노드 ID 정리 ('.'은 구분자로 사용)"""
+    return re.sub(r"[^A-Za-z0-9_-]", "-", node_id) or "node"
+
+
+@dataclass
+class Lease:
+    """노드가 보유한 항목 임대"""
+    item_id: str
+    node_id: str
+    token: str
+    path: Path
+    item: Dict[str, Any]
+
+    @property
+    def name(self) -> str:
+        return f"{self.item_id}.{self.node_id}.{self.token}"
+
+
+def create_batch(job_dir: Path, paths: List[Path],
+                 output_directory: Optional[Path] = None,
+                 save_to_original_dir: bool = False) -> Dict[str, Any]:
+    """
+    공유 작업 디렉토리에 배치 생성
+
+    Args:
+        job_dir: 공유 작업 디렉토리 (비어 있거나 존재하지 않아야 함)
+        paths: 변환할 파일 경로 (모든 노드에서 같은 경로로 접근 가능해야 함)
+        output_directory: 출력 디렉토리 (모든 노드에서 공유)
+        save_to_original_dir: 원본 파일 옆에 저장할지 여부
+
+    Returns:
+        배치 매니페스트
+    """
+    job_dir = Path(job_dir)
+    if (job_dir / MANIFEST_FILE).exists():
+        raise FileExistsError(f"Batch already exists: {job_dir}")
+    if not save_to_original_dir and output_directory is None:
+        raise ValueError("output_directory is required unless saving to the original directory")
+
+    for name in (_PENDING, _LEASED, _DONE, _RESULTS, _NODES):
+        (job_dir / name).mkdir(parents=True, exist_ok=True)
+
+    width = max(6, len(str(len(paths))))
+    for index, path in enumerate(paths):
+        item_id = f"{index:0{width}d}"
+        _atomic_write_json(job_dir / _PENDING / f"{item_id}.json", {
+            "id": item_id,
+            "index": index,
+            "path": str(Path(path).resolve()),
+        })
+
+    manifest = {
+        "batch_id": uuid.uuid4().hex,
+        "created": time.time(),
+        "total": len(paths),
+        "output_directory": str(Path(output_directory).resolve()) if output_directory else None,
+        "save_to_original_dir": save_to_original_dir,
+    }
+    # 매니페스트는 마지막에 기록 (존재하면 배치 준비 완료)
+    _atomic_write_json(job_dir / MANIFEST_FILE, manifest)
+    logger.info(f"분산 배치 생성: {job_dir} ({len(paths)}개 항목)")
+    return manifest
+
+
+def load_manifest(job_dir: Path) -> Dict[str, Any]:
+    """배치 매니페스트 로드"""
+    manifest = _read_json(Path(job_dir) / MANIFEST_FILE)
+    if manifest is None:
+        raise FileNotFoundError(f"No batch manifest in {job_dir}")
+    return manifest
+
+
+class JobDirectory:
+    """공유 작업 디렉토리의 원자적 상태 전이"""
+
+    def __init__(self, job_dir: Path, node_id: str):
+        self.root = Path(job_dir)
+        self.node_id = sanitize_node_id(node_id)
+        self.pending_dir = self.root / _PENDING
+        self.leased_dir = self.root / _LEASED
+        self.done_dir = self.root / _DONE
+        self.results_dir = self.root / _RESULTS
+        self.nodes_dir = self.root / _NODES
+
+    def claim(self) -> Optional[Lease]:
+        """대기 항목 하나를 임대 (다른 노드와 경쟁 시 다음 항목 시도)"""
+        for entry in sorted(self.pending_dir.glob("*.json")):
+            item_id = entry.stem
+            token = uuid.uuid4().hex[:12]
+            lease_path = self.leased_dir / f"{item_id}.{self.node_id}.{token}.json"
+            try:
+                # rename은 mtime을 유지하므로 먼저 갱신 (오래된 항목이 즉시 만료로 보이지 않도록)
+                os.utime(entry)
+                os.rename(entry, lease_path)
+            except FileNotFoundError:
+                continue  # 다른 노드가 먼저 가져감
+            item = _read_json(lease_path) or {"id": item_id}
+            return Lease(item_id, self.node_id, token, lease_path, item)
+        return None
+
+    def heartbeat(self, lease: Lease) -> bool:
+        """
+        임대 갱신
+
+        Returns:
+            임대를 아직 보유하고 있는지 여부
+        """
+        try:
+            os.utime(lease.path)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def commit(self, lease: Lease, result: Dict[str, Any]) -> bool:
+        """
+        결과 기록 후 완료 처리
+
+        Returns:
+            커밋 성공 여부 (임대를 잃었으면 False, 결과는 삭제)
+        """
+        result_path = self.results_dir / f"{lease.name}.json"
+        _atomic_write_json(result_path, result)
+        try:
+            os.rename(lease.path, self.done_dir / f"{lease.name}.json")
+            return True
+        except FileNotFoundError:
+            logger.warning(f"임대 만료로 결과 폐기: {lease.item_id} ({self.node_id})")
+            try:
+                result_path.unlink()
+            except FileNotFoundError:
+                pass
+            return False
+
+    def release(self, lease: Lease) -> bool:
+        """
+        처리하지 못한 임대를 대기 상태로 반환
+
+        Returns:
+            반환 여부 (이미 회수되었으면 False)
+        """
+        try:
+            os.rename(lease.path, self.pending_dir / f"{lease.item_id}.json")
+            return True
+        except FileNotFoundError:
+            return False
+
+    def reclaim_expired(self, lease_timeout: float) -> int:
+        """
+        하트비트가 끊긴 임대를 대기 상태로 회수
+
+        Returns:
+            회수한 항목 수
+        """
+        now = time.time()
+        reclaimed = 0
+        for entry in self.leased_dir.glob("*.json"):
+            try:
+                if now - entry.stat().st_mtime < lease_timeout:
+                    continue
+                item_id = entry.name.split(".", 1)[0]
+                os.rename(entry, self.pending_dir / f"{item_id}.json")
+            except FileNotFoundError:
+                continue  # 커밋되었거나 다른 노드가 먼저 회수
+            reclaimed += 1
+            logger.warning(f"만료된 임대 회수: {entry.name}")
+        return reclaimed
+
+    def count(self, state_dir: Path) -> int:
+        return sum(1 for _ in state_dir.glob("*.json"))
+
+    def is_drained(self) -> bool:
+        """대기/임대 항목이 모두 없는지 확인"""
+        return self.count(self.pending_dir) == 0 and self.count(self.leased_dir) == 0
+
+    def write_node_status(self, status: Dict[str, Any]):
+        _atomic_write_json(self.nodes_dir / f"{self.node_id}.json", status)
+
+
+@dataclass
+class NodeStatistics:
+    """노드 처리 통계"""
+    committed: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    lost_leases: int = 0
+    reclaimed: int = 0
+    start_time: float = field(default_factory=time.time)
+
+
+class DistributedWorker:
+    """공유 작업 디렉토리의 항목을 다른 노드와 함께 처리하는 노드"""
+
+    def __init__(self, job_dir: Path, config_manager: ConfigManager,
+                 node_id: Optional[str] = None, workers: Optional[int] = None,
+                 lease_timeout: float = DISTRIBUTED_LEASE_TIMEOUT,
+                 heartbeat_interval: float = DISTRIBUTED_HEARTBEAT_INTERVAL,
+                 poll_interval: float = DISTRIBUTED_POLL_INTERVAL,
+                 sink: Optional[Callable[[Dict[str, Any]], None]] = None):
+        """
+        Args:
+            job_dir: 공유 작업 디렉토리
+            config_manager: 설정을 로드한 ConfigManager
+            node_id: 노드 ID (기본값: 호스트명-PID)
+            workers: 노드 내 동시 변환 수 (기본값: 설정의 max_workers)
+            lease_timeout: 하트비트 없이 임대가 유지되는 시간(초)
+            heartbeat_interval: 임대 갱신 간격(초), lease_timeout보다 충분히 짧아야 함
+            poll_interval: 다른 노드가 항목을 처리 중일 때 재확인 간격(초)
+            sink: 커밋된 항목 레코드 수신자
+        """
+        self.manifest = load_manifest(job_dir)
+        self.config_manager = config_manager
+        self.directory = JobDirectory(job_dir, node_id or default_node_id())
+        self.node_id = self.directory.node_id
+        config = config_manager.get_config()
+        self.workers = max(1, min(workers or config.max_workers, MAX_WORKER_THREADS))
+        self.lease_timeout = lease_timeout
+        self.heartbeat_interval = heartbeat_interval
+        self.poll_interval = poll_interval
+        self.sink = sink or (lambda record: None)
+
+        self.stats = NodeStatistics()
+        self._stats_lock = threading.Lock()
+        self._active: Dict[str, Lease] = {}
+        self._active_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._memory_optimizer = MemoryOptimizer()
+        self._conflict_handler = FileConflictHandler(config_manager.get_file_conflict_config())
+        self._local = threading.local()
+
+    def stop(self):
+        """새 항목 임대를 중단 (진행 중인 항목은 완료 후 커밋)"""
+        self._stop_event.set()
+
+    def run(self) -> NodeStatistics:
+        """배치가 모두 처리될 때까지 항목 처리"""
+        logger.info(f"분산 노드 시작: {self.node_id} (워커 {self.workers}개)")
+        self._write_status("running")
+        heartbeat = threading.Thread(target=self._heartbeat_loop,
+                                     name=f"Heartbeat-{self.node_id}", daemon=True)
+        heartbeat.start()
+
+        threads = [threading.Thread(target=self._worker_loop, name=f"DistributedWorker-{i}",
+                                    daemon=True) for i in range(self.workers)]
+        for thread in threads:
+            thread.start()
+        try:
+            for thread in threads:
+                while thread.is_alive():
+                    thread.join(0.5)
+        except KeyboardInterrupt:
+            self.stop()
+            for thread in threads:
+                thread.join()
+            raise
+        finally:
+            self._stop_event.set()
+            heartbeat.join()
+            self._write_status("finished")
+            self._memory_optimizer.cleanup()
+
+        if self.directory.is_drained():
+            write_report(self.directory.root)
+        logger.info(f"분산 노드 종료: {self.node_id} (커밋 {self.stats.committed}개)")
+        return self.stats
+
+    def _worker_loop(self):
+        while not self._stop_event.is_set():
+            lease = self.directory.claim()
+            if lease is None:
+                reclaimed = self.directory.reclaim_expired(self.lease_timeout)
+                if reclaimed:
+                    with self._stats_lock:
+                        self.stats.reclaimed += reclaimed
+                    continue
+                if self.directory.is_drained():
+                    return
+                # 다른 노드가 처리 중 - 완료 또는 만료 대기
+                self._stop_event.wait(self.poll_interval)
+                continue
+
+            with self._active_lock:
+                self._active[lease.name] = lease
+            try:
+                record = self._process(lease)
+                committed = self.directory.commit(lease, record)
+            except Exception as e:
+                # 결과를 기록하지 못함 - 만료를 기다리지 않고 바로 반환
+                logger.error(f"항목 처리 실패, 임대 반환: {lease.item_id} ({e})")
+                self.directory.release(lease)
+                self._stop_event.wait(self.poll_interval)
+                continue
+            finally:
+                with self._active_lock:
+                    self._active.pop(lease.name, None)
+
+            with self._stats_lock:
+                if committed:
+                    self.stats.committed += 1
+                    if record["status"] == ConversionStatus.SUCCESS.value:
+                        self.stats.succeeded += 1
+                    else:
+                        self.stats.failed += 1
+                else:
+                    self.stats.lost_leases += 1
+            if committed:
+                self.sink(record)
+
+    def _process(self, lease: Lease) -> Dict[str, Any]:
+        """항목 변환 (ConversionEngine.convert_file과 동일한 처리)"""
+        path = Path(lease.item.get("path", ""))
+        file_info = create_file_info(path)
+        if file_info is None:
+            record = {
+                "type": "file", "path": str(path), "status": ConversionStatus.FAILED.value,
+                "output_path": None, "error": f"File not found: {path}",
+                "size": 0, "duration": 0.0,
+            }
+        else:
+            try:
+                engine = self._get_engine()
+                result = engine.convert_file(file_info, self._output_path(engine, lease))
+            except Exception as e:
+                logger.error(f"분산 변환 실패 ({path}): {e}")
+                result = ConversionResult(file_info=file_info, status=ConversionStatus.FAILED,
+                                          error_message=str(e))
+            record = result_to_record(result)
+        record.update({
+            "item": lease.item_id,
+            "index": lease.item.get("index"),
+            "node": self.node_id,
+            "finished": time.time(),
+        })
+        return record
+
+    def _output_path(self, engine: ConversionEngine, lease: Lease) -> Path:
+        """
+        항목별 고정 출력 경로
+        
+        원본 전체 파일명과 항목 ID로 이름을 정하므로 줄기가 같은 원본(a1.csv, a1.txt)끼리
+        겹치지 않고, 회수된 항목을 다시 처리해도 같은 경로를 (원자적으로) 교체한다.
+        """
+        path = Path(lease.item["path"])
+        save_to_original_dir = self.manifest.get("save_to_original_dir", False)
+        directory = resolve_markdown_output_path(
+            source_path=path,
+            preserve_structure=not save_to_original_dir,
+            output_base_dir=path.parent if save_to_original_dir else engine.output_directory,
+            ensure_unique=False
+        ).parent
+        return directory / f"{sanitize_filename(path.name)}.{lease.item_id}.md"
+
+    def _get_engine(self) -> ConversionEngine:
+        """워커 스레드별 변환 엔진"""
+        engine = getattr(self._local, "engine", None)
+        if engine is None:
+            output_directory = self.manifest.get("output_directory")
+            engine = ConversionEngine(
+                Path(output_directory) if output_directory else self.directory.root / "output",
+                memory_optimizer=self._memory_optimizer,
+                conflict_handler=self._conflict_handler,
+                save_to_original_dir=self.manifest.get("save_to_original_dir", False),
+                config_manager=self.config_manager
+            )
+            self._local.engine = engine
+        return engine
+
+    def _heartbeat_loop(self):
+        """보유 중인 임대와 노드 상태 갱신"""
+        while not self._stop_event.wait(self.heartbeat_interval):
+            with self._active_lock:
+                leases = list(self._active.values())
+            for lease in leases:
+                if not self.directory.heartbeat(lease):
+                    logger.warning(f"임대를 잃음: {lease.item_id} ({self.node_id})")
+            self._write_status("running")
+
+    def _write_status(self, state: str):
+        with self._stats_lock:
+            status = {
+                "node": self.node_id,
+                "state": state,
+                "updated": time.time(),
+                "started": self.stats.start_time,
+                "committed": self.stats.committed,
+                "succeeded": self.stats.succeeded,
+                "failed": self.stats.failed,
+                "lost_leases": self.stats.lost_leases,
+                "reclaimed": self.stats.reclaimed,
+            }
+        try:
+            self.directory.write_node_status(status)
+        except OSError as e:
+            logger.warning(f"노드 상태 기록 실패: {e}")
+
+
+def merge_report(job_dir: Path) -> Dict[str, Any]:
+    """
+    모든 노드의 커밋된 결과를 하나의 보고서로 병합
+
+    Returns:
+        보고서 (항목은 원래 순서로 정렬)
+    """
+    job_dir = Path(job_dir)
+    manifest = load_manifest(job_dir)
+    directory = JobDirectory(job_dir, "report")
+
+    items: Dict[str, Dict[str, Any]] = {}
+    for marker in directory.done_dir.glob("*.json"):
+        name = marker.name[:-len(".json")]
+        result = _read_json(directory.results_dir / f"{name}.json")
+        if result is None:
+            continue
+        items[name.split(".", 1)[0]] = result
+
+    records = [items[key] for key in sorted(items)]
+    counts: Dict[str, int] = {}
+    per_node: Dict[str, int] = {}
+    for record in records:
+        counts[record["status"]] = counts.get(record["status"], 0) + 1
+        per_node[record["node"]] = per_node.get(record["node"], 0) + 1
+
+    nodes = [status for status in
+             (_read_json(path) for path in sorted(directory.nodes_dir.glob("*.json")))
+             if status]
+
+    return {
+        "batch_id": manifest["batch_id"],
+        "total": manifest["total"],
+        "completed": len(records),
+        "pending": directory.count(directory.pending_dir),
+        "leased": directory.count(directory.leased_dir),
+        "complete": len(records) == manifest["total"],
+        "counts": counts,
+        "items_per_node": per_node,
+        "nodes": nodes,
+        "items": records,
+    }
+
+
+def write_report(job_dir: Path) -> Dict[str, Any]:
+    """병합 보고서를 report.json으로 기록 (여러 노드가 호출해도 결과는 동일)"""
+    report = merge_report(job_dir)
+    _atomic_write_json(Path(job_dir) / REPORT_FILE, report)
+    return report
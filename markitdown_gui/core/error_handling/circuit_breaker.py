@@ -82,7 +82,7 @@ class CircuitBreaker:
         self.logger = logging.getLogger(f"{__name__}.{name}")
         
         # Thread safety
-        self._lock = threading.Lock()
+        self._lock = threading.RLock()  # Reentrant: call() records rejections while holding it
         
         # State management
         self._state = CircuitBreakerState.CLOSED
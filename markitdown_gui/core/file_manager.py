@@ -3,7 +3,6 @@
 파일 스캔, 관리, 정보 수집을 담당
 """
 
-import os
 import time
 from pathlib import Path
 from datetime import datetime
@@ -15,219 +14,15 @@ import logging
 from PyQt6.QtCore import QObject, pyqtSignal, QThread, QMutex, QMutexLocker
 
 from .models import FileInfo, FileType, get_file_type, ConversionStatus
-from .utils import (
-    scan_directory, validate_path, format_file_size,
-    validate_file_extension, sanitize_filename, get_unique_output_path
-)
+from .utils import scan_directory, validate_path, format_file_size, validate_file_extension
 from .logger import get_logger
 from .memory_optimizer import MemoryOptimizer
-from .constants import DEFAULT_OUTPUT_DIRECTORY
+from .constants import CACHE_NAMESPACE_FILE_INFO
 
 
 logger = get_logger(__name__)
 
 
-def resolve_markdown_output_path(
-    source_path: Path,
-    preserve_structure: bool = True,
-    output_base_dir: Optional[Path] = None,
-    ensure_unique: bool = True
-) -> Path:
-    """
-    Resolve markdown output path within the program's markdown directory.
-    
-    This centralized utility function provides secure, cross-platform path resolution
-    for markdown output files with comprehensive sanitization and conflict handling.
-    
-    Args:
-        source_path: Path to the source file to be converted
-        preserve_structure: If True, preserves the directory structure relative
-                          to the source file's directory. If False, places all
-                          output files in the root markdown directory.
-        output_base_dir: Base directory for markdown output. If None, uses the
-                        program's default markdown directory.
-        ensure_unique: If True, automatically generates unique filenames to avoid
-                      conflicts. If False, returns the target path even if it exists.
-    
-    Returns:
-        Absolute Path: Resolved path within the markdown output directory
-    
-    Raises:
-        ValueError: If source_path is invalid or cannot be processed
-        OSError: If there are permission issues accessing directories
-        
-    Security:
-        - Prevents directory traversal attacks through path sanitization
-        - Validates all path components for filesystem safety
-        - Ensures output paths remain within designated markdown directory
-        - Handles Windows reserved names and invalid characters
-        
-    Performance:
-        - Efficient path operations using pathlib
-        - Minimal filesystem access for path resolution
-        - Caches directory structure validation
-        
-    Cross-platform Compatibility:
-        - Uses pathlib for OS-agnostic path operations
-        - Handles Windows/Linux path length limitations
-        - Respects filesystem-specific naming conventions
-        
-    Examples:
-        >>> # Basic usage - flatten structure
-        >>> source = Path("/home/user/docs/report.pdf")
-        >>> output = resolve_markdown_output_path(source, preserve_structure=False)
-        >>> print(output)
-        /program/markdown/report.md
-        
-        >>> # Preserve directory structure
-        >>> source = Path("/home/user/docs/2024/report.pdf")
-        >>> output = resolve_markdown_output_path(source, preserve_structure=True)
-        >>> print(output)
-        /program/markdown/docs/2024/report.md
-        
-        >>> # Custom output directory
-        >>> source = Path("/home/user/docs/report.pdf")
-        >>> custom_dir = Path("/custom/markdown")
-        >>> output = resolve_markdown_output_path(source, output_base_dir=custom_dir)
-        >>> print(output)
-        /custom/markdown/report.md
-    """
-    # Input validation
-    if not isinstance(source_path, Path):
-        try:
-            source_path = Path(source_path)
-        except (TypeError, ValueError) as e:
-            raise ValueError(f"Invalid source path: {e}")
-    
-    if not source_path.name:
-        raise ValueError("Source path must point to a file, not a directory")
-    
-    # Security check: Ensure source path is absolute or can be resolved safely
-    try:
-        # Convert to absolute path to prevent relative path manipulation
-        if not source_path.is_absolute():
-            source_path = source_path.resolve()
-    except (OSError, RuntimeError) as e:
-        raise ValueError(f"Cannot resolve source path '{source_path}': {e}")
-    
-    # Determine output base directory
-    if output_base_dir is None:
-        # Use program's root directory + default markdown directory
-        program_root = Path(__file__).parent.parent.parent  # Navigate to project root
-        output_base_dir = program_root / DEFAULT_OUTPUT_DIRECTORY
-    else:
-        # Validate and resolve custom output directory
-        if not isinstance(output_base_dir, Path):
-            try:
-                output_base_dir = Path(output_base_dir)
-            except (TypeError, ValueError) as e:
-                raise ValueError(f"Invalid output base directory: {e}")
-        
-        # Ensure output directory is absolute
-        if not output_base_dir.is_absolute():
-            output_base_dir = output_base_dir.resolve()
-    
-    # Security validation: Prevent directory traversal
-    try:
-        output_base_dir = output_base_dir.resolve()
-    except (OSError, RuntimeError) as e:
-        raise ValueError(f"Cannot resolve output base directory '{output_base_dir}': {e}")
-    
-    # Generate safe markdown filename
-    source_stem = source_path.stem
-    if not source_stem:
-        source_stem = "untitled"
-    
-    # Sanitize filename to ensure filesystem compatibility
-    safe_filename = sanitize_filename(f"{source_stem}.md")
-    
-    # Determine final output path based on preserve_structure setting
-    if preserve_structure:
-        # Attempt to preserve directory structure
-        try:
-            # For absolute paths, we need a reference point for relative structure
-            # Use the source file's parent directory as the structure to preserve
-            source_parent = source_path.parent
-            
-            # Get the relative structure - use just the immediate parent name
-            # to avoid creating overly deep directory structures
-            if source_parent.name and source_parent.name != source_parent.root:
-                # Create a subdirectory based on source parent directory name
-                subdir_name = sanitize_filename(source_parent.name)
-                output_subdir = output_base_dir / subdir_name
-            else:
-                # Fallback to root output directory if parent structure is unclear
-                output_subdir = output_base_dir
-        except (OSError, ValueError):
-            # Fallback to root output directory if structure preservation fails
-            output_subdir = output_base_dir
-    else:
-        # Place directly in root markdown directory
-        output_subdir = output_base_dir
-    
-    # Construct final output path
-    output_path = output_subdir / safe_filename
-    
-    # Security check: Ensure resolved path is within output base directory
-    try:
-        resolved_output = output_path.resolve()
-        resolved_base = output_base_dir.resolve()
-        
-        # Verify the output path is within the base directory
-        try:
-            resolved_output.relative_to(resolved_base)
-        except ValueError:
-            # Path is outside base directory - security violation
-            raise ValueError(
-                f"Resolved output path '{resolved_output}' is outside "
-                f"base directory '{resolved_base}'. This may indicate a "
-                f"directory traversal attempt."
-            )
-    except (OSError, RuntimeError) as e:
-        raise ValueError(f"Security validation failed for output path: {e}")
-    
-    # Handle duplicate filenames if requested
-    if ensure_unique and output_path.exists():
-        try:
-            output_path = get_unique_output_path(output_path)
-        except ValueError as e:
-            # Fallback: add timestamp if unique path generation fails
-            from datetime import datetime
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            name_stem = output_path.stem
-            suffix = output_path.suffix
-            timestamped_name = f"{name_stem}_{timestamp}{suffix}"
-            output_path = output_path.parent / timestamped_name
-    
-    # Validate final path length (filesystem limitations)
-    final_path_str = str(output_path)
-    if len(final_path_str) > 4000:  # Conservative limit for cross-platform compatibility
-        raise ValueError(
-            f"Generated output path is too long ({len(final_path_str)} chars): "
-            f"'{final_path_str[:100]}...'"
-        )
-    
-    # Create output directory if it doesn't exist
-    try:
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-    except (OSError, PermissionError) as e:
-        raise OSError(
-            f"Cannot create output directory '{output_path.parent}': {e}"
-        )
-    
-    # Final validation: Check write permissions
-    try:
-        # Test write access to the parent directory
-        if output_path.parent.exists() and not os.access(output_path.parent, os.W_OK):
-            raise OSError(
-                f"No write permission to output directory '{output_path.parent}'"
-            )
-    except OSError as e:
-        raise OSError(f"Permission check failed: {e}")
-    
-    return output_path
-
-
 class FileScanWorker(QThread):
     """파일 스캔 워커 스레드"""
     
@@ -337,7 +132,7 @@ class FileScanWorker(QThread):
             
             # 캐시에서 파일 정보 확인
             cache_key = f"fileinfo_{file_path}_{file_path.stat().st_mtime}"
-            cached_info = self._memory_optimizer.get_cached_result(cache_key)
+            cached_info = self._memory_optimizer.get_cached_result(cache_key, CACHE_NAMESPACE_FILE_INFO)
             
             if cached_info:
                 return cached_info
@@ -362,7 +157,7 @@ class FileScanWorker(QThread):
             
             # 파일 정보 캐싱 (작은 객체만)
             if stat.st_size < 50 * 1024 * 1024:  # 50MB 미만
-                self._memory_optimizer.cache_result(cache_key, file_info)
+                self._memory_optimizer.cache_result(cache_key, file_info, CACHE_NAMESPACE_FILE_INFO)
             
             return file_info
             
@@ -21,6 +21,7 @@ from PyQt6.QtWidgets import QApplication
 
 from .logger import get_logger
 from .exceptions import ConfigurationError, ValidationError
+from .translation_catalog import CatalogKey, TranslationCatalog
 
 
 logger = get_logger(__name__)
@@ -74,6 +75,9 @@ class I18nManager(QObject):
         self.qt_translator: Optional[QTranslator] = None
         self.loaded_translations: Dict[str, Dict[str, Any]] = {}
         self.missing_keys: Set[str] = set()
+        # 로드할 때 평탄화한 번역 (현재 언어 맵은 영어 대체 항목 포함)
+        self._catalog = TranslationCatalog(fallback_language="en_US")
+        self._table: Dict[CatalogKey, str] = {}
         
         # 경로 설정
         try:
@@ -108,8 +112,6 @@ class I18nManager(QObject):
         
         # 폰트 설정
         self.font_cache: Dict[str, QFont] = {}
-        self.translation_cache: Dict[str, str] = {}  # 번역 결과 캐시
-        self.cache_size_limit = 1000  # 캐시 최대 크기
         self._init_fonts()
         
         # 설정 로드
@@ -229,7 +231,7 @@ class I18nManager(QObject):
             logger.error(f"Unsupported language: {language_code}")
             return False
         
-        if language_code == self.current_language:
+        if language_code == self.current_language and self._catalog.has_language(language_code):
             logger.debug(f"Language {language_code} already active")
             return True
         
@@ -241,6 +243,7 @@ class I18nManager(QObject):
             success = self._load_translation(language_code)
             if success:
                 self.current_language = language_code
+                self._table = self._catalog.compiled(language_code)
                 
                 # Qt 내장 번역 로드
                 self._load_qt_translations(language_code)
@@ -253,8 +256,6 @@ class I18nManager(QObject):
                 try:
                     settings = QSettings()
                     settings.setValue("language", language_code)
-                    # 캐시 무효화 (언어 변경시)
-                    self.translation_cache.clear()
                 except Exception as e:
                     logger.warning(f"Error saving language setting: {e}")
                 
@@ -282,12 +283,40 @@ class I18nManager(QObject):
             self.qt_translator = None
     
     def _load_translation(self, language_code: str) -> bool:
-        """번역 파일 로드"""
+        """번역 로드 (이미 컴파일된 언어는 파일을 다시 읽지 않음)"""
         try:
             if not language_code or not isinstance(language_code, str):
                 logger.error(f"Invalid language code: {language_code}")
                 return False
-                
+            
+            if not self._catalog.has_language(language_code) and not self._read_translation_file(language_code):
+                return False
+            
+            # 영어 대체 항목이 컴파일된 맵에 들어가도록 함께 로드
+            fallback = self._catalog.fallback_language
+            if language_code != fallback and not self._catalog.has_language(fallback):
+                self._read_translation_file(fallback)
+            
+            # QTranslator 생성 및 설치
+            translator = QTranslator()
+            
+            # JSON 데이터를 QTranslator로 변환하는 것은 복잡하므로
+            # 우리만의 번역 시스템을 사용
+            self.current_translator = translator
+            self.app.installTranslator(translator)
+            
+            self.translation_loaded.emit(language_code)
+            
+            logger.info(f"Translation loaded: {language_code} with {self._catalog.key_count(language_code)} keys")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Unexpected error loading translation {language_code}: {e}")
+            return False
+    
+    def _read_translation_file(self, language_code: str) -> bool:
+        """번역 JSON을 읽어 카탈로그에 컴파일"""
+        try:
             translation_file = self.translations_dir / f"{language_code}.json"
             
             if not translation_file.exists():
@@ -303,18 +332,7 @@ class I18nManager(QObject):
                 
             # 번역 데이터 저장
             self.loaded_translations[language_code] = translations
-            
-            # QTranslator 생성 및 설치
-            translator = QTranslator()
-            
-            # JSON 데이터를 QTranslator로 변환하는 것은 복잡하므로
-            # 우리만의 번역 시스템을 사용
-            self.current_translator = translator
-            self.app.installTranslator(translator)
-            
-            self.translation_loaded.emit(language_code)
-            
-            logger.info(f"Translation loaded: {language_code} with {len(self._extract_keys(translations))} keys")
+            self._catalog.add_language(language_code, translations)
             return True
             
         except json.JSONDecodeError as e:
@@ -327,7 +345,7 @@ class I18nManager(QObject):
             logger.error(f"Permission denied reading translation file: {e}")
             return False
         except Exception as e:
-            logger.error(f"Unexpected error loading translation {language_code}: {e}")
+            logger.error(f"Unexpected error reading translation {language_code}: {e}")
             return False
     
     def _load_qt_translations(self, language_code: str):
@@ -363,20 +381,10 @@ class I18nManager(QObject):
             logger.debug(f"Error loading Qt translations: {e}")
     
     def tr(self, key: str, context: str = "", *args) -> str:
-        """번역 문자열 가져오기 (빠른 버전)"""
-        # 캐시 확인
-        if not args:  # 인수가 없는 경우만 캐시 사용
-            cache_key = f"{self.current_language}:{context}:{key}"
-            if cache_key in self.translation_cache:
-                return self.translation_cache[cache_key]
-        
-        result = self.translate(key, context, *args)
-        
-        # 결과 캐싱 (arguments 없는 경우만)
-        if not args and len(self.translation_cache) < self.cache_size_limit:
-            cache_key = f"{self.current_language}:{context}:{key}"
-            self.translation_cache[cache_key] = result
-        
+        """번역 문자열 가져오기 (빠른 버전 - 컴파일된 맵 한 번 조회)"""
+        result = self._table.get((context, key))
+        if result is None or args:
+            return self.translate(key, context, *args)
         return result
     
     def translate(self, key: str, context: str = "", *args) -> str:
@@ -385,28 +393,16 @@ class I18nManager(QObject):
             return ""
         
         try:
-            # 현재 언어의 번역 데이터 가져오기
-            translations = self.loaded_translations.get(self.current_language, {})
-            
-            # 번역 결과 찾기
-            result = self._find_translation(translations, key, context)
-            
-            # 현재 언어에서 찾지 못한 경우 영어 대체 시도
-            if result is None and self.current_language != "en_US":
-                en_translations = self.loaded_translations.get("en_US", {})
-                result = self._find_translation(en_translations, key, context)
-                
-                if result is not None:
-                    logger.debug(f"Using English fallback for '{key}' in context '{context}'")
+            # 현재 언어 맵에 영어 대체 항목이 이미 합쳐져 있음
+            result = self._table.get((context, key))
             
             # 모든 시도가 실패한 경우
             if result is None:
                 result = key  # 키 자체를 반환
                 self._track_missing_key(key, context)
-                logger.warning(f"Translation not found: key='{key}', context='{context}'")
             
             # 문자열 포매팅 (Python style)
-            if args and isinstance(result, str):
+            if args:
                 try:
                     result = result.format(*args)
                 except (IndexError, KeyError, ValueError) as e:
@@ -419,41 +415,6 @@ class I18nManager(QObject):
             logger.error(f"Translation error for key '{key}', context '{context}': {e}")
             return key  # 에러 시 키 자체 반환
     
-    def _find_translation(self, translations: Dict[str, Any], key: str, context: str = "") -> Optional[str]:
-        """번역 데이터에서 키 찾기"""
-        if not isinstance(translations, dict):
-            return None
-        
-        try:
-            # 컨텍스트가 있는 경우 계층적 검색
-            if context:
-                # 컨텍스트 경로를 따라 이동
-                current_level = translations
-                search_path = context.split('.')
-                
-                for path_part in search_path:
-                    if isinstance(current_level, dict) and path_part in current_level:
-                        current_level = current_level[path_part]
-                    else:
-                        return None  # 컨텍스트 경로가 존재하지 않음
-                
-                # 최종 레벨에서 키 검색
-                if isinstance(current_level, dict) and key in current_level:
-                    value = current_level[key]
-                    return str(value) if value is not None else None
-            
-            # 컨텍스트가 없는 경우 직접 검색
-            else:
-                if key in translations:
-                    value = translations[key]
-                    return str(value) if value is not None else None
-            
-            return None
-            
-        except Exception as e:
-            logger.debug(f"Error finding translation: key='{key}', context='{context}', error={e}")
-            return None
-    
     def _track_missing_key(self, key: str, context: str = ""):
         """누락된 번역 키 추적"""
         try:
@@ -461,7 +422,8 @@ class I18nManager(QObject):
             if full_key not in self.missing_keys:
                 self.missing_keys.add(full_key)
                 self.translation_missing.emit(full_key, self.current_language)
-                logger.debug(f"Missing translation: {full_key} for {self.current_language}")
+                # 같은 키는 한 번만 경고
+                logger.warning(f"Translation not found: key='{key}', context='{context}'")
         except Exception as e:
             logger.error(f"Error tracking missing key '{key}': {e}")
     
@@ -704,18 +666,17 @@ class I18nManager(QObject):
         self.missing_keys.clear()
     
     def clear_cache(self):
-        """번역 및 폰트 캐시 청소"""
+        """폰트 캐시 청소 (번역은 컴파일된 카탈로그에서 바로 조회하므로 캐시 없음)"""
         try:
-            self.translation_cache.clear()
             self.font_cache.clear()
-            logger.debug("Translation and font caches cleared")
+            logger.debug("Font cache cleared")
         except Exception as e:
             logger.error(f"Error clearing caches: {e}")
     
     def get_cache_stats(self) -> Dict[str, int]:
         """캐시 통계 정보 반환"""
         return {
-            "translation_cache_size": len(self.translation_cache),
+            "catalog_size": len(self._table),
             "font_cache_size": len(self.font_cache),
             "missing_keys_count": len(self.missing_keys)
         }
@@ -725,6 +686,7 @@ class I18nManager(QObject):
         try:
             current_lang = self.current_language
             self.loaded_translations.clear()
+            self._catalog.clear()
             self.missing_keys.clear()
             self.clear_cache()
             return self.set_language(current_lang)
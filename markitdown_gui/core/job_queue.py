@@ -0,0 +1,264 @@
+"""
+영속 작업 큐
+변환 서비스의 작업(job)과 파일 항목을 SQLite에 저장하는 디스크 기반 큐
+
+서비스가 재시작되어도 대기/진행 중이던 항목은 recover()로 다시 대기 상태가 되며,
+여러 워커 스레드가 claim_next()로 파일 단위 항목을 원자적으로 가져간다.
+"""
+
+import json
+import time
+import uuid
+import sqlite3
+import threading
+from enum import Enum
+from pathlib import Path
+from typing import List, Optional, Dict, Any, Tuple
+
+from .logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class JobStatus(Enum):
+    """작업 상태 (파일 항목 상태에서 파생)"""
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    CANCELLED = "cancelled"
+
+
+class JobItemStatus(Enum):
+    """파일 항목 상태"""
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCESS = "success"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    created REAL NOT NULL,
+    updated REAL NOT NULL,
+    metadata TEXT NOT NULL DEFAULT '{}'
+);
+CREATE TABLE IF NOT EXISTS job_items (
+    job_id TEXT NOT NULL REFERENCES jobs(id),
+    idx INTEGER NOT NULL,
+    path TEXT NOT NULL,
+    status TEXT NOT NULL,
+    output_path TEXT,
+    error TEXT,
+    duration REAL,
+    PRIMARY KEY (job_id, idx)
+);
+CREATE INDEX IF NOT EXISTS idx_job_items_status ON job_items(status, job_id, idx);
+"""
+
+
+class JobQueue:
+    """SQLite 기반 영속 작업 큐 (스레드 안전)"""
+
+    def __init__(self, db_path: Path):
+        """
+        Args:
+            db_path: 큐 데이터베이스 파일 경로
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False,
+                                     isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        """데이터베이스 연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+    def submit(self, paths: List[Path], metadata: Optional[Dict[str, Any]] = None) -> str:
+        """
+        새 작업 등록
+
+        Args:
+            paths: 변환할 파일 경로 목록
+            metadata: 작업에 함께 저장할 부가 정보
+
+        Returns:
+            작업 ID
+        """
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "INSERT INTO jobs (id, created, updated, metadata) VALUES (?, ?, ?, ?)",
+                    (job_id, now, now, json.dumps(metadata or {}, ensure_ascii=False))
+                )
+                self._conn.executemany(
+                    "INSERT INTO job_items (job_id, idx, path, status) VALUES (?, ?, ?, ?)",
+                    [(job_id, i, str(p), JobItemStatus.PENDING.value) for i, p in enumerate(paths)]
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        logger.info(f"작업 등록: {job_id} ({len(paths)}개 파일)")
+        return job_id
+
+    def claim_next(self) -> Optional[Tuple[str, int, Path]]:
+        """
+        가장 오래된 대기 항목을 진행 중으로 전환하여 반환
+
+        Returns:
+            (작업 ID, 항목 인덱스, 파일 경로) 또는 대기 항목이 없으면 None
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT i.job_id, i.idx, i.path FROM job_items i "
+                    "JOIN jobs j ON j.id = i.job_id "
+                    "WHERE i.status = ? ORDER BY j.created, i.idx LIMIT 1",
+                    (JobItemStatus.PENDING.value,)
+                ).fetchone()
+                if row is None:
+                    self._conn.execute("COMMIT")
+                    return None
+                self._conn.execute(
+                    "UPDATE job_items SET status = ? WHERE job_id = ? AND idx = ?",
+                    (JobItemStatus.RUNNING.value, row["job_id"], row["idx"])
+                )
+                self._touch(row["job_id"])
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return row["job_id"], row["idx"], Path(row["path"])
+
+    def complete_item(self, job_id: str, idx: int, status: JobItemStatus,
+                      output_path: Optional[Path] = None, error: Optional[str] = None,
+                      duration: Optional[float] = None):
+        """항목 처리 결과 기록"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE job_items SET status = ?, output_path = ?, error = ?, duration = ? "
+                "WHERE job_id = ? AND idx = ?",
+                (status.value, str(output_path) if output_path else None, error, duration,
+                 job_id, idx)
+            )
+            self._touch(job_id)
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        작업의 대기 항목 취소 (진행 중인 항목은 완료까지 실행됨)
+
+        Returns:
+            작업이 존재하는지 여부
+        """
+        with self._lock:
+            if not self._job_exists(job_id):
+                return False
+            self._conn.execute(
+                "UPDATE job_items SET status = ? WHERE job_id = ? AND status = ?",
+                (JobItemStatus.CANCELLED.value, job_id, JobItemStatus.PENDING.value)
+            )
+            self._touch(job_id)
+        return True
+
+    def recover(self) -> int:
+        """
+        비정상 종료로 진행 중 상태에 남은 항목을 대기 상태로 복구
+
+        Returns:
+            복구된 항목 수
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE job_items SET status = ? WHERE status = ?",
+                (JobItemStatus.PENDING.value, JobItemStatus.RUNNING.value)
+            )
+        if cursor.rowcount:
+            logger.info(f"중단된 작업 항목 복구: {cursor.rowcount}개")
+        return cursor.rowcount
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 상태와 항목 목록 반환"""
+        with self._lock:
+            job = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if job is None:
+                return None
+            items = self._conn.execute(
+                "SELECT idx, path, status, output_path, error, duration FROM job_items "
+                "WHERE job_id = ? ORDER BY idx", (job_id,)
+            ).fetchall()
+        return self._job_to_dict(job, items)
+
+    def list_jobs(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """최근 작업 목록 (항목 제외)"""
+        with self._lock:
+            jobs = self._conn.execute(
+                "SELECT * FROM jobs ORDER BY created DESC LIMIT ?", (limit,)
+            ).fetchall()
+            summaries = []
+            for job in jobs:
+                items = self._conn.execute(
+                    "SELECT idx, path, status, output_path, error, duration FROM job_items "
+                    "WHERE job_id = ?", (job["id"],)
+                ).fetchall()
+                summary = self._job_to_dict(job, items)
+                del summary["items"]
+                summaries.append(summary)
+        return summaries
+
+    def pending_count(self) -> int:
+        """대기 항목 수"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM job_items WHERE status = ?",
+                (JobItemStatus.PENDING.value,)
+            ).fetchone()[0]
+
+    def _job_exists(self, job_id: str) -> bool:
+        return self._conn.execute("SELECT 1 FROM jobs WHERE id = ?", (job_id,)).fetchone() is not None
+
+    def _touch(self, job_id: str):
+        self._conn.execute("UPDATE jobs SET updated = ? WHERE id = ?", (time.time(), job_id))
+
+    @staticmethod
+    def _job_to_dict(job: sqlite3.Row, items: List[sqlite3.Row]) -> Dict[str, Any]:
+        counts = {status.value: 0 for status in JobItemStatus}
+        for item in items:
+            counts[item["status"]] += 1
+
+        if counts[JobItemStatus.PENDING.value] == len(items) and items:
+            status = JobStatus.QUEUED
+        elif counts[JobItemStatus.PENDING.value] or counts[JobItemStatus.RUNNING.value]:
+            status = JobStatus.RUNNING
+        elif items and counts[JobItemStatus.CANCELLED.value] == len(items):
+            status = JobStatus.CANCELLED
+        else:
+            status = JobStatus.COMPLETED
+
+        return {
+            "id": job["id"],
+            "status": status.value,
+            "created": job["created"],
+            "updated": job["updated"],
+            "metadata": json.loads(job["metadata"]),
+            "total": len(items),
+            "counts": counts,
+            "items": [dict(item) for item in items],
+        }
+
+
+def is_finished_status(status: str) -> bool:
+    """작업 상태가 종료 상태인지 확인"""
+    return status in (JobStatus.COMPLETED.value, JobStatus.CANCELLED.value)
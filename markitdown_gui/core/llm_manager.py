@@ -19,6 +19,7 @@ from .models import (
 from .api_client import APIClientFactory, APIClient
 from .logger import get_logger
 from .memory_optimizer import MemoryOptimizer
+from .constants import CACHE_NAMESPACE_LLM
 
 
 logger = get_logger(__name__)
@@ -412,7 +413,7 @@ class LLMManager:
         
         # 응답 캐싱 확인
         cache_key = f"llm_{hash(prompt)}_{system_prompt or ''}_{usage_type.value}"
-        cached_response = self._memory_optimizer.get_cached_result(cache_key)
+        cached_response = self._memory_optimizer.get_cached_result(cache_key, CACHE_NAMESPACE_LLM)
         
         if cached_response:
             logger.debug(f"LLM response from cache")
@@ -427,7 +428,7 @@ class LLMManager:
             
             # 응답 캐싱 (성공한 경우만)
             if response.is_success and len(response.content) < 100 * 1024:  # 100KB 미만
-                self._memory_optimizer.cache_result(cache_key, response)
+                self._memory_optimizer.cache_result(cache_key, response, CACHE_NAMESPACE_LLM)
             
             # 통계 및 사용량 추적
             self.stats.add_request(response)
@@ -467,7 +468,7 @@ class LLMManager:
         # OCR 결과 캐싱 확인
         image_stat = request.image_path.stat()
         cache_key = f"ocr_{request.image_path}_{image_stat.st_mtime}_{request.language}_{hash(request.prompt or '')}"
-        cached_result = self._memory_optimizer.get_cached_result(cache_key)
+        cached_result = self._memory_optimizer.get_cached_result(cache_key, CACHE_NAMESPACE_LLM)
         
         if cached_result:
             logger.debug(f"OCR result from cache: {request.image_path}")
@@ -518,7 +519,7 @@ class LLMManager:
                     
                     # OCR 결과 캐싱 (성공한 경우만)
                     if len(response.content) < 50 * 1024:  # 50KB 미만
-                        self._memory_optimizer.cache_result(cache_key, ocr_result)
+                        self._memory_optimizer.cache_result(cache_key, ocr_result, CACHE_NAMESPACE_LLM)
                     
                     return ocr_result
                 else:
@@ -1,22 +1,35 @@
 """
 로깅 시스템 설정
 애플리케이션 전체의 로깅을 관리
+
+루트 로거에는 QueueHandler 하나만 두고 실제 콘솔/파일/UI 핸들러는 QueueListener의
+백그라운드 스레드에서 실행한다. 변환 워커 등 로그를 남기는 스레드는 레코드를 큐에
+넣기만 하므로 파일 I/O가 변환 지연 시간에 포함되지 않는다.
 """
 
+import atexit
 import logging
 import logging.config
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional
+from typing import Optional, List
+
+
+# 루트 로거의 핸들러를 실행하는 백그라운드 리스너 (setup_logging에서 생성)
+_queue_listener: Optional[QueueListener] = None
 
 
-def setup_logging(config_file: Optional[Path] = None, log_dir: Optional[Path] = None) -> None:
+def setup_logging(config_file: Optional[Path] = None, log_dir: Optional[Path] = None,
+                  console_stream=None) -> None:
     """
     로깅 시스템 설정
     
     Args:
         config_file: 로깅 설정 파일 경로
         log_dir: 로그 파일 저장 디렉토리
+        console_stream: 콘솔 로그 출력 스트림 (기본값: sys.stdout)
     """
     # 기본 경로 설정
     if config_file is None:
@@ -32,21 +45,25 @@ def setup_logging(config_file: Optional[Path] = None, log_dir: Optional[Path] =
     if config_file.exists():
         try:
             logging.config.fileConfig(config_file, disable_existing_loggers=False)
+            _install_queue_logging()
+            if console_stream is not None:
+                redirect_console_logging(console_stream)
             logging.info(f"로깅 설정 파일 로드됨: {config_file}")
         except Exception as e:
-            _setup_default_logging(log_dir)
+            _setup_default_logging(log_dir, console_stream)
             logging.error(f"로깅 설정 파일 로드 실패, 기본 설정 사용: {e}")
     else:
-        _setup_default_logging(log_dir)
+        _setup_default_logging(log_dir, console_stream)
         logging.info("로깅 설정 파일이 없어 기본 설정 사용")
 
 
-def _setup_default_logging(log_dir: Path) -> None:
+def _setup_default_logging(log_dir: Path, console_stream=None) -> None:
     """
     기본 로깅 설정
     
     Args:
         log_dir: 로그 파일 저장 디렉토리
+        console_stream: 콘솔 로그 출력 스트림 (기본값: sys.stdout)
     """
     # 로그 파일 경로
     log_file = log_dir / "markitdown_gui.log"
@@ -60,7 +77,7 @@ def _setup_default_logging(log_dir: Path) -> None:
         root_logger.removeHandler(handler)
     
     # 콘솔 핸들러
-    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler = logging.StreamHandler(console_stream or sys.stdout)
     console_handler.setLevel(logging.INFO)
     console_formatter = logging.Formatter(
         '%(levelname)s - %(message)s'
@@ -89,6 +106,79 @@ def _setup_default_logging(log_dir: Path) -> None:
     except Exception as e:
         console_handler.setLevel(logging.DEBUG)
         logging.error(f"파일 핸들러 설정 실패: {e}")
+    
+    _install_queue_logging()
+
+
+def _install_queue_logging() -> None:
+    """
+    루트 로거의 핸들러를 QueueListener 스레드로 옮기고 QueueHandler로 대체
+    
+    이미 설치된 리스너가 있으면 남은 레코드를 처리한 뒤 교체한다.
+    """
+    global _queue_listener
+    
+    stop_queue_logging()
+    root_logger = logging.getLogger()
+    handlers = [h for h in root_logger.handlers if not isinstance(h, QueueHandler)]
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+    
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+    _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+
+
+def stop_queue_logging() -> None:
+    """
+    큐에 남은 레코드를 모두 기록하고 리스너 스레드 종료
+    
+    리스너의 핸들러는 루트 로거로 되돌리므로 이후 로그는 동기적으로 기록된다.
+    """
+    global _queue_listener
+    
+    listener, _queue_listener = _queue_listener, None
+    if listener is None:
+        return
+    root_logger = logging.getLogger()
+    for handler in listener.handlers:
+        root_logger.addHandler(handler)
+    for handler in root_logger.handlers[:]:
+        if isinstance(handler, QueueHandler) and handler.queue is listener.queue:
+            root_logger.removeHandler(handler)
+    listener.stop()
+
+
+atexit.register(stop_queue_logging)
+
+
+def _output_handlers() -> List[logging.Handler]:
+    """실제로 출력하는 핸들러 (리스너 핸들러 포함)"""
+    loggers = [logging.getLogger()] + [
+        logger for logger in logging.Logger.manager.loggerDict.values()
+        if isinstance(logger, logging.Logger)
+    ]
+    handlers = [handler for logger in loggers for handler in logger.handlers]
+    if _queue_listener is not None:
+        handlers.extend(_queue_listener.handlers)
+    return handlers
+
+
+def redirect_console_logging(stream=None) -> None:
+    """
+    stdout으로 출력하는 콘솔 핸들러를 다른 스트림으로 전환
+
+    헤드리스 CLI가 stdout을 기계 판독용 출력(JSONL)으로 사용할 때 호출한다.
+
+    Args:
+        stream: 새 출력 스트림 (기본값: sys.stderr)
+    """
+    stream = stream or sys.stderr
+    for handler in _output_handlers():
+        if (type(handler) is logging.StreamHandler
+                and handler.stream in (sys.stdout, sys.__stdout__)):
+            handler.setStream(stream)
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -105,25 +195,26 @@ def get_logger(name: str) -> logging.Logger:
 
 
 class UILogHandler(logging.Handler):
-    """UI 로그 위젯에 로그 메시지를 전송하는 핸들러"""
+    """
+    UI 로그 위젯에 로그 메시지를 전송하는 핸들러
+    
+    큐 로깅이 설치되어 있으면 리스너 스레드에서 실행되므로 위젯을 직접 조작하지 않고
+    스레드 안전한 `post_log()`로 전달한다. 위젯은 이를 모아 GUI 스레드에서 일괄 반영한다.
+    """
     
     def __init__(self, log_widget=None):
         super().__init__()
         self.log_widget = log_widget
         self.setLevel(logging.INFO)
-        
-        formatter = logging.Formatter(
-            '%(asctime)s - %(levelname)s - %(message)s',
-            datefmt='%H:%M:%S'
-        )
-        self.setFormatter(formatter)
+        # 시각과 레벨은 위젯이 레코드 값으로 표시
+        self.setFormatter(logging.Formatter('%(message)s'))
     
     def emit(self, record):
         """로그 레코드를 UI 위젯으로 전송"""
-        if self.log_widget is not None:
+        log_widget = self.log_widget
+        if log_widget is not None:
             try:
-                msg = self.format(record)
-                self.log_widget.append_log(msg, record.levelname)
+                log_widget.post_log(self.format(record), record.levelname, record.created)
             except Exception:
                 # UI 로그 실패시 무시 (무한 루프 방지)
                 pass
@@ -142,11 +233,15 @@ def add_ui_logging(log_widget) -> None:
     UI 로깅 추가
     
     Args:
-        log_widget: 로그를 표시할 UI 위젯
+        log_widget: 로그를 표시할 UI 위젯 (스레드 안전한 post_log 제공)
     """
     ui_log_handler.set_log_widget(log_widget)
     
-    # 루트 로거에 UI 핸들러 추가
+    # 큐 리스너가 있으면 리스너 스레드에서, 없으면 루트 로거에서 처리
+    if _queue_listener is not None:
+        if ui_log_handler not in _queue_listener.handlers:
+            _queue_listener.handlers = _queue_listener.handlers + (ui_log_handler,)
+        return
     root_logger = logging.getLogger()
     if ui_log_handler not in root_logger.handlers:
         root_logger.addHandler(ui_log_handler)
@@ -154,7 +249,11 @@ def add_ui_logging(log_widget) -> None:
 
 def remove_ui_logging() -> None:
     """UI 로깅 제거"""
+    if _queue_listener is not None:
+        _queue_listener.handlers = tuple(
+            h for h in _queue_listener.handlers if h is not ui_log_handler
+        )
     root_logger = logging.getLogger()
     if ui_log_handler in root_logger.handlers:
         root_logger.removeHandler(ui_log_handler)
-    ui_log_handler.set_log_widget(None)
\ No newline at end of file
+    ui_log_handler.set_log_widget(None)
@@ -0,0 +1,149 @@
+"""
+마크다운 HTML 렌더러
+미리보기용 마크다운→HTML 변환을 내용 해시 기준으로 캐시하고, 큰 문서를 섹션 단위로 나눔
+
+렌더링은 미리보기 다이얼로그가 렌더링마다 새로 만드는 작업 스레드에서 호출된다.
+markdown.Markdown 객체는 스레드 안전하지 않으므로 렌더링하는 동안 한 스레드가 독점하고,
+끝나면 유휴 목록에 돌려놓아 reset() 후 재사용한다. 유휴 객체가 없을 때만 새로 만들어
+앞선 렌더링이 끝나지 않았어도 다음 렌더링이 기다리지 않는다.
+"""
+
+import hashlib
+import re
+import threading
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+try:
+    import markdown
+    MARKDOWN_AVAILABLE = True
+except ImportError:
+    MARKDOWN_AVAILABLE = False
+
+from .constants import PREVIEW_HTML_CACHE_ENTRIES, PREVIEW_HTML_CACHE_MB, PREVIEW_SECTION_MAX_CHARS
+from .memory_optimizer import LRUCache
+
+
+MARKDOWN_EXTENSIONS = ('codehilite', 'tables', 'toc', 'fenced_code')
+
+_HEADING_RE = re.compile(r'^(#{1,2})\s+(.+?)\s*#*\s*$')
+_FENCE_RE = re.compile(r'^\s{0,3}(`{3,}|~{3,})')
+
+
+@dataclass(frozen=True)
+class MarkdownSection:
+    """문서의 한 섹션 (원문 문자 범위)"""
+    title: str
+    start: int
+    end: int
+
+    def text(self, content: str) -> str:
+        return content[self.start:self.end]
+
+
+def content_digest(text: str) -> str:
+    """캐시 키로 쓰는 내용 해시"""
+    return hashlib.sha256(text.encode('utf-8', 'surrogatepass')).hexdigest()
+
+
+def split_sections(content: str, max_chars: int = PREVIEW_SECTION_MAX_CHARS) -> List[MarkdownSection]:
+    """
+    최상위(#, ##) 제목 기준으로 섹션 분할
+
+    코드 블록 안의 줄은 제목으로 보지 않으며, max_chars를 넘는 섹션은 코드 블록 밖의
+    빈 줄에서 추가로 나눈다. 섹션을 이어 붙이면 원문과 같다.
+    """
+    sections: List[MarkdownSection] = []
+    start = 0
+    title = ""
+    part = 1
+    fence: Optional[str] = None
+    offset = 0
+
+    def close(end: int):
+        if end > start:
+            if title:
+                name = title if part == 1 else f"{title} ({part})"
+            else:
+                name = content[start:end].lstrip().split('\n', 1)[0][:60] or "(빈 섹션)"
+            sections.append(MarkdownSection(name, start, end))
+
+    for line in content.splitlines(keepends=True):
+        stripped = line.rstrip('\r\n')
+        fence_match = _FENCE_RE.match(stripped)
+        if fence_match:
+            marker = fence_match.group(1)
+            if fence is None:
+                fence = marker
+            elif marker[0] == fence[0] and len(marker) >= len(fence):
+                fence = None
+        elif fence is None:
+            heading = _HEADING_RE.match(stripped)
+            if heading:
+                close(offset)
+                start, title, part = offset, heading.group(2), 1
+            elif not stripped.strip() and offset - start >= max_chars:
+                close(offset)
+                start, part = offset, part + 1
+        offset += len(line)
+
+    close(len(content))
+    return sections
+
+
+class MarkdownRenderer:
+    """내용 해시 기준 HTML 캐시를 가진 마크다운 렌더러"""
+
+    def __init__(self, cache: Optional[LRUCache] = None,
+                 extensions: Sequence[str] = MARKDOWN_EXTENSIONS):
+        self.cache = cache if cache is not None else LRUCache(
+            PREVIEW_HTML_CACHE_ENTRIES, PREVIEW_HTML_CACHE_MB
+        )
+        self.extensions = tuple(extensions)
+        self._idle_md: List = []
+        self._md_lock = threading.Lock()
+
+    def cached(self, content: str) -> Optional[str]:
+        """캐시된 HTML (없으면 None, UI 스레드에서 호출해도 됨)"""
+        return self.cache.get(content_digest(content))
+
+    def render(self, content: str) -> str:
+        """HTML 렌더링 (캐시 우선)"""
+        key = content_digest(content)
+        html = self.cache.get(key)
+        if html is None:
+            md = self._markdown()
+            try:
+                md.reset()
+                html = md.convert(content)
+            finally:
+                self._release_markdown(md)
+            self.cache.set(key, html, size=len(html) * 2)
+        return html
+
+    def _markdown(self):
+        """유휴 Markdown 객체를 꺼내 독점 (없으면 새로 생성)"""
+        with self._md_lock:
+            if self._idle_md:
+                return self._idle_md.pop()
+        if not MARKDOWN_AVAILABLE:
+            raise RuntimeError("markdown 라이브러리가 설치되어 있지 않습니다")
+        return markdown.Markdown(extensions=list(self.extensions))
+
+    def _release_markdown(self, md):
+        """렌더링을 마친 Markdown 객체를 유휴 목록에 반환"""
+        with self._md_lock:
+            self._idle_md.append(md)
+
+
+_renderer: Optional[MarkdownRenderer] = None
+_renderer_lock = threading.Lock()
+
+
+def get_markdown_renderer() -> MarkdownRenderer:
+    """공유 렌더러 (미리보기 창을 다시 열어도 캐시 유지)"""
+    global _renderer
+    with _renderer_lock:
+        if _renderer is None:
+            _renderer = MarkdownRenderer()
+        return _renderer
@@ -3,20 +3,38 @@ Memory optimization utilities and management
 """
 
 import gc
+import sys
+import zlib
 import weakref
 import tracemalloc
 import threading
-from typing import Dict, List, Optional, Any, Callable, Generator
+from enum import Enum
+from typing import Dict, List, Optional, Any, Callable, Generator, Tuple, Iterable
 from functools import wraps
 from collections import OrderedDict
-import psutil
 import time
-from pathlib import Path
+from pathlib import Path, PurePath
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
 
 from .logger import get_logger
+from .constants import (
+    GC_TRIGGER_MEMORY_PERCENT, CACHE_NAMESPACE_BUDGETS, CACHE_NAMESPACE_DEFAULT,
+    CACHE_COMPRESSED_NAMESPACES, CACHE_COMPRESSION_MIN_BYTES
+)
+from .resource_sampler import get_resource_sampler, ResourceSnapshot
 
 logger = get_logger(__name__)
 
+# Size estimation limits
+_MAX_SIZE_DEPTH = 4
+_DEFAULT_ENTRY_SIZE = 1024
+
 
 class MemoryTracker:
     """Track memory usage and detect leaks"""
@@ -91,12 +109,8 @@ class MemoryTracker:
         return checkpoint_data
     
     def _get_current_memory(self) -> int:
-        """Get current process memory usage"""
-        try:
-            process = psutil.Process()
-            return process.memory_info().rss
-        except Exception:
-            return 0
+        """Get current process memory usage from the background sampler"""
+        return get_resource_sampler().snapshot().rss
     
     def _format_bytes(self, bytes_val: int) -> str:
         """Format bytes as human readable string"""
@@ -134,87 +148,406 @@ class MemoryTracker:
         return "\n".join(report)
 
 
+def estimate_size(obj: Any, _depth: int = 0) -> int:
+    """
+    Estimate the in-memory footprint of an object in bytes.
+    
+    Strings, bytes and containers are measured with ``sys.getsizeof`` and
+    walked recursively; plain objects and dataclasses (``FileInfo``,
+    ``OCRResult``, ...) are measured through their attributes. Enum members
+    are shared singletons and count as zero. Recursion is bounded so
+    pathological object graphs stay cheap to size.
+    """
+    if obj is None or isinstance(obj, (bool, Enum)):
+        return 0
+    try:
+        size = sys.getsizeof(obj)
+        if isinstance(obj, (str, bytes, bytearray, memoryview, int, float)):
+            return size
+        if isinstance(obj, PurePath):
+            return size + sys.getsizeof(str(obj))
+        if _depth >= _MAX_SIZE_DEPTH:
+            return size
+        
+        if isinstance(obj, dict):
+            size += sum(estimate_size(k, _depth + 1) + estimate_size(v, _depth + 1)
+                        for k, v in obj.items())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            size += sum(estimate_size(item, _depth + 1) for item in obj)
+        else:
+            attrs = getattr(obj, '__dict__', None)
+            if attrs is not None:
+                size += sum(estimate_size(v, _depth + 1) for v in attrs.values())
+            for slot in getattr(type(obj), '__slots__', ()):
+                size += estimate_size(getattr(obj, slot, None), _depth + 1)
+        return size
+    except Exception:
+        return _DEFAULT_ENTRY_SIZE
+
+
 class LRUCache:
-    """Memory-efficient LRU cache implementation"""
+    """
+    Byte-budgeted LRU cache.
     
-    def __init__(self, max_size: int = 128, max_memory_mb: int = 50):
+    Each entry's size is computed once on insert (by ``sizer``, or passed
+    explicitly) and stored alongside the value, so eviction and replacement
+    are O(1) bookkeeping instead of re-measuring values.
+    """
+    
+    def __init__(self, max_size: int = 128, max_memory_mb: float = 50,
+                 sizer: Optional[Callable[[Any], int]] = None):
         self.max_size = max_size
-        self.max_memory_bytes = max_memory_mb * 1024 * 1024
-        self._cache = OrderedDict()
+        self.max_memory_bytes = int(max_memory_mb * 1024 * 1024)
+        self.sizer = sizer or estimate_size
+        self._cache: "OrderedDict[Any, Tuple[Any, int]]" = OrderedDict()
         self._memory_usage = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._rejections = 0
         self._lock = threading.RLock()
     
-    def get(self, key: Any) -> Any:
+    @property
+    def cache(self) -> "OrderedDict[Any, Tuple[Any, int]]":
+        """Underlying ordered mapping of key -> (value, size)"""
+        return self._cache
+    
+    def __len__(self) -> int:
+        return len(self._cache)
+    
+    def __contains__(self, key: Any) -> bool:
+        return key in self._cache
+    
+    def get(self, key: Any, default: Any = None) -> Any:
         """Get item from cache"""
         with self._lock:
-            if key in self._cache:
-                # Move to end (most recent)
-                value = self._cache.pop(key)
-                self._cache[key] = value
-                return value
-            return None
-    
-    def set(self, key: Any, value: Any):
-        """Set item in cache"""
+            entry = self._cache.get(key)
+            if entry is None:
+                self._misses += 1
+                return default
+            self._cache.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+    
+    def set(self, key: Any, value: Any, size: Optional[int] = None) -> bool:
+        """
+        Set item in cache
+        
+        Args:
+            key: Cache key
+            value: Value to cache
+            size: Pre-computed size in bytes; measured with ``sizer`` if omitted
+        
+        Returns:
+            False if the value alone exceeds the memory budget and was not cached
+        """
+        item_size = size if size is not None else self.sizer(value)
+        
         with self._lock:
-            # Estimate memory usage
-            item_size = self._estimate_size(value)
-            
             # Remove existing item if present
-            if key in self._cache:
-                old_value = self._cache.pop(key)
-                self._memory_usage -= self._estimate_size(old_value)
+            old_entry = self._cache.pop(key, None)
+            if old_entry is not None:
+                self._memory_usage -= old_entry[1]
+                self._on_discard(*old_entry)
             
-            # Check memory limit
-            while (self._memory_usage + item_size > self.max_memory_bytes or
-                   len(self._cache) >= self.max_size):
-                if not self._cache:
-                    break
-                
-                # Remove oldest item
-                oldest_key, oldest_value = self._cache.popitem(last=False)
-                self._memory_usage -= self._estimate_size(oldest_value)
+            if item_size > self.max_memory_bytes:
+                self._rejections += 1
+                return False
+            
+            # Evict oldest entries until the new one fits
+            while self._cache and (self._memory_usage + item_size > self.max_memory_bytes or
+                                   len(self._cache) >= self.max_size):
+                _, (evicted_value, evicted_size) = self._cache.popitem(last=False)
+                self._memory_usage -= evicted_size
+                self._evictions += 1
+                self._on_discard(evicted_value, evicted_size)
             
-            # Add new item
-            self._cache[key] = value
+            self._cache[key] = (value, item_size)
             self._memory_usage += item_size
+            self._on_insert(value, item_size)
+            return True
+    
+    put = set
+    
+    def remove(self, key: Any) -> bool:
+        """Remove item from cache"""
+        with self._lock:
+            entry = self._cache.pop(key, None)
+            if entry is None:
+                return False
+            self._memory_usage -= entry[1]
+            self._on_discard(*entry)
+            return True
     
     def clear(self):
         """Clear all cached items"""
         with self._lock:
             self._cache.clear()
             self._memory_usage = 0
+            self._on_clear()
     
-    def _estimate_size(self, obj: Any) -> int:
-        """Estimate memory size of object"""
-        try:
-            # Simple estimation based on type
-            if isinstance(obj, str):
-                return len(obj.encode('utf-8'))
-            elif isinstance(obj, (bytes, bytearray)):
-                return len(obj)
-            elif isinstance(obj, (list, tuple)):
-                return sum(self._estimate_size(item) for item in obj)
-            elif isinstance(obj, dict):
-                return sum(self._estimate_size(k) + self._estimate_size(v) 
-                          for k, v in obj.items())
-            else:
-                return 1024  # Default estimate
-        except Exception:
-            return 1024  # Fallback estimate
+    # Bookkeeping hooks for subclasses; called with the lock held
+    def _on_insert(self, value: Any, size: int):
+        pass
+    
+    def _on_discard(self, value: Any, size: int):
+        pass
+    
+    def _on_clear(self):
+        pass
+    
+    def reset_stats(self):
+        """Reset hit/miss/eviction counters"""
+        with self._lock:
+            self._hits = self._misses = self._evictions = self._rejections = 0
     
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
         with self._lock:
+            lookups = self._hits + self._misses
             return {
                 'size': len(self._cache),
                 'max_size': self.max_size,
                 'memory_usage': self._memory_usage,
+                'memory_usage_bytes': self._memory_usage,
                 'max_memory': self.max_memory_bytes,
-                'memory_utilization': self._memory_usage / self.max_memory_bytes * 100
+                'memory_utilization': (self._memory_usage / self.max_memory_bytes * 100
+                                       if self.max_memory_bytes else 0.0),
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'rejections': self._rejections,
+                'hit_ratio': self._hits / lookups if lookups else 0.0
             }
 
 
+class _ZlibCodec:
+    """zlib codec (always available)"""
+    
+    name = "zlib"
+    
+    def __init__(self, level: int = 6):
+        self.level = level
+    
+    def compress(self, data: bytes) -> bytes:
+        return zlib.compress(data, self.level)
+    
+    def decompress(self, data: bytes) -> bytes:
+        return zlib.decompress(data)
+
+
+class _ZstdCodec:
+    """zstd codec; compressor objects are not thread-safe so each thread gets its own"""
+    
+    name = "zstd"
+    
+    def __init__(self, level: int = 3):
+        self.level = level
+        self._local = threading.local()
+    
+    def _compressors(self):
+        local = self._local
+        if not hasattr(local, 'compressor'):
+            local.compressor = zstandard.ZstdCompressor(level=self.level)
+            local.decompressor = zstandard.ZstdDecompressor()
+        return local.compressor, local.decompressor
+    
+    def compress(self, data: bytes) -> bytes:
+        return self._compressors()[0].compress(data)
+    
+    def decompress(self, data: bytes) -> bytes:
+        return self._compressors()[1].decompress(data)
+
+
+def get_default_codec():
+    """zstd if the zstandard package is installed, zlib otherwise"""
+    return _ZstdCodec() if ZSTD_AVAILABLE else _ZlibCodec()
+
+
+class CompressedEntry:
+    """Compressed cache payload, decompressed lazily on a cache hit"""
+    
+    __slots__ = ('data', 'raw_size', 'is_text')
+    
+    # Approximate fixed cost of the entry object and its bytes header
+    OVERHEAD = sys.getsizeof(b'') + 64
+    
+    def __init__(self, data: bytes, raw_size: int, is_text: bool):
+        self.data = data
+        self.raw_size = raw_size
+        self.is_text = is_text
+    
+    @property
+    def stored_size(self) -> int:
+        return len(self.data) + self.OVERHEAD
+
+
+class CompressedLRUCache(LRUCache):
+    """
+    LRU cache that stores ``str``/``bytes`` values compressed.
+    
+    The byte budget is charged with the compressed size, so highly
+    compressible values such as converted markdown and OCR text fit many
+    times over in the same budget. Values are decompressed only on a hit;
+    values that are small or do not shrink are stored as-is.
+    """
+    
+    def __init__(self, max_size: int = 128, max_memory_mb: float = 50,
+                 sizer: Optional[Callable[[Any], int]] = None, codec=None,
+                 min_compress_size: int = CACHE_COMPRESSION_MIN_BYTES):
+        super().__init__(max_size, max_memory_mb, sizer)
+        self.codec = codec or get_default_codec()
+        self.min_compress_size = min_compress_size
+        self._raw_bytes = 0
+        self._compressed_entries = 0
+        self._decompressions = 0
+    
+    def get(self, key: Any, default: Any = None) -> Any:
+        value = super().get(key, default)
+        if isinstance(value, CompressedEntry):
+            raw = self.codec.decompress(value.data)
+            with self._lock:
+                self._decompressions += 1
+            return raw.decode('utf-8') if value.is_text else raw
+        return value
+    
+    def set(self, key: Any, value: Any, size: Optional[int] = None) -> bool:
+        entry = self._compress(value)
+        if entry is None:
+            return super().set(key, value, size)
+        return super().set(key, entry, entry.stored_size)
+    
+    put = set
+    
+    def _compress(self, value: Any) -> Optional[CompressedEntry]:
+        if isinstance(value, str):
+            raw, is_text = value.encode('utf-8'), True
+        elif isinstance(value, (bytes, bytearray)):
+            raw, is_text = bytes(value), False
+        else:
+            return None
+        
+        if len(raw) < self.min_compress_size:
+            return None
+        
+        try:
+            data = self.codec.compress(raw)
+        except Exception as e:
+            logger.debug(f"Cache compression failed, storing raw value: {e}")
+            return None
+        
+        if len(data) >= len(raw):
+            return None
+        # Charge the raw side with the in-memory size of the original object
+        return CompressedEntry(data, sys.getsizeof(value), is_text)
+    
+    def _on_insert(self, value: Any, size: int):
+        if isinstance(value, CompressedEntry):
+            self._raw_bytes += value.raw_size
+            self._compressed_entries += 1
+        else:
+            self._raw_bytes += size
+    
+    def _on_discard(self, value: Any, size: int):
+        if isinstance(value, CompressedEntry):
+            self._raw_bytes -= value.raw_size
+            self._compressed_entries -= 1
+        else:
+            self._raw_bytes -= size
+    
+    def _on_clear(self):
+        self._raw_bytes = 0
+        self._compressed_entries = 0
+    
+    def get_stats(self) -> Dict[str, Any]:
+        stats = super().get_stats()
+        with self._lock:
+            stats.update({
+                'codec': self.codec.name,
+                'raw_bytes': self._raw_bytes,
+                'compressed_entries': self._compressed_entries,
+                'decompressions': self._decompressions,
+                'compression_ratio': (self._raw_bytes / self._memory_usage
+                                      if self._memory_usage else 1.0)
+            })
+        return stats
+
+
+class NamespacedCache:
+    """
+    Set of independent LRU caches, one per namespace.
+    
+    Each namespace has its own entry and byte budget, so a flood of small
+    file-info entries cannot evict cached conversion results.
+    """
+    
+    def __init__(self, budgets: Optional[Dict[str, Tuple[int, float]]] = None,
+                 default_budget: Tuple[int, float] = (128, 10),
+                 sizer: Optional[Callable[[Any], int]] = None,
+                 compressed_namespaces: Optional[Iterable[str]] = None):
+        self._budgets = dict(CACHE_NAMESPACE_BUDGETS if budgets is None else budgets)
+        self._default_budget = default_budget
+        self._sizer = sizer
+        self._compressed_namespaces = frozenset(
+            CACHE_COMPRESSED_NAMESPACES if compressed_namespaces is None else compressed_namespaces
+        )
+        self._namespaces: Dict[str, LRUCache] = {}
+        self._lock = threading.Lock()
+    
+    def namespace(self, name: str) -> LRUCache:
+        """Get or create the cache for a namespace"""
+        cache = self._namespaces.get(name)
+        if cache is None:
+            with self._lock:
+                cache = self._namespaces.get(name)
+                if cache is None:
+                    max_size, max_memory_mb = self._budgets.get(name, self._default_budget)
+                    cache_class = (CompressedLRUCache if name in self._compressed_namespaces
+                                   else LRUCache)
+                    cache = cache_class(max_size, max_memory_mb, self._sizer)
+                    self._namespaces[name] = cache
+        return cache
+    
+    def get(self, key: Any, namespace: str = CACHE_NAMESPACE_DEFAULT, default: Any = None) -> Any:
+        return self.namespace(namespace).get(key, default)
+    
+    def set(self, key: Any, value: Any, namespace: str = CACHE_NAMESPACE_DEFAULT,
+            size: Optional[int] = None) -> bool:
+        return self.namespace(namespace).set(key, value, size)
+    
+    def remove(self, key: Any, namespace: str = CACHE_NAMESPACE_DEFAULT) -> bool:
+        return self.namespace(namespace).remove(key)
+    
+    def clear(self, namespace: Optional[str] = None, exclude: Iterable[str] = ()):
+        """Clear one namespace, or all of them except ``exclude``"""
+        if namespace is not None:
+            self.namespace(namespace).clear()
+            return
+        excluded = set(exclude)
+        for name, cache in list(self._namespaces.items()):
+            if name not in excluded:
+                cache.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Aggregate statistics with a per-namespace breakdown"""
+        per_namespace = {name: cache.get_stats() for name, cache in list(self._namespaces.items())}
+        
+        totals = {key: sum(ns[key] for ns in per_namespace.values())
+                  for key in ('size', 'max_size', 'memory_usage', 'max_memory',
+                              'hits', 'misses', 'evictions', 'rejections')}
+        lookups = totals['hits'] + totals['misses']
+        totals['raw_bytes'] = sum(ns.get('raw_bytes', ns['memory_usage'])
+                                  for ns in per_namespace.values())
+        totals['compression_ratio'] = (totals['raw_bytes'] / totals['memory_usage']
+                                       if totals['memory_usage'] else 1.0)
+        totals['memory_usage_bytes'] = totals['memory_usage']
+        totals['memory_utilization'] = (totals['memory_usage'] / totals['max_memory'] * 100
+                                        if totals['max_memory'] else 0.0)
+        totals['hit_ratio'] = totals['hits'] / lookups if lookups else 0.0
+        totals['namespaces'] = per_namespace
+        return totals
+
+
 class StreamingFileProcessor:
     """Process files in chunks to reduce memory usage"""
     
@@ -414,7 +747,8 @@ class MemoryOptimizer:
     
     def __init__(self):
         self.tracker = MemoryTracker()
-        self.cache = LRUCache()
+        self.sampler = get_resource_sampler()
+        self.cache = NamespacedCache()
         self.file_processor = StreamingFileProcessor()
         self.weak_refs = WeakReferenceManager()
         self._memory_pools = {}
@@ -450,13 +784,13 @@ class MemoryOptimizer:
         
         return stats
     
-    def cleanup_resources(self):
-        """Cleanup all managed resources"""
+    def cleanup_resources(self, preserve_namespaces: Iterable[str] = ()):
+        """Cleanup all managed resources, optionally keeping some cache namespaces warm"""
         if not self._optimization_enabled:
             return
         
         # Clear caches
-        self.cache.clear()
+        self.cache.clear(exclude=preserve_namespaces)
         
         # Cleanup weak references
         dead_refs = self.weak_refs.cleanup_dead_references()
@@ -516,17 +850,16 @@ class MemoryOptimizer:
             }
         }
         
-        # Add current memory info
-        try:
-            process = psutil.Process()
-            memory_info = process.memory_info()
+        # Add current memory info from the latest background sample
+        snapshot = self.sampler.snapshot()
+        if snapshot.is_valid:
             stats['system_memory'] = {
-                'rss': memory_info.rss,
-                'vms': memory_info.vms,
-                'percent': process.memory_percent()
+                'rss': snapshot.rss,
+                'vms': snapshot.vms,
+                'peak_rss': snapshot.peak_rss,
+                'percent': snapshot.memory_percent,
+                'cpu_percent': snapshot.cpu_percent
             }
-        except Exception as e:
-            logger.warning(f"Could not get system memory info: {e}")
         
         return stats
     
@@ -543,6 +876,10 @@ class MemoryOptimizer:
             f"  Size: {stats['cache_stats']['size']}/{stats['cache_stats']['max_size']}",
             f"  Memory Usage: {stats['cache_stats']['memory_usage'] / (1024*1024):.1f} MB",
             f"  Memory Utilization: {stats['cache_stats']['memory_utilization']:.1f}%",
+            f"  Hits/Misses/Evictions: {stats['cache_stats']['hits']}/"
+            f"{stats['cache_stats']['misses']}/{stats['cache_stats']['evictions']} "
+            f"(hit ratio {stats['cache_stats']['hit_ratio']:.1%})",
+            f"  Compression Ratio: {stats['cache_stats']['compression_ratio']:.1f}x",
             "",
             "Weak References:",
             f"  Total: {stats['weak_ref_stats']['total_references']}",
@@ -574,20 +911,17 @@ class MemoryOptimizer:
         """Start memory monitoring (compatibility method)"""
         self.start_session("file_manager")
     
-    def cleanup(self):
+    def cleanup(self, preserve_namespaces: Iterable[str] = ()):
         """Cleanup resources (compatibility method)"""
-        self.cleanup_resources()
+        self.cleanup_resources(preserve_namespaces)
     
     def should_trigger_gc(self) -> bool:
         """Check if garbage collection should be triggered"""
-        try:
-            process = psutil.Process()
-            memory_percent = process.memory_percent()
-            # Trigger GC if memory usage is above 70%
-            return memory_percent > 70.0
-        except Exception:
+        snapshot = self.sampler.snapshot()
+        if not snapshot.is_valid:
             # Default to triggering GC every so often
             return True
+        return snapshot.memory_percent > GC_TRIGGER_MEMORY_PERCENT
     
     def force_gc(self):
         """Force garbage collection"""
@@ -596,30 +930,31 @@ class MemoryOptimizer:
     
     def get_memory_statistics(self) -> Dict[str, Any]:
         """Get memory statistics (compatibility method)"""
-        stats = self.get_comprehensive_stats()
+        snapshot = self.sampler.snapshot()
+        cache_stats = self.cache.get_stats()
         
         # Convert to format expected by file_manager
-        try:
-            process = psutil.Process()
-            memory_info = process.memory_info()
-            peak_memory_mb = memory_info.rss / (1024 * 1024)
-        except Exception:
-            peak_memory_mb = 0.0
-        
         return {
-            'peak_memory_mb': peak_memory_mb,
-            'current_memory_mb': peak_memory_mb,
-            'cache_size': stats['cache_stats']['size'],
-            'optimization_enabled': stats['optimization_enabled']
+            'peak_memory_mb': snapshot.peak_rss_mb,
+            'current_memory_mb': snapshot.rss_mb,
+            'cpu_percent': snapshot.cpu_percent,
+            'cache_size': cache_stats['size'],
+            'cache_stats': cache_stats,
+            'optimization_enabled': self._optimization_enabled
         }
     
-    def get_cached_result(self, cache_key: str) -> Any:
-        """Get cached result (compatibility method)"""
-        return self.cache.get(cache_key)
+    def get_resource_snapshot(self) -> ResourceSnapshot:
+        """Latest background resource sample"""
+        return self.sampler.snapshot()
+    
+    def get_cached_result(self, cache_key: str, namespace: str = CACHE_NAMESPACE_DEFAULT) -> Any:
+        """Get cached result from a cache namespace"""
+        return self.cache.get(cache_key, namespace)
     
-    def cache_result(self, cache_key: str, result: Any):
-        """Cache result (compatibility method)"""
-        self.cache.set(cache_key, result)
+    def cache_result(self, cache_key: str, result: Any, namespace: str = CACHE_NAMESPACE_DEFAULT,
+                     size: Optional[int] = None) -> bool:
+        """Cache result in a cache namespace (size is measured once if omitted)"""
+        return self.cache.set(cache_key, result, namespace, size)
 
 
 # Global memory optimizer instance
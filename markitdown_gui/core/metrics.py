@@ -0,0 +1,639 @@
+"""
+통합 메트릭 레지스트리
+카운터/게이지/지연 히스토그램을 한 곳에 모아 Prometheus 텍스트 형식으로 내보내기
+
+두 가지 방식으로 값을 모은다.
+- push: 변환 엔진이 파일마다 `Counter.inc()`, `Histogram.observe()`로 직접 기록
+- pull: CircuitBreaker, ErrorRecoveryManager, LLMStats, 캐시처럼 dict 통계만 제공하는
+  구성 요소는 `register_source()`로 등록해 두고 수집 시점에 읽어 변환
+
+등록된 소스는 약한 참조로 보관하므로 엔진이 사라지면 자동으로 빠진다. 이때 카운터와
+히스토그램은 마지막으로 수집한 값을 보존 합계로 옮겨 계속 내보내므로(게이지는 제외)
+소스가 사라져도 카운터가 줄어들어 리셋처럼 보이지 않는다. 워커마다 엔진이 있어 같은
+이름/레이블의 샘플이 여러 번 나오면 카운터와 히스토그램은 합산하고 게이지는
+최댓값(예: 가장 나쁜 회로 상태)을 사용한다.
+
+내보내기:
+    write_prometheus_file()     node_exporter textfile collector용 파일 (원자적 교체)
+    MetricsFileExporter         주기적으로 파일을 갱신하는 백그라운드 스레드
+    MetricsServer               localhost `GET /metrics` 엔드포인트
+"""
+
+import math
+import time
+import threading
+import weakref
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from pathlib import Path
+from http import HTTPStatus
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Dict, List, Optional, Any, Callable, Iterable, Sequence, Tuple
+
+from .constants import (
+    METRICS_PREFIX, METRICS_DEFAULT_HOST, METRICS_DEFAULT_PORT, METRICS_EXPORT_INTERVAL,
+    METRICS_LATENCY_BUCKETS
+)
+from .logger import get_logger
+from .utils import atomic_write_text
+
+
+logger = get_logger(__name__)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+COUNTER = "counter"
+GAUGE = "gauge"
+HISTOGRAM = "histogram"
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def metric_name(name: str) -> str:
+    """접두어가 붙은 메트릭 이름"""
+    return f"{METRICS_PREFIX}_{name}"
+
+
+@dataclass
+class MetricFamily:
+    """같은 이름을 가진 샘플 묶음 (수집 결과)"""
+    name: str
+    type: str
+    documentation: str
+    samples: List[Tuple[str, LabelKey, float]] = field(default_factory=list)
+
+    def add(self, value: float, suffix: str = "", **labels):
+        """샘플 추가 (suffix는 히스토그램의 _bucket/_sum/_count)"""
+        self.samples.append((self.name + suffix, _label_key(labels), float(value)))
+        return self
+
+
+def _label_key(labels: Dict[str, Any]) -> LabelKey:
+    return tuple(sorted((str(k), str(v)) for k, v in labels.items()))
+
+
+class _Metric:
+    """레이블별 값을 가진 메트릭의 공통 부분"""
+
+    type = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(sorted(labelnames))
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> LabelKey:
+        if tuple(sorted(labels)) != self.labelnames:
+            raise ValueError(f"{self.name}: expected labels {self.labelnames}, "
+                             f"got {tuple(sorted(labels))}")
+        return _label_key(labels)
+
+    def collect(self) -> MetricFamily:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    type = COUNTER
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels):
+        if amount < 0:
+            raise ValueError(f"{self.name}: counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def collect(self) -> MetricFamily:
+        family = MetricFamily(self.name, self.type, self.documentation)
+        with self._lock:
+            family.samples = [(self.name, key, value) for key, value in self._values.items()]
+        return family
+
+
+class Gauge(_Metric):
+    """임의로 오르내리는 현재 값"""
+
+    type = GAUGE
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelKey, float] = {}
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels):
+        self.inc(-amount, **labels)
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def collect(self) -> MetricFamily:
+        family = MetricFamily(self.name, self.type, self.documentation)
+        with self._lock:
+            family.samples = [(self.name, key, value) for key, value in self._values.items()]
+        return family
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램 (지연 시간 등)"""
+
+    type = HISTOGRAM
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = METRICS_LATENCY_BUCKETS):
+        if "le" in labelnames:
+            raise ValueError(f"{name}: 'le' is reserved for histogram buckets")
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(float(b) for b in buckets if not math.isinf(b)))
+        # 레이블 -> (버킷별 개수[+Inf 포함], 합계)
+        self._series: Dict[LabelKey, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = ([0] * (len(self.buckets) + 1), [0.0])
+            series[0][index] += 1
+            series[1][0] += value
+
+    def count(self, **labels) -> int:
+        with self._lock:
+            series = self._series.get(self._key(labels))
+            return sum(series[0]) if series else 0
+
+    def collect(self) -> MetricFamily:
+        family = MetricFamily(self.name, self.type, self.documentation)
+        with self._lock:
+            series = [(key, list(counts), total[0]) for key, (counts, total) in self._series.items()]
+        for key, counts, total in series:
+            labels = dict(key)
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                family.add(cumulative, "_bucket", le=_format_value(bound), **labels)
+            family.add(total, "_sum", **labels)
+            family.add(cumulative, "_count", **labels)
+        return family
+
+
+SourceCollector = Callable[[Any], Iterable[MetricFamily]]
+
+
+class MetricsRegistry:
+    """메트릭과 pull 소스를 보관하고 수집/내보내기"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._sources: Dict[Tuple[int, int], Tuple[weakref.ref, SourceCollector]] = {}
+        # 소스별 마지막 누적 값(카운터/히스토그램)과 사라진 소스의 보존 합계
+        self._last_totals: Dict[Tuple[int, int], List[MetricFamily]] = {}
+        self._retained: List[MetricFamily] = []
+        self._lock = threading.Lock()
+
+    # Push metrics
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """카운터 조회 또는 생성"""
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """게이지 조회 또는 생성"""
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = METRICS_LATENCY_BUCKETS) -> Histogram:
+        """히스토그램 조회 또는 생성"""
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def _get_or_create(self, metric_class, name: str, documentation: str,
+                       labelnames: Sequence[str], **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = metric_class(name, documentation, labelnames, **kwargs)
+            elif type(metric) is not metric_class or metric.labelnames != tuple(sorted(labelnames)):
+                raise ValueError(f"Metric {name} already registered as {metric.type} "
+                                 f"with labels {metric.labelnames}")
+        return metric
+
+    # Pull sources
+
+    def register_source(self, source: Any, collector: SourceCollector):
+        """
+        dict 통계를 제공하는 객체 등록 (수집 시점에 collector(source) 호출)
+
+        같은 객체를 같은 collector로 다시 등록하면 무시되므로 공유 캐시처럼 여러 엔진이
+        함께 쓰는 객체도 한 번만 집계된다.
+        """
+        key = (id(source), id(collector))
+        with self._lock:
+            existing = self._sources.get(key)
+            if existing is not None:
+                if existing[0]() is source:
+                    return
+                # 사라진 소스의 id를 새 객체가 재사용
+                self._retain(key)
+            self._sources[key] = (weakref.ref(source), collector)
+
+    def unregister_source(self, source: Any):
+        """객체의 모든 collector 등록 해제 (누적 값은 보존 합계로 옮김)"""
+        with self._lock:
+            entries = [(k, collector) for k, (ref, collector) in self._sources.items()
+                       if ref() is source]
+        for key, collector in entries:
+            totals = self._collect_source(source, collector)
+            with self._lock:
+                if totals is not None:
+                    self._last_totals[key] = totals
+                self._retain(key)
+                self._sources.pop(key, None)
+
+    @staticmethod
+    def _collect_source(source: Any, collector: SourceCollector) -> Optional[List[MetricFamily]]:
+        try:
+            return list(collector(source))
+        except Exception as e:
+            logger.warning(f"메트릭 수집 실패 ({getattr(collector, '__name__', collector)}): {e}")
+            return None
+
+    def _retain(self, key: Tuple[int, int]):
+        """소스의 마지막 카운터/히스토그램 값을 보존 합계에 더함 (잠금 상태에서 호출)"""
+        totals = self._last_totals.pop(key, None)
+        if totals:
+            self._retained = _merge_families(
+                self._retained + [family for family in totals if family.type != GAUGE]
+            )
+
+    # Collection
+
+    def collect(self) -> List[MetricFamily]:
+        """모든 메트릭과 소스를 수집하여 이름별로 병합"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+            sources = list(self._sources.items())
+
+        families: List[MetricFamily] = [metric.collect() for metric in metrics]
+        dead = []
+        totals: Dict[Tuple[int, int], List[MetricFamily]] = {}
+        for key, (ref, collector) in sources:
+            source = ref()
+            if source is None:
+                dead.append(key)
+                continue
+            collected = self._collect_source(source, collector)
+            if collected is not None:
+                families.extend(collected)
+                totals[key] = collected
+            del source
+
+        with self._lock:
+            for key, collected in totals.items():
+                entry = self._sources.get(key)
+                if entry is not None and entry[0]() is not None:
+                    self._last_totals[key] = collected
+            for key in dead:
+                entry = self._sources.get(key)
+                if entry is not None and entry[0]() is None:
+                    del self._sources[key]
+                    self._retain(key)
+            families.extend(self._retained)
+        return _merge_families(families)
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식 (0.0.4)"""
+        return render_prometheus(self.collect())
+
+
+def _merge_families(families: Iterable[MetricFamily]) -> List[MetricFamily]:
+    """같은 이름의 샘플 병합 (카운터/히스토그램은 합산, 게이지는 최댓값)"""
+    merged: Dict[str, MetricFamily] = {}
+    values: Dict[str, Dict[Tuple[str, LabelKey], float]] = {}
+    for family in families:
+        target = merged.get(family.name)
+        if target is None:
+            target = merged[family.name] = MetricFamily(family.name, family.type,
+                                                        family.documentation)
+            values[family.name] = {}
+        samples = values[family.name]
+        for name, labels, value in family.samples:
+            key = (name, labels)
+            if key not in samples:
+                samples[key] = value
+            elif target.type == GAUGE:
+                samples[key] = max(samples[key], value)
+            else:
+                samples[key] += value
+
+    for name, family in merged.items():
+        family.samples = [(sample_name, labels, value)
+                          for (sample_name, labels), value in values[name].items()]
+    return sorted(merged.values(), key=lambda f: f.name)
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _escape_help(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def render_prometheus(families: Iterable[MetricFamily]) -> str:
+    """수집 결과를 Prometheus 텍스트 노출 형식으로 변환"""
+    lines: List[str] = []
+    for family in families:
+        lines.append(f"# HELP {family.name} {_escape_help(family.documentation)}")
+        lines.append(f"# TYPE {family.name} {family.type}")
+        for name, labels, value in family.samples:
+            if labels:
+                label_text = ",".join(f'{k}="{_escape_label(v)}"' for k, v in labels)
+                lines.append(f"{name}{{{label_text}}} {_format_value(value)}")
+            else:
+                lines.append(f"{name} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
+
+
+# Source collectors (dict 통계 -> MetricFamily)
+
+_CIRCUIT_STATE_VALUES = {"closed": 0, "half_open": 1, "open": 2}
+
+
+def _circuit_breaker_families(metrics: Dict[str, Any]) -> List[MetricFamily]:
+    breaker = metrics.get("name", "unknown")
+    operations = MetricFamily(metric_name("circuit_breaker_operations_total"), COUNTER,
+                              "Operations executed through the circuit breaker")
+    operations.add(metrics.get("successful_operations", 0), breaker=breaker, result="success")
+    operations.add(metrics.get("failed_operations", 0), breaker=breaker, result="failure")
+    return [
+        operations,
+        MetricFamily(metric_name("circuit_breaker_opened_total"), COUNTER,
+                     "Times the circuit breaker opened").add(
+            metrics.get("circuit_opened_count", 0), breaker=breaker),
+        MetricFamily(metric_name("circuit_breaker_state"), GAUGE,
+                     "Circuit state (0=closed, 1=half_open, 2=open)").add(
+            _CIRCUIT_STATE_VALUES.get(metrics.get("current_state"), 0), breaker=breaker),
+        MetricFamily(metric_name("circuit_breaker_failure_rate"), GAUGE,
+                     "Failure rate over the recent operation window").add(
+            metrics.get("current_failure_rate", 0.0), breaker=breaker),
+    ]
+
+
+def collect_circuit_breaker(breaker) -> List[MetricFamily]:
+    """CircuitBreaker.get_metrics() 수집"""
+    return _circuit_breaker_families(breaker.get_metrics())
+
+
+def _error_recovery_families(metrics: Dict[str, Any]) -> List[MetricFamily]:
+    recoveries = MetricFamily(metric_name("recoveries_total"), COUNTER,
+                              "Error recovery attempts by result")
+    recoveries.add(metrics.get("successful_recoveries", 0), result="success")
+    recoveries.add(metrics.get("failed_recoveries", 0), result="failure")
+
+    by_action = MetricFamily(metric_name("recoveries_by_action_total"), COUNTER,
+                             "Error recovery attempts by recovery action and result")
+    for action, counts in metrics.get("recovery_by_action", {}).items():
+        for result in ("success", "failure"):
+            by_action.add(counts.get(result, 0), action=action, result=result)
+
+    by_error = MetricFamily(metric_name("recoveries_by_error_type_total"), COUNTER,
+                            "Error recovery attempts by error type and result")
+    for error_type, counts in metrics.get("recovery_by_error_type", {}).items():
+        for result in ("success", "failure"):
+            by_error.add(counts.get(result, 0), error_type=error_type, result=result)
+
+    families = [recoveries, by_action, by_error]
+    if metrics.get("circuit_breaker"):
+        families += _circuit_breaker_families(metrics["circuit_breaker"])
+    return families
+
+
+def collect_error_recovery(manager) -> List[MetricFamily]:
+    """ErrorRecoveryManager.get_metrics() 수집 (복구용 회로 차단기 포함)"""
+    return _error_recovery_families(manager.get_metrics())
+
+
+def collect_llm_stats(owner) -> List[MetricFamily]:
+    """LLMManager.stats(LLMStats) 수집 - OCR 토큰 사용량과 비용 추정"""
+    stats = owner.stats
+    requests = MetricFamily(metric_name("llm_requests_total"), COUNTER,
+                            "LLM (OCR) API requests by result")
+    requests.add(stats.successful_requests, result="success")
+    requests.add(stats.failed_requests, result="failure")
+    return [
+        requests,
+        MetricFamily(metric_name("llm_tokens_total"), COUNTER,
+                     "Tokens consumed by LLM (OCR) requests").add(stats.total_tokens_used),
+        MetricFamily(metric_name("llm_cost_estimate_total"), COUNTER,
+                     "Estimated LLM (OCR) spend in USD").add(stats.total_cost_estimate),
+        MetricFamily(metric_name("llm_response_time_seconds_avg"), GAUGE,
+                     "Average LLM response time").add(stats.average_response_time),
+    ]
+
+
+def collect_cache(memory_optimizer) -> List[MetricFamily]:
+    """MemoryOptimizer 캐시의 네임스페이스별 적중/미스/축출/사용량 수집"""
+    stats = memory_optimizer.cache.get_stats()
+    lookups = MetricFamily(metric_name("cache_lookups_total"), COUNTER,
+                           "Cache lookups by namespace and result")
+    evictions = MetricFamily(metric_name("cache_evictions_total"), COUNTER,
+                             "Cache entries evicted by namespace")
+    entries = MetricFamily(metric_name("cache_entries"), GAUGE, "Cached entries by namespace")
+    memory = MetricFamily(metric_name("cache_memory_bytes"), GAUGE,
+                          "Bytes held by the cache by namespace")
+    hit_ratio = MetricFamily(metric_name("cache_hit_ratio"), GAUGE,
+                             "Cache hit ratio by namespace")
+    for namespace, ns in stats.get("namespaces", {}).items():
+        lookups.add(ns.get("hits", 0), namespace=namespace, result="hit")
+        lookups.add(ns.get("misses", 0), namespace=namespace, result="miss")
+        evictions.add(ns.get("evictions", 0), namespace=namespace)
+        entries.add(ns.get("size", 0), namespace=namespace)
+        memory.add(ns.get("memory_usage", 0), namespace=namespace)
+        total = ns.get("hits", 0) + ns.get("misses", 0)
+        hit_ratio.add(ns.get("hits", 0) / total if total else 0.0, namespace=namespace)
+    return [lookups, evictions, entries, memory, hit_ratio]
+
+
+_MANAGER_RESULTS = {
+    "successful_conversions": "success",
+    "failed_conversions": "failure",
+    "recovered_conversions": "recovered",
+}
+
+
+def collect_conversion_manager(manager) -> List[MetricFamily]:
+    """ConversionManager.get_conversion_metrics() 수집 (회로 차단기/복구 지표 포함)"""
+    metrics = manager.get_conversion_metrics()
+    conversions = MetricFamily(metric_name("manager_conversions_total"), COUNTER,
+                               "Conversions completed by the GUI conversion manager")
+    for key, result in _MANAGER_RESULTS.items():
+        conversions.add(metrics.get(key, 0), result=result)
+
+    families = [
+        conversions,
+        MetricFamily(metric_name("manager_validation_failures_total"), COUNTER,
+                     "Files rejected by pre-conversion validation").add(
+            metrics.get("validation_failures", 0)),
+        MetricFamily(metric_name("manager_font_errors_total"), COUNTER,
+                     "Font descriptor errors seen during conversion").add(
+            metrics.get("font_error_count", 0)),
+        MetricFamily(metric_name("manager_conversion_seconds_avg"), GAUGE,
+                     "Average conversion time reported by the manager").add(
+            metrics.get("avg_conversion_time", 0.0)),
+    ]
+    if metrics.get("circuit_breaker_metrics"):
+        families += _circuit_breaker_families(metrics["circuit_breaker_metrics"])
+    if metrics.get("recovery_metrics"):
+        families += _error_recovery_families(metrics["recovery_metrics"])
+    return families
+
+
+# Default registry
+
+_default_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """프로세스 전역 기본 레지스트리"""
+    return _default_registry
+
+
+# Exporters
+
+def write_prometheus_file(path: Path, registry: Optional[MetricsRegistry] = None) -> Path:
+    """
+    Prometheus 텍스트 파일 저장
+
+    임시 파일에 쓴 뒤 교체하므로 수집기가 반쯤 쓰인 파일을 읽지 않는다.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    content = (registry or _default_registry).render()
+    atomic_write_text(path, content)
+    return path
+
+
+class MetricsFileExporter:
+    """주기적으로 메트릭 파일을 갱신하는 백그라운드 스레드"""
+
+    def __init__(self, path: Path, registry: Optional[MetricsRegistry] = None,
+                 interval: float = METRICS_EXPORT_INTERVAL):
+        self.path = Path(path)
+        self.registry = registry or _default_registry
+        self.interval = interval
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="MetricsFileExporter", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """스레드 종료 후 마지막 값을 한 번 더 기록"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._export()
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            self._export()
+            self._stop_event.wait(self.interval)
+
+    def _export(self):
+        try:
+            write_prometheus_file(self.path, self.registry)
+        except OSError as e:
+            logger.warning(f"메트릭 파일 저장 실패 ({self.path}): {e}")
+
+
+class MetricsRequestHandler(BaseHTTPRequestHandler):
+    """`GET /metrics` 처리기"""
+
+    server_version = "MarkItDownMetrics/0.1"
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+        send_metrics_response(self, self.server.registry)
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+
+def send_metrics_response(handler: BaseHTTPRequestHandler, registry: MetricsRegistry):
+    """HTTP 처리기에서 Prometheus 텍스트 응답 전송 (변환 서비스와 공용)"""
+    start = time.perf_counter()
+    body = registry.render().encode("utf-8")
+    handler.send_response(HTTPStatus.OK)
+    handler.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+    handler.send_header("Content-Length", str(len(body)))
+    handler.end_headers()
+    handler.wfile.write(body)
+    logger.debug(f"메트릭 응답 {len(body)} bytes ({(time.perf_counter() - start) * 1000:.1f}ms)")
+
+
+class MetricsServer(ThreadingHTTPServer):
+    """메트릭 스크랩용 HTTP 서버 (기본적으로 localhost에만 바인딩)"""
+
+    daemon_threads = True
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None,
+                 host: str = METRICS_DEFAULT_HOST, port: int = METRICS_DEFAULT_PORT):
+        self.registry = registry or _default_registry
+        self._thread: Optional[threading.Thread] = None
+        super().__init__((host, port), MetricsRequestHandler)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/metrics"
+
+    def start(self):
+        """백그라운드 스레드에서 서비스 시작"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.serve_forever, name="MetricsServer",
+                                            daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        if self._thread is not None:
+            self.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.server_close()
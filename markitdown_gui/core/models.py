@@ -127,6 +127,11 @@ class FileInfo:
     def extension(self) -> str:
         """파일 확장자 반환"""
         return self.path.suffix.lower()
+    
+    @property
+    def file_id(self) -> str:
+        """배치 안에서 파일을 식별하는 안정적인 ID (경로 기반, 같은 이름의 다른 파일과 구분)"""
+        return str(self.path)
 
 
 @dataclass
@@ -244,6 +249,7 @@ class AppConfig:
     # UI 설정
     window_width: int = 960
     window_height: int = 800
+    show_thumbnails: bool = False  # 파일 목록에 이미지 썸네일 아이콘 표시
     recent_directories: List[str] = None
     
     def __post_init__(self):
@@ -308,6 +314,7 @@ class ConversionProgress:
     total_files: int
     completed_files: int
     current_file: Optional[str] = None
+    current_file_id: Optional[str] = None  # FileInfo.file_id (O(1) 조회용)
     current_status: str = ""
     # 상세 진행 정보
     current_progress_status: ConversionProgressStatus = ConversionProgressStatus.INITIALIZING
@@ -16,6 +16,7 @@ from .models import (
 )
 from .llm_manager import LLMManager
 from .logger import get_logger
+from .tracing import trace_span
 
 
 logger = get_logger(__name__)
@@ -166,7 +167,10 @@ class OCRService:
         if self.config.enable_preprocessing and self.preprocessing_pipeline:
             try:
                 logger.debug(f"Applying preprocessing to {image_path.name}")
-                preprocessing_result = await self.preprocessing_pipeline.auto_enhance_for_ocr(image_path)
+                with trace_span("ocr.preprocessing") as span:
+                    preprocessing_result = await self.preprocessing_pipeline.auto_enhance_for_ocr(image_path)
+                    span.set(success=preprocessing_result.is_success,
+                             cache_hit=getattr(preprocessing_result, 'cache_hit', None))
 
                 if preprocessing_result.is_success:
                     processed_image_path = preprocessing_result.enhanced_image_path
@@ -202,7 +206,9 @@ class OCRService:
                     prompt=prompt
                 )
 
-                result = await self.llm_manager.ocr_image(request)
+                with trace_span("ocr.llm_api", provider=str(self.llm_manager.current_config.provider)) as span:
+                    result = await self.llm_manager.ocr_image(request)
+                    span.set(success=result.is_success)
 
                 if result.is_success:
                     # 전처리 메타데이터 추가
@@ -252,6 +258,11 @@ class OCRService:
             )
     
     async def _tesseract_ocr(self, image_path: Path, language: str = "auto", preprocessing_metadata: Optional[Dict] = None) -> OCRResult:
+        """Tesseract OCR (추적 구간 기록)"""
+        with trace_span("ocr.tesseract"):
+            return await self._run_tesseract_ocr(image_path, language, preprocessing_metadata)
+    
+    async def _run_tesseract_ocr(self, image_path: Path, language: str = "auto", preprocessing_metadata: Optional[Dict] = None) -> OCRResult:
         """
         Tesseract를 사용한 OCR
 
@@ -359,7 +370,9 @@ class OCRService:
         
         try:
             # PDF를 이미지로 변환하여 OCR 적용
-            images = await self._pdf_to_images(pdf_path, page_range)
+            with trace_span("ocr.pdf_to_images") as span:
+                images = await self._pdf_to_images(pdf_path, page_range)
+                span.set(pages=len(images))
             
             for i, image_path in enumerate(images):
                 try:
@@ -0,0 +1,256 @@
+"""
+대용량 텍스트 파일 페이지 단위 읽기
+mmap으로 파일을 매핑해 보이는 페이지만 디코딩하고, 줄 번호 색인은 백그라운드에서 구축
+
+페이지는 PAGED_VIEW_PAGE_SIZE 바이트 단위로 나누되 경계를 다음 줄바꿈 뒤로 맞추므로
+페이지를 이어 붙이면 원문과 같다. 줄바꿈 없이 한 페이지를 넘는 줄은 페이지 크기 근처의
+문자 경계에서 자른다. 인코딩은 파일 앞부분 샘플로 추정하고, 뒤쪽 페이지가 그 인코딩으로
+디코딩되지 않으면 해당 페이지로 한 번 다시 추정한다.
+"""
+
+import codecs
+import mmap
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+try:
+    from charset_normalizer import from_bytes
+    CHARSET_NORMALIZER_AVAILABLE = True
+except ImportError:
+    CHARSET_NORMALIZER_AVAILABLE = False
+
+from .constants import ENCODING_SAMPLE_SIZE, LINE_INDEX_CHUNK_SIZE, PAGED_VIEW_PAGE_SIZE
+
+
+# (BOM, 표시용 인코딩, 페이지 디코딩에 쓰는 코덱)
+_BOMS = (
+    (codecs.BOM_UTF8, 'utf-8-sig', 'utf-8'),
+    (codecs.BOM_UTF16_LE, 'utf-16', 'utf-16-le'),
+    (codecs.BOM_UTF16_BE, 'utf-16', 'utf-16-be'),
+)
+# 통계적 추정보다 먼저 시도 (짧은 한글 샘플은 다른 CJK 인코딩으로 오판되기 쉬움)
+_PREFERRED_ENCODINGS = ('utf-8', 'cp949')
+# 멀티바이트 코덱(cp949, Shift_JIS, GBK, Big5)의 후행 바이트가 될 수 없는 바이트 (0x00-0x3F)
+_NON_TRAIL_BYTES = tuple(bytes([b]) for b in range(0x40))
+
+
+def _decodes(sample: bytes, encoding: str) -> bool:
+    # 샘플 끝에서 잘린 멀티바이트 문자는 허용
+    try:
+        codecs.getincrementaldecoder(encoding)().decode(sample, final=False)
+        return True
+    except (UnicodeDecodeError, LookupError):
+        return False
+
+
+def detect_encoding(sample: bytes) -> Tuple[str, str, int]:
+    """
+    파일 앞부분 샘플로 인코딩 추정
+
+    Returns:
+        (표시용 인코딩, 디코딩 코덱, BOM 길이)
+    """
+    for bom, name, codec in _BOMS:
+        if sample.startswith(bom):
+            return name, codec, len(bom)
+
+    for encoding in _PREFERRED_ENCODINGS:
+        if _decodes(sample, encoding):
+            return encoding, encoding, 0
+
+    if CHARSET_NORMALIZER_AVAILABLE:
+        best = from_bytes(sample).best()
+        if best is not None:
+            return best.encoding, best.encoding, 0
+    return 'latin-1', 'latin-1', 0
+
+
+@dataclass
+class LineIndex:
+    """청크마다 (바이트 오프셋, 그 위치의 줄 번호) 체크포인트를 둔 줄 색인"""
+    offsets: array
+    lines: array
+    total_lines: int
+
+
+class PagedTextFile:
+    """mmap 기반 페이지 단위 텍스트 파일"""
+
+    def __init__(self, path: Path, page_size: int = PAGED_VIEW_PAGE_SIZE):
+        self.path = Path(path)
+        self.page_size = page_size
+        self._file = open(self.path, 'rb')
+        self.size = self.path.stat().st_size
+        # 빈 파일은 매핑할 수 없음
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else None
+
+        sample = self._mm[:ENCODING_SAMPLE_SIZE] if self._mm is not None else b''
+        self.encoding, self.codec, self.data_start = detect_encoding(sample)
+        self._newline = '\n'.encode(self.codec)
+        # 샘플 밖에서 디코딩 실패 시 재추정은 한 번만
+        self._redetected = False
+
+    def close(self):
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+    def __enter__(self) -> "PagedTextFile":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @property
+    def page_count(self) -> int:
+        data_size = self.size - self.data_start
+        return max(1, -(-data_size // self.page_size))
+
+    def _boundary(self, offset: int) -> int:
+        """offset 이후 첫 줄바꿈 바로 뒤 위치 (한 페이지 안에 없으면 offset 근처 문자 경계)"""
+        if offset >= self.size:
+            return self.size
+        unit = len(self._newline)
+        search_from = offset
+        limit = min(self.size, offset + self.page_size)
+        while True:
+            pos = self._mm.find(self._newline, search_from, limit)
+            if pos < 0:
+                break
+            if (pos - self.data_start) % unit == 0:
+                return pos + unit
+            search_from = pos + 1
+        # 긴 줄은 잘라서 표시
+        offset -= (offset - self.data_start) % unit
+        if self.codec == 'utf-8':
+            while offset > self.data_start and self._mm[offset] & 0xC0 == 0x80:
+                offset -= 1
+        elif unit == 1:
+            offset = self._char_boundary(offset)
+        return offset
+
+    def _char_boundary(self, offset: int) -> int:
+        """
+        멀티바이트 코덱에서 offset 이전의 마지막 문자 경계
+
+        후행 바이트가 될 수 없는 바이트 바로 뒤(확실한 문자 경계)부터 offset까지 증분
+        디코딩하고, 디코더에 남은 미완성 문자 바이트만큼 물러선다.
+        """
+        window_start = max(self.data_start, offset - self.page_size)
+        window = self._mm[window_start:offset]
+        anchor = window_start + max(window.rfind(b) for b in _NON_TRAIL_BYTES) + 1
+        decoder = codecs.getincrementaldecoder(self.codec)()
+        try:
+            decoder.decode(self._mm[anchor:offset], final=False)
+            pending = decoder.getstate()[0]
+        except (UnicodeDecodeError, LookupError):
+            return offset
+        return offset - len(pending)
+
+    def page_range(self, index: int) -> Tuple[int, int]:
+        """페이지의 바이트 범위 [start, end)"""
+        if self._mm is None:
+            return 0, 0
+        last = self.page_count - 1
+        start = self.data_start if index <= 0 else self._boundary(self.data_start + index * self.page_size)
+        end = self.size if index >= last else self._boundary(self.data_start + (index + 1) * self.page_size)
+        return start, max(start, end)
+
+    def read_range(self, start: int, end: int) -> str:
+        if self._mm is None:
+            return ""
+        data = self._mm[start:end]
+        try:
+            return data.decode(self.codec)
+        except UnicodeDecodeError:
+            if self._redetect(data):
+                return self.read_range(start, end)
+            return data.decode(self.codec, errors='replace')
+
+    def _redetect(self, data: bytes) -> bool:
+        """
+        샘플로 추정한 인코딩으로 디코딩되지 않는 구간을 만나면 그 구간으로 다시 추정
+
+        앞부분 샘플이 ASCII뿐인 cp949 파일은 utf-8로 추정되므로 뒤쪽 페이지에서 바로잡는다.
+        끝에서 잘린 문자만 있는 구간(임의 범위 읽기)은 재추정하지 않는다.
+
+        Returns:
+            인코딩이 바뀌었는지 여부
+        """
+        if self._redetected or self.data_start or _decodes(data, self.codec):
+            return False
+        self._redetected = True
+        encoding, codec, _ = detect_encoding(data)
+        if codec == self.codec or '\n'.encode(codec) != self._newline or not _decodes(data, codec):
+            return False
+        self.encoding, self.codec = encoding, codec
+        return True
+
+    def read_page(self, index: int) -> str:
+        """페이지 디코딩 (줄바꿈은 \\n으로 통일)"""
+        return self.read_range(*self.page_range(index)).replace('\r\n', '\n')
+
+    def page_of_offset(self, offset: int) -> int:
+        """바이트 오프셋이 속한 페이지"""
+        index = min(self.page_count - 1, max(0, (offset - self.data_start) // self.page_size))
+        while index > 0 and offset < self.page_range(index)[0]:
+            index -= 1
+        while index < self.page_count - 1 and offset >= self.page_range(index)[1]:
+            index += 1
+        return index
+
+    def find(self, text: str, start: int = 0) -> int:
+        """텍스트의 바이트 오프셋 (대소문자 구분, 없으면 -1)"""
+        if self._mm is None or not text:
+            return -1
+        return self._mm.find(text.encode(self.codec), max(start, self.data_start))
+
+    def build_line_index(self, cancelled: Optional[Callable[[], bool]] = None,
+                         progress: Optional[Callable[[int, int], None]] = None,
+                         chunk_size: int = LINE_INDEX_CHUNK_SIZE) -> Optional[LineIndex]:
+        """
+        줄 번호 색인 구축 (작업 스레드에서 호출)
+
+        화면 표시용 매핑과 별도로 파일을 다시 매핑하므로 뷰어가 먼저 닫혀도 안전하다.
+        취소되면 None을 반환한다.
+        """
+        offsets, lines = array('Q'), array('Q')
+        total = 0
+        chunk_size -= chunk_size % len(self._newline)
+        if self.size == 0:
+            return LineIndex(offsets, lines, 0)
+
+        with open(self.path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for start in range(self.data_start, self.size, chunk_size):
+                if cancelled is not None and cancelled():
+                    return None
+                offsets.append(start)
+                lines.append(total)
+                total += mm[start:start + chunk_size].count(self._newline)
+                if progress is not None:
+                    progress(min(start + chunk_size, self.size), self.size)
+            # 마지막 줄이 줄바꿈으로 끝나지 않으면 한 줄 더
+            if mm[-len(self._newline):] != self._newline:
+                total += 1
+        return LineIndex(offsets, lines, total)
+
+    def line_offset(self, index: LineIndex, line: int) -> int:
+        """0부터 시작하는 줄 번호의 바이트 오프셋 (체크포인트에서 한 청크 이내만 탐색)"""
+        line = max(0, min(line, index.total_lines - 1))
+        # 해당 줄보다 앞선 줄바꿈 수가 line보다 작은 마지막 체크포인트에서 시작
+        checkpoint = bisect_left(index.lines, line) - 1
+        if self._mm is None or checkpoint < 0:
+            return self.data_start
+        offset, current = index.offsets[checkpoint], index.lines[checkpoint]
+        unit = len(self._newline)
+        while current < line:
+            pos = self._mm.find(self._newline, offset)
+            if pos < 0:
+                break
+            offset = pos + unit
+            current += 1
+        return offset
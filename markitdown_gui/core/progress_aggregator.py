@@ -0,0 +1,85 @@
+"""
+진행률 이벤트 병합기
+변환 스레드의 파일별 이벤트를 모아 두었다가 UI가 프레임 단위로 한 번에 가져가도록 함
+
+작은 파일을 빠르게 변환하면 파일마다 진행률/시작/완료 이벤트가 여러 번 발생한다.
+이를 그대로 GUI 스레드로 보내면 위젯 갱신이 이벤트 수만큼 반복되므로, 진행률은 최신
+스냅샷 하나로 합치고 파일별 시작/완료는 순서대로 모두 보관한다(최종 상태는 누락 없음).
+"""
+
+import copy
+import threading
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from .models import ConversionProgress, ConversionResult, FileInfo
+
+
+@dataclass
+class ProgressBatch:
+    """한 프레임 동안 모인 진행 상황"""
+    progress: Optional[ConversionProgress] = None
+    started: List[FileInfo] = field(default_factory=list)
+    completed: List[ConversionResult] = field(default_factory=list)
+    # 병합된 진행률 이벤트 수 (진단용)
+    merged_updates: int = 0
+
+    @property
+    def in_progress(self) -> List[FileInfo]:
+        """이번 프레임에 시작했고 아직 완료되지 않은 파일"""
+        finished = {id(result.file_info) for result in self.completed}
+        return [file_info for file_info in self.started if id(file_info) not in finished]
+
+
+class ProgressAggregator:
+    """스레드 안전한 진행률 이벤트 병합기"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._batch = ProgressBatch()
+        self._dirty = False
+
+    def add_progress(self, progress: ConversionProgress) -> bool:
+        """
+        진행률 스냅샷 기록 (이전 스냅샷은 대체)
+
+        엔진은 같은 ConversionProgress 객체를 계속 갱신하므로 복사본을 보관한다.
+
+        Returns:
+            비어 있던 병합기에 처음 들어온 이벤트인지 여부 (True이면 전달 예약 필요)
+        """
+        snapshot = copy.copy(progress)
+        with self._lock:
+            self._batch.progress = snapshot
+            self._batch.merged_updates += 1
+            return self._mark_dirty()
+
+    def add_started(self, file_info: FileInfo) -> bool:
+        """파일 변환 시작 기록"""
+        with self._lock:
+            self._batch.started.append(file_info)
+            return self._mark_dirty()
+
+    def add_completed(self, result: ConversionResult) -> bool:
+        """파일 변환 완료 기록 (모든 최종 상태 보관)"""
+        with self._lock:
+            self._batch.completed.append(result)
+            return self._mark_dirty()
+
+    def _mark_dirty(self) -> bool:
+        was_clean = not self._dirty
+        self._dirty = True
+        return was_clean
+
+    def has_pending(self) -> bool:
+        with self._lock:
+            return self._dirty
+
+    def drain(self) -> Optional[ProgressBatch]:
+        """모인 이벤트를 꺼내고 초기화 (없으면 None)"""
+        with self._lock:
+            if not self._dirty:
+                return None
+            batch, self._batch = self._batch, ProgressBatch()
+            self._dirty = False
+            return batch
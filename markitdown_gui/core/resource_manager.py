@@ -16,6 +16,7 @@ import logging
 from .logger import get_logger
 from .constants import DEFAULT_MAX_FILE_SIZE_BYTES
 from .exceptions import ResourceError, ResourceNotFoundError, InsufficientResourceError
+from .resource_sampler import get_resource_sampler, PSUTIL_AVAILABLE
 
 logger = get_logger(__name__)
 
@@ -247,20 +248,18 @@ class MemoryMonitor:
         self.critical_threshold = critical_threshold
     
     def get_memory_usage(self) -> Dict[str, float]:
-        """메모리 사용량 정보 반환"""
-        try:
-            import psutil
-            process = psutil.Process()
-            memory_info = process.memory_info()
-            
-            return {
-                "rss_mb": memory_info.rss / (1024 * 1024),
-                "vms_mb": memory_info.vms / (1024 * 1024),
-                "percent": process.memory_percent()
-            }
-        except ImportError:
+        """메모리 사용량 정보 반환 (백그라운드 샘플러의 최신 스냅샷)"""
+        if not PSUTIL_AVAILABLE:
             logger.warning("psutil not available for memory monitoring")
-            return {"rss_mb": 0, "vms_mb": 0, "percent": 0}
+            return {"rss_mb": 0, "vms_mb": 0, "peak_rss_mb": 0, "percent": 0}
+        
+        snapshot = get_resource_sampler().snapshot()
+        return {
+            "rss_mb": snapshot.rss_mb,
+            "vms_mb": snapshot.vms_mb,
+            "peak_rss_mb": snapshot.peak_rss_mb,
+            "percent": snapshot.memory_percent
+        }
     
     def check_memory_pressure(self) -> Optional[str]:
         """메모리 압박 상황 확인"""
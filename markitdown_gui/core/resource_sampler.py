@@ -0,0 +1,215 @@
+"""
+Background process resource sampler
+
+A single daemon thread samples RSS, peak RSS, CPU and I/O counters at a
+fixed interval and publishes an immutable ``ResourceSnapshot``. Readers on
+the conversion path and the UI only read the latest published reference,
+so no psutil call or lock is taken per file.
+"""
+
+import sys
+import time
+import atexit
+import threading
+from dataclasses import dataclass
+from typing import Optional, Dict, Any
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    psutil = None
+    PSUTIL_AVAILABLE = False
+
+try:
+    import resource as _resource
+except ImportError:  # Windows
+    _resource = None
+
+from .constants import RESOURCE_SAMPLE_INTERVAL, MB
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class ResourceSnapshot:
+    """Immutable point-in-time view of process resource usage"""
+    timestamp: float = 0.0
+    rss: int = 0
+    vms: int = 0
+    peak_rss: int = 0
+    memory_percent: float = 0.0
+    cpu_percent: float = 0.0
+    num_threads: int = 0
+    read_bytes: int = 0
+    write_bytes: int = 0
+    read_count: int = 0
+    write_count: int = 0
+    sample_count: int = 0
+
+    @property
+    def rss_mb(self) -> float:
+        return self.rss / MB
+
+    @property
+    def vms_mb(self) -> float:
+        return self.vms / MB
+
+    @property
+    def peak_rss_mb(self) -> float:
+        return self.peak_rss / MB
+
+    @property
+    def is_valid(self) -> bool:
+        """True once at least one real sample has been taken"""
+        return self.sample_count > 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'timestamp': self.timestamp,
+            'rss_mb': self.rss_mb,
+            'vms_mb': self.vms_mb,
+            'peak_rss_mb': self.peak_rss_mb,
+            'memory_percent': self.memory_percent,
+            'cpu_percent': self.cpu_percent,
+            'num_threads': self.num_threads,
+            'read_bytes': self.read_bytes,
+            'write_bytes': self.write_bytes,
+            'read_count': self.read_count,
+            'write_count': self.write_count,
+            'sample_count': self.sample_count
+        }
+
+
+def _os_peak_rss() -> int:
+    """Peak RSS reported by the OS (ru_maxrss), 0 if unavailable"""
+    if _resource is None:
+        return 0
+    try:
+        max_rss = _resource.getrusage(_resource.RUSAGE_SELF).ru_maxrss
+    except (AttributeError, ValueError, OSError):
+        return 0
+    # ru_maxrss is bytes on macOS and kilobytes elsewhere
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+class ResourceSampler:
+    """Samples process resources on a background thread"""
+
+    def __init__(self, interval: float = RESOURCE_SAMPLE_INTERVAL):
+        self.interval = interval
+        self._snapshot = ResourceSnapshot()
+        self._process = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._start_lock = threading.Lock()
+
+        if PSUTIL_AVAILABLE:
+            try:
+                self._process = psutil.Process()
+                # Prime cpu_percent so the first real sample is meaningful
+                self._process.cpu_percent(interval=None)
+            except Exception as e:
+                logger.warning(f"Resource sampler could not attach to process: {e}")
+                self._process = None
+
+    def start(self):
+        """Start the sampling thread (idempotent)"""
+        with self._start_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            if self._process is None:
+                logger.debug("psutil not available, resource sampler disabled")
+                return
+
+            self._stop_event.clear()
+            self.sample_now()
+            self._thread = threading.Thread(
+                target=self._run, name="ResourceSampler", daemon=True
+            )
+            self._thread.start()
+            logger.debug(f"Resource sampler started (interval: {self.interval}s)")
+
+    def stop(self, timeout: float = 2.0):
+        """Stop the sampling thread"""
+        self._stop_event.set()
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            thread.join(timeout=timeout)
+        self._thread = None
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def snapshot(self) -> ResourceSnapshot:
+        """Latest published snapshot (lock-free read)"""
+        return self._snapshot
+
+    def sample_now(self) -> ResourceSnapshot:
+        """Take a sample immediately and publish it"""
+        previous = self._snapshot
+        if self._process is None:
+            return previous
+
+        try:
+            with self._process.oneshot():
+                memory_info = self._process.memory_info()
+                memory_percent = self._process.memory_percent()
+                cpu_percent = self._process.cpu_percent(interval=None)
+                num_threads = self._process.num_threads()
+                io = None
+                if hasattr(self._process, 'io_counters'):
+                    try:
+                        io = self._process.io_counters()
+                    except (psutil.AccessDenied, NotImplementedError, OSError):
+                        io = None
+        except Exception as e:
+            logger.debug(f"Resource sample failed: {e}")
+            return previous
+
+        peak_rss = max(previous.peak_rss, memory_info.rss, _os_peak_rss())
+
+        snapshot = ResourceSnapshot(
+            timestamp=time.time(),
+            rss=memory_info.rss,
+            vms=memory_info.vms,
+            peak_rss=peak_rss,
+            memory_percent=memory_percent,
+            cpu_percent=cpu_percent,
+            num_threads=num_threads,
+            read_bytes=getattr(io, 'read_bytes', 0) if io else 0,
+            write_bytes=getattr(io, 'write_bytes', 0) if io else 0,
+            read_count=getattr(io, 'read_count', 0) if io else 0,
+            write_count=getattr(io, 'write_count', 0) if io else 0,
+            sample_count=previous.sample_count + 1
+        )
+        # Single reference assignment is atomic; readers never see a torn value
+        self._snapshot = snapshot
+        return snapshot
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            self.sample_now()
+
+
+_sampler: Optional[ResourceSampler] = None
+_sampler_lock = threading.Lock()
+
+
+def get_resource_sampler() -> ResourceSampler:
+    """Return the process-wide sampler, starting it on first use"""
+    global _sampler
+    if _sampler is None:
+        with _sampler_lock:
+            if _sampler is None:
+                sampler = ResourceSampler()
+                sampler.start()
+                atexit.register(sampler.stop)
+                _sampler = sampler
+    return _sampler
+
+
+def get_resource_snapshot() -> ResourceSnapshot:
+    """Shortcut for ``get_resource_sampler().snapshot()``"""
+    return get_resource_sampler().snapshot()
@@ -25,6 +25,7 @@ from PyQt6.QtCore import (
 # Import accessibility classes from compatibility layer
 from .qt_compatibility import QAccessible, QAccessibleInterface, QAccessibleEvent, is_accessibility_available
 
+from .constants import ANNOUNCEMENT_MIN_INTERVAL_MS, ANNOUNCEMENT_SUMMARY_INTERVAL_MS
 from .logger import get_logger
 
 
@@ -494,6 +495,9 @@ class AnnouncementQueue:
             # 우선순위가 높은 메시지는 기존 큐 비우기
             if announcement.priority == AnnouncementPriority.ASSERTIVE:
                 self.queue.clear()
+            elif announcement.context:
+                # 같은 컨텍스트의 읽지 않은 메시지는 새 메시지로 대체
+                self.queue = [queued for queued in self.queue if queued.context != announcement.context]
             
             # 큐 크기 제한
             while len(self.queue) >= self.max_size:
@@ -542,12 +546,15 @@ class AnnouncementQueue:
 class AnnouncementWorker(QThread):
     """알림 메시지 처리 워커 스레드"""
     
-    def __init__(self, screen_reader_api: ScreenReaderAPI, announcement_queue: AnnouncementQueue):
+    def __init__(self, screen_reader_api: ScreenReaderAPI, announcement_queue: AnnouncementQueue,
+                 min_interval_ms: int = ANNOUNCEMENT_MIN_INTERVAL_MS):
         super().__init__()
         self.screen_reader_api = screen_reader_api
         self.announcement_queue = announcement_queue
+        self.min_interval_ms = min_interval_ms
         self.running = True
         self.paused = False
+        self._last_announce_time = 0.0
     
     def run(self):
         """워커 스레드 실행"""
@@ -568,6 +575,12 @@ class AnnouncementWorker(QThread):
                     continue
                 
                 if self.announcement_queue.wait_for_announcement(1000):
+                    # 음성 엔진 호출 간격 제한 (기다리는 동안 쌓인 메시지는 큐에서 대체됨)
+                    remaining = self.min_interval_ms - (time.monotonic() - self._last_announce_time) * 1000
+                    if remaining > 0:
+                        self.msleep(int(remaining))
+                        continue
+                    
                     announcement = self.announcement_queue.dequeue()
                     if announcement and announcement.priority != AnnouncementPriority.OFF:
                         try:
@@ -576,6 +589,7 @@ class AnnouncementWorker(QThread):
                                 consecutive_failures = 0  # 유효하지 않은 메시지는 실패로 카운트하지 않음
                                 continue
                             
+                            self._last_announce_time = time.monotonic()
                             success = self.screen_reader_api.announce(
                                 announcement.message.strip(), 
                                 announcement.priority
@@ -591,9 +605,6 @@ class AnnouncementWorker(QThread):
                             consecutive_failures += 1
                             logger.error(f"Error announcing message: {e}")
                             
-                        # 메시지 간격 조절 (너무 빠른 연속 알림 방지)
-                        self.msleep(50)
-                        
             except Exception as e:
                 logger.error(f"Critical error in announcement worker: {e}")
                 consecutive_failures += 1
@@ -752,7 +763,9 @@ class LiveRegionManager:
                 if len(new_content) > len(old_content):
                     added_content = new_content[len(old_content):]
                     message = self._format_live_region_message(live_region, added_content)
-                    self.screen_reader_bridge._enqueue_announcement(message, live_region.priority, widget)
+                    self.screen_reader_bridge._enqueue_announcement(
+                        message, live_region.priority, widget, self._region_context(widget)
+                    )
             
             elif "text" in live_region.relevant:
                 # 전체 내용 알림
@@ -761,11 +774,18 @@ class LiveRegionManager:
                 else:
                     message = self._format_live_region_message(live_region, new_content)
                 
-                self.screen_reader_bridge._enqueue_announcement(message, live_region.priority, widget)
+                self.screen_reader_bridge._enqueue_announcement(
+                    message, live_region.priority, widget, self._region_context(widget)
+                )
         
         except Exception as e:
             logger.error(f"Error handling content change: {e}")
     
+    @staticmethod
+    def _region_context(widget: QWidget) -> str:
+        """리전별 컨텍스트 (아직 읽지 않은 이전 변경은 최신 변경으로 대체)"""
+        return f"live_region:{id(widget)}"
+    
     def _format_live_region_message(self, live_region: LiveRegion, content: str) -> str:
         """라이브 리전 메시지 포맷팅"""
         try:
@@ -800,6 +820,80 @@ class LiveRegionManager:
             logger.error(f"Error cleaning up live region manager: {e}")
 
 
+class AnnouncementAggregator(QObject):
+    """
+    일괄 변환 중 파일별 진행 이벤트를 주기적 요약 알림으로 합치는 집계기
+    
+    파일마다 알리는 대신 카운터만 갱신하고 interval_ms마다 "5,000개 중 1,240개 변환됨, 3개 실패"
+    하나를 보낸다. 요약은 같은 컨텍스트로 보내므로 아직 읽지 않은 이전 요약은 큐에서 대체된다.
+    """
+    
+    SUMMARY_CONTEXT = "conversion_progress"
+    
+    def __init__(self, bridge: "ScreenReaderBridge", interval_ms: int = ANNOUNCEMENT_SUMMARY_INTERVAL_MS):
+        super().__init__(bridge)
+        self.bridge = bridge
+        self.total = 0
+        self.succeeded = 0
+        self.failed = 0
+        self._changed = False
+        
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._announce_summary)
+    
+    @property
+    def completed(self) -> int:
+        return self.succeeded + self.failed
+    
+    @property
+    def is_active(self) -> bool:
+        return self._timer.isActive()
+    
+    def start(self, total: int):
+        """일괄 변환 시작 알림 후 주기적 요약 시작"""
+        self.total = total
+        self.succeeded = 0
+        self.failed = 0
+        self._changed = False
+        self.bridge.announce(f"{total:,}개 파일 변환 시작", "polite", context=self.SUMMARY_CONTEXT)
+        self._timer.start()
+    
+    def record(self, succeeded: int = 0, failed: int = 0):
+        """완료된 파일 수 반영 (알림은 다음 요약 때)"""
+        if succeeded == 0 and failed == 0:
+            return
+        self.succeeded += succeeded
+        self.failed += failed
+        self._changed = True
+    
+    def summary(self) -> str:
+        """현재 진행 요약 문장"""
+        text = f"{self.total:,}개 중 {self.completed:,}개 변환됨"
+        if self.failed:
+            text += f", {self.failed:,}개 실패"
+        return text
+    
+    def finish(self):
+        """최종 요약을 바로 알리고 중지"""
+        if not self._timer.isActive():
+            return
+        self._timer.stop()
+        self.bridge.announce(f"변환 완료. {self.summary()}", "polite", context=self.SUMMARY_CONTEXT)
+    
+    def stop(self):
+        """알림 없이 중지"""
+        self._timer.stop()
+        self._changed = False
+    
+    def _announce_summary(self):
+        # 바뀐 것이 없으면 같은 문장을 반복하지 않음
+        if not self._changed:
+            return
+        self._changed = False
+        self.bridge.announce(self.summary(), "polite", context=self.SUMMARY_CONTEXT)
+
+
 class ScreenReaderBridge(QObject):
     """스크린 리더 브리지 - 메인 인터페이스"""
     
@@ -824,6 +918,9 @@ class ScreenReaderBridge(QObject):
         # 라이브 리전 매니저
         self.live_region_manager = LiveRegionManager(self)
         
+        # 일괄 변환 진행 요약 알림
+        self.progress_aggregator = AnnouncementAggregator(self)
+        
         # 설정
         self.enabled = True
         self.announcement_delay = 0  # 알림 지연 시간 (ms)
@@ -947,7 +1044,7 @@ class ScreenReaderBridge(QObject):
                     return False
             
             # 큐에 추가
-            self._enqueue_announcement(message, priority_enum, widget)
+            self._enqueue_announcement(message, priority_enum, widget, context)
             
             self.last_announcement_time = time.time() * 1000
             return True
@@ -956,13 +1053,15 @@ class ScreenReaderBridge(QObject):
             logger.error(f"Error announcing message: {e}")
             return False
     
-    def _enqueue_announcement(self, message: str, priority: AnnouncementPriority, widget: QWidget = None):
-        """알림을 큐에 추가"""
+    def _enqueue_announcement(self, message: str, priority: AnnouncementPriority, widget: QWidget = None,
+                              context: str = ""):
+        """알림을 큐에 추가 (context가 같은 읽지 않은 알림은 대체)"""
         try:
             announcement = Announcement(
                 message=message,
                 priority=priority,
-                widget=widget
+                widget=widget,
+                context=context
             )
             
             self.announcement_queue.enqueue(announcement)
@@ -1064,6 +1163,9 @@ class ScreenReaderBridge(QObject):
     def cleanup(self):
         """정리"""
         try:
+            # 진행 요약 중지
+            self.progress_aggregator.stop()
+            
             # 알림 워커 중지
             if self.announcement_worker:
                 try:
@@ -0,0 +1,288 @@
+"""
+전문 검색 색인
+변환된 마크다운 출력 전체를 SQLite FTS5로 색인해 순위가 매겨진 결과와 발췌문을 반환
+
+변환 엔진은 .md 파일을 저장할 때마다 해당 문서만 색인하고(증분), 이 기능 이전에 만들어진
+출력이나 바깥에서 바뀐 파일은 sync_directory로 (수정 시각, 크기)가 달라진 파일만 다시 읽는다.
+한국어는 조사가 어절 뒤에 붙으므로 검색어마다 접두어 검색("변환"*)으로 질의한다.
+"""
+
+import html
+import os
+import re
+import sqlite3
+import threading
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .constants import SEARCH_RESULT_LIMIT, SEARCH_SNIPPET_TOKENS
+from .logger import get_logger
+from .utils import get_search_index_path
+
+
+logger = get_logger(__name__)
+
+
+def _fts5_available() -> bool:
+    try:
+        with closing(sqlite3.connect(':memory:')) as conn:
+            conn.execute("CREATE VIRTUAL TABLE probe USING fts5(body)")
+        return True
+    except sqlite3.Error:
+        return False
+
+
+FTS5_AVAILABLE = _fts5_available()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(
+    title, body, tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+);
+"""
+# 제목 일치에 가중치. rank로 정렬하면 FTS5가 LIMIT 안의 행에만 발췌문을 만든다
+_RANK_FUNCTION = 'bm25(5.0, 1.0)'
+
+# 발췌문에서 일치 구간을 표시하는 제어 문자 (본문에 나오지 않음)
+_MATCH_START = '\x02'
+_MATCH_END = '\x03'
+
+_TERM_RE = re.compile(r'\w+')
+_HEADING_RE = re.compile(r'^#{1,6}\s+(.+?)\s*#*\s*$', re.MULTILINE)
+_SYNC_COMMIT_EVERY = 200
+
+
+def query_terms(text: str) -> List[str]:
+    """검색어를 단어 목록으로 분리 (FTS 연산자와 따옴표는 버림)"""
+    return _TERM_RE.findall(text)
+
+
+def build_match_query(text: str) -> Optional[str]:
+    """모든 단어를 접두어로 포함하는 FTS5 MATCH 식 (단어가 없으면 None)"""
+    terms = query_terms(text)
+    if not terms:
+        return None
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def strip_metadata_header(content: str) -> str:
+    """변환 엔진이 붙이는 --- 메타데이터 머리글 제거 (검색 결과에 매번 걸리지 않도록)"""
+    if content.startswith('---'):
+        end = content.find('\n---', 3)
+        if end >= 0:
+            return content[end + 4:].lstrip('\n')
+    return content
+
+
+def extract_title(body: str, fallback: str) -> str:
+    """첫 제목 줄 (없으면 fallback)"""
+    match = _HEADING_RE.search(body)
+    return match.group(1) if match else fallback
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """검색 결과 한 건"""
+    path: Path
+    title: str
+    snippet: str  # 일치 구간은 _MATCH_START/_MATCH_END로 감쌈
+    score: float  # bm25 (작을수록 관련도 높음)
+
+    @property
+    def snippet_text(self) -> str:
+        return self.snippet.replace(_MATCH_START, '').replace(_MATCH_END, '')
+
+    def snippet_html(self) -> str:
+        """일치 구간을 <b>로 강조한 HTML"""
+        return (html.escape(self.snippet)
+                .replace(_MATCH_START, '<b>').replace(_MATCH_END, '</b>')
+                .replace('\n', ' '))
+
+
+class SearchIndex:
+    """SQLite FTS5 기반 마크다운 출력 색인 (여러 스레드에서 공유)"""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        if not FTS5_AVAILABLE:
+            raise RuntimeError("이 Python의 SQLite는 FTS5를 지원하지 않습니다")
+        self.db_path = Path(db_path) if db_path is not None else get_search_index_path()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(
+                "INSERT INTO documents_fts (documents_fts, rank) VALUES ('rank', ?)", (_RANK_FUNCTION,)
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _key(path: Path) -> str:
+        return os.path.abspath(path)
+
+    def _upsert(self, key: str, content: str, fallback_title: str, mtime_ns: int, size: int):
+        # 호출 측에서 잠금을 잡고 있어야 함
+        body = strip_metadata_header(content)
+        title = extract_title(body, fallback_title)
+        row = self._conn.execute("SELECT id FROM documents WHERE path = ?", (key,)).fetchone()
+        if row is None:
+            doc_id = self._conn.execute(
+                "INSERT INTO documents (path, title, mtime_ns, size) VALUES (?, ?, ?, ?)",
+                (key, title, mtime_ns, size)
+            ).lastrowid
+        else:
+            doc_id = row[0]
+            self._conn.execute("DELETE FROM documents_fts WHERE rowid = ?", (doc_id,))
+            self._conn.execute(
+                "UPDATE documents SET title = ?, mtime_ns = ?, size = ? WHERE id = ?",
+                (title, mtime_ns, size, doc_id)
+            )
+        self._conn.execute(
+            "INSERT INTO documents_fts (rowid, title, body) VALUES (?, ?, ?)", (doc_id, title, body)
+        )
+
+    def _delete(self, key: str):
+        row = self._conn.execute("SELECT id FROM documents WHERE path = ?", (key,)).fetchone()
+        if row is not None:
+            self._conn.execute("DELETE FROM documents_fts WHERE rowid = ?", (row[0],))
+            self._conn.execute("DELETE FROM documents WHERE id = ?", (row[0],))
+
+    def index_document(self, path: Path, content: Optional[str] = None):
+        """
+        문서 하나 색인 (이미 있으면 교체)
+
+        Args:
+            path: 마크다운 파일 경로
+            content: 방금 저장한 내용 (None이면 파일에서 읽음)
+        """
+        path = Path(path)
+        if content is None:
+            content = path.read_text(encoding='utf-8', errors='replace')
+        stat = path.stat()
+        with self._lock:
+            self._upsert(self._key(path), content, path.stem, stat.st_mtime_ns, stat.st_size)
+            self._conn.commit()
+
+    def remove_document(self, path: Path):
+        with self._lock:
+            self._delete(self._key(path))
+            self._conn.commit()
+
+    def document_count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def _documents_under(self, prefix: str) -> Dict[str, Tuple[int, int]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path, mtime_ns, size FROM documents WHERE substr(path, 1, ?) = ?",
+                (len(prefix), prefix)
+            ).fetchall()
+        return {path: (mtime_ns, size) for path, mtime_ns, size in rows}
+
+    def sync_directory(self, root: Path, cancelled: Optional[Callable[[], bool]] = None,
+                       progress: Optional[Callable[[int, int], None]] = None) -> Tuple[int, int]:
+        """
+        디렉토리의 .md 파일과 색인을 맞춤 (작업 스레드에서 호출)
+
+        (수정 시각, 크기)가 바뀐 파일만 다시 읽고, 사라진 파일은 색인에서 뺀다.
+
+        Returns:
+            (새로 색인한 문서 수, 제거한 문서 수)
+        """
+        prefix = os.path.join(self._key(root), '')
+        known = self._documents_under(prefix)
+        files = sorted(Path(root).rglob('*.md'))
+        indexed = 0
+        seen = set()
+        interrupted = False
+
+        for done, path in enumerate(files, 1):
+            if cancelled is not None and cancelled():
+                interrupted = True
+                break
+            key = self._key(path)
+            seen.add(key)
+            try:
+                stat = path.stat()
+                if known.get(key) != (stat.st_mtime_ns, stat.st_size):
+                    content = path.read_text(encoding='utf-8', errors='replace')
+                    with self._lock:
+                        self._upsert(key, content, path.stem, stat.st_mtime_ns, stat.st_size)
+                        indexed += 1
+                        if indexed % _SYNC_COMMIT_EVERY == 0:
+                            self._conn.commit()
+            except OSError as e:
+                logger.warning(f"색인 실패: {path} - {e}")
+            if progress is not None:
+                progress(done, len(files))
+
+        # 끝까지 훑은 경우에만 사라진 파일 정리
+        stale = set() if interrupted else known.keys() - seen
+        with self._lock:
+            for key in stale:
+                self._delete(key)
+            self._conn.commit()
+        return indexed, len(stale)
+
+    def search(self, text: str, limit: int = SEARCH_RESULT_LIMIT,
+               root: Optional[Path] = None) -> List[SearchHit]:
+        """
+        순위순 검색 결과
+
+        Args:
+            text: 검색어 (공백으로 나눈 모든 단어를 접두어로 포함하는 문서)
+            limit: 최대 결과 수
+            root: 지정하면 이 디렉토리 아래 문서만
+        """
+        match = build_match_query(text)
+        if match is None:
+            return []
+        sql = (
+            "SELECT d.path, d.title, "
+            "snippet(documents_fts, -1, ?, ?, '…', ?), rank "
+            "FROM documents_fts JOIN documents d ON d.id = documents_fts.rowid "
+            "WHERE documents_fts MATCH ?"
+        )
+        params: list = [_MATCH_START, _MATCH_END, SEARCH_SNIPPET_TOKENS, match]
+        if root is not None:
+            prefix = os.path.join(self._key(root), '')
+            sql += " AND substr(d.path, 1, ?) = ?"
+            params += [len(prefix), prefix]
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(limit)
+
+        try:
+            with self._lock:
+                rows = self._conn.execute(sql, params).fetchall()
+        except sqlite3.OperationalError as e:
+            logger.warning(f"검색 실패 ({text!r}): {e}")
+            return []
+        return [SearchHit(Path(path), title, snippet, score) for path, title, snippet, score in rows]
+
+
+_index: Optional[SearchIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_search_index() -> SearchIndex:
+    """공유 검색 색인"""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = SearchIndex()
+        return _index
@@ -0,0 +1,388 @@
+"""
+시작 시간 벤치마크
+모듈별 import 시간(-X importtime), main.py의 첫 창 표시 시간,
+ConversionManager/MarkItDown() 준비 시간을 새 인터프리터에서 측정하고
+저장된 기준값(baseline) 대비 예산 초과 여부를 판정
+"""
+
+import os
+import sys
+import json
+import time
+import platform
+import statistics
+import subprocess
+import tempfile
+import textwrap
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Any, Iterable
+
+from .constants import (
+    STARTUP_PROBE_ENV, STARTUP_READY_MARKER, STARTUP_BENCHMARK_RUNS,
+    STARTUP_BUDGET_TOLERANCE, STARTUP_BUDGET_SLACK_MS
+)
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+MAIN_SCRIPT = PROJECT_ROOT / "main.py"
+# 측정 프로세스의 바이트코드 캐시 (저장소에 .pyc를 남기지 않음)
+PROBE_PYCACHE_PREFIX = Path(tempfile.gettempdir()) / "markitdown_gui_startup_pycache"
+
+# import 시간을 추적할 모듈 (시작 경로 순)
+DEFAULT_IMPORT_MODULES = (
+    "markitdown_gui.core.conversion_engine",
+    "markitdown_gui.core.conversion_manager",
+    "markitdown_gui.cli",
+    "markitdown_gui.ui.main_window",
+)
+
+# 준비 시간 프로브: import부터 객체 생성 완료까지 (tmp: 임시 디렉토리 경로)
+READY_PROBES = {
+    "ready:ConversionManager": (
+        "from markitdown_gui.core.conversion_manager import ConversionManager\n"
+        "ConversionManager(output_directory=Path(tmp))\n"
+    ),
+    "ready:MarkItDown": (
+        "from markitdown_gui.core.conversion_engine import load_markitdown\n"
+        "markitdown_class = load_markitdown()\n"
+        "if markitdown_class is None:\n"
+        "    sys.exit(PROBE_SKIPPED)\n"
+        "markitdown_class()\n"
+    ),
+}
+
+FIRST_WINDOW_METRIC = "first_window:main.py"
+
+# 프로브가 측정 대상을 사용할 수 없을 때의 종료 코드 (선택적 의존성 미설치 등)
+PROBE_SKIPPED = 3
+
+# 바이트코드 캐시를 채우기 위한 측정 전 import (실패는 측정 단계에서 보고)
+_WARM_IMPORTS = """\
+import importlib
+for name in {modules!r}:
+    try:
+        importlib.import_module(name)
+    except Exception:
+        pass
+"""
+
+_READY_TEMPLATE = """\
+import json, sys, tempfile, time
+from pathlib import Path
+PROBE_SKIPPED = {skipped}
+_start = time.perf_counter()
+with tempfile.TemporaryDirectory() as tmp:
+{body}
+    print(json.dumps({{"elapsed_ms": (time.perf_counter() - _start) * 1000}}))
+"""
+
+
+class BenchmarkError(Exception):
+    """측정 프로세스 실패"""
+
+
+@dataclass
+class StartupMetric:
+    """측정 항목 하나의 표본"""
+    name: str
+    samples_ms: List[float] = field(default_factory=list)
+    skipped: Optional[str] = None
+
+    @property
+    def median_ms(self) -> Optional[float]:
+        return statistics.median(self.samples_ms) if self.samples_ms else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            "median_ms": None if self.median_ms is None else round(self.median_ms, 1),
+            "samples_ms": [round(s, 1) for s in self.samples_ms],
+        }
+        if self.skipped:
+            data["skipped"] = self.skipped
+        return data
+
+
+@dataclass
+class BudgetViolation:
+    """예산 초과 항목"""
+    name: str
+    median_ms: float
+    baseline_ms: float
+    budget_ms: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "median_ms": round(self.median_ms, 1),
+            "baseline_ms": self.baseline_ms,
+            "budget_ms": round(self.budget_ms, 1),
+        }
+
+    def __str__(self) -> str:
+        return (f"{self.name}: {self.median_ms:.1f}ms > 예산 {self.budget_ms:.1f}ms "
+                f"(기준 {self.baseline_ms:.1f}ms)")
+
+
+def parse_importtime(output: str) -> Dict[str, Tuple[int, int]]:
+    """
+    `-X importtime` 출력 파싱
+
+    Returns:
+        모듈명 -> (self 마이크로초, cumulative 마이크로초)
+    """
+    timings = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue  # 헤더 행
+        timings[parts[2].strip()] = (self_us, cumulative_us)
+    return timings
+
+
+def slowest_imports(timings: Dict[str, Tuple[int, int]], limit: int = 10) -> List[Dict[str, Any]]:
+    """self 시간 기준 가장 느린 import 목록 (회귀 원인 분석용)"""
+    ranked = sorted(timings.items(), key=lambda item: item[1][0], reverse=True)[:limit]
+    return [{"module": name, "self_ms": round(self_us / 1000, 1),
+             "cumulative_ms": round(cumulative_us / 1000, 1)}
+            for name, (self_us, cumulative_us) in ranked]
+
+
+def _probe_env() -> Dict[str, str]:
+    """측정용 환경 변수 (프로젝트 루트를 import 경로에 추가, 화면 없이 Qt 실행)"""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(PROJECT_ROOT), env.get("PYTHONPATH")]))
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    # 접두 경로를 쓰면 표준 라이브러리/의존성의 기존 .pyc도 쓰이지 않으므로
+    # 첫 실행에서 채워 재사용할 수 있도록 바이트코드 기록을 허용
+    env.setdefault("PYTHONPYCACHEPREFIX", str(PROBE_PYCACHE_PREFIX))
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env.pop(STARTUP_PROBE_ENV, None)
+    return env
+
+
+def _run_python(args: List[str], timeout: float, cwd: Optional[Path] = None,
+                env: Optional[Dict[str, str]] = None) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable] + args, capture_output=True, text=True,
+                          timeout=timeout, cwd=cwd, env=env or _probe_env())
+
+
+def measure_import(module: str, runs: int = STARTUP_BENCHMARK_RUNS,
+                   timeout: float = 60.0) -> Tuple[StartupMetric, Dict[str, Tuple[int, int]]]:
+    """
+    새 인터프리터에서 모듈 import 누적 시간 측정
+
+    Returns:
+        (측정 결과, 마지막 실행의 importtime 파싱 결과)
+    """
+    metric = StartupMetric(f"import:{module}")
+    timings: Dict[str, Tuple[int, int]] = {}
+    for _ in range(runs):
+        result = _run_python(["-X", "importtime", "-c", f"import {module}"], timeout)
+        if result.returncode != 0:
+            raise BenchmarkError(f"{module} import 실패: {result.stderr.strip()[-500:]}")
+        timings = parse_importtime(result.stderr)
+        if module not in timings:
+            raise BenchmarkError(f"importtime 출력에서 {module}을 찾을 수 없습니다")
+        metric.samples_ms.append(timings[module][1] / 1000)
+    return metric, timings
+
+
+def measure_ready(name: str, body: str, runs: int = STARTUP_BENCHMARK_RUNS,
+                  timeout: float = 120.0) -> StartupMetric:
+    """새 인터프리터에서 import부터 객체 생성까지의 시간 측정"""
+    metric = StartupMetric(name)
+    code = _READY_TEMPLATE.format(skipped=PROBE_SKIPPED, body=textwrap.indent(body, "    "))
+    for _ in range(runs):
+        result = _run_python(["-c", code], timeout)
+        if result.returncode == PROBE_SKIPPED:
+            metric.skipped = "측정 대상을 사용할 수 없음"
+            return metric
+        if result.returncode != 0:
+            raise BenchmarkError(f"{name} 프로브 실패: {result.stderr.strip()[-500:]}")
+        metric.samples_ms.append(json.loads(result.stdout.strip().splitlines()[-1])["elapsed_ms"])
+    return metric
+
+
+def _time_first_window(main_script: Path, cwd: Path, env: Dict[str, str],
+                       timeout: float) -> float:
+    """
+    첫 창 표시 알림까지의 시간 (표시 알림과 프로세스 종료 모두 timeout 안에 끝나야 함)
+
+    stdout은 별도 스레드에서 읽으므로 main.py가 알림 없이 멈춰도 제한 시간에 종료시킨다.
+    """
+    start = time.perf_counter()
+    deadline = start + timeout
+    process = subprocess.Popen([sys.executable, str(main_script)], cwd=cwd, env=env,
+                               stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    ready = threading.Event()
+    ready_at: List[float] = []
+
+    def read_stdout():
+        # 알림 이후에도 파이프가 가득 차 프로세스가 멈추지 않도록 끝까지 읽음
+        for line in process.stdout:
+            if not ready.is_set() and line.strip() == STARTUP_READY_MARKER:
+                ready_at.append(time.perf_counter())
+                ready.set()
+
+    reader = threading.Thread(target=read_stdout, name="StartupProbeReader", daemon=True)
+    reader.start()
+    try:
+        while not ready.wait(0.05):
+            if not reader.is_alive():
+                # 알림 없이 stdout이 닫힘 (프로세스 종료)
+                break
+            if time.perf_counter() >= deadline:
+                raise BenchmarkError("main.py가 제한 시간 내에 첫 창 표시를 알리지 않았습니다")
+        try:
+            process.wait(timeout=max(0.0, deadline - time.perf_counter()))
+        except subprocess.TimeoutExpired:
+            raise BenchmarkError("main.py가 제한 시간 내에 종료되지 않았습니다")
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        reader.join(timeout=5)
+        process.stdout.close()
+
+    if not ready_at:
+        raise BenchmarkError(f"main.py가 첫 창 표시를 알리지 않았습니다 (코드 {process.returncode})")
+    return (ready_at[0] - start) * 1000
+
+
+def measure_first_window(main_script: Path = MAIN_SCRIPT, runs: int = STARTUP_BENCHMARK_RUNS,
+                         timeout: float = 120.0, workdir: Optional[Path] = None) -> StartupMetric:
+    """
+    프로세스 시작부터 main.py가 첫 창을 표시할 때까지의 시간 측정
+
+    main.py는 STARTUP_PROBE_ENV가 설정되면 첫 이벤트 루프 반복 후 표시 완료를 알리고 종료한다.
+    인터프리터 시작 시간도 포함된다.
+    """
+    metric = StartupMetric(FIRST_WINDOW_METRIC)
+    if not main_script.exists():
+        metric.skipped = f"{main_script}가 없음"
+        return metric
+
+    env = _probe_env()
+    env[STARTUP_PROBE_ENV] = "1"
+    # 설정/로그 파일이 작업 디렉토리에 생성되므로 저장소 밖에서 실행
+    with tempfile.TemporaryDirectory() as tmp:
+        for _ in range(runs):
+            metric.samples_ms.append(
+                _time_first_window(main_script, workdir or Path(tmp), env, timeout)
+            )
+    return metric
+
+
+def run_startup_benchmarks(runs: int = STARTUP_BENCHMARK_RUNS,
+                           modules: Iterable[str] = DEFAULT_IMPORT_MODULES,
+                           include_window: bool = True,
+                           include_ready: bool = True,
+                           workdir: Optional[Path] = None) -> Dict[str, Any]:
+    """
+    전체 시작 시간 벤치마크 실행
+
+    Returns:
+        {"metrics": {이름: StartupMetric}, "slowest_imports": [...], "environment": {...}}
+    """
+    # 첫 실행의 바이트코드 컴파일 비용이 측정에 섞이지 않도록 프로젝트와 의존성을 미리 컴파일
+    modules = tuple(modules)
+    _run_python(["-m", "compileall", "-q", str(PROJECT_ROOT / "markitdown_gui")], timeout=300)
+    _run_python(["-c", _WARM_IMPORTS.format(modules=list(modules) + ["markitdown"])], timeout=300)
+
+    metrics: Dict[str, StartupMetric] = {}
+    slowest: List[Dict[str, Any]] = []
+    for module in modules:
+        metric, timings = measure_import(module, runs)
+        metrics[metric.name] = metric
+        if module == "markitdown_gui.ui.main_window" or not slowest:
+            slowest = slowest_imports(timings)
+
+    if include_ready:
+        for name, body in READY_PROBES.items():
+            metrics[name] = measure_ready(name, body, runs)
+
+    if include_window:
+        metrics[FIRST_WINDOW_METRIC] = measure_first_window(runs=runs, workdir=workdir)
+
+    return {
+        "metrics": metrics,
+        "slowest_imports": slowest,
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "runs": runs,
+        },
+    }
+
+
+def load_baseline(path: Path) -> Dict[str, Any]:
+    """기준값 파일 로드"""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_baseline(path: Path, metrics: Dict[str, StartupMetric],
+                  previous: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    측정 결과를 기준값으로 저장
+
+    기존 파일의 허용 오차와 항목별 고정 예산(budget_ms)은 유지한다.
+    """
+    previous = previous or {}
+    old_metrics = previous.get("metrics", {})
+    baseline = {
+        "tolerance": previous.get("tolerance", STARTUP_BUDGET_TOLERANCE),
+        "slack_ms": previous.get("slack_ms", STARTUP_BUDGET_SLACK_MS),
+        "metrics": {},
+    }
+    for name, metric in metrics.items():
+        if metric.median_ms is None:
+            continue
+        entry = {"baseline_ms": round(metric.median_ms, 1)}
+        if "budget_ms" in old_metrics.get(name, {}):
+            entry["budget_ms"] = old_metrics[name]["budget_ms"]
+        baseline["metrics"][name] = entry
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    return baseline
+
+
+def budget_for(entry: Dict[str, Any], tolerance: float, slack_ms: float) -> float:
+    """항목 예산: 고정 budget_ms가 있으면 사용, 없으면 기준값 * (1 + 허용 오차) + 여유"""
+    if "budget_ms" in entry:
+        return float(entry["budget_ms"])
+    return float(entry["baseline_ms"]) * (1 + tolerance) + slack_ms
+
+
+def check_budgets(metrics: Dict[str, StartupMetric], baseline: Dict[str, Any],
+                  tolerance: Optional[float] = None) -> List[BudgetViolation]:
+    """
+    기준값 대비 예산을 초과한 항목 반환
+
+    Args:
+        tolerance: 허용 오차 재정의 (None이면 기준값 파일의 값 사용)
+    """
+    if tolerance is None:
+        tolerance = baseline.get("tolerance", STARTUP_BUDGET_TOLERANCE)
+    slack_ms = baseline.get("slack_ms", STARTUP_BUDGET_SLACK_MS)
+
+    violations = []
+    for name, entry in baseline.get("metrics", {}).items():
+        metric = metrics.get(name)
+        if metric is None or metric.median_ms is None:
+            continue
+        budget = budget_for(entry, tolerance, slack_ms)
+        if metric.median_ms > budget:
+            violations.append(BudgetViolation(name, metric.median_ms, entry["baseline_ms"], budget))
+    return violations
@@ -0,0 +1,141 @@
+"""
+Stylesheet Compiler
+QSS 템플릿을 한 번만 토큰화하고 색상 변수를 한 번에 치환해 (테마, 색상) 단위로 캐시
+
+템플릿은 리터럴 조각과 변수 이름의 목록으로 파싱되며, 변수는 가장 긴 이름으로 매칭되므로
+@primary가 @primary-variant를 덮어쓰지 않는다. 최종 스타일시트는 메모리와 디스크에 캐시되어
+시작 시 테마 적용은 디스크 캐시 한 번 읽기로 끝난다. 캐시 키에는 원본 QSS의 (수정 시각, 크기)와
+모든 색상 값이 들어가므로 QSS나 팔레트가 바뀌면 자동으로 다시 컴파일된다.
+"""
+
+import hashlib
+import os
+import re
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .logger import get_logger
+from .utils import atomic_write_text
+
+
+logger = get_logger(__name__)
+
+
+# 캐시 형식이 바뀌면 올림
+_COMPILER_VERSION = 1
+_VARIABLE_RE = re.compile(r'@([A-Za-z][A-Za-z0-9-]*)')
+
+
+def theme_variables(colors) -> Dict[str, str]:
+    """ThemeColors를 QSS 변수 이름(@ 제외, 밑줄은 하이픈)과 값의 매핑으로 변환"""
+    return {name.replace('_', '-'): value for name, value in asdict(colors).items()}
+
+
+class StylesheetTemplate:
+    """토큰화된 QSS 템플릿"""
+
+    def __init__(self, source: str):
+        # 짝수 위치는 리터럴, 홀수 위치는 변수 이름
+        self._parts: List[str] = _VARIABLE_RE.split(source)
+
+    @property
+    def variables(self) -> List[str]:
+        return sorted(set(self._parts[1::2]))
+
+    def render(self, values: Dict[str, str]) -> str:
+        """변수를 한 번에 치환 (모르는 변수는 그대로 둠)"""
+        parts = self._parts[:]
+        for i in range(1, len(parts), 2):
+            name = parts[i]
+            parts[i] = values.get(name, '@' + name)
+        return ''.join(parts)
+
+
+class StylesheetCache:
+    """테마별 컴파일된 스타일시트 캐시 (메모리 + 디스크)"""
+
+    def __init__(self, styles_dir: Path, cache_dir: Optional[Path] = None):
+        self.styles_dir = Path(styles_dir)
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        # 원본 경로 -> ((수정 시각, 크기), 템플릿)
+        self._templates: Dict[Path, Tuple[Tuple[int, int], StylesheetTemplate]] = {}
+        self._compiled: Dict[str, str] = {}
+        self.compile_count = 0
+
+    def _cache_key(self, filename: str, stat: os.stat_result, values: Dict[str, str]) -> str:
+        digest = hashlib.sha1()
+        digest.update(f"{_COMPILER_VERSION}|{filename}|{stat.st_mtime_ns}|{stat.st_size}".encode())
+        for name in sorted(values):
+            digest.update(f"|{name}={values[name]}".encode())
+        return digest.hexdigest()[:16]
+
+    def _cache_path(self, filename: str, key: str) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"{Path(filename).stem}-{key}.qss"
+
+    def _template(self, path: Path, stat: os.stat_result) -> StylesheetTemplate:
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._templates.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        template = StylesheetTemplate(path.read_text(encoding='utf-8'))
+        self._templates[path] = (signature, template)
+        return template
+
+    def get(self, filename: str, colors) -> Optional[str]:
+        """
+        컴파일된 스타일시트 반환
+
+        Args:
+            filename: styles_dir 안의 QSS 파일 이름
+            colors: 치환할 ThemeColors (None이면 변수를 치환하지 않음)
+
+        Returns:
+            스타일시트 (원본이 없으면 None)
+        """
+        path = self.styles_dir / filename
+        try:
+            stat = path.stat()
+        except OSError:
+            logger.error(f"Stylesheet not found: {path}")
+            return None
+
+        values = theme_variables(colors) if colors is not None else {}
+        key = self._cache_key(filename, stat, values)
+        stylesheet = self._compiled.get(key)
+        if stylesheet is not None:
+            return stylesheet
+
+        cache_path = self._cache_path(filename, key)
+        if cache_path is not None:
+            try:
+                stylesheet = cache_path.read_text(encoding='utf-8')
+            except OSError:
+                stylesheet = None
+        if stylesheet is None:
+            stylesheet = self._template(path, stat).render(values)
+            self.compile_count += 1
+            if cache_path is not None:
+                self._write(cache_path, stylesheet)
+
+        self._compiled[key] = stylesheet
+        return stylesheet
+
+    def _write(self, cache_path: Path, stylesheet: str):
+        """디스크 캐시 저장 (같은 QSS의 이전 컴파일 결과는 삭제)"""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            prefix = cache_path.name.rsplit('-', 1)[0]
+            for old in cache_path.parent.glob(f"{prefix}-*.qss"):
+                if old != cache_path:
+                    old.unlink(missing_ok=True)
+            atomic_write_text(cache_path, stylesheet)
+        except OSError as e:
+            logger.warning(f"Failed to write stylesheet cache {cache_path}: {e}")
+
+    def clear(self):
+        """메모리 캐시 비우기 (디스크 캐시는 키가 달라지면 자연히 교체됨)"""
+        self._templates.clear()
+        self._compiled.clear()
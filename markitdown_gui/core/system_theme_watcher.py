@@ -0,0 +1,213 @@
+"""
+System Theme Watcher
+시스템 테마 변경을 알림으로 받아 UI 스레드를 막지 않고 전달
+
+알림 원본은 다음 순서로 고른다.
+1. QStyleHints.colorSchemeChanged - 플랫폼 플러그인이 색 구성을 알 때 (Windows, macOS, 최신 GNOME/KDE)
+2. XDG 데스크톱 포털 Settings.SettingChanged (D-Bus) - Linux
+3. 백그라운드 스레드 폴링 - 위 둘이 없을 때. gsettings 등의 프로세스 실행은 작업 스레드에서만 한다
+
+처음 감지는 start()에서 한 번 하고, 이후 현재 테마는 캐시된 값을 반환한다.
+"""
+
+import threading
+from typing import Optional
+
+from PyQt6.QtCore import QObject, Qt, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QGuiApplication
+
+try:
+    from PyQt6.QtDBus import QDBusConnection, QDBusMessage, QDBusVariant
+    QTDBUS_AVAILABLE = True
+except ImportError:
+    QTDBUS_AVAILABLE = False
+
+from .constants import SYSTEM_THEME_POLL_INTERVAL
+from .logger import get_logger
+from .system_theme_detector import SystemThemeDetector
+
+
+logger = get_logger(__name__)
+
+
+_PORTAL_SERVICE = "org.freedesktop.portal.Desktop"
+_PORTAL_PATH = "/org/freedesktop/portal/desktop"
+_PORTAL_INTERFACE = "org.freedesktop.portal.Settings"
+# (네임스페이스, 키) - 값이 바뀌면 테마를 다시 감지
+_PORTAL_THEME_KEYS = {
+    ("org.freedesktop.appearance", "color-scheme"),
+    ("org.gnome.desktop.interface", "color-scheme"),
+    ("org.gnome.desktop.interface", "gtk-theme"),
+    ("org.kde.kdeglobals.General", "ColorScheme"),
+}
+
+
+if QTDBUS_AVAILABLE:
+    class _PortalListener(QObject):
+        """포털 SettingChanged 시그널 수신기"""
+
+        setting_changed = pyqtSignal(str, str, object)  # 네임스페이스, 키, 값
+
+        @pyqtSlot(QDBusMessage)
+        def on_message(self, message: "QDBusMessage"):
+            arguments = message.arguments()
+            if len(arguments) < 3:
+                return
+            value = arguments[2]
+            if isinstance(value, QDBusVariant):
+                value = value.variant()
+            self.setting_changed.emit(str(arguments[0]), str(arguments[1]), value)
+
+
+class SystemThemeWatcher(QObject):
+    """시스템 테마 변경 감시기"""
+
+    # 'dark' 또는 'light' (바뀐 경우에만)
+    theme_changed = pyqtSignal(str)
+    # 작업 스레드의 감지 결과 (큐 연결로 UI 스레드에 전달)
+    _detected = pyqtSignal(str)
+
+    def __init__(self, detector: SystemThemeDetector,
+                 poll_interval: float = SYSTEM_THEME_POLL_INTERVAL, parent=None):
+        super().__init__(parent)
+        self.detector = detector
+        self.poll_interval = poll_interval
+        self._current: Optional[str] = None
+        self._source: Optional[str] = None
+        self._stop_event = threading.Event()
+        self._poll_thread: Optional[threading.Thread] = None
+        self._detecting = threading.Lock()
+        self._portal_listener = None
+        self._detected.connect(self._on_detected)
+
+    @property
+    def current_theme(self) -> Optional[str]:
+        """마지막으로 감지한 테마 (start 전이면 None)"""
+        return self._current
+
+    @property
+    def source(self) -> Optional[str]:
+        """사용 중인 알림 원본 ('style_hints', 'portal', 'polling', 중지 상태면 None)"""
+        return self._source
+
+    def start(self) -> str:
+        """
+        감시 시작
+
+        Returns:
+            현재 시스템 테마
+        """
+        if self._source is not None:
+            return self._current or "light"
+
+        hinted = self._style_hints_theme()
+        self._current = hinted if hinted is not None else self.detector.get_system_theme()
+
+        if hinted is not None:
+            QGuiApplication.styleHints().colorSchemeChanged.connect(self._on_color_scheme_changed)
+            self._source = "style_hints"
+        elif self._connect_portal():
+            self._source = "portal"
+        else:
+            self._start_polling()
+            self._source = "polling"
+        logger.debug(f"System theme watcher started ({self._source}): {self._current}")
+        return self._current
+
+    def stop(self):
+        """감시 중지 (폴링 스레드는 다음 대기에서 종료)"""
+        if self._source == "style_hints":
+            try:
+                QGuiApplication.styleHints().colorSchemeChanged.disconnect(self._on_color_scheme_changed)
+            except (TypeError, RuntimeError):
+                pass
+        elif self._source == "portal":
+            QDBusConnection.sessionBus().disconnect(
+                _PORTAL_SERVICE, _PORTAL_PATH, _PORTAL_INTERFACE, "SettingChanged",
+                self._portal_listener.on_message
+            )
+            self._portal_listener = None
+        self._stop_event.set()
+        self._poll_thread = None
+        self._source = None
+
+    # QStyleHints
+
+    @staticmethod
+    def _style_hints_theme() -> Optional[str]:
+        if QGuiApplication.instance() is None:
+            return None
+        scheme = QGuiApplication.styleHints().colorScheme()
+        if scheme == Qt.ColorScheme.Dark:
+            return "dark"
+        if scheme == Qt.ColorScheme.Light:
+            return "light"
+        return None
+
+    def _on_color_scheme_changed(self, scheme):
+        theme = self._style_hints_theme()
+        if theme is None:
+            self._detect_async()
+        else:
+            self._on_detected(theme)
+
+    # XDG 데스크톱 포털
+
+    def _connect_portal(self) -> bool:
+        if not QTDBUS_AVAILABLE or self.detector.system != "linux":
+            return False
+        bus = QDBusConnection.sessionBus()
+        if not bus.isConnected():
+            return False
+        listener = _PortalListener(self)
+        if not bus.connect(_PORTAL_SERVICE, _PORTAL_PATH, _PORTAL_INTERFACE, "SettingChanged",
+                           listener.on_message):
+            listener.deleteLater()
+            return False
+        listener.setting_changed.connect(self._on_portal_setting_changed)
+        self._portal_listener = listener
+        return True
+
+    def _on_portal_setting_changed(self, namespace: str, key: str, value):
+        if (namespace, key) not in _PORTAL_THEME_KEYS:
+            return
+        # org.freedesktop.appearance color-scheme: 1 = 다크 선호, 2 = 라이트 선호, 0 = 선호 없음
+        if namespace == "org.freedesktop.appearance" and value in (1, 2):
+            self._on_detected("dark" if value == 1 else "light")
+        else:
+            self._detect_async()
+
+    # 백그라운드 감지
+
+    def _start_polling(self):
+        self._stop_event = threading.Event()
+        self._poll_thread = threading.Thread(
+            target=self._poll, args=(self._stop_event,), name="SystemThemePoll", daemon=True
+        )
+        self._poll_thread.start()
+
+    def _poll(self, stop_event: threading.Event):
+        while not stop_event.wait(self.poll_interval):
+            self._detect_and_emit()
+
+    def _detect_async(self):
+        """작업 스레드에서 한 번 감지 (이미 감지 중이면 무시)"""
+        threading.Thread(target=self._detect_and_emit, name="SystemThemeDetect", daemon=True).start()
+
+    def _detect_and_emit(self):
+        if not self._detecting.acquire(blocking=False):
+            return
+        try:
+            theme = self.detector.get_system_theme()
+            self._detected.emit(theme)
+        except RuntimeError:
+            # 감시기가 이미 삭제됨
+            pass
+        finally:
+            self._detecting.release()
+
+    def _on_detected(self, theme: str):
+        if self._source is None or theme == self._current:
+            return
+        self._current = theme
+        self.theme_changed.emit(theme)
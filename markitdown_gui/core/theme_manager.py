@@ -11,11 +11,14 @@ from enum import Enum
 from dataclasses import dataclass
 
 from PyQt6.QtWidgets import QApplication, QWidget, QGraphicsOpacityEffect
-from PyQt6.QtCore import QObject, pyqtSignal, QSettings, QTimer, QPropertyAnimation, QEasingCurve
+from PyQt6.QtCore import QObject, pyqtSignal, QSettings, QPropertyAnimation, QEasingCurve
 from PyQt6.QtGui import QPalette, QColor
 
+from .constants import STYLESHEET_CACHE_DIR
 from .logger import get_logger
+from .stylesheet_compiler import StylesheetCache, StylesheetTemplate, theme_variables
 from .system_theme_detector import SystemThemeDetector
+from .system_theme_watcher import SystemThemeWatcher
 
 
 logger = get_logger(__name__)
@@ -85,6 +88,9 @@ class ThemeManager(QObject):
         self.config_dir = config_dir or Path("config")
         self.styles_dir = Path(__file__).parent.parent / "resources" / "styles"
         
+        # 컴파일된 스타일시트 캐시 (테마 전환/시작 시 QSS 재파싱 없음)
+        self._stylesheet_cache = StylesheetCache(self.styles_dir, self.config_dir / STYLESHEET_CACHE_DIR)
+        
         # 설정 저장
         self.settings = QSettings()
         
@@ -92,14 +98,10 @@ class ThemeManager(QObject):
         self._current_theme = ThemeType.FOLLOW_SYSTEM
         self._current_accent = "#3B82F6"  # Blue-500
         self._system_theme_detector = None
+        self._system_theme_watcher: Optional[SystemThemeWatcher] = None
         self._theme_colors: Dict[ThemeType, ThemeColors] = {}
         self._last_system_theme = None
         
-        # 테마 변경 감지 타이머 (시스템 테마용)
-        self._theme_check_timer = QTimer()
-        self._theme_check_timer.timeout.connect(self._check_system_theme_change)
-        self._theme_check_timer.setInterval(5000)  # 5초마다 체크
-        
         # 콜백 함수들 (테마 적용시 호출)
         self._theme_callbacks: list[Callable] = []
         
@@ -191,27 +193,25 @@ class ThemeManager(QObject):
         """시스템 테마 감지기 초기화"""
         try:
             self._system_theme_detector = SystemThemeDetector()
+            # 변경 알림 기반 감시 (UI 스레드에서 프로세스를 실행하지 않음)
+            self._system_theme_watcher = SystemThemeWatcher(self._system_theme_detector, parent=self)
+            self._system_theme_watcher.theme_changed.connect(self._on_system_theme_changed)
             logger.info("System theme detector initialized")
         except Exception as e:
             logger.warning(f"Failed to initialize system theme detector: {e}")
     
-    def _check_system_theme_change(self):
-        """시스템 테마 변경 감지 및 적용"""
-        if not self._system_theme_detector:
-            return
-        
+    def _on_system_theme_changed(self, system_theme_str: str):
+        """시스템 테마 변경 알림 적용"""
         if self._current_theme != ThemeType.FOLLOW_SYSTEM:
             return
         
         try:
-            current_system_theme_str = self._system_theme_detector.get_system_theme()
-            if current_system_theme_str != self._last_system_theme:
-                self._last_system_theme = current_system_theme_str
-                actual_theme = ThemeType.DARK if current_system_theme_str == "dark" else ThemeType.LIGHT
-                self._apply_theme(actual_theme)
-                logger.info(f"System theme changed to: {current_system_theme_str}")
+            self._last_system_theme = system_theme_str
+            actual_theme = ThemeType.DARK if system_theme_str == "dark" else ThemeType.LIGHT
+            self._apply_theme(actual_theme)
+            logger.info(f"System theme changed to: {system_theme_str}")
         except Exception as e:
-            logger.error(f"Error checking system theme change: {e}")
+            logger.error(f"Error applying system theme change: {e}")
     
     def set_theme(self, theme: ThemeType) -> bool:
         """
@@ -232,17 +232,17 @@ class ThemeManager(QObject):
             
             # 시스템 테마 팔로우 모드 처리
             if theme == ThemeType.FOLLOW_SYSTEM:
-                if self._system_theme_detector:
-                    system_theme_str = self._system_theme_detector.get_system_theme()
+                if self._system_theme_watcher:
+                    system_theme_str = self._system_theme_watcher.start()
                     actual_theme = ThemeType.DARK if system_theme_str == "dark" else ThemeType.LIGHT
                     self._last_system_theme = system_theme_str
-                    self._theme_check_timer.start()
                 else:
                     # 시스템 감지 실패시 라이트 테마로 폴백
                     actual_theme = ThemeType.LIGHT
                     logger.warning("System theme detection failed, falling back to light theme")
             else:
-                self._theme_check_timer.stop()
+                if self._system_theme_watcher:
+                    self._system_theme_watcher.stop()
                 actual_theme = theme
             
             # 테마 적용
@@ -275,16 +275,12 @@ class ThemeManager(QObject):
             성공 여부
         """
         try:
-            # QSS 스타일시트 로드
-            stylesheet = self._load_stylesheet(theme)
+            # 테마 색상으로 치환된 스타일시트 (캐시 우선)
+            colors = self._theme_colors.get(theme)
+            stylesheet = self._stylesheet_cache.get(self._stylesheet_filename(theme), colors)
             if not stylesheet:
                 return False
             
-            # 테마 색상으로 스타일시트 변수 치환
-            colors = self._theme_colors.get(theme)
-            if colors:
-                stylesheet = self._replace_color_variables(stylesheet, colors)
-            
             # 스무스 트랜지션으로 스타일시트 적용
             if self._transition_enabled:
                 self._apply_theme_with_transition(stylesheet, theme, colors)
@@ -434,9 +430,15 @@ class ThemeManager(QObject):
             except Exception as e:
                 logger.warning(f"Theme callback error: {e}")
     
+    def _stylesheet_filename(self, theme: ThemeType) -> str:
+        """테마의 QSS 파일 이름"""
+        if theme == ThemeType.HIGH_CONTRAST:
+            return "high_contrast_theme.qss"
+        return f"{theme.value}_theme.qss"
+    
     def _load_stylesheet(self, theme: ThemeType) -> Optional[str]:
         """
-        QSS 스타일시트 파일 로드
+        QSS 스타일시트 파일 로드 (변수 치환 전 원본)
         
         Args:
             theme: 테마 타입
@@ -445,11 +447,7 @@ class ThemeManager(QObject):
             스타일시트 문자열
         """
         try:
-            if theme == ThemeType.HIGH_CONTRAST:
-                filename = "high_contrast_theme.qss"  
-            else:
-                filename = f"{theme.value}_theme.qss"
-            stylesheet_path = self.styles_dir / filename
+            stylesheet_path = self.styles_dir / self._stylesheet_filename(theme)
             
             if not stylesheet_path.exists():
                 logger.error(f"Stylesheet not found: {stylesheet_path}")
@@ -474,35 +472,8 @@ class ThemeManager(QObject):
             치환된 스타일시트
         """
         try:
-            # 색상 변수 매핑
-            color_vars = {
-                "@primary": colors.primary,
-                "@primary-variant": colors.primary_variant,
-                "@secondary": colors.secondary,
-                "@secondary-variant": colors.secondary_variant,
-                "@background": colors.background,
-                "@surface": colors.surface,
-                "@error": colors.error,
-                "@on-primary": colors.on_primary,
-                "@on-secondary": colors.on_secondary,
-                "@on-background": colors.on_background,
-                "@on-surface": colors.on_surface,
-                "@on-error": colors.on_error,
-                "@border": colors.border,
-                "@hover": colors.hover,
-                "@pressed": colors.pressed,
-                "@disabled": colors.disabled,
-                "@selected": colors.selected,
-                "@accent": colors.accent,
-            }
-            
-            # 변수 치환
-            result = stylesheet
-            for var, color in color_vars.items():
-                result = result.replace(var, color)
-            
-            return result
-            
+            # 가장 긴 변수 이름으로 한 번에 치환 (@primary가 @primary-variant를 덮어쓰지 않음)
+            return StylesheetTemplate(stylesheet).render(theme_variables(colors))
         except Exception as e:
             logger.error(f"Error replacing color variables: {e}")
             return stylesheet
@@ -600,8 +571,9 @@ class ThemeManager(QObject):
     def _get_actual_theme(self) -> ThemeType:
         """현재 실제 적용된 테마 반환"""
         if self._current_theme == ThemeType.FOLLOW_SYSTEM:
-            if self._system_theme_detector:
-                system_theme_str = self._system_theme_detector.get_system_theme()
+            # 감시기가 알려준 마지막 값 (매번 감지하지 않음)
+            if self._system_theme_watcher:
+                system_theme_str = self._system_theme_watcher.current_theme or self._system_theme_watcher.start()
                 return ThemeType.DARK if system_theme_str == "dark" else ThemeType.LIGHT
             else:
                 return ThemeType.LIGHT  # fallback
@@ -734,7 +706,8 @@ class ThemeManager(QObject):
                 self._current_animation.deleteLater()
                 self._current_animation = None
             
-            self._theme_check_timer.stop()
+            if self._system_theme_watcher:
+                self._system_theme_watcher.stop()
             self.save_settings()
             logger.info("Theme manager cleaned up")
         except Exception as e:
@@ -0,0 +1,447 @@
+"""
+변환 처리량 벤치마크
+시드 고정 합성 코퍼스(TXT/CSV/JSON/HTML/DOCX/XLSX/PDF)를 생성하고
+워커 수와 캐시 상태(cold/warm)별로 ConversionEngine 처리량을 측정
+
+각 시나리오는 기본적으로 별도 인터프리터에서 실행되어 최대 RSS가 서로 섞이지 않는다.
+결과는 커밋 간 비교를 위해 JSON으로 보고한다.
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import random
+import hashlib
+import zipfile
+import platform
+import subprocess
+import threading
+from dataclasses import dataclass, field, asdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Iterable, Callable
+
+from .constants import (
+    KB, MB, THROUGHPUT_DEFAULT_SEED, THROUGHPUT_DEFAULT_FORMATS,
+    THROUGHPUT_FILES_PER_FORMAT, THROUGHPUT_FILE_SIZE_KB
+)
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+CORPUS_MANIFEST = "corpus.json"
+CACHE_STATES = ("cold", "warm")
+
+# zip 항목의 타임스탬프를 고정하여 바이트 단위로 재현 가능한 DOCX/XLSX 생성
+_ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+_WORDS = (
+    "conversion markdown document table figure section summary report analysis "
+    "throughput latency worker cache memory engine pipeline batch result value "
+    "문서 변환 결과 요약 분석 처리량 메모리 캐시 작업자 보고서"
+).split()
+
+
+@dataclass
+class CorpusSpec:
+    """합성 코퍼스 사양"""
+    seed: int = THROUGHPUT_DEFAULT_SEED
+    formats: List[str] = field(default_factory=lambda: list(THROUGHPUT_DEFAULT_FORMATS))
+    files_per_format: int = THROUGHPUT_FILES_PER_FORMAT
+    size_kb: int = THROUGHPUT_FILE_SIZE_KB
+
+
+def _sentence(rng: random.Random, words: int = 12) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize() + "."
+
+
+def _fill(rng: random.Random, target: int, make_chunk: Callable[[random.Random, int], str]) -> List[str]:
+    """누적 길이가 target 바이트에 도달할 때까지 조각 생성"""
+    chunks, size, index = [], 0, 0
+    while size < target:
+        chunk = make_chunk(rng, index)
+        chunks.append(chunk)
+        size += len(chunk.encode("utf-8"))
+        index += 1
+    return chunks
+
+
+def _xml_escape(text: str) -> str:
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def _zip_bytes(parts: Dict[str, str]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, content in parts.items():
+            info = zipfile.ZipInfo(name, date_time=_ZIP_DATE_TIME)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            archive.writestr(info, content)
+    return buffer.getvalue()
+
+
+def _make_txt(rng: random.Random, target: int) -> bytes:
+    return "\n\n".join(_fill(rng, target, lambda r, i: _sentence(r, 40))).encode("utf-8")
+
+
+def _make_csv(rng: random.Random, target: int) -> bytes:
+    rows = ["id,name,category,amount,ratio"]
+    rows += _fill(rng, target, lambda r, i: (
+        f"{i},{r.choice(_WORDS)},{r.choice(_WORDS)},{r.randint(0, 100000)},{r.random():.4f}"
+    ))
+    return "\n".join(rows).encode("utf-8")
+
+
+def _make_json(rng: random.Random, target: int) -> bytes:
+    records = []
+    size = 0
+    while size < target:
+        record = {"id": len(records), "title": _sentence(rng, 5),
+                  "tags": [rng.choice(_WORDS) for _ in range(3)],
+                  "score": round(rng.random() * 100, 2)}
+        records.append(record)
+        size += len(json.dumps(record, ensure_ascii=False).encode("utf-8"))
+    return json.dumps({"records": records}, ensure_ascii=False, indent=1).encode("utf-8")
+
+
+def _make_html(rng: random.Random, target: int) -> bytes:
+    def block(r: random.Random, i: int) -> str:
+        if i % 5 == 4:
+            cells = "".join(f"<td>{r.randint(0, 999)}</td>" for _ in range(4))
+            return f"<table><tr><th>A</th><th>B</th><th>C</th><th>D</th></tr><tr>{cells}</tr></table>"
+        return f"<h2>Section {i}</h2><p>{_xml_escape(_sentence(r, 40))}</p>"
+
+    body = "\n".join(_fill(rng, target, block))
+    return (f"<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\"><title>Benchmark</title></head>"
+            f"<body>\n{body}\n</body></html>").encode("utf-8")
+
+
+def _make_docx(rng: random.Random, target: int) -> bytes:
+    paragraphs = "".join(_fill(rng, target, lambda r, i: (
+        f"<w:p><w:r><w:t>{_xml_escape(_sentence(r, 40))}</w:t></w:r></w:p>"
+    )))
+    return _zip_bytes({
+        "[Content_Types].xml": (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/word/document.xml" ContentType="application/'
+            'vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/></Types>'
+        ),
+        "_rels/.rels": (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/'
+            'relationships/officeDocument" Target="word/document.xml"/></Relationships>'
+        ),
+        "word/document.xml": (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+            f'<w:body>{paragraphs}</w:body></w:document>'
+        ),
+    })
+
+
+def _make_xlsx(rng: random.Random, target: int) -> bytes:
+    def row(r: random.Random, i: int) -> str:
+        return (f'<row r="{i + 1}">'
+                f'<c r="A{i + 1}" t="inlineStr"><is><t>{r.choice(_WORDS)}</t></is></c>'
+                f'<c r="B{i + 1}"><v>{r.randint(0, 100000)}</v></c>'
+                f'<c r="C{i + 1}"><v>{r.random():.4f}</v></c></row>')
+
+    rows = "".join(_fill(rng, target, row))
+    return _zip_bytes({
+        "[Content_Types].xml": (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/xl/workbook.xml" ContentType="application/'
+            'vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+            '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/'
+            'vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/></Types>'
+        ),
+        "_rels/.rels": (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/'
+            'relationships/officeDocument" Target="xl/workbook.xml"/></Relationships>'
+        ),
+        "xl/workbook.xml": (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+            'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+            '<sheets><sheet name="Data" sheetId="1" r:id="rId1"/></sheets></workbook>'
+        ),
+        "xl/_rels/workbook.xml.rels": (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/'
+            'relationships/worksheet" Target="worksheets/sheet1.xml"/></Relationships>'
+        ),
+        "xl/worksheets/sheet1.xml": (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+            f'<sheetData>{rows}</sheetData></worksheet>'
+        ),
+    })
+
+
+def _make_pdf(rng: random.Random, target: int) -> bytes:
+    """Helvetica 텍스트만 있는 최소 PDF (페이지당 40줄)"""
+    ascii_words = [w for w in _WORDS if w.isascii()]
+    lines = _fill(rng, target, lambda r, i: " ".join(r.choice(ascii_words) for _ in range(10)))
+    pages = [lines[i:i + 40] for i in range(0, len(lines), 40)] or [[]]
+
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None,
+               "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    page_ids = []
+    for page_lines in pages:
+        text = "".join(f"({line}) Tj T* " for line in page_lines)
+        stream = f"BT /F1 10 Tf 12 TL 50 780 Td {text}ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        content_id = len(objects)
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+                       f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>")
+        page_ids.append(len(objects))
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+    objects[1] = f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>"
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1")
+    xref = len(output)
+    output += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("latin-1")
+    for offset in offsets:
+        output += f"{offset:010d} 00000 n \n".encode("latin-1")
+    output += (f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+               f"startxref\n{xref}\n%%EOF\n").encode("latin-1")
+    return bytes(output)
+
+
+CORPUS_GENERATORS: Dict[str, Callable[[random.Random, int], bytes]] = {
+    "txt": _make_txt,
+    "csv": _make_csv,
+    "json": _make_json,
+    "html": _make_html,
+    "docx": _make_docx,
+    "xlsx": _make_xlsx,
+    "pdf": _make_pdf,
+}
+
+
+def generate_corpus(directory: Path, spec: Optional[CorpusSpec] = None) -> Dict[str, Any]:
+    """
+    시드 고정 합성 코퍼스 생성
+
+    같은 사양이면 항상 같은 바이트를 생성하며, 매니페스트의 digest로 확인할 수 있다.
+
+    Returns:
+        코퍼스 매니페스트 (corpus.json에도 저장)
+    """
+    spec = spec or CorpusSpec()
+    unknown = [fmt for fmt in spec.formats if fmt not in CORPUS_GENERATORS]
+    if unknown:
+        raise ValueError(f"지원하지 않는 코퍼스 형식: {', '.join(unknown)}")
+
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    digest = hashlib.sha256()
+    files = []
+
+    for fmt in spec.formats:
+        for index in range(spec.files_per_format):
+            # 형식/번호별 독립 시드: 형식 목록이나 개수를 바꿔도 기존 파일은 동일
+            rng = random.Random(f"{spec.seed}:{fmt}:{index}")
+            data = CORPUS_GENERATORS[fmt](rng, spec.size_kb * KB)
+            name = f"{fmt}_{index:04d}.{fmt}"
+            (directory / name).write_bytes(data)
+            file_digest = hashlib.sha256(data).hexdigest()
+            digest.update(f"{name}:{file_digest}\n".encode())
+            files.append({"name": name, "format": fmt, "size": len(data), "sha256": file_digest})
+
+    manifest = {
+        "spec": asdict(spec),
+        "files": files,
+        "total_bytes": sum(f["size"] for f in files),
+        "digest": digest.hexdigest(),
+    }
+    (directory / CORPUS_MANIFEST).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    return manifest
+
+
+def percentile(values: List[float], fraction: float) -> Optional[float]:
+    """최근접 순위 백분위수"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * fraction // 1))  # ceil(n * fraction)
+    return ordered[int(rank) - 1]
+
+
+def _latency_summary(latencies_ms: List[float]) -> Dict[str, Optional[float]]:
+    def rounded(value):
+        return None if value is None else round(value, 2)
+    return {
+        "p50": rounded(percentile(latencies_ms, 0.50)),
+        "p95": rounded(percentile(latencies_ms, 0.95)),
+        "max": rounded(max(latencies_ms) if latencies_ms else None),
+    }
+
+
+def run_scenario(corpus_dir: Path, output_dir: Path, workers: int,
+                 cache: str = "cold") -> Dict[str, Any]:
+    """
+    현재 프로세스에서 시나리오 하나 실행
+
+    warm 시나리오는 같은 MemoryOptimizer로 측정하지 않는 사전 실행을 한 번 거쳐
+    변환 캐시가 채워진 상태에서 측정한다.
+    """
+    # 측정 대상 모듈은 시나리오 프로세스 안에서 import (부모 프로세스 RSS 오염 방지)
+    from .conversion_engine import ConversionEngine
+    from .memory_optimizer import MemoryOptimizer
+    from .resource_sampler import ResourceSampler
+    from .models import ConversionStatus
+    from .utils import create_file_info
+
+    if cache not in CACHE_STATES:
+        raise ValueError(f"알 수 없는 캐시 상태: {cache}")
+
+    manifest = json.loads((Path(corpus_dir) / CORPUS_MANIFEST).read_text(encoding="utf-8"))
+    paths = [(Path(corpus_dir) / entry["name"], entry["format"]) for entry in manifest["files"]]
+
+    memory_optimizer = MemoryOptimizer()
+    local = threading.local()
+
+    def convert(item):
+        path, fmt = item
+        engine = getattr(local, "engine", None)
+        if engine is None:
+            engine = ConversionEngine(Path(output_dir), memory_optimizer=memory_optimizer,
+                                      save_to_original_dir=False, overwrite_outputs=True)
+            local.engine = engine
+        file_info = create_file_info(path)
+        start = time.perf_counter()
+        result = engine.convert_file(file_info)
+        return fmt, file_info.size, result.status == ConversionStatus.SUCCESS, \
+            (time.perf_counter() - start) * 1000
+
+    sampler = ResourceSampler(interval=0.05)
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="BenchWorker") as executor:
+            if cache == "warm":
+                list(executor.map(convert, paths))
+
+            sampler.start()
+            start = time.perf_counter()
+            outcomes = list(executor.map(convert, paths))
+            elapsed = time.perf_counter() - start
+        snapshot = sampler.sample_now()
+    finally:
+        sampler.stop()
+        memory_optimizer.cleanup()
+
+    total_bytes = sum(size for _, size, _, _ in outcomes)
+    latencies = [latency for _, _, _, latency in outcomes]
+    by_format: Dict[str, Dict[str, Any]] = {}
+    for fmt in dict.fromkeys(fmt for fmt, _, _, _ in outcomes):
+        format_outcomes = [o for o in outcomes if o[0] == fmt]
+        by_format[fmt] = {
+            "files": len(format_outcomes),
+            "failed": sum(1 for o in format_outcomes if not o[2]),
+            "latency_ms": _latency_summary([o[3] for o in format_outcomes]),
+        }
+
+    return {
+        "workers": workers,
+        "cache": cache,
+        "files": len(outcomes),
+        "succeeded": sum(1 for o in outcomes if o[2]),
+        "failed": sum(1 for o in outcomes if not o[2]),
+        "elapsed": round(elapsed, 4),
+        "files_per_sec": round(len(outcomes) / elapsed, 2) if elapsed > 0 else None,
+        "mb_per_sec": round(total_bytes / MB / elapsed, 3) if elapsed > 0 else None,
+        "latency_ms": _latency_summary(latencies),
+        "peak_rss_mb": round(snapshot.peak_rss_mb, 1) if snapshot.is_valid else None,
+        "by_format": by_format,
+    }
+
+
+def _run_scenario_isolated(corpus_dir: Path, output_dir: Path, workers: int, cache: str,
+                           timeout: float) -> Dict[str, Any]:
+    """새 인터프리터에서 시나리오 실행 (시나리오별 최대 RSS 분리)"""
+    args = json.dumps([str(corpus_dir), str(output_dir), workers, cache])
+    code = ("import json, sys\n"
+            "from markitdown_gui.core.logger import setup_logging\n"
+            "from markitdown_gui.core.throughput_benchmark import run_scenario\n"
+            "setup_logging(console_stream=sys.stderr)\n"
+            "print(json.dumps(run_scenario(*json.loads(sys.argv[1]))))\n")
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(PROJECT_ROOT), env.get("PYTHONPATH")]))
+    result = subprocess.run([sys.executable, "-c", code, args], capture_output=True, text=True,
+                            timeout=timeout, cwd=str(output_dir), env=env)
+    if result.returncode != 0:
+        raise RuntimeError(f"시나리오 실행 실패 (workers={workers}, cache={cache}): "
+                           f"{result.stderr.strip()[-500:]}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def run_throughput_benchmark(corpus_dir: Path, output_dir: Path,
+                             spec: Optional[CorpusSpec] = None,
+                             worker_counts: Iterable[int] = (1, 2, 4),
+                             cache_states: Iterable[str] = CACHE_STATES,
+                             isolate: bool = True,
+                             timeout: float = 600.0) -> Dict[str, Any]:
+    """
+    코퍼스 생성 후 워커 수 x 캐시 상태 조합별 처리량 측정
+
+    Args:
+        corpus_dir: 코퍼스 디렉토리 (사양과 일치하는 코퍼스가 있으면 재사용)
+        output_dir: 변환 결과를 쓸 디렉토리
+        isolate: 시나리오마다 별도 인터프리터 사용 (최대 RSS 분리)
+
+    Returns:
+        JSON 직렬화 가능한 보고서
+    """
+    spec = spec or CorpusSpec()
+    corpus_dir, output_dir = Path(corpus_dir), Path(output_dir)
+    manifest_path = corpus_dir / CORPUS_MANIFEST
+
+    manifest = None
+    if manifest_path.exists():
+        existing = json.loads(manifest_path.read_text(encoding="utf-8"))
+        if existing.get("spec") == asdict(spec):
+            manifest = existing
+    if manifest is None:
+        manifest = generate_corpus(corpus_dir, spec)
+
+    scenarios = []
+    for workers in worker_counts:
+        for cache in cache_states:
+            scenario_output = output_dir / f"w{workers}_{cache}"
+            scenario_output.mkdir(parents=True, exist_ok=True)
+            if isolate:
+                scenarios.append(_run_scenario_isolated(corpus_dir, scenario_output,
+                                                        workers, cache, timeout))
+            else:
+                scenarios.append(run_scenario(corpus_dir, scenario_output, workers, cache))
+
+    return {
+        "type": "throughput_benchmark",
+        "corpus": {
+            "spec": manifest["spec"],
+            "files": len(manifest["files"]),
+            "total_bytes": manifest["total_bytes"],
+            "digest": manifest["digest"],
+        },
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "isolated": isolate,
+        },
+        "scenarios": scenarios,
+    }
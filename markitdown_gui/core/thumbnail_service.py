@@ -0,0 +1,224 @@
+"""
+썸네일 서비스
+이미지 미리보기와 파일 목록 아이콘용 썸네일을 백그라운드 풀에서 만들고 디스크에 캐시
+
+썸네일은 원본 내용 해시와 크기로 식별하므로 파일을 옮기거나 이름을 바꿔도 다시 만들지
+않는다. JPEG은 draft 모드로 필요한 크기(1/2, 1/4, 1/8)까지만 디코딩한다. 같은 원본의 해시는
+(경로, 크기, 수정 시각) 기준으로 메모리에 기억해 다시 읽지 않는다. 캐시 적중 시 썸네일
+파일의 수정 시각을 갱신하므로 디스크 캐시는 가장 오래 사용하지 않은 것부터 정리된다.
+"""
+
+import hashlib
+import importlib.util
+import os
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+# 파일 목록 위젯을 통해 GUI 시작 경로에서 import되므로 Pillow는 가용성만 확인하고
+# 실제 import는 첫 썸네일 생성 시점(작업 스레드)으로 미룬다
+PILLOW_AVAILABLE = importlib.util.find_spec("PIL") is not None
+
+from .constants import (
+    DEFAULT_THUMBNAIL_QUALITY, MB, THUMBNAIL_CACHE_MAX_MB, THUMBNAIL_WORKERS
+)
+from .logger import get_logger
+from .memory_optimizer import LRUCache
+from .models import FileType
+from .utils import get_thumbnail_cache_directory
+
+
+logger = get_logger(__name__)
+
+
+Size = Tuple[int, int]
+
+# 썸네일을 만들 수 있는 파일 형식
+THUMBNAIL_FILE_TYPES = frozenset({
+    FileType.JPG, FileType.JPEG, FileType.PNG, FileType.GIF, FileType.BMP, FileType.TIFF
+})
+
+_HASH_CHUNK_SIZE = 1 * MB
+
+
+def file_digest(path: Path) -> str:
+    """원본 내용 해시"""
+    digest = hashlib.blake2b(digest_size=20)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def render_thumbnail(source: Path, target: Path, size: Size,
+                     quality: int = DEFAULT_THUMBNAIL_QUALITY) -> Path:
+    """
+    썸네일 생성 (비율 유지, 투명 영역은 흰 배경으로 합성)
+
+    임시 파일에 쓴 뒤 교체하므로 동시에 읽는 쪽이 반쯤 쓴 파일을 보지 않는다.
+    """
+    if not PILLOW_AVAILABLE:
+        raise RuntimeError("썸네일 생성을 위해 Pillow 라이브러리가 필요합니다")
+    from PIL import Image, ImageOps
+
+    with Image.open(source) as image:
+        # JPEG은 축소 디코딩, 다른 형식은 무시됨
+        image.draft('RGB', size)
+        image = ImageOps.exif_transpose(image)
+        image.thumbnail(size, Image.Resampling.LANCZOS)
+
+        if image.mode in ('RGBA', 'LA', 'P'):
+            image = image.convert('RGBA')
+            background = Image.new('RGB', image.size, (255, 255, 255))
+            background.paste(image, mask=image.getchannel('A'))
+            image = background
+        elif image.mode != 'RGB':
+            image = image.convert('RGB')
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(dir=target.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                image.save(f, 'JPEG', quality=quality)
+            os.replace(temp_name, target)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+    return target
+
+
+class ThumbnailService:
+    """디스크 캐시를 가진 썸네일 생성기"""
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_workers: int = THUMBNAIL_WORKERS,
+                 max_cache_mb: float = THUMBNAIL_CACHE_MAX_MB):
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else get_thumbnail_cache_directory()
+        self.max_cache_bytes = int(max_cache_mb * MB)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="Thumbnail")
+        # (경로, 크기, 수정 시각) -> 내용 해시
+        self._digests = LRUCache(max_size=20000, max_memory_mb=8)
+        self._pending: Dict[Tuple[str, Size], Future] = {}
+        self._lock = threading.Lock()
+        self._cache_bytes: Optional[int] = None
+        self.generated = 0
+
+    def cache_path(self, digest: str, size: Size) -> Path:
+        return self.cache_dir / digest[:2] / f"{digest}_{size[0]}x{size[1]}.jpg"
+
+    def _stat_key(self, source: Path) -> Tuple[str, int, int]:
+        stat = source.stat()
+        return str(source), stat.st_size, stat.st_mtime_ns
+
+    def _digest(self, source: Path) -> str:
+        key = self._stat_key(source)
+        digest = self._digests.get(key)
+        if digest is None:
+            digest = file_digest(source)
+            self._digests.set(key, digest, size=128)
+        return digest
+
+    def cached_thumbnail(self, source: Path, size: Size) -> Optional[Path]:
+        """
+        이미 만들어진 썸네일 (없거나 해시를 아직 모르면 None)
+
+        원본을 읽지 않으므로 UI 스레드에서 호출해도 된다.
+        """
+        try:
+            digest = self._digests.get(self._stat_key(Path(source)))
+        except OSError:
+            return None
+        if digest is None:
+            return None
+        path = self.cache_path(digest, size)
+        return path if self._touch(path) else None
+
+    def get_thumbnail(self, source: Path, size: Size) -> Path:
+        """썸네일 경로 (캐시에 없으면 생성, 작업 스레드에서 호출)"""
+        source = Path(source)
+        path = self.cache_path(self._digest(source), size)
+        if self._touch(path):
+            return path
+        render_thumbnail(source, path, size)
+        self.generated += 1
+        self._account(path.stat().st_size)
+        return path
+
+    @staticmethod
+    def _touch(path: Path) -> bool:
+        """캐시 적중 표시 (수정 시각 갱신), 파일이 없으면 False"""
+        try:
+            os.utime(path)
+            return True
+        except OSError:
+            return False
+
+    def request(self, source: Path, size: Size) -> Future:
+        """백그라운드 생성 요청 (같은 원본/크기의 진행 중 요청은 공유)"""
+        key = (str(source), tuple(size))
+        with self._lock:
+            future = self._pending.get(key)
+            if future is None:
+                future = self._executor.submit(self.get_thumbnail, Path(source), tuple(size))
+                self._pending[key] = future
+                future.add_done_callback(lambda _, key=key: self._forget(key))
+        return future
+
+    def _forget(self, key):
+        with self._lock:
+            self._pending.pop(key, None)
+
+    # 캐시 크기 관리
+
+    def _account(self, added: int):
+        with self._lock:
+            if self._cache_bytes is None:
+                self._cache_bytes = sum(p.stat().st_size for p in self.cache_dir.rglob('*.jpg'))
+            else:
+                self._cache_bytes += added
+            over_budget = self._cache_bytes > self.max_cache_bytes
+        if over_budget:
+            self.prune()
+
+    def prune(self, target_ratio: float = 0.8):
+        """가장 오래 사용하지 않은 썸네일부터 지워 캐시를 예산의 target_ratio 이하로 줄임"""
+        entries = []
+        for path in self.cache_dir.rglob('*.jpg'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        limit = self.max_cache_bytes * target_ratio
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= limit:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        with self._lock:
+            self._cache_bytes = total
+        if removed:
+            logger.debug(f"썸네일 캐시 정리: {removed}개 삭제")
+
+    def shutdown(self, wait: bool = False):
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+_service: Optional[ThumbnailService] = None
+_service_lock = threading.Lock()
+
+
+def get_thumbnail_service() -> ThumbnailService:
+    """공유 썸네일 서비스"""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = ThumbnailService()
+        return _service
@@ -0,0 +1,182 @@
+"""
+변환 파이프라인 단계별 추적
+배치 단위로 활성화하는 경량 span 기록기와 Chrome trace(Perfetto) JSON 내보내기
+
+활성 Tracer는 contextvars로 전달되므로 OCR 서비스처럼 엔진 밖의 코드도
+`trace_span()`으로 하위 단계를 기록할 수 있다. 추적이 꺼져 있으면 `trace_span()`은
+공유 no-op 객체를 반환하므로 비용이 거의 없다.
+"""
+
+import os
+import json
+import time
+import threading
+import contextvars
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Iterator
+
+from .constants import TRACE_MAX_EVENTS
+
+
+_current_tracer: contextvars.ContextVar[Optional["Tracer"]] = contextvars.ContextVar(
+    "markitdown_gui_tracer", default=None
+)
+
+
+class Span:
+    """기록 중인 구간 (with 블록 종료 시 완료 이벤트로 저장)"""
+
+    __slots__ = ("_tracer", "name", "category", "args", "_start")
+
+    def __init__(self, tracer: "Tracer", name: str, category: str, args: Dict[str, Any]):
+        self._tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self._start = 0
+
+    def set(self, **args):
+        """구간 인자 추가 (예: 캐시 적중 여부)"""
+        self.args.update(args)
+
+    def __enter__(self) -> "Span":
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self._tracer._add_complete(self.name, self.category, self._start, end, self.args)
+        return False
+
+
+class _NullSpan:
+    """추적 비활성 시 사용하는 no-op 구간"""
+
+    __slots__ = ()
+
+    def set(self, **args):
+        pass
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """스레드 안전한 span 수집기"""
+
+    def __init__(self, name: str = "markitdown_gui", max_events: int = TRACE_MAX_EVENTS):
+        self.name = name
+        self.max_events = max_events
+        self.dropped_events = 0
+        self._origin = time.perf_counter_ns()
+        self._events: List[Dict[str, Any]] = []
+        self._thread_names: Dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def span(self, name: str, category: str = "stage", **args) -> Span:
+        """구간 기록용 컨텍스트 매니저"""
+        return Span(self, name, category, args)
+
+    def instant(self, name: str, category: str = "event", **args):
+        """시점 이벤트 기록"""
+        now = time.perf_counter_ns()
+        self._append({"name": name, "cat": category, "ph": "i", "s": "t",
+                      "ts": (now - self._origin) / 1000, "args": args})
+
+    def _add_complete(self, name: str, category: str, start: int, end: int, args: Dict[str, Any]):
+        self._append({"name": name, "cat": category, "ph": "X",
+                      "ts": (start - self._origin) / 1000, "dur": (end - start) / 1000,
+                      "args": args})
+
+    def _append(self, event: Dict[str, Any]):
+        thread = threading.current_thread()
+        event["pid"] = self._pid
+        event["tid"] = thread.ident
+        with self._lock:
+            if len(self._events) >= self.max_events:
+                self.dropped_events += 1
+                return
+            self._events.append(event)
+            if thread.ident not in self._thread_names:
+                self._thread_names[thread.ident] = thread.name
+
+    @property
+    def events(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self._events)
+
+    def stage_summary(self) -> Dict[str, Dict[str, float]]:
+        """단계 이름별 횟수/합계/평균/최대 시간(ms)"""
+        summary: Dict[str, Dict[str, float]] = {}
+        for event in self.events:
+            if event["ph"] != "X":
+                continue
+            duration = event["dur"] / 1000
+            entry = summary.setdefault(event["name"], {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+            entry["count"] += 1
+            entry["total_ms"] += duration
+            entry["max_ms"] = max(entry["max_ms"], duration)
+        for entry in summary.values():
+            entry["mean_ms"] = entry["total_ms"] / entry["count"]
+        return summary
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Chrome trace event 형식 (chrome://tracing, ui.perfetto.dev에서 열기)"""
+        with self._lock:
+            events = list(self._events)
+            thread_names = dict(self._thread_names)
+
+        metadata = [{"name": "process_name", "ph": "M", "pid": self._pid, "tid": 0,
+                     "args": {"name": self.name}}]
+        metadata += [{"name": "thread_name", "ph": "M", "pid": self._pid, "tid": tid,
+                      "args": {"name": thread_name}}
+                     for tid, thread_name in thread_names.items()]
+        return {
+            "traceEvents": metadata + events,
+            "displayTimeUnit": "ms",
+            "otherData": {
+                "stage_summary": self.stage_summary(),
+                "dropped_events": self.dropped_events,
+            },
+        }
+
+    def export(self, path: Path) -> Path:
+        """Chrome trace JSON 파일로 저장"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f, ensure_ascii=False, default=str)
+        return path
+
+
+def current_tracer() -> Optional[Tracer]:
+    """현재 컨텍스트의 활성 Tracer"""
+    return _current_tracer.get()
+
+
+@contextmanager
+def activate_tracer(tracer: Optional[Tracer]) -> Iterator[Optional[Tracer]]:
+    """블록 안에서 tracer를 활성화 (None이면 비활성화)"""
+    token = _current_tracer.set(tracer)
+    try:
+        yield tracer
+    finally:
+        _current_tracer.reset(token)
+
+
+def trace_span(name: str, category: str = "stage", **args):
+    """활성 Tracer가 있으면 구간을 기록하고, 없으면 no-op"""
+    tracer = _current_tracer.get()
+    if tracer is None:
+        return NULL_SPAN
+    return Span(tracer, name, category, args)
@@ -0,0 +1,63 @@
+"""
+번역 카탈로그
+중첩된 번역 JSON을 로드할 때 한 번 평탄화해 (컨텍스트, 키) -> 문자열 맵으로 컴파일
+
+컨텍스트는 키까지의 경로를 '.'로 이은 것("settings.general")이다. 대체 언어(en_US)의 항목을
+미리 합쳐 두므로 번역 조회는 딕셔너리 한 번이고, 언어를 바꿀 때는 이미 컴파일된 맵으로
+교체만 한다 (JSON을 다시 읽지 않음).
+"""
+
+from typing import Any, Dict, Tuple
+
+
+# (컨텍스트, 키)
+CatalogKey = Tuple[str, str]
+
+
+def flatten_translations(data: Dict[str, Any], context: str = "") -> Dict[CatalogKey, str]:
+    """중첩된 번역 데이터를 (컨텍스트, 키) -> 문자열 맵으로 변환 (None 값은 제외)"""
+    flat: Dict[CatalogKey, str] = {}
+    for key, value in data.items():
+        if isinstance(value, dict):
+            flat.update(flatten_translations(value, f"{context}.{key}" if context else key))
+        elif value is not None:
+            flat[(context, key)] = str(value)
+    return flat
+
+
+class TranslationCatalog:
+    """언어별 평탄화된 번역 맵"""
+
+    def __init__(self, fallback_language: str = "en_US"):
+        self.fallback_language = fallback_language
+        self._entries: Dict[str, Dict[CatalogKey, str]] = {}
+        # 대체 언어 항목을 합친 맵
+        self._compiled: Dict[str, Dict[CatalogKey, str]] = {}
+
+    def add_language(self, language: str, data: Dict[str, Any]):
+        """번역 데이터 등록 (같은 언어가 있으면 교체)"""
+        self._entries[language] = flatten_translations(data)
+        if language == self.fallback_language:
+            # 대체 언어가 바뀌면 모든 언어의 컴파일 결과가 달라짐
+            self._compiled.clear()
+        else:
+            self._compiled.pop(language, None)
+
+    def has_language(self, language: str) -> bool:
+        return language in self._entries
+
+    def key_count(self, language: str) -> int:
+        return len(self._entries.get(language, {}))
+
+    def compiled(self, language: str) -> Dict[CatalogKey, str]:
+        """대체 언어 항목을 미리 합친 조회용 맵"""
+        table = self._compiled.get(language)
+        if table is None:
+            table = dict(self._entries.get(self.fallback_language, {}))
+            table.update(self._entries.get(language, {}))
+            self._compiled[language] = table
+        return table
+
+    def clear(self):
+        self._entries.clear()
+        self._compiled.clear()
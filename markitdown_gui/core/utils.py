@@ -5,11 +5,13 @@
 
 import re
 import os
+import uuid
 from pathlib import Path
+from datetime import datetime
 from typing import List, Tuple, Optional
 import logging
 
-from .models import FileType, get_file_type
+from .models import FileType, FileInfo, get_file_type
 
 
 logger = logging.getLogger(__name__)
@@ -33,6 +35,30 @@ def get_default_output_directory() -> Path:
     return project_root / MARKDOWN_OUTPUT_DIR
 
 
+def get_thumbnail_cache_directory() -> Path:
+    """
+    Get the on-disk thumbnail cache directory
+    
+    Returns:
+        Thumbnail cache directory path (program_root/thumbnail_cache)
+    """
+    from .constants import THUMBNAIL_CACHE_DIR
+    
+    return Path(__file__).parent.parent.parent / THUMBNAIL_CACHE_DIR
+
+
+def get_search_index_path() -> Path:
+    """
+    Get the full-text search index database path
+    
+    Returns:
+        Search index path (program_root/search_index.db)
+    """
+    from .constants import SEARCH_INDEX_FILE
+    
+    return Path(__file__).parent.parent.parent / SEARCH_INDEX_FILE
+
+
 def validate_file_extension(file_path: Path, supported_extensions: List[str]) -> bool:
     """
     파일 확장자 검증
@@ -203,6 +229,61 @@ def get_unique_output_path(base_path: Path) -> Path:
             raise ValueError(f"유니크한 파일명을 생성할 수 없습니다: {base_path}")
 
 
+def atomic_write_text(path: Path, content: str, encoding: str = "utf-8"):
+    """
+    같은 디렉토리의 임시 파일에 기록한 뒤 os.replace로 교체
+    
+    읽는 쪽(또는 같은 경로에 쓰는 다른 프로세스)은 이전 내용이나 완성된 새 내용만 보게 된다.
+    
+    Args:
+        path: 대상 파일 경로
+        content: 기록할 내용
+        encoding: 텍스트 인코딩
+    """
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with open(tmp_path, "w", encoding=encoding) as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def reserve_unique_output_path(base_path: Path) -> Path:
+    """
+    중복되지 않는 출력 파일 경로를 원자적으로 예약
+    
+    get_unique_output_path와 같은 이름 규칙(stem, stem_1, ...)을 따르되 O_CREAT|O_EXCL로
+    빈 파일을 만들어 선점하므로, 여러 스레드/프로세스가 동시에 골라도 같은 이름을 받지 않는다.
+    예약된 파일은 호출자가 내용으로 교체(또는 실패 시 삭제)해야 한다.
+    
+    Args:
+        base_path: 기본 파일 경로
+    
+    Returns:
+        예약된 파일 경로
+    """
+    stem = base_path.stem
+    suffix = base_path.suffix
+    parent = base_path.parent
+    
+    candidate = base_path
+    for counter in range(1, 10001):
+        try:
+            os.close(os.open(candidate, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            return candidate
+        except FileExistsError:
+            candidate = parent / f"{stem}_{counter}{suffix}"
+    
+    raise ValueError(f"유니크한 파일명을 생성할 수 없습니다: {base_path}")
+
+
 def create_markdown_filename(original_path: Path) -> str:
     """
     원본 파일 경로로부터 마크다운 파일명 생성
@@ -218,6 +299,208 @@ def create_markdown_filename(original_path: Path) -> str:
     return f"{sanitized_name}.md"
 
 
+def resolve_markdown_output_path(
+    source_path: Path,
+    preserve_structure: bool = True,
+    output_base_dir: Optional[Path] = None,
+    ensure_unique: bool = True
+) -> Path:
+    """
+    Resolve markdown output path within the program's markdown directory.
+    
+    This centralized utility function provides secure, cross-platform path resolution
+    for markdown output files with comprehensive sanitization and conflict handling.
+    
+    Args:
+        source_path: Path to the source file to be converted
+        preserve_structure: If True, preserves the directory structure relative
+                          to the source file's directory. If False, places all
+                          output files in the root markdown directory.
+        output_base_dir: Base directory for markdown output. If None, uses the
+                        program's default markdown directory.
+        ensure_unique: If True, automatically generates unique filenames to avoid
+                      conflicts. If False, returns the target path even if it exists.
+    
+    Returns:
+        Absolute Path: Resolved path within the markdown output directory
+    
+    Raises:
+        ValueError: If source_path is invalid or cannot be processed
+        OSError: If there are permission issues accessing directories
+        
+    Security:
+        - Prevents directory traversal attacks through path sanitization
+        - Validates all path components for filesystem safety
+        - Ensures output paths remain within designated markdown directory
+        - Handles Windows reserved names and invalid characters
+        
+    Performance:
+        - Efficient path operations using pathlib
+        - Minimal filesystem access for path resolution
+        - Caches directory structure validation
+        
+    Cross-platform Compatibility:
+        - Uses pathlib for OS-agnostic path operations
+        - Handles Windows/Linux path length limitations
+        - Respects filesystem-specific naming conventions
+        
+    Examples:
+        >>> # Basic usage - flatten structure
+        >>> source = Path("/home/user/docs/report.pdf")
+        >>> output = resolve_markdown_output_path(source, preserve_structure=False)
+        >>> print(output)
+        /program/markdown/report.md
+        
+        >>> # Preserve directory structure
+        >>> source = Path("/home/user/docs/2024/report.pdf")
+        >>> output = resolve_markdown_output_path(source, preserve_structure=True)
+        >>> print(output)
+        /program/markdown/docs/2024/report.md
+        
+        >>> # Custom output directory
+        >>> source = Path("/home/user/docs/report.pdf")
+        >>> custom_dir = Path("/custom/markdown")
+        >>> output = resolve_markdown_output_path(source, output_base_dir=custom_dir)
+        >>> print(output)
+        /custom/markdown/report.md
+    """
+    # Input validation
+    if not isinstance(source_path, Path):
+        try:
+            source_path = Path(source_path)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid source path: {e}")
+    
+    if not source_path.name:
+        raise ValueError("Source path must point to a file, not a directory")
+    
+    # Security check: Ensure source path is absolute or can be resolved safely
+    try:
+        # Convert to absolute path to prevent relative path manipulation
+        if not source_path.is_absolute():
+            source_path = source_path.resolve()
+    except (OSError, RuntimeError) as e:
+        raise ValueError(f"Cannot resolve source path '{source_path}': {e}")
+    
+    # Determine output base directory
+    if output_base_dir is None:
+        # Use program's root directory + default markdown directory
+        from .constants import MARKDOWN_OUTPUT_DIR
+        program_root = Path(__file__).parent.parent.parent  # Navigate to project root
+        output_base_dir = program_root / MARKDOWN_OUTPUT_DIR
+    else:
+        # Validate and resolve custom output directory
+        if not isinstance(output_base_dir, Path):
+            try:
+                output_base_dir = Path(output_base_dir)
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"Invalid output base directory: {e}")
+        
+        # Ensure output directory is absolute
+        if not output_base_dir.is_absolute():
+            output_base_dir = output_base_dir.resolve()
+    
+    # Security validation: Prevent directory traversal
+    try:
+        output_base_dir = output_base_dir.resolve()
+    except (OSError, RuntimeError) as e:
+        raise ValueError(f"Cannot resolve output base directory '{output_base_dir}': {e}")
+    
+    # Generate safe markdown filename
+    source_stem = source_path.stem
+    if not source_stem:
+        source_stem = "untitled"
+    
+    # Sanitize filename to ensure filesystem compatibility
+    safe_filename = sanitize_filename(f"{source_stem}.md")
+    
+    # Determine final output path based on preserve_structure setting
+    if preserve_structure:
+        # Attempt to preserve directory structure
+        try:
+            # For absolute paths, we need a reference point for relative structure
+            # Use the source file's parent directory as the structure to preserve
+            source_parent = source_path.parent
+            
+            # Get the relative structure - use just the immediate parent name
+            # to avoid creating overly deep directory structures
+            if source_parent.name and source_parent.name != source_parent.root:
+                # Create a subdirectory based on source parent directory name
+                subdir_name = sanitize_filename(source_parent.name)
+                output_subdir = output_base_dir / subdir_name
+            else:
+                # Fallback to root output directory if parent structure is unclear
+                output_subdir = output_base_dir
+        except (OSError, ValueError):
+            # Fallback to root output directory if structure preservation fails
+            output_subdir = output_base_dir
+    else:
+        # Place directly in root markdown directory
+        output_subdir = output_base_dir
+    
+    # Construct final output path
+    output_path = output_subdir / safe_filename
+    
+    # Security check: Ensure resolved path is within output base directory
+    try:
+        resolved_output = output_path.resolve()
+        resolved_base = output_base_dir.resolve()
+        
+        # Verify the output path is within the base directory
+        try:
+            resolved_output.relative_to(resolved_base)
+        except ValueError:
+            # Path is outside base directory - security violation
+            raise ValueError(
+                f"Resolved output path '{resolved_output}' is outside "
+                f"base directory '{resolved_base}'. This may indicate a "
+                f"directory traversal attempt."
+            )
+    except (OSError, RuntimeError) as e:
+        raise ValueError(f"Security validation failed for output path: {e}")
+    
+    # Handle duplicate filenames if requested
+    if ensure_unique and output_path.exists():
+        try:
+            output_path = get_unique_output_path(output_path)
+        except ValueError as e:
+            # Fallback: add timestamp if unique path generation fails
+            from datetime import datetime
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            name_stem = output_path.stem
+            suffix = output_path.suffix
+            timestamped_name = f"{name_stem}_{timestamp}{suffix}"
+            output_path = output_path.parent / timestamped_name
+    
+    # Validate final path length (filesystem limitations)
+    final_path_str = str(output_path)
+    if len(final_path_str) > 4000:  # Conservative limit for cross-platform compatibility
+        raise ValueError(
+            f"Generated output path is too long ({len(final_path_str)} chars): "
+            f"'{final_path_str[:100]}...'"
+        )
+    
+    # Create output directory if it doesn't exist
+    try:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+    except (OSError, PermissionError) as e:
+        raise OSError(
+            f"Cannot create output directory '{output_path.parent}': {e}"
+        )
+    
+    # Final validation: Check write permissions
+    try:
+        # Test write access to the parent directory
+        if output_path.parent.exists() and not os.access(output_path.parent, os.W_OK):
+            raise OSError(
+                f"No write permission to output directory '{output_path.parent}'"
+            )
+    except OSError as e:
+        raise OSError(f"Permission check failed: {e}")
+    
+    return output_path
+
+
 def scan_directory(directory: Path, 
                   include_subdirectories: bool = True,
                   supported_extensions: Optional[List[str]] = None,
@@ -283,6 +566,31 @@ def scan_directory(directory: Path,
     return found_files
 
 
+def create_file_info(file_path: Path) -> Optional[FileInfo]:
+    """
+    파일 경로로부터 FileInfo 생성 (Qt 없이 사용 가능)
+    
+    Args:
+        file_path: 파일 경로
+    
+    Returns:
+        FileInfo 또는 파일 정보를 읽을 수 없는 경우 None
+    """
+    try:
+        stat = file_path.stat()
+    except OSError as e:
+        logger.warning(f"파일 정보 생성 실패 ({file_path}): {e}")
+        return None
+    
+    return FileInfo(
+        path=file_path,
+        name=file_path.name,
+        size=stat.st_size,
+        modified_time=datetime.fromtimestamp(stat.st_mtime),
+        file_type=get_file_type(file_path)
+    )
+
+
 def get_file_icon_name(file_type: FileType) -> str:
     """
     파일 타입에 따른 아이콘 파일명 반환
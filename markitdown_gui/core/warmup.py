@@ -0,0 +1,95 @@
+"""
+백그라운드 워밍업
+메인 윈도우 표시 후 무거운 모듈을 미리 import하여 첫 변환 지연을 줄임
+"""
+
+import importlib
+import threading
+import time
+from typing import Callable, Dict, Iterable, Optional, Union
+
+from .logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+# 시작 경로에서 제외했지만 곧 필요해질 모듈 (import 순서대로)
+DEFAULT_WARMUP_TARGETS = (
+    "markitdown_gui.core.conversion_engine:load_markitdown",
+    "markitdown_gui.core.llm_manager",
+    "markitdown_gui.core.ocr_service",
+    "markitdown_gui.ui.preview_dialog",
+    "markitdown_gui.ui.settings_dialog",
+)
+
+WarmupTarget = Union[str, Callable[[], object]]
+
+
+def _run_target(target: WarmupTarget):
+    """
+    워밍업 대상 하나 실행
+
+    문자열 "module" 은 import만, "module:function" 은 import 후 함수를 호출한다.
+    """
+    if callable(target):
+        return target()
+
+    module_name, _, attribute = target.partition(":")
+    module = importlib.import_module(module_name)
+    if attribute:
+        return getattr(module, attribute)()
+    return module
+
+
+class BackgroundWarmup:
+    """데몬 스레드에서 워밍업 대상을 순차 실행"""
+
+    def __init__(self, targets: Optional[Iterable[WarmupTarget]] = None):
+        self.targets = list(DEFAULT_WARMUP_TARGETS if targets is None else targets)
+        self.timings: Dict[str, float] = {}
+        self.errors: Dict[str, str] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._done = threading.Event()
+
+    def start(self) -> "BackgroundWarmup":
+        """워밍업 스레드 시작 (이미 시작된 경우 무시)"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="warmup", daemon=True)
+            self._thread.start()
+        return self
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """워밍업 완료 대기"""
+        return self._done.wait(timeout)
+
+    @property
+    def is_done(self) -> bool:
+        return self._done.is_set()
+
+    def _run(self):
+        started = time.perf_counter()
+        for target in self.targets:
+            name = target if isinstance(target, str) else getattr(target, "__name__", repr(target))
+            target_start = time.perf_counter()
+            try:
+                _run_target(target)
+            except Exception as e:
+                # 워밍업 실패는 치명적이지 않음 - 실제 사용 시점에 다시 시도된다
+                self.errors[name] = str(e)
+                logger.debug(f"워밍업 실패 {name}: {e}")
+            self.timings[name] = time.perf_counter() - target_start
+
+        self._done.set()
+        logger.debug(f"백그라운드 워밍업 완료: {time.perf_counter() - started:.2f}초")
+
+
+_warmup: Optional[BackgroundWarmup] = None
+
+
+def start_background_warmup(targets: Optional[Iterable[WarmupTarget]] = None) -> BackgroundWarmup:
+    """전역 백그라운드 워밍업 시작 (한 번만 실행)"""
+    global _warmup
+    if _warmup is None:
+        _warmup = BackgroundWarmup(targets).start()
+    return _warmup
@@ -7,14 +7,17 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTreeWidget, QTreeWidgetItem,
     QPushButton, QLabel, QHeaderView, QCheckBox, QMenu
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QSize
 from PyQt6.QtGui import QIcon, QPixmap, QAction
 
-from typing import List, Optional
+from typing import List, Optional, Set
 from pathlib import Path
 
+from ...core.constants import THUMBNAIL_ICON_SIZE
 from ...core.models import FileInfo, ConversionStatus
 from ...core.logger import get_logger
+from ...core.thumbnail_service import THUMBNAIL_FILE_TYPES
+from .thumbnail_loader import ThumbnailLoader
 
 logger = get_logger(__name__)
 
@@ -39,6 +42,14 @@ class FileListWidget(QWidget):
     def __init__(self, ocr_config: Optional[OCREnhancementConfig] = None):
         super().__init__()
         self.file_items = {}  # Path -> QTreeWidgetItem 매핑
+        
+        # 이미지 썸네일 아이콘 (선택적, 화면에 보이는 항목만 요청)
+        self._thumbnails_enabled = False
+        self._thumbnail_loader: Optional[ThumbnailLoader] = None
+        self._thumbnail_requested: Set[Path] = set()
+        self._thumbnail_timer = QTimer(self)
+        self._thumbnail_timer.setSingleShot(True)
+        self._thumbnail_timer.setInterval(100)
 
         # OCR 상태 제공자 초기화 (선택적)
         self.ocr_status_provider = None
@@ -135,11 +146,15 @@ class FileListWidget(QWidget):
         self.tree_widget.itemDoubleClicked.connect(self._on_item_double_clicked)
         self.tree_widget.itemChanged.connect(self._on_item_changed)
         self.tree_widget.customContextMenuRequested.connect(self._show_context_menu)
+        
+        self._thumbnail_timer.timeout.connect(self._request_visible_thumbnails)
+        self.tree_widget.verticalScrollBar().valueChanged.connect(self._schedule_thumbnails)
     
     def clear(self):
         """모든 항목 제거"""
         self.tree_widget.clear()
         self.file_items.clear()
+        self._thumbnail_requested.clear()
         self._update_count_display()
     
     def add_file(self, file_info: FileInfo):
@@ -175,6 +190,7 @@ class FileListWidget(QWidget):
         self.file_items[file_info.path] = item
         
         self._update_count_display()
+        self._schedule_thumbnails()
         logger.debug(f"파일 추가됨: {file_info.name}")
     
     def add_files(self, file_infos: List[FileInfo]):
@@ -291,6 +307,57 @@ class FileListWidget(QWidget):
                 if checkbox:
                     checkbox.setChecked(False)
     
+    def set_thumbnails_enabled(self, enabled: bool):
+        """이미지 파일의 아이콘을 썸네일로 표시"""
+        self._thumbnails_enabled = enabled
+        if enabled:
+            if self._thumbnail_loader is None:
+                self._thumbnail_loader = ThumbnailLoader(parent=self)
+                self._thumbnail_loader.thumbnail_ready.connect(self._on_thumbnail_ready)
+            self.tree_widget.setIconSize(QSize(*THUMBNAIL_ICON_SIZE))
+            self.tree_widget.setColumnWidth(1, THUMBNAIL_ICON_SIZE[0] + 8)
+            self._schedule_thumbnails()
+            return
+        
+        for path in self._thumbnail_requested:
+            item = self.file_items.get(path)
+            if item is not None:
+                item.setIcon(1, QIcon())
+                item.setText(1, "📄")
+        self._thumbnail_requested.clear()
+        self.tree_widget.setColumnWidth(1, 30)
+    
+    def _schedule_thumbnails(self, *args):
+        if self._thumbnails_enabled:
+            self._thumbnail_timer.start()
+    
+    def _request_visible_thumbnails(self):
+        """화면에 보이는 이미지 항목의 썸네일 요청 (스크롤이 멈춘 뒤 한 번)"""
+        if not self._thumbnails_enabled:
+            return
+        bottom = self.tree_widget.viewport().height()
+        item = self.tree_widget.itemAt(0, 0)
+        while item is not None and self.tree_widget.visualItemRect(item).top() <= bottom:
+            file_info = item.data(0, Qt.ItemDataRole.UserRole)
+            if (file_info is not None and file_info.file_type in THUMBNAIL_FILE_TYPES
+                    and file_info.path not in self._thumbnail_requested):
+                self._thumbnail_requested.add(file_info.path)
+                cached = self._thumbnail_loader.request(file_info.path, THUMBNAIL_ICON_SIZE)
+                if cached is not None:
+                    self._set_thumbnail_icon(item, cached)
+            item = self.tree_widget.itemBelow(item)
+    
+    def _on_thumbnail_ready(self, source: Path, size, thumbnail_path: Path):
+        if not self._thumbnails_enabled or tuple(size) != THUMBNAIL_ICON_SIZE:
+            return
+        item = self.file_items.get(Path(source))
+        if item is not None:
+            self._set_thumbnail_icon(item, thumbnail_path)
+    
+    def _set_thumbnail_icon(self, item: QTreeWidgetItem, thumbnail_path: Path):
+        item.setIcon(1, QIcon(QPixmap(str(thumbnail_path))))
+        item.setText(1, "")
+    
     def _get_status_text(self, status: ConversionStatus) -> str:
         """상태를 텍스트로 변환"""
         status_texts = {
@@ -1,31 +1,66 @@
 """
 로그 위젯
 애플리케이션 로그를 표시하는 위젯
+
+로그는 크기가 제한된 링 버퍼에 보관하고, 화면에는 타이머로 모아서 한 번에 추가한다.
+레벨 필터는 버퍼에 적용되므로 필터를 바꾸면 이전 로그도 다시 그려진다.
+다른 스레드(로깅 리스너)는 `post_log()`로 전달하며, 큐 연결 시그널로 GUI 스레드에서 반영된다.
 """
 
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTextEdit,
+    QWidget, QVBoxLayout, QHBoxLayout, QPlainTextEdit,
     QPushButton, QGroupBox, QCheckBox, QComboBox, QLabel
 )
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer
-from PyQt6.QtGui import QFont, QTextCursor, QColor
+from PyQt6.QtGui import QFont, QTextCursor, QTextCharFormat, QColor
 
 import logging
+import threading
+from collections import deque
 from datetime import datetime
-from typing import Optional
+from typing import Optional, List, NamedTuple, Iterable
 
 from ...core.logger import get_logger
+from ...core.constants import (
+    LOG_VIEW_MAX_LINES, LOG_VIEW_BUFFER_SIZE, LOG_VIEW_FLUSH_INTERVAL
+)
 
 
 logger = get_logger(__name__)
 
 
+ALL_LEVELS = "전체"
+
+LEVEL_PRIORITY = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL
+}
+
+
+class LogEntry(NamedTuple):
+    """버퍼에 보관되는 로그 한 줄"""
+    text: str
+    level: str
+    priority: int
+
+
 class LogWidget(QWidget):
     """로그 표시 위젯"""
     
+    # 다른 스레드에서 게시된 로그가 있음 (게시 묶음당 한 번)
+    _logs_posted = pyqtSignal()
+    
     def __init__(self):
         super().__init__()
-        self._max_lines = 1000
+        self._posted = []
+        self._posted_lock = threading.Lock()
+        self._max_lines = LOG_VIEW_MAX_LINES
+        self._entries = deque(maxlen=LOG_VIEW_BUFFER_SIZE)
+        self._pending = deque(maxlen=LOG_VIEW_BUFFER_SIZE)
+        self._formats = {}
         self._init_ui()
         self._setup_connections()
     
@@ -69,7 +104,7 @@ class LogWidget(QWidget):
         control_layout.addWidget(level_label)
         
         self.level_combo = QComboBox()
-        self.level_combo.addItems(["전체", "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"])
+        self.level_combo.addItems([ALL_LEVELS, "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"])
         self.level_combo.setCurrentText("INFO")
         self.level_combo.setMaximumWidth(100)
         control_layout.addWidget(self.level_combo)
@@ -93,9 +128,11 @@ class LogWidget(QWidget):
         
         group_layout.addLayout(control_layout)
         
-        # 텍스트 에디트
-        self.text_edit = QTextEdit()
+        # 텍스트 에디트 (블록 수 제한은 Qt가 추가 시점에 처리)
+        self.text_edit = QPlainTextEdit()
         self.text_edit.setReadOnly(True)
+        self.text_edit.setUndoRedoEnabled(False)
+        self.text_edit.setMaximumBlockCount(self._max_lines)
         self.text_edit.setMaximumHeight(200)
         
         # 폰트 설정 (모노스페이스)
@@ -108,51 +145,106 @@ class LogWidget(QWidget):
         )
 
         group_layout.addWidget(self.text_edit)
+        
+        # 일괄 추가 타이머
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(LOG_VIEW_FLUSH_INTERVAL)
     
     def _setup_connections(self):
         """시그널-슬롯 연결"""
+        self._flush_timer.timeout.connect(self._flush_pending)
+        self._logs_posted.connect(self._drain_posted, Qt.ConnectionType.QueuedConnection)
         self.clear_btn.clicked.connect(self.clear_log)
         self.save_btn.clicked.connect(self.save_log)
         self.level_combo.currentTextChanged.connect(self._on_level_filter_changed)
     
-    def append_log(self, message: str, level: str = "INFO"):
-        """로그 메시지 추가"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        formatted_message = f"[{timestamp}] {level}: {message}"
-        
-        # 레벨 필터링
-        current_filter = self.level_combo.currentText()
-        if current_filter != "전체":
-            level_priority = {
-                "DEBUG": 10,
-                "INFO": 20,
-                "WARNING": 30,
-                "ERROR": 40,
-                "CRITICAL": 50
-            }
-            
-            if level_priority.get(level, 0) < level_priority.get(current_filter, 0):
-                return
+    def post_log(self, message: str, level: str = "INFO", created: Optional[float] = None):
+        """
+        임의의 스레드에서 로그 전달 (스레드 안전)
         
-        # 색상 설정
-        color = self._get_level_color(level)
+        게시된 로그는 모아 두었다가 GUI 스레드에서 한 번에 append_log로 추가한다.
+        """
+        with self._posted_lock:
+            self._posted.append((message, level, created))
+            first = len(self._posted) == 1
+        if first:
+            self._logs_posted.emit()
+    
+    def _drain_posted(self):
+        """게시된 로그를 GUI 스레드에서 버퍼에 추가"""
+        with self._posted_lock:
+            posted, self._posted = self._posted, []
+        for message, level, created in posted:
+            self.append_log(message, level, created)
+    
+    def append_log(self, message: str, level: str = "INFO", created: Optional[float] = None):
+        """로그 메시지 추가 (GUI 스레드 전용, 화면 반영은 다음 타이머 주기에 일괄 처리)"""
+        moment = datetime.fromtimestamp(created) if created is not None else datetime.now()
+        timestamp = moment.strftime("%H:%M:%S")
+        entry = LogEntry(f"[{timestamp}] {level}: {message}", level,
+                         LEVEL_PRIORITY.get(level, 0))
+        self._entries.append(entry)
+        self._pending.append(entry)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def _flush_pending(self):
+        """대기 중인 로그를 필터링하여 한 번의 편집으로 추가"""
+        if not self._pending:
+            return
+        pending = list(self._pending)
+        self._pending.clear()
+        self._render(self._filtered(pending))
+    
+    def _filtered(self, entries: Iterable[LogEntry]) -> List[LogEntry]:
+        """현재 레벨 필터를 통과한 항목 (화면에 남을 마지막 max_lines개만)"""
+        threshold = self._level_threshold()
+        visible = [entry for entry in entries if entry.priority >= threshold]
+        return visible[-self._max_lines:]
+    
+    def _level_threshold(self) -> int:
+        return LEVEL_PRIORITY.get(self.level_combo.currentText(), 0)
+    
+    def _render(self, entries: List[LogEntry]):
+        """항목을 문서 끝에 추가 (레벨별 색상은 문자 서식으로 적용)"""
+        if not entries:
+            return
         
-        # 텍스트 추가
-        cursor = self.text_edit.textCursor()
+        document = self.text_edit.document()
+        cursor = QTextCursor(document)
         cursor.movePosition(QTextCursor.MoveOperation.End)
-        
-        # 색상 적용
-        if color:
-            cursor.insertHtml(f'<span style="color: {color};">{formatted_message}</span><br>')
-        else:
-            cursor.insertText(formatted_message + "\n")
-        
-        # 최대 라인 수 제한
-        self._limit_lines()
+        cursor.beginEditBlock()
+        first = document.isEmpty()
+        for entry in entries:
+            if not first:
+                cursor.insertBlock()
+            first = False
+            cursor.insertText(entry.text, self._char_format(entry.level))
+        cursor.endEditBlock()
         
         # 자동 스크롤
         if self.auto_scroll_check.isChecked():
-            self.text_edit.moveCursor(QTextCursor.MoveOperation.End)
+            scroll_bar = self.text_edit.verticalScrollBar()
+            scroll_bar.setValue(scroll_bar.maximum())
+    
+    def _char_format(self, level: str) -> QTextCharFormat:
+        """레벨별 문자 서식 (캐시)"""
+        char_format = self._formats.get(level)
+        if char_format is None:
+            char_format = QTextCharFormat()
+            color = self._get_level_color(level)
+            if color:
+                char_format.setForeground(QColor(color))
+            self._formats[level] = char_format
+        return char_format
+    
+    def _rerender(self):
+        """버퍼 전체를 현재 필터로 다시 그리기"""
+        self._pending.clear()
+        self._flush_timer.stop()
+        self.text_edit.clear()
+        self._render(self._filtered(self._entries))
     
     def _get_level_color(self, level: str) -> Optional[str]:
         """로그 레벨에 따른 색상 반환"""
@@ -165,19 +257,11 @@ class LogWidget(QWidget):
         }
         return colors.get(level)
     
-    def _limit_lines(self):
-        """최대 라인 수 제한"""
-        document = self.text_edit.document()
-        if document.blockCount() > self._max_lines:
-            cursor = QTextCursor(document)
-            cursor.movePosition(QTextCursor.MoveOperation.Start)
-            cursor.movePosition(QTextCursor.MoveOperation.Down, 
-                              QTextCursor.MoveMode.KeepAnchor, 
-                              document.blockCount() - self._max_lines)
-            cursor.removeSelectedText()
-    
     def clear_log(self):
         """로그 지우기"""
+        self._entries.clear()
+        self._pending.clear()
+        self._flush_timer.stop()
         self.text_edit.clear()
         logger.info("로그가 지워졌습니다")
     
@@ -195,21 +279,22 @@ class LogWidget(QWidget):
         if filename:
             try:
                 with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(self.text_edit.toPlainText())
+                    f.write(self.get_log_text())
                 logger.info(f"로그가 저장되었습니다: {filename}")
             except Exception as e:
                 logger.error(f"로그 저장 실패: {e}")
     
     def _on_level_filter_changed(self, level: str):
-        """로그 레벨 필터 변경시"""
-        # 현재는 새로운 로그만 필터링
-        # 필요시 기존 로그도 다시 필터링하도록 구현
+        """로그 레벨 필터 변경시 - 버퍼의 이전 로그도 다시 필터링"""
+        self._rerender()
         logger.debug(f"로그 레벨 필터 변경: {level}")
     
     def set_max_lines(self, max_lines: int):
         """최대 라인 수 설정"""
         self._max_lines = max_lines
+        self.text_edit.setMaximumBlockCount(max_lines)
     
     def get_log_text(self) -> str:
-        """현재 로그 텍스트 반환"""
+        """현재 로그 텍스트 반환 (대기 중인 로그 포함)"""
+        self._flush_pending()
         return self.text_edit.toPlainText()
@@ -0,0 +1,279 @@
+"""
+페이지 단위 텍스트 뷰어
+mmap으로 연 파일을 스크롤 위치에 따라 페이지 단위로 불러오는 읽기 전용 뷰어
+
+화면에는 최대 PAGED_VIEW_MAX_LOADED_PAGES 페이지만 유지한다. 아래로 스크롤하면 다음 페이지를
+붙이고 맨 앞 페이지를 버리며, 위로 스크롤하면 반대로 한다. 줄 수와 줄 이동용 색인은
+작업 스레드에서 구축되며, 완료 전에도 내용은 바로 볼 수 있다.
+"""
+
+from collections import deque
+from pathlib import Path
+from typing import NamedTuple, Optional, Tuple
+
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QPlainTextEdit, QLabel
+from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtGui import QFont, QTextCursor
+
+from ...core.constants import PAGED_VIEW_MAX_LOADED_PAGES, PAGED_VIEW_PREFETCH_LINES
+from ...core.logger import get_logger
+from ...core.paged_text import LineIndex, PagedTextFile
+from ...core.utils import format_file_size
+
+
+logger = get_logger(__name__)
+
+
+class LineIndexWorker(QThread):
+    """줄 색인 구축 스레드"""
+
+    progress_changed = pyqtSignal(int)
+    index_ready = pyqtSignal(object)
+
+    def __init__(self, paged_file: PagedTextFile):
+        super().__init__()
+        self.paged_file = paged_file
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        """색인 구축 실행"""
+        try:
+            index = self.paged_file.build_line_index(
+                cancelled=lambda: self._cancelled,
+                progress=lambda done, total: self.progress_changed.emit(int(done * 100 / total))
+            )
+        except (OSError, ValueError) as e:
+            logger.warning(f"줄 색인 구축 실패: {e}")
+            return
+        if index is not None:
+            self.index_ready.emit(index)
+
+
+class _LoadedPage(NamedTuple):
+    index: int
+    length: int  # 문서 위치 단위(UTF-16) 길이
+    lines: int  # 페이지 안의 줄바꿈 수
+
+
+class PagedTextView(QWidget):
+    """mmap 기반 페이지 단위 텍스트 뷰어"""
+
+    # 줄 색인 완료 (전체 줄 수)
+    line_count_ready = pyqtSignal(int)
+
+    def __init__(self, parent=None, max_loaded_pages: int = PAGED_VIEW_MAX_LOADED_PAGES):
+        super().__init__(parent)
+        self.paged_file: Optional[PagedTextFile] = None
+        self.line_index: Optional[LineIndex] = None
+        self.max_loaded_pages = max(2, max_loaded_pages)
+        self._pages: "deque[_LoadedPage]" = deque()
+        self._index_worker: Optional[LineIndexWorker] = None
+        self._loading = False
+        self._init_ui()
+
+    def _init_ui(self):
+        """UI 초기화"""
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self.text_edit = QPlainTextEdit()
+        self.text_edit.setReadOnly(True)
+        self.text_edit.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        font = QFont("Consolas", 10)
+        if not font.exactMatch():
+            font = QFont("Courier New", 10)
+        self.text_edit.setFont(font)
+        self.text_edit.verticalScrollBar().valueChanged.connect(self._on_scrolled)
+        layout.addWidget(self.text_edit)
+
+        self.status_label = QLabel()
+        layout.addWidget(self.status_label)
+
+    @property
+    def page_count(self) -> int:
+        return self.paged_file.page_count if self.paged_file else 0
+
+    @property
+    def loaded_pages(self) -> range:
+        """현재 화면에 올라와 있는 페이지 범위"""
+        if not self._pages:
+            return range(0)
+        return range(self._pages[0].index, self._pages[-1].index + 1)
+
+    def open_file(self, path: Path) -> bool:
+        """파일 열기 (첫 페이지만 읽고 줄 색인은 백그라운드에서 구축)"""
+        self.close_file()
+        try:
+            self.paged_file = PagedTextFile(path)
+        except (OSError, ValueError) as e:
+            logger.error(f"파일 열기 실패: {path} - {e}")
+            self.status_label.setText(f"파일을 열 수 없습니다: {e}")
+            return False
+
+        self._reset_to_page(0)
+        self._update_status("줄 수 계산 중...")
+
+        self._index_worker = LineIndexWorker(self.paged_file)
+        self._index_worker.progress_changed.connect(
+            lambda percent: self._update_status(f"줄 수 계산 중... {percent}%")
+        )
+        self._index_worker.index_ready.connect(self._on_index_ready)
+        self._index_worker.start()
+        return True
+
+    def close_file(self):
+        """파일 닫기 (색인 스레드 취소 후 대기)"""
+        if self._index_worker is not None:
+            self._index_worker.cancel()
+            self._index_worker.wait()
+            self._index_worker = None
+        if self.paged_file is not None:
+            self.paged_file.close()
+            self.paged_file = None
+        self.line_index = None
+        self._pages.clear()
+        self.text_edit.clear()
+        self.status_label.clear()
+
+    def set_font_size(self, size: int):
+        """폰트 크기 설정"""
+        font = self.text_edit.font()
+        font.setPointSize(size)
+        self.text_edit.setFont(font)
+
+    def _update_status(self, lines_text: str):
+        paged_file = self.paged_file
+        if paged_file is None:
+            return
+        self.status_label.setText(
+            f"{format_file_size(paged_file.size)} · {paged_file.encoding} · {lines_text}"
+        )
+
+    def _on_index_ready(self, index: LineIndex):
+        if self.paged_file is None:
+            return
+        self.line_index = index
+        self._update_status(f"{index.total_lines:,}줄")
+        self.line_count_ready.emit(index.total_lines)
+
+    # 페이지 창 관리
+
+    def _reset_to_page(self, page: int):
+        """화면을 비우고 지정한 페이지부터 다시 채움"""
+        self._pages.clear()
+        self.text_edit.clear()
+        self._append_page(page)
+
+    def _read(self, page: int) -> Tuple[str, _LoadedPage]:
+        text = self.paged_file.read_page(page)
+        return text, _LoadedPage(page, len(text.encode('utf-16-le')) // 2, text.count('\n'))
+
+    def _append_page(self, page: int):
+        text, loaded = self._read(page)
+        self._loading = True
+        try:
+            cursor = QTextCursor(self.text_edit.document())
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            cursor.insertText(text)
+            self._pages.append(loaded)
+            if len(self._pages) > self.max_loaded_pages:
+                self._drop_first_page()
+        finally:
+            self._loading = False
+
+    def _prepend_page(self, page: int):
+        text, loaded = self._read(page)
+        scroll_bar = self.text_edit.verticalScrollBar()
+        self._loading = True
+        try:
+            value = scroll_bar.value()
+            cursor = QTextCursor(self.text_edit.document())
+            cursor.movePosition(QTextCursor.MoveOperation.Start)
+            cursor.insertText(text)
+            self._pages.appendleft(loaded)
+            # 보던 줄이 그대로 보이도록 스크롤 위치 보정
+            scroll_bar.setValue(value + loaded.lines)
+            if len(self._pages) > self.max_loaded_pages:
+                self._drop_last_page()
+        finally:
+            self._loading = False
+
+    def _drop_first_page(self):
+        dropped = self._pages.popleft()
+        scroll_bar = self.text_edit.verticalScrollBar()
+        value = scroll_bar.value()
+        cursor = QTextCursor(self.text_edit.document())
+        cursor.setPosition(0)
+        cursor.setPosition(dropped.length, QTextCursor.MoveMode.KeepAnchor)
+        cursor.removeSelectedText()
+        scroll_bar.setValue(max(0, value - dropped.lines))
+
+    def _drop_last_page(self):
+        self._pages.pop()
+        start = sum(page.length for page in self._pages)
+        cursor = QTextCursor(self.text_edit.document())
+        cursor.setPosition(start)
+        cursor.movePosition(QTextCursor.MoveOperation.End, QTextCursor.MoveMode.KeepAnchor)
+        cursor.removeSelectedText()
+
+    def _on_scrolled(self, value: int):
+        """스크롤이 끝에 가까워지면 이웃 페이지를 불러옴"""
+        if self._loading or not self._pages or self.paged_file is None:
+            return
+        scroll_bar = self.text_edit.verticalScrollBar()
+        if value >= scroll_bar.maximum() - PAGED_VIEW_PREFETCH_LINES:
+            next_page = self._pages[-1].index + 1
+            if next_page < self.page_count:
+                self._append_page(next_page)
+        elif value <= PAGED_VIEW_PREFETCH_LINES:
+            previous_page = self._pages[0].index - 1
+            if previous_page >= 0:
+                self._prepend_page(previous_page)
+
+    # 이동/검색
+
+    def _show_offset(self, offset: int, select_length: int = 0):
+        """바이트 오프셋 위치로 이동 (필요하면 해당 페이지로 다시 채움)"""
+        page = self.paged_file.page_of_offset(offset)
+        if page not in self.loaded_pages:
+            self._reset_to_page(page)
+
+        page_start = self.paged_file.page_range(page)[0]
+        before = self.paged_file.read_range(page_start, offset).replace('\r\n', '\n')
+        position = sum(p.length for p in self._pages if p.index < page)
+        position += len(before.encode('utf-16-le')) // 2
+
+        cursor = self.text_edit.textCursor()
+        cursor.setPosition(position)
+        if select_length:
+            cursor.setPosition(position + select_length, QTextCursor.MoveMode.KeepAnchor)
+        self.text_edit.setTextCursor(cursor)
+        self.text_edit.centerCursor()
+
+    def goto_line(self, line: int) -> bool:
+        """줄 이동 (1부터 시작, 줄 색인이 준비된 뒤에만 가능)"""
+        if self.paged_file is None or self.line_index is None:
+            return False
+        self._show_offset(self.paged_file.line_offset(self.line_index, line - 1))
+        return True
+
+    def find_text(self, text: str) -> bool:
+        """
+        다음 일치 항목 검색 (대소문자 구분)
+
+        화면에 올라온 페이지에서 먼저 찾고, 없으면 파일의 나머지 부분을 mmap에서 찾는다.
+        """
+        if not text or self.paged_file is None:
+            return False
+        if self.text_edit.find(text):
+            return True
+
+        last_loaded_end = self.paged_file.page_range(self._pages[-1].index)[1]
+        offset = self.paged_file.find(text, last_loaded_end)
+        if offset < 0:
+            return False
+        self._show_offset(offset, len(text.encode('utf-16-le')) // 2)
+        return True
@@ -1,15 +1,21 @@
 """
 진행률 위젯
 변환 진행 상황을 표시하는 위젯
+
+파일 목록은 경로(FileInfo.file_id)로 색인된 모델에 보관하고 QTreeView가 화면에 보이는
+행만 그리므로 수만 개 파일 배치에서도 시작 비용과 갱신 비용이 파일 수에 비례하지 않는다.
 """
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QProgressBar,
     QLabel, QPushButton, QGroupBox, QScrollArea, QFrame,
-    QTreeWidget, QTreeWidgetItem, QHeaderView, QSplitter,
+    QTreeView, QHeaderView, QSplitter, QAbstractItemView,
     QSizePolicy, QStackedWidget, QToolButton, QSpacerItem
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QPropertyAnimation, QEasingCurve, QRect
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QTimer, QPropertyAnimation, QEasingCurve, QRect,
+    QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+)
 from PyQt6.QtGui import QPalette, QIcon, QFont, QPainter, QColor, QBrush, QPixmap
 
 from ...core.models import (
@@ -17,7 +23,7 @@ from ...core.models import (
     FileInfo, ConversionStatus
 )
 from ...core.logger import get_logger
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Iterable, Any
 from datetime import datetime
 
 # OCR Enhancement imports (optional, only if feature is enabled)
@@ -180,29 +186,95 @@ class PhaseProgressBar(QProgressBar):
         return stage_texts.get(stage, "OCR 처리")
 
 
-class FileProgressItem(QTreeWidgetItem):
-    """파일별 진행률 아이템"""
-    
-    def __init__(self, file_info: FileInfo):
-        super().__init__()
-        self.file_info = file_info
-        self.status_icon = StatusIcon(file_info.conversion_status)
-        
-        # 컬럼 설정
-        self.setText(0, file_info.name)
-        self.setText(1, file_info.progress_status.value)
-        self.setText(2, file_info.conflict_status.value if file_info.conflict_status != FileConflictStatus.NONE else "")
-        self.setText(3, file_info.size_formatted)
-        
-        # 도구 팁 설정
-        self.setToolTip(0, str(file_info.path))
+STATUS_COLORS = {
+    ConversionStatus.PENDING: "#9E9E9E",
+    ConversionStatus.IN_PROGRESS: "#2196F3",
+    ConversionStatus.SUCCESS: "#4CAF50",
+    ConversionStatus.FAILED: "#F44336",
+    ConversionStatus.CANCELLED: "#FF9800"
+}
+
+
+class FileProgressModel(QAbstractTableModel):
+    """
+    파일별 진행률 모델
+    
+    행 데이터는 FileInfo 참조뿐이며 표시 문자열은 뷰가 요청할 때(보이는 행만) 계산한다.
+    file_id -> 행 번호 색인으로 상태 갱신은 O(1)이다.
+    """
+    
+    HEADERS = ["파일명", "상태", "충돌", "크기"]
+    SORT_ROLE = Qt.ItemDataRole.UserRole + 1
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._files: List[FileInfo] = []
+        self._rows: Dict[str, int] = {}
+    
+    def set_files(self, files: Iterable[FileInfo]):
+        """파일 목록 교체 (중복 ID는 처음 항목만 유지)"""
+        self.beginResetModel()
+        self._files = []
+        self._rows = {}
+        for file_info in files:
+            file_id = file_info.file_id
+            if file_id not in self._rows:
+                self._rows[file_id] = len(self._files)
+                self._files.append(file_info)
+        self.endResetModel()
+    
+    def clear(self):
+        self.set_files([])
+    
+    def file_info(self, file_id: Optional[str]) -> Optional[FileInfo]:
+        """ID로 FileInfo 조회"""
+        row = self._rows.get(file_id)
+        return self._files[row] if row is not None else None
+    
+    def update_file(self, file_info: FileInfo) -> bool:
+        """파일 상태 변경 반영 (목록에 없으면 False)"""
+        row = self._rows.get(file_info.file_id)
+        if row is None:
+            return False
+        self._files[row] = file_info
+        self.dataChanged.emit(self.index(row, 1), self.index(row, 2))
+        return True
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._files)
+    
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
     
-    def update_progress(self, file_info: FileInfo):
-        """진행률 업데이트"""
-        self.file_info = file_info
-        self.setText(1, file_info.progress_status.value)
-        self.setText(2, file_info.conflict_status.value if file_info.conflict_status != FileConflictStatus.NONE else "")
-        self.status_icon.update_status(file_info.conversion_status)
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        file_info = self._files[index.row()]
+        column = index.column()
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                return file_info.name
+            if column == 1:
+                return file_info.progress_status.value
+            if column == 2:
+                return (file_info.conflict_status.value
+                        if file_info.conflict_status != FileConflictStatus.NONE else "")
+            return file_info.size_formatted
+        if role == self.SORT_ROLE:
+            # 크기는 숫자로 정렬
+            return file_info.size if column == 3 else self.data(index)
+        if role == Qt.ItemDataRole.ToolTipRole and column == 0:
+            return str(file_info.path)
+        if role == Qt.ItemDataRole.ForegroundRole and column == 1:
+            return QColor(STATUS_COLORS.get(file_info.conversion_status, "#9E9E9E"))
+        return None
 
 
 class ConflictSummaryWidget(QWidget):
@@ -373,7 +445,8 @@ class ProgressWidget(QWidget):
     def __init__(self, ocr_config: Optional[OCREnhancementConfig] = None):
         super().__init__()
         self._is_active = False
-        self._file_items: Dict[str, FileProgressItem] = {}
+        self._file_model = FileProgressModel(self)
+        self._current_file_id: Optional[str] = None
         self._start_time = None
 
         # OCR 진행률 추적기 초기화 (선택적)
@@ -506,32 +579,43 @@ class ProgressWidget(QWidget):
     
     def _create_file_list_section(self, splitter):
         """파일 목록 섹션 생성"""
-        # 파일 목록
-        self.file_tree = QTreeWidget()
-        self.file_tree.setHeaderLabels(["파일명", "상태", "충돌", "크기"])
+        # 파일 목록 (모델 기반, 보이는 행만 그림)
+        self._file_proxy = QSortFilterProxyModel(self)
+        self._file_proxy.setSourceModel(self._file_model)
+        self._file_proxy.setSortRole(FileProgressModel.SORT_ROLE)
+        # 상태가 바뀔 때마다 전체를 다시 정렬하지 않음
+        self._file_proxy.setDynamicSortFilter(False)
+        
+        self.file_tree = QTreeView()
+        self.file_tree.setModel(self._file_proxy)
+        self.file_tree.setUniformRowHeights(True)
         self.file_tree.setAlternatingRowColors(True)
+        # 기본은 변환 순서 유지, 헤더를 클릭했을 때만 정렬 (대량 목록 시작 시 정렬 비용 없음)
+        self.file_tree.header().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
         self.file_tree.setSortingEnabled(True)
         self.file_tree.setRootIsDecorated(False)
+        self.file_tree.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
 
         self.file_tree.setStyleSheet(
             """
-            QTreeWidget {
+            QTreeView {
                 background-color: #FFFFFF;
                 alternate-background-color: #F7F7F7;
                 color: #1F1F1F;
             }
-            QTreeWidget::item {
+            QTreeView::item {
                 background-color: transparent;
             }
             """
         )
         
-        # 컬럼 너비 설정
+        # 컬럼 너비 설정 (ResizeToContents는 모든 행을 측정하므로 고정 너비 사용)
         header = self.file_tree.header()
+        header.setStretchLastSection(False)
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
+        for column, width in ((1, 90), (2, 80), (3, 80)):
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.Interactive)
+            header.resizeSection(column, width)
         
         # 접근성 설정
         self.file_tree.setAccessibleName("파일 변환 진행률 목록")
@@ -609,15 +693,9 @@ class ProgressWidget(QWidget):
         self.completion_label.setText(f"0/{total_files} 완료")
         self.current_file_label.setText("시작 중...")
         
-        # 파일 목록 초기화
-        self.file_tree.clear()
-        self._file_items.clear()
-        
-        if file_list:
-            for file_info in file_list:
-                item = FileProgressItem(file_info)
-                self.file_tree.addTopLevelItem(item)
-                self._file_items[str(file_info.path)] = item
+        # 파일 목록 초기화 (행 위젯을 만들지 않으므로 파일 수와 무관하게 즉시 완료)
+        self._current_file_id = None
+        self._file_model.set_files(file_list or [])
         
         logger.info(f"진행률 시작: {total_files}개 파일")
     
@@ -634,6 +712,7 @@ class ProgressWidget(QWidget):
         self.completion_label.setText(f"{progress.completed_files}/{progress.total_files} 완료")
         
         # 현재 파일 정보 업데이트
+        self._current_file_id = progress.current_file_id
         if progress.current_file:
             display_name = progress.current_file
             if len(display_name) > 50:
@@ -642,7 +721,7 @@ class ProgressWidget(QWidget):
             self.current_phase_label.setText(progress.current_progress_status.value)
             
             # 현재 파일 진행률 (OCR 단계 정보 포함)
-            ocr_stage = self._get_current_ocr_stage(progress.current_file) if progress.current_file else None
+            ocr_stage = self._get_current_ocr_stage(progress.current_file_id)
             self.current_file_progress.update_phase(
                 progress.current_progress_status,
                 progress.current_file_progress,
@@ -669,9 +748,7 @@ class ProgressWidget(QWidget):
     
     def update_file_progress(self, file_info: FileInfo):
         """개별 파일 진행률 업데이트"""
-        file_path_str = str(file_info.path)
-        if file_path_str in self._file_items:
-            self._file_items[file_path_str].update_progress(file_info)
+        self._file_model.update_file(file_info)
     
     def finish_progress(self, success: bool = True, message: str = ""):
         """진행률 완료"""
@@ -733,8 +810,8 @@ class ProgressWidget(QWidget):
         self.cancel_btn.setEnabled(False)
         
         # 파일 목록 및 정보 초기화
-        self.file_tree.clear()
-        self._file_items.clear()
+        self._file_model.clear()
+        self._current_file_id = None
     
     def _on_cancel_clicked(self):
         """취소 버튼 클릭시"""
@@ -813,13 +890,12 @@ class ProgressWidget(QWidget):
 
         return self.ocr_progress_tracker.create_ocr_progress_summary(file_info)
 
-    def _get_current_ocr_stage(self, current_file: str) -> Optional[str]:
+    def _get_current_ocr_stage(self, file_id: Optional[str]) -> Optional[str]:
         """현재 파일의 OCR 단계 반환"""
-        if not self.ocr_progress_tracker or not current_file:
+        if not self.ocr_progress_tracker or not file_id:
             return None
 
-        # 파일 정보 검색
-        file_info = self._find_file_info_by_name(current_file)
+        file_info = self._file_model.file_info(file_id)
         if not file_info:
             return None
 
@@ -831,25 +907,10 @@ class ProgressWidget(QWidget):
         return status_info.status.value if hasattr(status_info.status, 'value') else str(status_info.status)
 
     def _get_current_file_path(self) -> Optional[str]:
-        """현재 처리 중인 파일 경로 반환"""
-        # 현재 파일 레이블에서 파일명 추출
-        current_text = self.current_file_label.text()
-        if not current_text or current_text in ["대기 중...", "시작 중...", "완료", "중단됨"]:
-            return None
-
-        # 파일명으로 파일 정보 검색
-        file_info = self._find_file_info_by_name(current_text.replace("...", ""))
+        """현재 처리 중인 파일 경로 반환 (진행률에 담긴 파일 ID로 조회)"""
+        file_info = self._file_model.file_info(self._current_file_id)
         return str(file_info.path) if file_info else None
 
-    def _find_file_info_by_name(self, file_name: str) -> Optional[FileInfo]:
-        """파일명으로 FileInfo 검색"""
-        # 간단한 파일명 매칭 (개선 가능)
-        for item in self._file_items.values():
-            file_info = item.file_info
-            if file_info.name in file_name or file_name in file_info.name:
-                return file_info
-        return None
-
     def clear_ocr_tracking(self):
         """OCR 추적 데이터 정리"""
         if self.ocr_progress_tracker:
@@ -868,7 +929,7 @@ class ProgressWidget(QWidget):
     
     def get_file_count(self) -> int:
         """파일 개수 반환"""
-        return len(self._file_items)
+        return self._file_model.rowCount()
     
     def set_expandable_sections_visibility(self, visible: bool):
         """확장 가능한 섹션들의 표시 여부 설정"""
@@ -0,0 +1,175 @@
+"""
+전문 검색 패널
+출력 디렉토리 전체의 변환 결과를 검색해 순위순 결과와 발췌문을 보여주는 패널
+"""
+
+import html
+import time
+from pathlib import Path
+from typing import Optional
+
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton,
+    QLabel, QListWidget, QListWidgetItem
+)
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal
+
+from ...core.constants import SEARCH_DEBOUNCE_MS
+from ...core.logger import get_logger
+from ...core.search_index import SearchHit, SearchIndex
+
+
+logger = get_logger(__name__)
+
+
+class IndexSyncWorker(QThread):
+    """출력 디렉토리와 색인을 맞추는 스레드"""
+
+    progress_changed = pyqtSignal(int, int)  # 처리한 파일 수, 전체 파일 수
+    sync_finished = pyqtSignal(int, int)  # 새로 색인한 수, 제거한 수
+
+    def __init__(self, index: SearchIndex, root: Path):
+        super().__init__()
+        self.index = index
+        self.root = root
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        """동기화 실행"""
+        try:
+            indexed, removed = self.index.sync_directory(
+                self.root,
+                cancelled=lambda: self._cancelled,
+                progress=self.progress_changed.emit
+            )
+        except Exception as e:
+            logger.error(f"검색 색인 동기화 실패: {e}")
+            return
+        self.sync_finished.emit(indexed, removed)
+
+
+class SearchPanel(QWidget):
+    """출력 디렉토리 전문 검색 패널"""
+
+    # 결과 열기 요청 (마크다운 경로, 검색어)
+    open_requested = pyqtSignal(object, str)
+
+    def __init__(self, index: SearchIndex, root: Optional[Path] = None, parent=None):
+        super().__init__(parent)
+        self.index = index
+        self.root = root
+        self._sync_worker: Optional[IndexSyncWorker] = None
+
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+
+        self._init_ui()
+        self._setup_connections()
+
+    def _init_ui(self):
+        """UI 초기화"""
+        layout = QVBoxLayout(self)
+
+        input_layout = QHBoxLayout()
+        self.query_input = QLineEdit()
+        self.query_input.setPlaceholderText("변환된 문서 전체에서 검색...")
+        self.query_input.setAccessibleName("전문 검색어")
+        self.query_input.setClearButtonEnabled(True)
+        input_layout.addWidget(self.query_input, 1)
+
+        self.sync_btn = QPushButton("색인 갱신")
+        self.sync_btn.setToolTip("출력 디렉토리에서 바뀐 파일을 다시 색인합니다")
+        input_layout.addWidget(self.sync_btn)
+        layout.addLayout(input_layout)
+
+        self.result_list = QListWidget()
+        self.result_list.setAccessibleName("검색 결과")
+        self.result_list.setAlternatingRowColors(True)
+        self.result_list.setWordWrap(True)
+        layout.addWidget(self.result_list, 1)
+
+        self.status_label = QLabel()
+        layout.addWidget(self.status_label)
+
+    def _setup_connections(self):
+        """시그널-슬롯 연결"""
+        self.query_input.textChanged.connect(lambda _: self._search_timer.start())
+        self.query_input.returnPressed.connect(self.run_search)
+        self._search_timer.timeout.connect(self.run_search)
+        self.sync_btn.clicked.connect(self.sync_index)
+        self.result_list.itemActivated.connect(self._on_item_activated)
+
+    def set_root(self, root: Optional[Path]):
+        """검색 범위 디렉토리 설정"""
+        self.root = root
+        self.run_search()
+
+    def run_search(self):
+        """현재 검색어로 검색 (UI 스레드에서 바로 실행)"""
+        self._search_timer.stop()
+        self.result_list.clear()
+        query = self.query_input.text().strip()
+        if not query:
+            self.status_label.clear()
+            return
+
+        started = time.perf_counter()
+        hits = self.index.search(query, root=self.root)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        for hit in hits:
+            self._add_hit(hit)
+        self.status_label.setText(f"{len(hits)}건 ({elapsed_ms:.0f} ms)" if hits else "검색 결과 없음")
+
+    def _add_hit(self, hit: SearchHit):
+        item = QListWidgetItem(self.result_list)
+        item.setData(Qt.ItemDataRole.UserRole, hit)
+        item.setToolTip(str(hit.path))
+        # 스크린 리더와 키보드 탐색용 일반 텍스트
+        item.setData(Qt.ItemDataRole.AccessibleTextRole, f"{hit.title}: {hit.snippet_text}")
+
+        label = QLabel(f"<b>{html.escape(hit.title)}</b> "
+                       f"<span style='color: gray;'>{html.escape(hit.path.name)}</span>"
+                       f"<br>{hit.snippet_html()}")
+        label.setTextFormat(Qt.TextFormat.RichText)
+        label.setWordWrap(True)
+        label.setContentsMargins(4, 2, 4, 2)
+        item.setSizeHint(label.sizeHint())
+        self.result_list.setItemWidget(item, label)
+
+    def _on_item_activated(self, item: QListWidgetItem):
+        hit: SearchHit = item.data(Qt.ItemDataRole.UserRole)
+        self.open_requested.emit(hit.path, self.query_input.text().strip())
+
+    # 색인 동기화
+
+    def sync_index(self):
+        """검색 범위 디렉토리의 바뀐 파일을 백그라운드에서 색인"""
+        if self.root is None or (self._sync_worker is not None and self._sync_worker.isRunning()):
+            return
+        self.sync_btn.setEnabled(False)
+        self.status_label.setText("색인 갱신 중...")
+        self._sync_worker = IndexSyncWorker(self.index, self.root)
+        self._sync_worker.progress_changed.connect(
+            lambda done, total: self.status_label.setText(f"색인 갱신 중... {done}/{total}")
+        )
+        self._sync_worker.sync_finished.connect(self._on_sync_finished)
+        self._sync_worker.finished.connect(lambda: self.sync_btn.setEnabled(True))
+        self._sync_worker.start()
+
+    def _on_sync_finished(self, indexed: int, removed: int):
+        logger.info(f"검색 색인 갱신: {indexed}개 색인, {removed}개 제거")
+        self.run_search()
+        if not self.query_input.text().strip():
+            self.status_label.setText(f"색인 갱신 완료 ({indexed}개 새로 색인, {removed}개 제거)")
+
+    def stop_sync(self):
+        """진행 중인 동기화 취소 후 대기"""
+        if self._sync_worker is not None:
+            self._sync_worker.cancel()
+            self._sync_worker.wait()
+            self._sync_worker = None
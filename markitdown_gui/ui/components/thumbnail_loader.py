@@ -0,0 +1,51 @@
+"""
+썸네일 로더
+ThumbnailService의 백그라운드 결과를 GUI 스레드 시그널로 전달
+"""
+
+from pathlib import Path
+from typing import Optional
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from ...core.thumbnail_service import Size, ThumbnailService, get_thumbnail_service
+
+
+class ThumbnailLoader(QObject):
+    """썸네일 요청/완료 시그널 브리지"""
+
+    # 원본 경로, 요청 크기, 썸네일 경로
+    thumbnail_ready = pyqtSignal(object, object, object)
+    # 원본 경로, 오류 메시지
+    thumbnail_failed = pyqtSignal(object, str)
+
+    def __init__(self, service: Optional[ThumbnailService] = None, parent=None):
+        super().__init__(parent)
+        self.service = service or get_thumbnail_service()
+
+    def request(self, source: Path, size: Size) -> Optional[Path]:
+        """
+        썸네일 요청
+
+        캐시에 있으면 경로를 바로 반환하고, 없으면 None을 반환한 뒤 생성이 끝나면
+        thumbnail_ready를 보낸다(작업 스레드에서 보내므로 수신 측에는 큐 연결로 전달됨).
+        """
+        cached = self.service.cached_thumbnail(source, size)
+        if cached is not None:
+            return cached
+        future = self.service.request(source, size)
+        future.add_done_callback(lambda f: self._deliver(source, size, f))
+        return None
+
+    def _deliver(self, source: Path, size: Size, future):
+        if future.cancelled():
+            return
+        try:
+            error = future.exception()
+            if error is None:
+                self.thumbnail_ready.emit(source, size, future.result())
+            else:
+                self.thumbnail_failed.emit(source, str(error))
+        except RuntimeError:
+            # 요청한 위젯이 이미 닫혀 로더가 삭제됨
+            pass
@@ -18,24 +18,25 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, QSettings, QThread, pyqtSignal, QTimer
 from PyQt6.QtGui import QFont, QPixmap, QPainter, QTextCursor
 
-try:
-    from PIL import Image, ImageQt
-    PILLOW_AVAILABLE = True
-except ImportError:
-    PILLOW_AVAILABLE = False
-
+from ..core.constants import MAX_THUMBNAIL_SIZE
 from ..core.models import FileInfo, FileType
 from ..core.logger import get_logger
+from ..core.thumbnail_service import THUMBNAIL_FILE_TYPES
+from .components.paged_text_view import PagedTextView
+from .components.thumbnail_loader import ThumbnailLoader
 
 
 logger = get_logger(__name__)
 
 
+# 페이지 단위 뷰어로 여는 텍스트 형식
+TEXT_FILE_TYPES = {FileType.TXT, FileType.HTML, FileType.HTM, FileType.CSV, FileType.JSON, FileType.XML}
+
+
 class FileContentLoader(QThread):
-    """파일 내용 로더 스레드"""
+    """파일 내용 로더 스레드 (텍스트는 PagedTextView, 이미지는 ThumbnailLoader가 처리)"""
     
     content_loaded = pyqtSignal(str)
-    image_loaded = pyqtSignal(QPixmap)
     error_occurred = pyqtSignal(str)
     
     def __init__(self, file_path: Path, file_type: FileType):
@@ -46,101 +47,9 @@ class FileContentLoader(QThread):
     def run(self):
         """파일 로딩 실행"""
         try:
-            if self.file_type in [FileType.TEXT, FileType.HTML, FileType.CSV, FileType.JSON, FileType.XML]:
-                self._load_text_file()
-            elif self.file_type in [FileType.IMAGE]:
-                self._load_image_file()
-            else:
-                self.content_loaded.emit("이 파일 형식은 미리보기를 지원하지 않습니다.")
-                
+            self.content_loaded.emit("이 파일 형식은 미리보기를 지원하지 않습니다.")
         except Exception as e:
             self.error_occurred.emit(str(e))
-    
-    def _load_text_file(self):
-        """텍스트 파일 로드"""
-        encodings = ['utf-8', 'utf-8-sig', 'cp949', 'euc-kr', 'latin-1']
-        
-        content = None
-        for encoding in encodings:
-            try:
-                with open(self.file_path, 'r', encoding=encoding) as f:
-                    content = f.read()
-                break
-            except UnicodeDecodeError:
-                continue
-            except Exception as e:
-                if encoding == encodings[-1]:  # 마지막 시도
-                    raise e
-        
-        if content is None:
-            content = "파일을 읽을 수 없습니다. 인코딩을 확인해주세요."
-        
-        # 파일이 너무 크면 일부만 표시
-        if len(content) > 100000:  # 100KB
-            content = content[:100000] + f"\n\n... (파일이 너무 큽니다. 처음 100KB만 표시)"
-        
-        self.content_loaded.emit(content)
-    
-    def _load_image_file(self):
-        """이미지 파일 로드"""
-        if not PILLOW_AVAILABLE:
-            self.content_loaded.emit("이미지 미리보기를 위해 Pillow 라이브러리가 필요합니다.")
-            return
-        
-        try:
-            # PIL로 이미지 로드
-            pil_image = Image.open(self.file_path)
-            
-            # 이미지가 너무 크면 리사이즈
-            max_size = (800, 600)
-            if pil_image.size[0] > max_size[0] or pil_image.size[1] > max_size[1]:
-                # PIL 호환성을 위해 여러 방법 시도
-                try:
-                    # 최신 PIL 버전
-                    pil_image.thumbnail(max_size, Image.Resampling.LANCZOS)
-                except AttributeError:
-                    # 구 PIL 버전
-                    pil_image.thumbnail(max_size, Image.LANCZOS)
-            
-            # RGBA 이미지의 경우 RGB로 변환 (투명도 처리)
-            if pil_image.mode in ('RGBA', 'LA', 'P'):
-                # 흰색 배경으로 합성
-                background = Image.new('RGB', pil_image.size, (255, 255, 255))
-                if pil_image.mode == 'P':
-                    pil_image = pil_image.convert('RGBA')
-                background.paste(pil_image, mask=pil_image.split()[-1] if pil_image.mode in ('RGBA', 'LA') else None)
-                pil_image = background
-            elif pil_image.mode != 'RGB':
-                pil_image = pil_image.convert('RGB')
-            
-            # QPixmap으로 변환
-            try:
-                # 최신 PIL 버전 - toqimage() 사용
-                qt_image = ImageQt.toqimage(pil_image)
-                pixmap = QPixmap.fromImage(qt_image)
-            except AttributeError:
-                try:
-                    # 구 PIL 버전 - ImageQt() 사용
-                    qt_image = ImageQt.ImageQt(pil_image)
-                    pixmap = QPixmap.fromImage(qt_image)
-                except:
-                    # 수동 변환
-                    import numpy as np
-                    img_array = np.array(pil_image)
-                    height, width, channel = img_array.shape
-                    bytes_per_line = 3 * width
-                    from PyQt6.QtGui import QImage
-                    qt_image = QImage(img_array.data, width, height, bytes_per_line, QImage.Format.Format_RGB888)
-                    pixmap = QPixmap.fromImage(qt_image)
-            
-            if pixmap.isNull():
-                self.error_occurred.emit("이미지를 QPixmap으로 변환할 수 없습니다.")
-                return
-                
-            self.image_loaded.emit(pixmap)
-            
-        except Exception as e:
-            self.error_occurred.emit(f"이미지 로드 실패: {str(e)}")
 
 
 class TextViewer(QTextEdit):
@@ -204,8 +113,9 @@ class FileViewerDialog(QDialog):
     def __init__(self, file_info: FileInfo, parent=None):
         super().__init__(parent)
         self.file_info = file_info
-        self.file_path = Path(file_info.file_path)
+        self.file_path = Path(file_info.path)
         self.loader_thread: Optional[FileContentLoader] = None
+        self.thumbnail_loader = ThumbnailLoader(parent=self)
         
         self._init_ui()
         self._setup_connections()
@@ -246,7 +156,7 @@ class FileViewerDialog(QDialog):
             f"파일명: {self.file_path.name}\n"
             f"경로: {self.file_path.parent}\n"
             f"크기: {self._format_file_size(self.file_info.size)}\n"
-            f"수정일: {self.file_info.modified_date}\n"
+            f"수정일: {self.file_info.modified_time}\n"
             f"타입: {self.file_info.file_type.value}"
         )
         info_layout.addWidget(self.file_info_label)
@@ -302,6 +212,11 @@ class FileViewerDialog(QDialog):
         self.text_viewer.setVisible(False)
         layout.addWidget(self.text_viewer)
         
+        # 텍스트 파일 뷰어 (mmap 페이지 단위, 대용량 CSV/로그도 즉시 열림)
+        self.paged_viewer = PagedTextView()
+        self.paged_viewer.setVisible(False)
+        layout.addWidget(self.paged_viewer)
+        
         # 이미지 뷰어
         self.image_viewer = ImageViewer()
         self.image_viewer.setVisible(False)
@@ -356,16 +271,32 @@ class FileViewerDialog(QDialog):
         self.open_folder_btn.clicked.connect(self._open_in_folder)
         self.refresh_btn.clicked.connect(self._refresh_content)
         self.close_btn.clicked.connect(self.accept)
+        self.thumbnail_loader.thumbnail_ready.connect(self._on_thumbnail_ready)
+        self.thumbnail_loader.thumbnail_failed.connect(self._on_thumbnail_failed)
     
     def _load_file_content(self):
         """파일 내용 로드"""
+        if self.file_info.file_type in TEXT_FILE_TYPES:
+            if self.paged_viewer.open_file(self.file_path):
+                self.loading_label.setVisible(False)
+                self.paged_viewer.setVisible(True)
+            else:
+                self._on_error_occurred(self.paged_viewer.status_label.text())
+            return
+        
+        if self.file_info.file_type in THUMBNAIL_FILE_TYPES:
+            # 디스크 캐시에 있으면 바로, 없으면 백그라운드에서 축소 디코딩 후 표시
+            cached = self.thumbnail_loader.request(self.file_path, MAX_THUMBNAIL_SIZE)
+            if cached is not None:
+                self._on_image_loaded(QPixmap(str(cached)))
+            return
+        
         if self.loader_thread and self.loader_thread.isRunning():
             self.loader_thread.quit()
             self.loader_thread.wait()
         
         self.loader_thread = FileContentLoader(self.file_path, self.file_info.file_type)
         self.loader_thread.content_loaded.connect(self._on_content_loaded)
-        self.loader_thread.image_loaded.connect(self._on_image_loaded)
         self.loader_thread.error_occurred.connect(self._on_error_occurred)
         self.loader_thread.start()
     
@@ -388,15 +319,25 @@ class FileViewerDialog(QDialog):
         else:
             self._on_error_occurred("이미지가 비어있거나 손상되었습니다.")
     
+    def _on_thumbnail_ready(self, source: Path, size, thumbnail_path: Path):
+        if Path(source) == self.file_path and tuple(size) == MAX_THUMBNAIL_SIZE:
+            self._on_image_loaded(QPixmap(str(thumbnail_path)))
+    
+    def _on_thumbnail_failed(self, source: Path, error_message: str):
+        if Path(source) == self.file_path:
+            self._on_error_occurred(f"이미지 로드 실패: {error_message}")
+    
     def _on_error_occurred(self, error_message: str):
         """에러 발생시"""
         self.loading_label.setText(f"오류: {error_message}")
         self.text_viewer.setVisible(False)
+        self.paged_viewer.setVisible(False)
         self.image_viewer.setVisible(False)
     
     def _on_font_size_changed(self, size: int):
         """폰트 크기 변경"""
         self.text_viewer.set_font_size(size)
+        self.paged_viewer.set_font_size(size)
         
         # 속성 텍스트도 업데이트
         font = self.properties_text.font()
@@ -442,6 +383,7 @@ class FileViewerDialog(QDialog):
         self.loading_label.setText("파일을 다시 불러오는 중...")
         self.loading_label.setVisible(True)
         self.text_viewer.setVisible(False)
+        self.paged_viewer.setVisible(False)
         self.image_viewer.setVisible(False)
         
         # 파일 정보 업데이트
@@ -453,7 +395,7 @@ class FileViewerDialog(QDialog):
                 f"파일명: {self.file_path.name}\n"
                 f"경로: {self.file_path.parent}\n"
                 f"크기: {self._format_file_size(self.file_info.size)}\n"
-                f"수정일: {self.file_info.modified_date}\n"
+                f"수정일: {self.file_info.modified_time}\n"
                 f"타입: {self.file_info.file_type.value}"
             )
         
@@ -568,12 +510,18 @@ MIME 타입: {self._get_mime_type()}
         settings.setValue("file_viewer_dialog/font_size", self.font_size_spin.value())
         settings.setValue("file_viewer_dialog/current_tab", self.tab_widget.currentIndex())
     
+    def done(self, result: int):
+        """닫기 버튼으로 닫을 때도 매핑한 파일 해제"""
+        self.paged_viewer.close_file()
+        super().done(result)
+    
     def closeEvent(self, event):
         """닫기 이벤트"""
         # 로더 스레드 정리
         if self.loader_thread and self.loader_thread.isRunning():
             self.loader_thread.quit()
             self.loader_thread.wait()
+        self.paged_viewer.close_file()
         
         self._save_settings()
         logger.info(f"파일 뷰어 다이얼로그 닫기: {self.file_path.name}")
@@ -34,9 +34,6 @@ from ..core.utils import get_default_output_directory
 from .components.file_list_widget import FileListWidget
 from .components.progress_widget import ProgressWidget
 from .components.log_widget import LogWidget
-from .preview_dialog import PreviewDialog
-from .settings_dialog import SettingsDialog
-from .file_viewer_dialog import FileViewerDialog
 from .performance_optimizer import ResponsivenessOptimizer
 
 
@@ -100,6 +97,18 @@ class MainWindow(QMainWindow):
         # ConversionManager의 내부 conflict_handler에 대한 참조
         self.conflict_handler = self.conversion_manager._conflict_handler
         
+        # 변환 결과 전문 검색 색인 (저장할 때마다 증분 색인)
+        self.search_index = None
+        self._search_dialog: Optional[QDialog] = None
+        # FTS5 확인이 sqlite 연결을 열므로 모듈 import 시점이 아니라 창 생성 시 로드
+        from ..core.search_index import FTS5_AVAILABLE, get_search_index
+        if FTS5_AVAILABLE:
+            try:
+                self.search_index = get_search_index()
+            except Exception as e:
+                logger.warning(f"검색 색인을 열 수 없습니다: {e}")
+        self.conversion_manager.set_search_index(self.search_index)
+        
         # UI 성능 최적화 적용
         from PyQt6.QtWidgets import QApplication
         app = QApplication.instance()
@@ -155,6 +164,7 @@ class MainWindow(QMainWindow):
         
         # 파일 리스트 위젯
         self.file_list_widget = FileListWidget()
+        self.file_list_widget.set_thumbnails_enabled(self.config.show_thumbnails)
         splitter.addWidget(self.file_list_widget)
         
         # 하단 영역 (진행률, 로그, 버튼들)
@@ -382,6 +392,13 @@ class MainWindow(QMainWindow):
         conversion_settings_action.triggered.connect(self._show_conversion_settings)
         tools_menu.addAction(conversion_settings_action)
         
+        # 변환된 문서 전문 검색
+        corpus_search_action = QAction("문서 검색(&F)", self)
+        corpus_search_action.setShortcut("Ctrl+Shift+F")
+        corpus_search_action.setEnabled(self.search_index is not None)
+        corpus_search_action.triggered.connect(self._show_corpus_search)
+        tools_menu.addAction(corpus_search_action)
+        
         tools_menu.addSeparator()
         
         # 충돌 정책 빠른 선택
@@ -473,9 +490,8 @@ class MainWindow(QMainWindow):
         self.file_manager.scan_error.connect(self._on_scan_error)
         
         # 변환 매니저 연결
-        self.conversion_manager.conversion_progress_updated.connect(self._on_conversion_progress)
-        self.conversion_manager.file_conversion_started.connect(self._on_file_conversion_started)
-        self.conversion_manager.file_conversion_completed.connect(self._on_file_conversion_completed)
+        # 진행률/파일 시작/완료는 프레임당 한 번 묶음으로 수신
+        self.conversion_manager.progress_batch_ready.connect(self._on_progress_batch)
         self.conversion_manager.conversion_completed.connect(self._on_conversion_completed)
         self.conversion_manager.conversion_error.connect(self._on_conversion_error)
     
@@ -594,7 +610,7 @@ class MainWindow(QMainWindow):
         # UI 상태 업데이트
         self.convert_btn.setEnabled(False)
         self.convert_btn.setText("변환 중...")
-        self.progress_widget.start_progress(len(selected_files))
+        self.progress_widget.start_progress(len(selected_files), selected_files)
         
         # 변환 시작 (향상된 변환 매니저 사용)
         success = self.conversion_manager.convert_files_async(selected_files)
@@ -602,6 +618,10 @@ class MainWindow(QMainWindow):
         if not success:
             self._reset_conversion_ui()
             QMessageBox.warning(self, "오류", "변환을 시작할 수 없습니다.")
+        else:
+            aggregator = self._progress_announcer()
+            if aggregator:
+                aggregator.start(len(selected_files))
         
         logger.info(f"파일 변환 시작: {len(selected_files)}개 (충돌 정책: {self.conflict_config.default_policy.value})")
     
@@ -626,6 +646,7 @@ class MainWindow(QMainWindow):
         
         if output_file.exists():
             # 변환된 파일 미리보기
+            from .preview_dialog import PreviewDialog
             dialog = PreviewDialog(self)
             dialog.set_markdown_file(output_file)
             dialog.exec()
@@ -651,6 +672,7 @@ class MainWindow(QMainWindow):
             result = self.conversion_manager.convert_single_file(file_info)
             
             if result.is_success:
+                from .preview_dialog import PreviewDialog
                 dialog = PreviewDialog(self)
                 dialog.set_markdown_file(result.output_path)
                 dialog.exec()
@@ -704,7 +726,8 @@ class MainWindow(QMainWindow):
     def _on_file_double_clicked(self, file_info):
         """파일 더블클릭시"""
         try:
-            # 원본 파일 뷰어 열기
+            # 원본 파일 뷰어 열기 (PIL 등 무거운 의존성은 최초 사용 시 로드)
+            from .file_viewer_dialog import FileViewerDialog
             dialog = FileViewerDialog(file_info, self)
             dialog.exec()
         except Exception as e:
@@ -795,6 +818,7 @@ class MainWindow(QMainWindow):
     
     def _show_settings(self):
         """설정 다이얼로그 표시"""
+        from .settings_dialog import SettingsDialog
         dialog = SettingsDialog(self.config_manager, self)
         dialog.settings_changed.connect(self._on_settings_changed)
         dialog.language_changed.connect(self._on_language_changed)
@@ -851,6 +875,43 @@ class MainWindow(QMainWindow):
             logger.error(f"설정 적용 실패: {e}")
             QMessageBox.warning(self, "경고", f"설정 적용 중 오류가 발생했습니다:\n{str(e)}")
     
+    def _search_root(self) -> Optional[Path]:
+        """전문 검색 범위 (원본 옆에 저장하면 현재 디렉토리, 아니면 출력 디렉토리)"""
+        if not getattr(self.config, 'save_to_original_dir', True):
+            return Path(self.config.output_directory or get_default_output_directory())
+        return getattr(self, 'current_directory', None)
+    
+    def _show_corpus_search(self):
+        """변환된 문서 전문 검색 창 표시 (열 때마다 바뀐 파일 색인)"""
+        if self.search_index is None:
+            return
+        from .components.search_panel import SearchPanel
+        
+        if self._search_dialog is None:
+            self._search_dialog = QDialog(self)
+            self._search_dialog.setWindowTitle("문서 검색")
+            self._search_dialog.resize(700, 500)
+            layout = QVBoxLayout(self._search_dialog)
+            layout.setContentsMargins(0, 0, 0, 0)
+            self.search_panel = SearchPanel(self.search_index, parent=self._search_dialog)
+            self.search_panel.open_requested.connect(self._open_search_hit)
+            layout.addWidget(self.search_panel)
+        
+        self.search_panel.set_root(self._search_root())
+        self.search_panel.sync_index()
+        self._search_dialog.show()
+        self._search_dialog.raise_()
+        self.search_panel.query_input.setFocus()
+    
+    def _open_search_hit(self, path: Path, query: str):
+        """검색 결과를 미리보기로 열고 모든 일치 구간 강조"""
+        from ..core.search_index import query_terms
+        from .preview_dialog import PreviewDialog
+        dialog = PreviewDialog(self)
+        dialog.set_markdown_file(Path(path))
+        dialog.highlight_matches(query_terms(query))
+        dialog.exec()
+    
     def _show_about(self):
         """정보 다이얼로그 표시"""
         QMessageBox.about(
@@ -1078,6 +1139,11 @@ class MainWindow(QMainWindow):
         except Exception as e:
             logger.debug(f"상태 변경 알림 실패: {e}")
     
+    def _progress_announcer(self):
+        """일괄 변환 진행 요약 알림 집계기 (스크린 리더 지원이 없으면 None)"""
+        bridge = self.accessibility_manager.screen_reader_bridge if self.accessibility_manager else None
+        return bridge.progress_aggregator if bridge else None
+    
     def _run_accessibility_validation(self):
         """접근성 검증 실행 (개발용)"""
         try:
@@ -1183,6 +1249,24 @@ class MainWindow(QMainWindow):
         self.scan_btn.setText("파일 스캔")
     
     # 변환 관련 이벤트 핸들러들
+    def _on_progress_batch(self, batch):
+        """프레임 단위로 병합된 진행 상황 반영 (완료된 파일은 모두 반영)"""
+        for file_info in batch.in_progress:
+            self._on_file_conversion_started(file_info)
+            self.progress_widget.update_file_progress(file_info)
+        for result in batch.completed:
+            self._on_file_conversion_completed(result)
+            self.progress_widget.update_file_progress(result.file_info)
+        
+        # 파일별로 알리지 않고 주기적 요약으로 합침
+        aggregator = self._progress_announcer()
+        if aggregator and batch.completed:
+            failed = sum(1 for result in batch.completed if not result.is_success)
+            aggregator.record(succeeded=len(batch.completed) - failed, failed=failed)
+        
+        if batch.progress is not None:
+            self._on_conversion_progress(batch.progress)
+    
     def _on_conversion_progress(self, progress):
         """변환 진행률 업데이트 (향상된 진행률 정보 포함)"""
         self.progress_widget.update_progress(progress)
@@ -1220,6 +1304,10 @@ class MainWindow(QMainWindow):
     
     def _on_conversion_completed(self, results: list):
         """전체 변환 완료시 (향상된 직접 파일 저장 완료)"""
+        aggregator = self._progress_announcer()
+        if aggregator:
+            aggregator.finish()
+        
         success_count = len([r for r in results if r.is_success])
         total_count = len(results)
         
@@ -1377,6 +1465,9 @@ class MainWindow(QMainWindow):
 
     def _on_conversion_error(self, error_message: str):
         """변환 오류시 (향상된 오류 처리)"""
+        aggregator = self._progress_announcer()
+        if aggregator:
+            aggregator.stop()
         self._reset_conversion_ui()
         self.progress_widget.finish_progress(success=False, message="변환 오류")
         
@@ -1553,6 +1644,10 @@ class MainWindow(QMainWindow):
             if hasattr(self, 'performance_optimizer'):
                 self.performance_optimizer.cleanup()
             
+            # 검색 색인 동기화 중단
+            if hasattr(self, 'search_panel'):
+                self.search_panel.stop_sync()
+            
             # 설정 저장
             self._save_settings()
             
@@ -15,6 +15,7 @@ from PyQt6.QtCore import QObject, pyqtSignal, QTimer, QThread, QMutex, QMutexLoc
 from PyQt6.QtWidgets import QApplication
 
 from ..core.logger import get_logger
+from ..core.resource_sampler import get_resource_snapshot
 
 
 logger = get_logger(__name__)
@@ -299,13 +300,11 @@ class PerformanceMonitor:
         metric.success = success
         metric.error_message = error_message
         
-        # 메모리 사용량 측정 (선택적)
-        try:
-            import psutil
-            process = psutil.Process()
-            metric.memory_usage_mb = process.memory_info().rss / 1024 / 1024
-        except ImportError:
-            pass
+        # 메모리/CPU 사용량 (백그라운드 샘플러의 최신 스냅샷)
+        snapshot = get_resource_snapshot()
+        if snapshot.is_valid:
+            metric.memory_usage_mb = snapshot.rss_mb
+            metric.cpu_usage = snapshot.cpu_percent
         
         # 메트릭 저장
         with QMutexLocker(self._mutex):
@@ -4,8 +4,9 @@
 """
 
 import os
+import shutil
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, List, Optional, Sequence, Set
 
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QTabWidget, QTextEdit,
@@ -13,24 +14,123 @@ from PyQt6.QtWidgets import (
     QMessageBox, QFileDialog, QSplitter, QTreeWidget, QTreeWidgetItem,
     QCheckBox, QWidget
 )
-from PyQt6.QtCore import Qt, QSettings, pyqtSignal
-from PyQt6.QtGui import QFont, QTextCursor, QKeySequence, QAction
+from PyQt6.QtCore import Qt, QSettings, QThread, pyqtSignal
+from PyQt6.QtGui import (
+    QFont, QTextCursor, QKeySequence, QAction, QColor, QTextCharFormat
+)
 from PyQt6.QtPrintSupport import QPrintDialog, QPrinter
 
-try:
-    import markdown
-    from markdown.extensions import codehilite, tables, toc
-    MARKDOWN_AVAILABLE = True
-except ImportError:
-    MARKDOWN_AVAILABLE = False
-
+from ..core.constants import (
+    PAGED_VIEW_THRESHOLD, PREVIEW_SECTIONED_THRESHOLD, PREVIEW_SECTION_MAX_CHARS,
+    SEARCH_MAX_HIGHLIGHTS
+)
+from ..core.markdown_renderer import (
+    MARKDOWN_AVAILABLE, MarkdownSection, get_markdown_renderer, split_sections
+)
 from ..core.models import FileInfo
 from ..core.logger import get_logger
+from ..core.paged_text import PagedTextFile
+from .components.paged_text_view import PagedTextView
 
 
 logger = get_logger(__name__)
 
 
+HTML_EXPORT_HEAD = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>Markdown Preview</title>
+    <style>
+        body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; line-height: 1.6; max-width: 800px; margin: 0 auto; padding: 20px; }
+        pre { background: #f4f4f4; padding: 10px; border-radius: 4px; overflow-x: auto; }
+        code { background: #f4f4f4; padding: 2px 4px; border-radius: 2px; }
+        table { border-collapse: collapse; width: 100%; }
+        th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+        th { background-color: #f2f2f2; }
+    </style>
+</head>
+<body>
+"""
+HTML_EXPORT_FOOT = """
+</body>
+</html>"""
+
+
+def highlight_all(edit: QTextEdit, terms: Sequence[str]) -> int:
+    """
+    모든 일치 구간을 배경색으로 강조하고 첫 일치 위치로 이동 (대소문자 무시)
+    
+    Returns:
+        강조한 구간 수 (SEARCH_MAX_HIGHLIGHTS에서 멈춤)
+    """
+    highlight = QTextCharFormat()
+    highlight.setBackground(QColor("#fff59d"))
+    document = edit.document()
+    selections = []
+    first: Optional[QTextCursor] = None
+    
+    for term in terms:
+        cursor = document.find(term)
+        while not cursor.isNull() and len(selections) < SEARCH_MAX_HIGHLIGHTS:
+            selection = QTextEdit.ExtraSelection()
+            selection.cursor = cursor
+            selection.format = highlight
+            selections.append(selection)
+            if first is None or cursor.position() < first.position():
+                first = QTextCursor(cursor)
+            cursor = document.find(term, cursor)
+    
+    edit.setExtraSelections(selections)
+    if first is not None:
+        edit.setTextCursor(first)
+        edit.ensureCursorVisible()
+    return len(selections)
+
+
+class MarkdownRenderWorker(QThread):
+    """마크다운 렌더링 스레드 (요청 세대 번호와 함께 결과 전달)"""
+    
+    render_finished = pyqtSignal(int, object)
+    render_failed = pyqtSignal(int, str)
+    
+    def __init__(self, generation: int, task: Callable[[], Any]):
+        super().__init__()
+        self.generation = generation
+        self.task = task
+    
+    def run(self):
+        """렌더링 실행"""
+        try:
+            result = self.task()
+        except Exception as e:
+            self.render_failed.emit(self.generation, str(e))
+            return
+        self.render_finished.emit(self.generation, result)
+
+
+# 닫힌 다이얼로그에서 떼어낸 렌더링 스레드 (끝날 때까지 참조 유지)
+_detached_render_workers: Set[MarkdownRenderWorker] = set()
+
+
+def _detach_render_worker(worker: MarkdownRenderWorker):
+    """결과 시그널 연결을 끊고 스레드가 스스로 끝나도록 둠 (닫을 때 UI 스레드가 기다리지 않음)"""
+    for signal in (worker.render_finished, worker.render_failed, worker.finished):
+        try:
+            signal.disconnect()
+        except TypeError:
+            pass  # 연결된 슬롯 없음
+    _detached_render_workers.add(worker)
+    worker.finished.connect(lambda: _release_detached_worker(worker))
+    if worker.isFinished():
+        _release_detached_worker(worker)
+
+
+def _release_detached_worker(worker: MarkdownRenderWorker):
+    worker.wait()
+    _detached_render_workers.discard(worker)
+
+
 class MarkdownTextEdit(QTextEdit):
     """검색 기능이 있는 마크다운 텍스트 에디터"""
     
@@ -73,6 +173,19 @@ class PreviewDialog(QDialog):
         self.markdown_content = ""
         self.html_content = ""
         
+        # HTML 렌더링 상태 (세대 번호가 바뀌면 이전 요청 결과는 버림)
+        self._renderer = get_markdown_renderer()
+        self._render_generation = 0
+        self._render_workers: Set[MarkdownRenderWorker] = set()
+        self._section_titles: List[str] = []
+        self._section_reader: Optional[Callable[[int], str]] = None
+        # 큰 출력 파일은 전체를 읽지 않고 페이지 단위 뷰어로 표시
+        self._paged = False
+        # HTML 탭용 매핑 (QTextDocument는 긴 목록의 setHtml이 느려 섹션 크기로 나눔)
+        self._html_pages: Optional[PagedTextFile] = None
+        # 전문 검색 결과로 열었을 때 강조할 검색어
+        self._highlight_terms: List[str] = []
+        
         self._init_ui()
         self._setup_connections()
         self._load_settings()
@@ -155,6 +268,11 @@ class PreviewDialog(QDialog):
         self.raw_text_edit = MarkdownTextEdit()
         layout.addWidget(self.raw_text_edit)
         
+        # 큰 파일용 페이지 단위 뷰어
+        self.raw_paged_view = PagedTextView()
+        self.raw_paged_view.setVisible(False)
+        layout.addWidget(self.raw_paged_view)
+        
         return widget
     
     def _create_html_tab(self) -> QWidget:
@@ -162,6 +280,21 @@ class PreviewDialog(QDialog):
         widget = QWidget()
         layout = QVBoxLayout(widget)
         
+        # 섹션 탐색 (큰 문서는 선택한 섹션만 렌더링)
+        self.section_bar = QWidget()
+        section_layout = QHBoxLayout(self.section_bar)
+        section_layout.setContentsMargins(0, 0, 0, 0)
+        section_layout.addWidget(QLabel("섹션:"))
+        self.section_combo = QComboBox()
+        self.section_combo.setAccessibleName("HTML 미리보기 섹션")
+        section_layout.addWidget(self.section_combo, 1)
+        self.prev_section_btn = QPushButton("이전")
+        section_layout.addWidget(self.prev_section_btn)
+        self.next_section_btn = QPushButton("다음")
+        section_layout.addWidget(self.next_section_btn)
+        self.section_bar.setVisible(False)
+        layout.addWidget(self.section_bar)
+        
         # HTML 뷰어
         self.html_text_edit = QTextEdit()
         self.html_text_edit.setReadOnly(True)
@@ -200,6 +333,11 @@ class PreviewDialog(QDialog):
         self.refresh_btn.clicked.connect(self._refresh_content)
         self.close_btn.clicked.connect(self.accept)
         
+        if hasattr(self, 'section_combo'):
+            self.section_combo.currentIndexChanged.connect(self._render_section)
+            self.prev_section_btn.clicked.connect(lambda: self._step_section(-1))
+            self.next_section_btn.clicked.connect(lambda: self._step_section(1))
+        
         # 검색 위젯 연결
         self.search_widget.search_requested.connect(self._search_text)
         self.search_widget.close_requested.connect(self._hide_search)
@@ -217,14 +355,19 @@ class PreviewDialog(QDialog):
                 QMessageBox.warning(self, "파일 오류", f"파일을 찾을 수 없습니다: {file_path}")
                 return
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                self.markdown_content = f.read()
-            
             self.current_file_path = file_path
             self.file_info_label.setText(f"파일: {file_path.name}")
+            self._highlight_terms = []
+            self.raw_text_edit.setExtraSelections([])
             
-            # 내용 표시
-            self._display_content()
+            if file_path.stat().st_size > PAGED_VIEW_THRESHOLD:
+                self._display_paged(file_path)
+            else:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    self.markdown_content = f.read()
+                
+                # 내용 표시
+                self._display_content()
             
             logger.info(f"미리보기 파일 설정: {file_path}")
             
@@ -241,30 +384,156 @@ class PreviewDialog(QDialog):
         self._display_content()
     
     def _display_content(self):
-        """내용 표시"""
+        """내용 표시 (Raw 탭은 즉시, HTML 탭은 렌더링이 끝나면)"""
+        self._set_paged_mode(False)
+        
         # Raw markdown 탭
         self.raw_text_edit.setPlainText(self.markdown_content)
+        self.html_content = ""
         
         # HTML 탭 (markdown 라이브러리가 있을 때만)
         if MARKDOWN_AVAILABLE and hasattr(self, 'html_text_edit'):
-            try:
-                # 마크다운을 HTML로 변환
-                md = markdown.Markdown(extensions=[
-                    'codehilite',
-                    'tables',
-                    'toc',
-                    'fenced_code'
-                ])
-                self.html_content = md.convert(self.markdown_content)
-                self.html_text_edit.setHtml(self.html_content)
-                
-            except Exception as e:
-                logger.error(f"HTML 변환 실패: {e}")
-                self.html_text_edit.setPlainText(f"HTML 변환 실패: {str(e)}")
+            self._schedule_html_render()
+    
+    def _set_paged_mode(self, paged: bool):
+        self._paged = paged
+        self.raw_text_edit.setVisible(not paged)
+        self.raw_paged_view.setVisible(paged)
+        if not paged:
+            self.raw_paged_view.close_file()
+        if self._html_pages is not None:
+            self._html_pages.close()
+            self._html_pages = None
+    
+    def _display_paged(self, file_path: Path):
+        """큰 파일 표시 (Raw는 mmap 페이지 단위, HTML은 선택한 페이지만 렌더링)"""
+        self._set_paged_mode(True)
+        self.markdown_content = ""
+        self.html_content = ""
+        self.raw_text_edit.clear()
+        if not self.raw_paged_view.open_file(file_path):
+            QMessageBox.critical(self, "파일 오류", self.raw_paged_view.status_label.text())
+            return
+        
+        if MARKDOWN_AVAILABLE and hasattr(self, 'html_text_edit'):
+            self._html_pages = PagedTextFile(file_path, page_size=PREVIEW_SECTION_MAX_CHARS)
+            count = self._html_pages.page_count
+            self._render_generation += 1
+            self.section_bar.setVisible(True)
+            self._set_sections([f"페이지 {i + 1}/{count}" for i in range(count)],
+                               self._html_pages.read_page)
+    
+    def _schedule_html_render(self):
+        """HTML 렌더링 요청 (캐시에 있으면 바로 표시, 없으면 작업 스레드에서)"""
+        content = self.markdown_content
+        self._render_generation += 1
+        self._section_titles = []
+        self._section_reader = None
+        sectioned = len(content) > PREVIEW_SECTIONED_THRESHOLD
+        self.section_bar.setVisible(sectioned)
+        
+        if sectioned:
+            self._show_html_pending()
+            self._start_render(lambda: split_sections(content), self._on_sections_ready)
+            return
+        
+        html = self._renderer.cached(content)
+        if html is not None:
+            self._show_html(html, full=True)
+            return
+        self._show_html_pending()
+        self._start_render(lambda: self._renderer.render(content), self._on_document_rendered)
+    
+    def _start_render(self, task: Callable[[], Any], handler: Callable[[int, Any], None],
+                      failed_handler: Optional[Callable[[int, str], None]] = None):
+        worker = MarkdownRenderWorker(self._render_generation, task)
+        worker.render_finished.connect(handler)
+        worker.render_failed.connect(failed_handler or self._on_render_failed)
+        worker.finished.connect(lambda: self._on_worker_finished(worker))
+        self._render_workers.add(worker)
+        worker.start()
+    
+    def _on_worker_finished(self, worker: MarkdownRenderWorker):
+        worker.wait()
+        self._render_workers.discard(worker)
+    
+    def _show_html_pending(self):
+        self.html_text_edit.setPlainText("HTML 렌더링 중...")
+    
+    def _show_html(self, html: str, full: bool):
+        if full:
+            self.html_content = html
+        self.html_text_edit.setHtml(html)
+        if self._highlight_terms:
+            highlight_all(self.html_text_edit, self._highlight_terms)
+    
+    def _on_document_rendered(self, generation: int, html: str):
+        """전체 문서 렌더링 완료"""
+        if generation == self._render_generation:
+            self._show_html(html, full=True)
+    
+    def _on_sections_ready(self, generation: int, sections: List[MarkdownSection]):
+        """큰 문서의 섹션 분할 완료 - 첫 섹션부터 표시"""
+        if generation != self._render_generation:
+            return
+        content = self.markdown_content
+        logger.debug(f"큰 문서 섹션 렌더링: {len(sections)}개 섹션")
+        self._set_sections([section.title for section in sections],
+                           lambda index: sections[index].text(content))
+    
+    def _set_sections(self, titles: List[str], reader: Callable[[int], str]):
+        self._section_titles = titles
+        self._section_reader = reader
+        self.section_combo.blockSignals(True)
+        self.section_combo.clear()
+        self.section_combo.addItems(titles)
+        self.section_combo.blockSignals(False)
+        self._render_section(0)
+    
+    def _render_section(self, index: int):
+        """선택한 섹션만 렌더링"""
+        if not (0 <= index < len(self._section_titles)):
+            return
+        if self.section_combo.currentIndex() != index:
+            self.section_combo.setCurrentIndex(index)  # currentIndexChanged로 다시 호출됨
+            return
+        self.prev_section_btn.setEnabled(index > 0)
+        self.next_section_btn.setEnabled(index < len(self._section_titles) - 1)
+        
+        text = self._section_reader(index)
+        self._render_generation += 1
+        html = self._renderer.cached(text)
+        if html is not None:
+            self._show_html(html, full=False)
+            return
+        self._show_html_pending()
+        self._start_render(lambda: self._renderer.render(text), self._on_section_rendered)
+    
+    def _on_section_rendered(self, generation: int, html: str):
+        if generation == self._render_generation:
+            self._show_html(html, full=False)
+    
+    def _on_render_failed(self, generation: int, message: str):
+        if generation != self._render_generation:
+            return
+        logger.error(f"HTML 변환 실패: {message}")
+        self.html_text_edit.setPlainText(f"HTML 변환 실패: {message}")
+    
+    def _step_section(self, step: int):
+        self._render_section(self.section_combo.currentIndex() + step)
+    
+    def _stop_render_workers(self):
+        """진행 중인 렌더링 결과를 무시하고 스레드는 기다리지 않고 떼어냄"""
+        self._render_generation += 1
+        for worker in list(self._render_workers):
+            _detach_render_worker(worker)
+        self._render_workers.clear()
+        self.save_btn.setEnabled(True)
     
     def _on_font_size_changed(self, size: int):
         """폰트 크기 변경시"""
         self.raw_text_edit.set_font_size(size)
+        self.raw_paged_view.set_font_size(size)
         if hasattr(self, 'html_text_edit'):
             font = self.html_text_edit.font()
             font.setPointSize(size)
@@ -279,12 +548,34 @@ class PreviewDialog(QDialog):
         """검색 위젯 숨김"""
         self.search_widget.setVisible(False)
     
+    def highlight_matches(self, terms: Sequence[str]) -> int:
+        """
+        검색어의 모든 일치 구간 강조 (HTML 탭은 렌더링이 끝날 때도 다시 적용)
+        
+        페이지 단위 뷰어는 문서 전체를 올리지 않으므로 첫 일치 위치로만 이동한다.
+        
+        Returns:
+            Raw 탭에서 강조한 구간 수
+        """
+        self._highlight_terms = [term for term in terms if term]
+        if not self._highlight_terms:
+            return 0
+        if hasattr(self, 'html_text_edit'):
+            highlight_all(self.html_text_edit, self._highlight_terms)
+        if self._paged:
+            self.raw_paged_view.find_text(self._highlight_terms[0])
+            return 0
+        return highlight_all(self.raw_text_edit, self._highlight_terms)
+    
     def _search_text(self, text: str, case_sensitive: bool, whole_words: bool):
         """텍스트 검색"""
         current_tab = self.tab_widget.currentWidget()
         
         if current_tab == self.raw_tab:
-            success = self.raw_text_edit.find_text(text, case_sensitive, whole_words)
+            if self._paged:
+                success = self.raw_paged_view.find_text(text)
+            else:
+                success = self.raw_text_edit.find_text(text, case_sensitive, whole_words)
             if not success and text:
                 self.search_widget.show_not_found()
         elif hasattr(self, 'html_text_edit') and current_tab == self.html_tab:
@@ -294,7 +585,7 @@ class PreviewDialog(QDialog):
     
     def _save_as(self):
         """다른 이름으로 저장"""
-        if not self.markdown_content:
+        if not self.markdown_content and not self._paged:
             QMessageBox.information(self, "정보", "저장할 내용이 없습니다.")
             return
         
@@ -314,8 +605,11 @@ class PreviewDialog(QDialog):
             
             if filename:
                 try:
-                    with open(filename, 'w', encoding='utf-8') as f:
-                        f.write(self.markdown_content)
+                    if self._paged:
+                        shutil.copyfile(self.current_file_path, filename)
+                    else:
+                        with open(filename, 'w', encoding='utf-8') as f:
+                            f.write(self.markdown_content)
                     QMessageBox.information(self, "저장 완료", f"파일이 저장되었습니다:\n{filename}")
                 except Exception as e:
                     QMessageBox.critical(self, "저장 오류", f"저장 중 오류가 발생했습니다:\n{str(e)}")
@@ -333,30 +627,40 @@ class PreviewDialog(QDialog):
             )
             
             if filename:
-                try:
-                    html_template = f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="utf-8">
-    <title>Markdown Preview</title>
-    <style>
-        body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; line-height: 1.6; max-width: 800px; margin: 0 auto; padding: 20px; }}
-        pre {{ background: #f4f4f4; padding: 10px; border-radius: 4px; overflow-x: auto; }}
-        code {{ background: #f4f4f4; padding: 2px 4px; border-radius: 2px; }}
-        table {{ border-collapse: collapse; width: 100%; }}
-        th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-        th {{ background-color: #f2f2f2; }}
-    </style>
-</head>
-<body>
-{self.html_content}
-</body>
-</html>"""
-                    with open(filename, 'w', encoding='utf-8') as f:
-                        f.write(html_template)
-                    QMessageBox.information(self, "저장 완료", f"HTML 파일이 저장되었습니다:\n{filename}")
-                except Exception as e:
-                    QMessageBox.critical(self, "저장 오류", f"저장 중 오류가 발생했습니다:\n{str(e)}")
+                # 섹션/페이지 단위로 보던 큰 문서는 저장할 때 전체를 작업 스레드에서 렌더링
+                self.save_btn.setEnabled(False)
+                self._start_render(self._html_export_task(Path(filename)),
+                                   self._on_html_exported, self._on_html_export_failed)
+    
+    def _html_export_task(self, path: Path) -> Callable[[], Path]:
+        """HTML 파일 내보내기 작업 (페이지 단위 파일은 별도로 열어 한 페이지씩 렌더링해 기록)"""
+        renderer = self._renderer
+        source_path = self.current_file_path if self._paged else None
+        html = self.html_content
+        content = self.markdown_content
+        
+        def export() -> Path:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(HTML_EXPORT_HEAD)
+                if source_path is not None:
+                    with PagedTextFile(source_path) as paged_file:
+                        for index in range(paged_file.page_count):
+                            f.write(renderer.render(paged_file.read_page(index)))
+                            f.write("\n")
+                else:
+                    f.write(html or renderer.render(content))
+                f.write(HTML_EXPORT_FOOT)
+            return path
+        
+        return export
+    
+    def _on_html_exported(self, generation: int, path: Path):
+        self.save_btn.setEnabled(True)
+        QMessageBox.information(self, "저장 완료", f"HTML 파일이 저장되었습니다:\n{path}")
+    
+    def _on_html_export_failed(self, generation: int, message: str):
+        self.save_btn.setEnabled(True)
+        QMessageBox.critical(self, "저장 오류", f"저장 중 오류가 발생했습니다:\n{message}")
     
     def _print(self):
         """인쇄"""
@@ -367,7 +671,10 @@ class PreviewDialog(QDialog):
             current_tab = self.tab_widget.currentWidget()
             
             if current_tab == self.raw_tab:
-                self.raw_text_edit.print(printer)
+                if self._paged:
+                    self.raw_paged_view.text_edit.print(printer)
+                else:
+                    self.raw_text_edit.print(printer)
             elif hasattr(self, 'html_text_edit') and current_tab == self.html_tab:
                 self.html_text_edit.print(printer)
     
@@ -398,7 +705,15 @@ class PreviewDialog(QDialog):
         settings.setValue("preview_dialog/geometry", self.saveGeometry())
         settings.setValue("preview_dialog/font_size", self.font_size_spin.value())
     
+    def done(self, result: int):
+        """닫기 버튼/Esc로 닫을 때도 렌더링 스레드 정리"""
+        self._stop_render_workers()
+        self._set_paged_mode(False)
+        super().done(result)
+    
     def closeEvent(self, event):
         """닫기 이벤트"""
         self._save_settings()
+        self._stop_render_workers()
+        self._set_paged_mode(False)
         super().closeEvent(event)
\ No newline at end of file
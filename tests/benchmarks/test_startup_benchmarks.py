@@ -0,0 +1,125 @@
+"""
+Startup Benchmark Tests
+콜드 스타트 시간 측정 및 저장된 기준값 대비 예산 검사
+
+기준값 갱신: python -m markitdown_gui benchmark startup --runs 5 \
+    --baseline tests/benchmarks/startup_baseline.json --update-baseline
+허용 오차 재정의: MARKITDOWN_STARTUP_TOLERANCE=1.0 pytest tests/benchmarks
+"""
+
+import os
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from markitdown_gui.core.startup_benchmark import (
+    StartupMetric, parse_importtime, check_budgets, save_baseline, load_baseline,
+    run_startup_benchmarks, measure_first_window, BenchmarkError, FIRST_WINDOW_METRIC,
+    PROJECT_ROOT, _probe_env
+)
+from markitdown_gui.core.constants import STARTUP_READY_MARKER
+
+
+BASELINE_FILE = Path(__file__).parent / "startup_baseline.json"
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      2000 |       5000 |     markitdown_gui.core.models
+import time:      1500 |       9000 | markitdown_gui.core.conversion_engine
+"""
+
+
+def tolerance_override():
+    value = os.environ.get("MARKITDOWN_STARTUP_TOLERANCE")
+    return float(value) if value else None
+
+
+class TestStartupBudget:
+    """기준값/예산 계산 테스트"""
+
+    def test_parse_importtime(self):
+        """중첩 들여쓰기를 제거하고 self/cumulative 시간 파싱"""
+        timings = parse_importtime(IMPORTTIME_OUTPUT)
+
+        assert timings["markitdown_gui.core.conversion_engine"] == (1500, 9000)
+        assert timings["markitdown_gui.core.models"] == (2000, 5000)
+        assert len(timings) == 3
+
+    def test_budget_violation(self):
+        """기준값 * (1 + 허용 오차) + 여유를 넘으면 위반"""
+        baseline = {"tolerance": 0.5, "slack_ms": 10,
+                    "metrics": {"a": {"baseline_ms": 100}, "b": {"baseline_ms": 100}}}
+        metrics = {"a": StartupMetric("a", [150, 160, 170]),
+                   "b": StartupMetric("b", [100, 200, 300])}
+
+        violations = check_budgets(metrics, baseline)
+
+        assert [v.name for v in violations] == ["b"]
+        assert violations[0].budget_ms == 160
+        assert check_budgets(metrics, baseline, tolerance=1.5) == []
+
+    def test_fixed_budget_and_skipped_metrics(self):
+        """항목별 budget_ms가 우선하고, 측정하지 못한 항목은 건너뜀"""
+        baseline = {"metrics": {"a": {"baseline_ms": 100, "budget_ms": 120},
+                                "b": {"baseline_ms": 100}}}
+        metrics = {"a": StartupMetric("a", [130]),
+                   "b": StartupMetric("b", skipped="missing")}
+
+        assert [v.name for v in check_budgets(metrics, baseline)] == ["a"]
+
+    def test_save_baseline_keeps_settings(self, tmp_path):
+        """기준값 갱신 시 허용 오차와 고정 예산 유지"""
+        path = tmp_path / "baseline.json"
+        previous = {"tolerance": 0.2, "slack_ms": 5,
+                    "metrics": {"a": {"baseline_ms": 10, "budget_ms": 40}}}
+
+        save_baseline(path, {"a": StartupMetric("a", [20, 30, 25]),
+                             "b": StartupMetric("b", skipped="missing")}, previous)
+
+        saved = load_baseline(path)
+        assert saved["tolerance"] == 0.2
+        assert saved["metrics"] == {"a": {"baseline_ms": 25, "budget_ms": 40}}
+
+    def test_probe_bytecode_outside_source_tree(self):
+        """측정 프로세스의 바이트코드 캐시는 저장소 밖에 기록"""
+        prefix = Path(_probe_env()["PYTHONPYCACHEPREFIX"])
+
+        assert PROJECT_ROOT not in prefix.parents
+
+    def test_first_window_reads_marker(self, tmp_path):
+        """표시 알림 줄까지의 시간을 측정 (알림 뒤 출력도 계속 읽음)"""
+        script = tmp_path / "main.py"
+        script.write_text(f"print({STARTUP_READY_MARKER!r}, flush=True)\nprint('x' * 200000)\n")
+
+        metric = measure_first_window(script, runs=1, timeout=30, workdir=tmp_path)
+
+        assert len(metric.samples_ms) == 1 and metric.samples_ms[0] > 0
+
+    def test_first_window_times_out_without_marker(self, tmp_path):
+        """알림 없이 멈춘 프로세스는 제한 시간에 종료하고 오류"""
+        script = tmp_path / "main.py"
+        script.write_text("import time\ntime.sleep(60)\n")
+
+        start = time.monotonic()
+        with pytest.raises(BenchmarkError):
+            measure_first_window(script, runs=1, timeout=1, workdir=tmp_path)
+        assert time.monotonic() - start < 10
+
+
+@pytest.mark.slow
+class TestStartupRegression:
+    """저장된 기준값 대비 시작 시간 회귀 검사"""
+
+    def test_startup_within_budget(self, tmp_path):
+        """모든 시작 시간 항목이 예산 이내"""
+        baseline = json.loads(BASELINE_FILE.read_text(encoding="utf-8"))
+
+        results = run_startup_benchmarks(workdir=tmp_path)
+        metrics = results["metrics"]
+
+        assert metrics[FIRST_WINDOW_METRIC].samples_ms
+        violations = check_budgets(metrics, baseline, tolerance_override())
+        assert not violations, "\n".join(str(v) for v in violations)
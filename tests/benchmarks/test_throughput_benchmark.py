@@ -0,0 +1,119 @@
+"""
+Throughput Benchmark Harness Tests
+Tests for deterministic synthetic corpora and the throughput scenario runner
+
+전체 벤치마크 실행: python -m markitdown_gui benchmark throughput --report report.json
+"""
+
+import json
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from markitdown_gui.core.error_handling.circuit_breaker import (
+    CircuitBreaker, CircuitBreakerConfig, CircuitBreakerError
+)
+from markitdown_gui.core.throughput_benchmark import (
+    CorpusSpec, generate_corpus, percentile, run_scenario, run_throughput_benchmark,
+    CORPUS_MANIFEST
+)
+
+
+SMALL_SPEC = CorpusSpec(files_per_format=2, size_kb=4)
+
+
+@pytest.fixture
+def markitdown_text():
+    """변환 결과는 파일 이름만 (바이너리 코퍼스는 읽지 않음)"""
+    return lambda path: f"# Converted\n\n{Path(path).name}"
+
+
+class TestSyntheticCorpus:
+    """합성 코퍼스 생성 테스트"""
+
+    def test_corpus_is_reproducible(self, tmp_path):
+        """같은 사양이면 바이트 단위로 동일한 코퍼스"""
+        first = generate_corpus(tmp_path / "a", SMALL_SPEC)
+        second = generate_corpus(tmp_path / "b", SMALL_SPEC)
+
+        assert first["digest"] == second["digest"]
+        assert len(first["files"]) == 14
+        assert (tmp_path / "a" / "pdf_0001.pdf").read_bytes() == \
+            (tmp_path / "b" / "pdf_0001.pdf").read_bytes()
+
+    def test_seed_changes_content(self, tmp_path):
+        """다른 시드는 다른 코퍼스"""
+        first = generate_corpus(tmp_path / "a", SMALL_SPEC)
+        second = generate_corpus(tmp_path / "b", CorpusSpec(seed=7, files_per_format=2, size_kb=4))
+
+        assert first["digest"] != second["digest"]
+
+    def test_files_are_well_formed(self, tmp_path):
+        """OOXML 패키지와 PDF 구조가 올바르고 크기가 목표 이상"""
+        manifest = generate_corpus(tmp_path, SMALL_SPEC)
+
+        with zipfile.ZipFile(tmp_path / "docx_0000.docx") as archive:
+            assert "word/document.xml" in archive.namelist()
+        with zipfile.ZipFile(tmp_path / "xlsx_0000.xlsx") as archive:
+            assert "xl/worksheets/sheet1.xml" in archive.namelist()
+        pdf = (tmp_path / "pdf_0000.pdf").read_bytes()
+        assert pdf.startswith(b"%PDF-1.4") and pdf.rstrip().endswith(b"%%EOF")
+        json.loads((tmp_path / "json_0000.json").read_text(encoding="utf-8"))
+
+        text_sizes = [f["size"] for f in manifest["files"] if f["format"] in ("txt", "csv", "html")]
+        assert min(text_sizes) >= 4 * 1024
+
+    def test_unknown_format_rejected(self, tmp_path):
+        """지원하지 않는 형식은 ValueError"""
+        with pytest.raises(ValueError):
+            generate_corpus(tmp_path, CorpusSpec(formats=["txt", "pptx"]))
+
+
+class TestThroughputScenario:
+    """처리량 시나리오 테스트"""
+
+    def test_percentile(self):
+        """최근접 순위 백분위수"""
+        values = [float(v) for v in range(1, 101)]
+
+        assert percentile(values, 0.50) == 50
+        assert percentile(values, 0.95) == 95
+        assert percentile([], 0.5) is None
+
+    def test_warm_scenario_hits_cache(self, tmp_path, fake_markitdown):
+        """warm 시나리오는 사전 실행 결과를 캐시에서 재사용"""
+        generate_corpus(tmp_path / "corpus", SMALL_SPEC)
+
+        result = run_scenario(tmp_path / "corpus", tmp_path / "out", workers=2, cache="warm")
+
+        assert result["files"] == result["succeeded"] == 14
+        assert fake_markitdown.convert.call_count == 14  # 측정 구간에서는 변환기를 호출하지 않음
+        assert set(result["by_format"]) == set(SMALL_SPEC.formats)
+        assert result["latency_ms"]["p50"] <= result["latency_ms"]["p95"]
+
+    def test_report_covers_each_scenario(self, tmp_path, fake_markitdown):
+        """워커 수 x 캐시 상태별 결과와 코퍼스 digest 보고"""
+        report = run_throughput_benchmark(tmp_path / "corpus", tmp_path / "out", SMALL_SPEC,
+                                          worker_counts=(1, 2), isolate=False)
+
+        assert [(s["workers"], s["cache"]) for s in report["scenarios"]] == [
+            (1, "cold"), (1, "warm"), (2, "cold"), (2, "warm")
+        ]
+        manifest = json.loads((tmp_path / "corpus" / CORPUS_MANIFEST).read_text(encoding="utf-8"))
+        assert report["corpus"]["digest"] == manifest["digest"]
+        assert all(s["files_per_sec"] > 0 and s["mb_per_sec"] > 0 for s in report["scenarios"])
+
+
+class TestCircuitBreakerRejection:
+    """열린 회로에서의 호출 거부 (벤치마크 중 발견된 교착 회귀 방지)"""
+
+    def test_open_circuit_rejects_without_deadlock(self):
+        """열린 회로는 잠금 재진입 없이 CircuitBreakerError 발생"""
+        breaker = CircuitBreaker("test", CircuitBreakerConfig(failure_threshold=1,
+                                                              recovery_timeout=60))
+        with pytest.raises(ValueError):
+            breaker.call(lambda: (_ for _ in ()).throw(ValueError("boom")))
+
+        with pytest.raises(CircuitBreakerError):
+            breaker.call(lambda: None)
@@ -6,7 +6,7 @@ import pytest
 import tempfile
 import shutil
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import QSettings
 
@@ -15,6 +15,13 @@ from markitdown_gui.core.file_manager import FileManager
 from markitdown_gui.core.conversion_manager import ConversionManager
 
 
+def pytest_configure(config):
+    """pytest.ini의 [tool:pytest] 섹션은 pytest가 읽지 않으므로 마커는 여기서 등록"""
+    for marker in ("unit: Unit tests", "integration: Integration tests", "slow: Slow tests",
+                   "gui: GUI-related tests", "async: Asynchronous tests"):
+        config.addinivalue_line("markers", marker)
+
+
 @pytest.fixture(scope="session")
 def qapp():
     """Create QApplication instance for tests"""
@@ -25,6 +32,24 @@ def qapp():
     app.quit()
 
 
+@pytest.fixture
+def markitdown_text():
+    """fake_markitdown의 변환 결과 (원본 경로 -> Markdown), 테스트 모듈에서 재정의 가능"""
+    return lambda path: f"# Converted\n\n{Path(path).read_text()}"
+
+
+@pytest.fixture
+def fake_markitdown(markitdown_text):
+    """ConversionEngine이 지연 로드하는 MarkItDown 대체 객체"""
+    instance = MagicMock()
+    instance.convert.side_effect = lambda path, **kwargs: MagicMock(
+        text_content=markitdown_text(path)
+    )
+    with patch('markitdown_gui.core.conversion_engine.MARKITDOWN_AVAILABLE', True), \
+         patch('markitdown_gui.core.conversion_engine.MarkItDown', return_value=instance):
+        yield instance
+
+
 @pytest.fixture
 def temp_dir():
     """Create temporary directory for tests"""
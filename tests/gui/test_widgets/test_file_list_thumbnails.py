@@ -0,0 +1,69 @@
+"""
+GUI tests for FileListWidget thumbnail icons
+"""
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+PIL = pytest.importorskip("PIL")
+from PIL import Image
+
+from markitdown_gui.core import thumbnail_service
+from markitdown_gui.core.constants import THUMBNAIL_ICON_SIZE
+from markitdown_gui.core.models import FileInfo, FileType
+from markitdown_gui.ui.components.file_list_widget import FileListWidget
+
+
+def make_file(path: Path, file_type: FileType) -> FileInfo:
+    return FileInfo(path=path, name=path.name, size=path.stat().st_size,
+                    modified_time=datetime(2024, 1, 1), file_type=file_type)
+
+
+class TestFileListThumbnails:
+    """파일 목록 썸네일 아이콘 테스트"""
+
+    @pytest.fixture
+    def service(self, tmp_path, monkeypatch):
+        service = thumbnail_service.ThumbnailService(cache_dir=tmp_path / "cache", max_workers=2)
+        monkeypatch.setattr(thumbnail_service, "_service", service)
+        yield service
+        service.shutdown(wait=True)
+
+    @pytest.fixture
+    def files(self, tmp_path):
+        image = tmp_path / "photo.png"
+        Image.new('RGB', (300, 200), (10, 120, 200)).save(image)
+        text = tmp_path / "notes.txt"
+        text.write_text("hello", encoding='utf-8')
+        return make_file(image, FileType.PNG), make_file(text, FileType.TXT)
+
+    def test_disabled_by_default(self, qtbot, service, files):
+        """기본값에서는 썸네일을 요청하지 않음"""
+        widget = FileListWidget()
+        qtbot.addWidget(widget)
+        widget.add_files(list(files))
+        qtbot.wait(200)
+        assert service.generated == 0
+        assert widget.file_items[files[0].path].text(1) == "📄"
+
+    def test_visible_image_gets_icon(self, qtbot, service, files):
+        """보이는 이미지 항목만 썸네일 아이콘으로 교체"""
+        widget = FileListWidget()
+        qtbot.addWidget(widget)
+        widget.resize(600, 400)
+        widget.show()
+        widget.set_thumbnails_enabled(True)
+        widget.add_files(list(files))
+
+        image_item = widget.file_items[files[0].path]
+        qtbot.waitUntil(lambda: not image_item.icon(1).isNull(), timeout=5000)
+        assert image_item.text(1) == ""
+        assert widget.file_items[files[1].path].icon(1).isNull()
+        assert service.generated == 1
+        assert service.cached_thumbnail(files[0].path, THUMBNAIL_ICON_SIZE) is not None
+
+        widget.set_thumbnails_enabled(False)
+        assert image_item.icon(1).isNull()
+        assert image_item.text(1) == "📄"
@@ -0,0 +1,87 @@
+"""
+GUI tests for LogWidget
+"""
+
+import threading
+from collections import deque
+
+import pytest
+from PyQt6.QtWidgets import QPlainTextEdit
+
+from markitdown_gui.ui.components.log_widget import LogWidget
+
+
+class TestLogWidget:
+    """LogWidget 링 버퍼/일괄 추가/재필터링 테스트"""
+
+    @pytest.fixture
+    def log_widget(self, qtbot):
+        widget = LogWidget()
+        qtbot.addWidget(widget)
+        return widget
+
+    def test_appends_are_batched(self, log_widget):
+        """추가 직후에는 화면에 반영되지 않고 타이머 주기에 한 번에 반영"""
+        assert isinstance(log_widget.text_edit, QPlainTextEdit)
+        for i in range(3):
+            log_widget.append_log(f"message {i}")
+
+        assert log_widget.text_edit.document().isEmpty()
+        assert log_widget._flush_timer.isActive()
+
+        log_widget._flush_pending()
+        assert log_widget.text_edit.blockCount() == 3
+
+    def test_flush_timer_renders_pending(self, log_widget, qtbot):
+        """이벤트 루프에서 타이머가 대기 로그를 추가"""
+        log_widget.append_log("hello", "WARNING")
+
+        qtbot.waitUntil(lambda: "WARNING: hello" in log_widget.text_edit.toPlainText())
+
+    def test_line_limit(self, log_widget):
+        """표시 줄 수는 max_lines로 제한되고 마지막 로그가 남음"""
+        log_widget.set_max_lines(10)
+        for i in range(50):
+            log_widget.append_log(f"message {i}")
+
+        text = log_widget.get_log_text()
+
+        assert log_widget.text_edit.blockCount() == 10
+        assert text.splitlines()[-1].endswith("message 49")
+
+    def test_level_change_refilters_history(self, log_widget):
+        """필터를 바꾸면 버퍼의 이전 로그도 다시 표시"""
+        log_widget.append_log("debug detail", "DEBUG")
+        log_widget.append_log("started", "INFO")
+        log_widget.append_log("failed", "ERROR")
+
+        assert "debug detail" not in log_widget.get_log_text()
+
+        log_widget.level_combo.setCurrentText("전체")
+        assert "debug detail" in log_widget.get_log_text()
+
+        log_widget.level_combo.setCurrentText("ERROR")
+        lines = log_widget.get_log_text().splitlines()
+        assert len(lines) == 1 and lines[0].endswith("ERROR: failed")
+
+    def test_clear_discards_buffer(self, log_widget):
+        """지우기는 버퍼도 비움"""
+        log_widget.append_log("old")
+        log_widget.clear_log()
+        log_widget.level_combo.setCurrentText("DEBUG")
+
+        assert "old" not in log_widget.get_log_text()
+
+    def test_post_log_from_worker_thread(self, log_widget, qtbot):
+        """다른 스레드의 로그는 큐 연결 시그널로 GUI 스레드에서 반영"""
+        def work():
+            for i in range(20):
+                log_widget.post_log(f"worker {i}", "INFO")
+
+        thread = threading.Thread(target=work)
+        thread.start()
+        thread.join()
+
+        assert log_widget._entries == deque()
+        qtbot.waitUntil(lambda: "worker 19" in log_widget.get_log_text())
+        assert len(log_widget._entries) == 20
@@ -0,0 +1,62 @@
+"""
+GUI tests for PagedTextView
+"""
+
+import pytest
+
+from markitdown_gui.ui.components.paged_text_view import PagedTextView
+
+
+@pytest.fixture
+def large_file(tmp_path):
+    path = tmp_path / "large.log"
+    path.write_text("".join(f"line {i:06d} payload\n" for i in range(100000)), encoding="utf-8")
+    return path
+
+
+class TestPagedTextView:
+    """페이지 단위 뷰어 테스트"""
+
+    @pytest.fixture
+    def view(self, qtbot):
+        view = PagedTextView(max_loaded_pages=3)
+        qtbot.addWidget(view)
+        view.resize(600, 400)
+        view.show()
+        yield view
+        view.close_file()
+
+    def test_opens_first_page_only(self, view, large_file, qtbot):
+        """첫 페이지만 읽고 줄 수는 백그라운드 색인으로 표시"""
+        view.open_file(large_file)
+
+        assert list(view.loaded_pages) == [0]
+        assert view.text_edit.toPlainText().startswith("line 000000")
+        qtbot.waitUntil(lambda: view.line_index is not None, timeout=5000)
+        assert "100,000줄" in view.status_label.text()
+
+    def test_scrolling_keeps_bounded_window(self, view, large_file):
+        """아래로 스크롤하면 다음 페이지를 붙이고 오래된 페이지는 버림"""
+        view.open_file(large_file)
+        scroll_bar = view.text_edit.verticalScrollBar()
+
+        for _ in range(view.page_count + 2):
+            scroll_bar.setValue(scroll_bar.maximum())
+
+        pages = view.loaded_pages
+        assert len(pages) == 3
+        assert pages[-1] == view.page_count - 1
+        expected = "".join(view.paged_file.read_page(i) for i in pages)
+        assert view.text_edit.toPlainText() in (expected, expected.rstrip("\n"))
+
+    def test_goto_line_and_find(self, view, large_file, qtbot):
+        """색인 준비 후 줄 이동, 화면 밖 텍스트는 파일에서 검색"""
+        view.open_file(large_file)
+        qtbot.waitUntil(lambda: view.line_index is not None, timeout=5000)
+
+        assert view.goto_line(15001)
+        assert view.text_edit.textCursor().block().text().startswith("line 015000")
+
+        view.goto_line(1)
+        assert view.find_text("line 099999")
+        assert view.text_edit.textCursor().selectedText() == "line 099999"
@@ -0,0 +1,105 @@
+"""
+GUI tests for PreviewDialog
+"""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from markitdown_gui.ui import preview_dialog
+from markitdown_gui.ui.preview_dialog import PreviewDialog
+
+
+class TestPreviewDialog:
+    """백그라운드 HTML 렌더링 테스트"""
+
+    @pytest.fixture
+    def dialog(self, qtbot):
+        dialog = PreviewDialog()
+        qtbot.addWidget(dialog)
+        yield dialog
+        dialog._stop_render_workers()
+
+    def test_raw_first_then_html(self, dialog, qtbot):
+        """Raw 탭은 즉시, HTML은 작업 스레드에서 렌더링 후 표시"""
+        dialog.set_markdown_content("# Heading\n\nbody text unique-1\n", "doc.md")
+
+        assert dialog.raw_text_edit.toPlainText().startswith("# Heading")
+        qtbot.waitUntil(lambda: "<h1" in dialog.html_content, timeout=5000)
+        assert "unique-1" in dialog.html_text_edit.toPlainText()
+
+    def test_cached_html_shown_immediately(self, dialog, qtbot):
+        """같은 내용을 다시 열면 캐시에서 바로 표시"""
+        content = "# Cached\n\nunique-2\n"
+        dialog.set_markdown_content(content, "a.md")
+        qtbot.waitUntil(lambda: bool(dialog.html_content), timeout=5000)
+
+        dialog.set_markdown_content(content, "a.md")
+
+        assert "<h1" in dialog.html_content
+        assert not dialog._render_workers
+
+    def test_large_document_renders_sections(self, dialog, qtbot):
+        """임계값을 넘는 문서는 선택한 섹션만 렌더링"""
+        content = "".join(f"# Part {i}\n\nline-{i}\n\n" for i in range(20))
+        with patch("markitdown_gui.ui.preview_dialog.PREVIEW_SECTIONED_THRESHOLD", 50):
+            dialog.set_markdown_content(content, "big.md")
+
+        qtbot.waitUntil(lambda: dialog.section_combo.count() == 20, timeout=5000)
+        qtbot.waitUntil(lambda: "line-0" in dialog.html_text_edit.toPlainText(), timeout=5000)
+        assert "line-1" not in dialog.html_text_edit.toPlainText()
+
+        dialog.next_section_btn.click()
+        qtbot.waitUntil(lambda: "line-1" in dialog.html_text_edit.toPlainText(), timeout=5000)
+        assert dialog.html_content == ""
+
+    def test_large_file_opens_paged(self, dialog, qtbot, tmp_path):
+        """임계값을 넘는 출력 파일은 전체를 읽지 않고 페이지 단위로 표시"""
+        path = tmp_path / "huge.md"
+        path.write_text("".join(f"item {i}\n\n" for i in range(60000)), encoding="utf-8")
+        with patch("markitdown_gui.ui.preview_dialog.PAGED_VIEW_THRESHOLD", 1024):
+            dialog.set_markdown_file(path)
+
+        assert dialog.markdown_content == ""
+        assert not dialog.raw_paged_view.isHidden() and dialog.raw_text_edit.isHidden()
+        assert dialog.section_combo.count() > dialog.raw_paged_view.page_count > 1
+        qtbot.waitUntil(lambda: "item 0" in dialog.html_text_edit.toPlainText(), timeout=5000)
+
+        dialog.set_markdown_content("# small", "small.md")
+        assert dialog.raw_paged_view.paged_file is None
+
+    def test_html_export_renders_on_worker(self, dialog, qtbot, tmp_path):
+        """섹션 단위로 보던 문서의 HTML 저장은 전체를 작업 스레드에서 렌더링"""
+        content = "".join(f"# Part {i}\n\nline-{i}\n\n" for i in range(20))
+        with patch("markitdown_gui.ui.preview_dialog.PREVIEW_SECTIONED_THRESHOLD", 50):
+            dialog.set_markdown_content(content, "big.md")
+        qtbot.waitUntil(lambda: dialog.section_combo.count() == 20, timeout=5000)
+        dialog.tab_widget.setCurrentWidget(dialog.html_tab)
+        target = tmp_path / "out.html"
+
+        with patch("markitdown_gui.ui.preview_dialog.QFileDialog.getSaveFileName",
+                   return_value=(str(target), "")), \
+             patch("markitdown_gui.ui.preview_dialog.QMessageBox.information") as info:
+            dialog._save_as()
+            assert not dialog.save_btn.isEnabled()
+            qtbot.waitUntil(lambda: info.called, timeout=5000)
+
+        assert dialog.save_btn.isEnabled()
+        html = target.read_text(encoding="utf-8")
+        assert "line-0" in html and "line-19" in html and html.rstrip().endswith("</html>")
+
+    def test_close_does_not_wait_for_render(self, dialog, qtbot):
+        """닫을 때 진행 중인 렌더링 스레드는 기다리지 않고 떼어냄"""
+        release = threading.Event()
+        rendered = []
+        dialog._start_render(lambda: release.wait(5) and "<p>late</p>",
+                             lambda generation, html: rendered.append(html))
+
+        dialog.done(0)
+
+        assert not dialog._render_workers
+        assert preview_dialog._detached_render_workers
+        release.set()
+        qtbot.waitUntil(lambda: not preview_dialog._detached_render_workers, timeout=5000)
+        assert rendered == []
@@ -0,0 +1,88 @@
+"""
+GUI tests for ProgressWidget
+"""
+
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from PyQt6.QtCore import Qt
+
+from markitdown_gui.core.models import (
+    FileInfo, FileType, ConversionProgress, ConversionProgressStatus, ConversionStatus
+)
+from markitdown_gui.ui.components.progress_widget import ProgressWidget, FileProgressModel
+
+
+def make_file(path: str, size: int = 1024) -> FileInfo:
+    path = Path(path)
+    return FileInfo(path=path, name=path.name, size=size, modified_time=datetime(2024, 1, 1),
+                    file_type=FileType.TXT)
+
+
+class TestProgressWidget:
+    """모델 기반 파일 진행률 목록 테스트"""
+
+    @pytest.fixture
+    def progress_widget(self, qtbot):
+        widget = ProgressWidget()
+        qtbot.addWidget(widget)
+        return widget
+
+    def test_large_batch_starts_without_row_widgets(self, progress_widget):
+        """5만 개 파일도 행 위젯 생성 없이 즉시 시작"""
+        files = [make_file(f"/batch/dir_{i % 100}/doc_{i}.txt") for i in range(50000)]
+
+        start = time.perf_counter()
+        progress_widget.start_progress(len(files), files)
+        elapsed = time.perf_counter() - start
+
+        assert progress_widget.get_file_count() == 50000
+        assert elapsed < 2.0
+
+    def test_duplicate_names_resolved_by_id(self, progress_widget):
+        """같은 이름의 파일도 진행률의 파일 ID로 정확히 구분"""
+        first, second = make_file("/a/report.txt"), make_file("/b/report.txt")
+        progress_widget.start_progress(2, [first, second])
+
+        progress_widget.update_progress(ConversionProgress(
+            total_files=2, completed_files=1, current_file=second.name,
+            current_file_id=second.file_id,
+            current_progress_status=ConversionProgressStatus.PROCESSING
+        ))
+
+        assert progress_widget._get_current_file_path() == str(second.path)
+
+    def test_update_touches_only_changed_row(self, progress_widget):
+        """상태 갱신은 해당 행에 대해서만 dataChanged 발생"""
+        files = [make_file(f"/batch/doc_{i}.txt") for i in range(1000)]
+        progress_widget.start_progress(len(files), files)
+        model = progress_widget._file_model
+        changed = []
+        model.dataChanged.connect(lambda top, bottom: changed.append((top.row(), bottom.row())))
+
+        target = files[700]
+        target.conversion_status = ConversionStatus.FAILED
+        target.progress_status = ConversionProgressStatus.ERROR
+        progress_widget.update_file_progress(target)
+
+        assert changed == [(700, 700)]
+        status_index = model.index(700, 1)
+        assert model.data(status_index) == ConversionProgressStatus.ERROR.value
+        assert model.data(status_index, Qt.ItemDataRole.ForegroundRole).name() == "#f44336"
+
+    def test_unknown_file_is_ignored(self, progress_widget):
+        """목록에 없는 파일 갱신은 무시"""
+        progress_widget.start_progress(1, [make_file("/a/one.txt")])
+
+        assert progress_widget._file_model.update_file(make_file("/a/other.txt")) is False
+        progress_widget.update_file_progress(make_file("/a/other.txt"))
+
+    def test_size_column_sorts_numerically(self, qtbot):
+        """크기 열은 표시 문자열이 아닌 바이트 수로 정렬"""
+        model = FileProgressModel()
+        model.set_files([make_file("/a/big.txt", 2 * 1024 * 1024), make_file("/a/small.txt", 900)])
+
+        assert model.data(model.index(0, 3), FileProgressModel.SORT_ROLE) == 2 * 1024 * 1024
+        assert model.data(model.index(1, 3)) == "900 B"
@@ -0,0 +1,87 @@
+"""
+GUI tests for SearchPanel and preview match highlighting
+"""
+
+import pytest
+
+from markitdown_gui.core.search_index import FTS5_AVAILABLE, SearchIndex
+from markitdown_gui.ui.components.search_panel import SearchPanel
+from markitdown_gui.ui.preview_dialog import PreviewDialog
+
+
+pytestmark = pytest.mark.skipif(not FTS5_AVAILABLE, reason="SQLite FTS5 not available")
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = SearchIndex(tmp_path / "index.db")
+    yield index
+    index.close()
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    root = tmp_path / "output"
+    root.mkdir()
+    (root / "budget.md").write_text("# 예산 보고서\n\n올해 예산을 검토했습니다.\n", encoding='utf-8')
+    (root / "minutes.md").write_text("# 회의록\n\n예산 회의. 예산 재검토.\n", encoding='utf-8')
+    (root / "other.md").write_text("# 기타\n\n관련 없음\n", encoding='utf-8')
+    return root
+
+
+class TestSearchPanel:
+    """전문 검색 패널 테스트"""
+
+    def test_sync_then_search(self, qtbot, index, corpus):
+        """색인 갱신 후 검색 결과 표시"""
+        panel = SearchPanel(index, root=corpus)
+        qtbot.addWidget(panel)
+
+        panel.sync_index()
+        qtbot.waitUntil(lambda: panel.sync_btn.isEnabled(), timeout=5000)
+        assert index.document_count() == 3
+
+        panel.query_input.setText("예산")
+        qtbot.waitUntil(lambda: panel.result_list.count() == 2, timeout=2000)
+        assert "2건" in panel.status_label.text()
+
+        with qtbot.waitSignal(panel.open_requested) as blocker:
+            panel.result_list.itemActivated.emit(panel.result_list.item(0))
+        path, query = blocker.args
+        assert path.name == "budget.md"
+        assert query == "예산"
+
+    def test_no_results(self, qtbot, index, corpus):
+        """결과가 없으면 안내 문구"""
+        index.sync_directory(corpus)
+        panel = SearchPanel(index, root=corpus)
+        qtbot.addWidget(panel)
+
+        panel.query_input.setText("없는단어")
+        panel.run_search()
+        assert panel.result_list.count() == 0
+        assert panel.status_label.text() == "검색 결과 없음"
+
+
+class TestPreviewHighlight:
+    """미리보기 모든 일치 구간 강조 테스트"""
+
+    def test_highlights_all_matches(self, qtbot, corpus):
+        """Raw 탭의 모든 일치 구간 강조 후 첫 위치로 이동"""
+        dialog = PreviewDialog()
+        qtbot.addWidget(dialog)
+        dialog.set_markdown_file(corpus / "minutes.md")
+
+        assert dialog.highlight_matches(["예산"]) == 2
+        selections = dialog.raw_text_edit.extraSelections()
+        assert [s.cursor.selectedText() for s in selections] == ["예산", "예산"]
+        assert dialog.raw_text_edit.textCursor().selectedText() == "예산"
+
+    def test_new_file_clears_terms(self, qtbot, corpus):
+        """다른 파일을 열면 이전 검색어는 적용하지 않음"""
+        dialog = PreviewDialog()
+        qtbot.addWidget(dialog)
+        dialog.set_markdown_file(corpus / "minutes.md")
+        dialog.highlight_matches(["예산"])
+        dialog.set_markdown_file(corpus / "budget.md")
+        assert dialog._highlight_terms == []
@@ -0,0 +1,105 @@
+"""
+스크린 리더 알림 집계 테스트
+"""
+
+import time
+
+from PyQt6.QtCore import QObject
+
+from markitdown_gui.core.screen_reader_support import (
+    Announcement, AnnouncementAggregator, AnnouncementPriority, AnnouncementQueue,
+    AnnouncementWorker, ScreenReaderAPI
+)
+
+
+class RecordingBridge(QObject):
+    """announce 호출을 기록하는 브리지"""
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def announce(self, message, priority="polite", widget=None, context=""):
+        self.messages.append((message, context))
+        return True
+
+
+class RecordingAPI(ScreenReaderAPI):
+    """호출 시각을 기록하는 음성 엔진"""
+
+    def __init__(self):
+        self.calls = []
+
+    def announce(self, message, priority):
+        self.calls.append((time.monotonic(), message))
+        return True
+
+    def stop_speech(self):
+        return True
+
+    def is_available(self):
+        return True
+
+    def get_name(self):
+        return "recording"
+
+
+class TestAnnouncementQueue:
+    """대체 가능한 알림 큐 테스트"""
+
+    def test_same_context_superseded(self):
+        """같은 컨텍스트의 읽지 않은 알림은 최신 것만 남음"""
+        queue = AnnouncementQueue()
+        queue.enqueue(Announcement("1개 변환됨", AnnouncementPriority.POLITE, context="progress"))
+        queue.enqueue(Announcement("로그", AnnouncementPriority.POLITE))
+        queue.enqueue(Announcement("2개 변환됨", AnnouncementPriority.POLITE, context="progress"))
+
+        messages = [queue.dequeue().message for _ in range(queue.size())]
+        assert messages == ["로그", "2개 변환됨"]
+
+
+class TestAnnouncementAggregator:
+    """진행 요약 알림 테스트"""
+
+    def test_flood_collapsed_into_summaries(self, qtbot):
+        """파일마다 알리지 않고 주기적으로 요약"""
+        bridge = RecordingBridge()
+        aggregator = AnnouncementAggregator(bridge, interval_ms=50)
+        aggregator.start(5000)
+        for i in range(1240):
+            aggregator.record(succeeded=0 if i < 3 else 1, failed=1 if i < 3 else 0)
+
+        qtbot.waitUntil(lambda: len(bridge.messages) == 2, timeout=2000)
+        qtbot.wait(150)
+        aggregator.finish()
+
+        assert [message for message, _ in bridge.messages] == [
+            "5,000개 파일 변환 시작",
+            "5,000개 중 1,240개 변환됨, 3개 실패",
+            "변환 완료. 5,000개 중 1,240개 변환됨, 3개 실패",
+        ]
+        assert {context for _, context in bridge.messages} == {AnnouncementAggregator.SUMMARY_CONTEXT}
+        assert not aggregator.is_active
+
+
+class TestAnnouncementWorker:
+    """음성 엔진 호출 간격 제한 테스트"""
+
+    def test_backend_calls_rate_limited(self, qtbot):
+        """호출 사이 간격을 지키고 기다리는 동안 대체된 알림은 건너뜀"""
+        api = RecordingAPI()
+        queue = AnnouncementQueue()
+        worker = AnnouncementWorker(api, queue, min_interval_ms=200)
+        worker.start()
+        try:
+            for i in range(20):
+                queue.enqueue(Announcement(f"{i}개 변환됨", AnnouncementPriority.POLITE, context="progress"))
+            qtbot.waitUntil(lambda: queue.size() == 0 and len(api.calls) >= 1, timeout=3000)
+            qtbot.wait(300)
+        finally:
+            worker.stop()
+
+        assert [message for _, message in api.calls][-1] == "19개 변환됨"
+        assert len(api.calls) <= 2
+        gaps = [b[0] - a[0] for a, b in zip(api.calls, api.calls[1:])]
+        assert all(gap >= 0.19 for gap in gaps)
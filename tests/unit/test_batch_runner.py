@@ -0,0 +1,195 @@
+"""
+Batch Runner Unit Tests
+Tests for the headless batch runner and CLI entry point
+"""
+
+import io
+import os
+import json
+import time
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from markitdown_gui import cli
+from markitdown_gui.core.batch_runner import BatchRunner, BatchStatistics, STATUS_UP_TO_DATE
+from markitdown_gui.core.config_manager import ConfigManager
+from markitdown_gui.core.utils import create_file_info, reserve_unique_output_path
+
+
+@pytest.fixture
+def source_dir(tmp_path):
+    """변환할 텍스트 파일 디렉토리"""
+    directory = tmp_path / "source"
+    directory.mkdir()
+    for i in range(4):
+        (directory / f"doc_{i}.txt").write_text(f"content {i}\n")
+    return directory
+
+
+@pytest.fixture
+def config_manager(tmp_path):
+    return ConfigManager(tmp_path / "config")
+
+
+def make_runner(config_manager, tmp_path, **kwargs):
+    records = []
+    runner = BatchRunner(config_manager, output_directory=tmp_path / "output",
+                         summary_interval=0, sink=records.append, **kwargs)
+    return runner, records
+
+
+class TestBatchRunner:
+    """BatchRunner 테스트"""
+
+    def test_run_emits_file_records_and_final_summary(self, config_manager, source_dir,
+                                                      tmp_path, fake_markitdown):
+        """파일별 레코드와 최종 요약 출력"""
+        runner, records = make_runner(config_manager, tmp_path, workers=2)
+
+        stats = runner.run([source_dir])
+
+        file_records = [r for r in records if r["type"] == "file"]
+        assert len(file_records) == 4
+        assert all(r["status"] == "success" for r in file_records)
+        assert all(Path(r["output_path"]).exists() for r in file_records)
+        assert records[-1]["type"] == "summary" and records[-1]["final"]
+        assert stats.succeeded == 4 and stats.failed == 0
+
+    def test_incremental_skips_up_to_date_outputs(self, config_manager, source_dir,
+                                                  tmp_path, fake_markitdown):
+        """증분 모드는 최신 출력이 있는 파일을 건너뜀"""
+        runner, _ = make_runner(config_manager, tmp_path)
+        runner.run([source_dir])
+
+        # 하나의 원본만 수정
+        changed = source_dir / "doc_0.txt"
+        future = time.time() + 10
+        os.utime(changed, (future, future))
+
+        runner, records = make_runner(config_manager, tmp_path, incremental=True)
+        stats = runner.run([source_dir])
+
+        skipped = [r for r in records if r.get("status") == STATUS_UP_TO_DATE]
+        converted = [r for r in records if r.get("status") == "success"]
+        assert len(skipped) == 3
+        assert [r["path"] for r in converted] == [str(changed.resolve())]
+        # 오래된 출력은 새 이름이 아니라 같은 경로에 갱신됨
+        assert converted[0]["output_path"] == str(
+            runner.expected_output_path(create_file_info(changed.resolve())))
+        assert stats.up_to_date == 3 and stats.total_files == 1
+
+    def test_same_stem_sources_keep_separate_outputs(self, config_manager, tmp_path,
+                                                     fake_markitdown):
+        """줄기가 같은 원본은 각자의 출력으로 최신 여부를 판단하고 갱신"""
+        source = tmp_path / "src"
+        source.mkdir()
+        (source / "a1.csv").write_text("from csv\n")
+        (source / "a1.txt").write_text("from txt\n")
+        runner, records = make_runner(config_manager, tmp_path, workers=2)
+        runner.run([source])
+        first = {r["path"]: r["output_path"] for r in records if r["type"] == "file"}
+        assert len(set(first.values())) == 2
+
+        changed = (source / "a1.txt").resolve()
+        future = time.time() + 10
+        os.utime(changed, (future, future))
+        runner, records = make_runner(config_manager, tmp_path, incremental=True)
+        runner.run([source])
+
+        by_path = {r["path"]: r for r in records if r["type"] == "file"}
+        assert by_path[str(changed)]["status"] == "success"
+        assert by_path[str(changed)]["output_path"] == first[str(changed)]
+        csv_record = by_path[str((source / "a1.csv").resolve())]
+        assert csv_record["status"] == STATUS_UP_TO_DATE
+        assert csv_record["output_path"] == first[str((source / "a1.csv").resolve())]
+        assert "from csv" in Path(csv_record["output_path"]).read_text(encoding="utf-8")
+
+    def test_parallel_reservations_get_distinct_names(self, tmp_path):
+        """동시에 예약해도 같은 출력 이름을 받지 않음"""
+        base = tmp_path / "out" / "doc.md"
+        base.parent.mkdir()
+        barrier = threading.Barrier(8)
+        reserved = []
+
+        def reserve():
+            barrier.wait()
+            reserved.append(reserve_unique_output_path(base))
+
+        threads = [threading.Thread(target=reserve) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(set(reserved)) == 8
+        assert base in reserved
+
+    def test_engine_failure_is_reported_per_file(self, config_manager, source_dir, tmp_path):
+        """엔진 생성 실패는 배치를 중단하지 않고 파일별 실패 레코드로 보고"""
+        runner, records = make_runner(config_manager, tmp_path, workers=2)
+
+        with patch('markitdown_gui.core.batch_runner.ConversionEngine',
+                   side_effect=OSError("read-only output")):
+            stats = runner.run([source_dir])
+
+        file_records = [r for r in records if r["type"] == "file"]
+        assert [r["status"] for r in file_records] == ["failed"] * 4
+        assert all("read-only output" in r["error"] for r in file_records)
+        assert stats.failed == 4
+
+    def test_duplicate_directories_are_scanned_once(self, config_manager, source_dir, tmp_path):
+        """중복 디렉토리의 파일은 한 번만 포함"""
+        runner, _ = make_runner(config_manager, tmp_path)
+
+        files = runner.scan([source_dir, source_dir])
+
+        assert len(files) == 4
+
+    def test_workers_default_from_config(self, config_manager, tmp_path):
+        """워커 수 기본값은 설정의 max_workers"""
+        config_manager.get_config().max_workers = 5
+        runner, _ = make_runner(config_manager, tmp_path)
+
+        assert runner.workers == 5
+
+    def test_statistics_throughput(self):
+        """처리량 계산"""
+        stats = BatchStatistics(total_files=10, completed=5, bytes_processed=500,
+                                start_time=time.monotonic() - 5)
+
+        record = stats.to_record()
+
+        assert record["files_per_sec"] == pytest.approx(1.0, rel=0.05)
+        assert record["eta"] == pytest.approx(5.0, rel=0.05)
+
+
+class TestBatchCli:
+    """batch 명령 테스트"""
+
+    def test_batch_command_writes_jsonl(self, tmp_path, source_dir, fake_markitdown):
+        """stdout에는 JSON 레코드만 출력"""
+        stdout = io.StringIO()
+        argv = ["--config-dir", str(tmp_path / "config"), "batch", str(source_dir),
+                "--output", str(tmp_path / "output"), "--workers", "2",
+                "--summary-interval", "0"]
+
+        with patch.object(cli, "_setup_headless_logging"):
+            exit_code = cli.main(argv, stdout=stdout)
+
+        records = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        assert exit_code == cli.EXIT_OK
+        assert sum(1 for r in records if r["type"] == "file") == 4
+        assert records[-1]["final"]
+
+    def test_missing_directory_is_usage_error(self, tmp_path):
+        """존재하지 않는 디렉토리는 사용 오류"""
+        exit_code = cli.main(["batch", str(tmp_path / "missing")], stdout=io.StringIO())
+
+        assert exit_code == cli.EXIT_USAGE
+
+    def test_no_command_prints_help(self):
+        """명령이 없으면 도움말과 사용 오류"""
+        assert cli.main([], stdout=io.StringIO()) == cli.EXIT_USAGE
@@ -0,0 +1,185 @@
+"""
+Conversion Engine Unit Tests
+Tests for the Qt-free conversion pipeline
+"""
+
+import sys
+import asyncio
+import warnings
+import threading
+import subprocess
+from pathlib import Path
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from markitdown_gui.core.conversion_engine import (
+    ConversionEngine, ConversionEvent, ConversionEventType, capture_warnings
+)
+from markitdown_gui.core.models import FileInfo, FileType, ConversionStatus
+
+
+def make_file_info(path: Path) -> FileInfo:
+    stat = path.stat()
+    return FileInfo(
+        path=path,
+        name=path.name,
+        size=stat.st_size,
+        modified_time=datetime.fromtimestamp(stat.st_mtime),
+        file_type=FileType.TXT
+    )
+
+
+@pytest.fixture
+def text_files(tmp_path):
+    """변환할 텍스트 파일들"""
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    files = []
+    for i in range(3):
+        path = source_dir / f"doc_{i}.txt"
+        path.write_text(f"content {i}\n")
+        files.append(make_file_info(path))
+    return files
+
+
+@pytest.fixture
+def engine(tmp_path):
+    return ConversionEngine(tmp_path / "output", save_to_original_dir=False)
+
+
+class TestConversionEngine:
+    """ConversionEngine 테스트"""
+
+    def test_engine_does_not_import_qt(self):
+        """새 인터프리터에서 엔진을 import해도 PyQt6가 로드되지 않음 (간접 import 포함)"""
+        code = ("import sys, markitdown_gui.core.conversion_engine; "
+                "assert not [m for m in sys.modules if m.split('.')[0] == 'PyQt6'], "
+                "sorted(m for m in sys.modules if m.startswith('PyQt6'))")
+        root = Path(__file__).resolve().parents[2]
+        subprocess.run([sys.executable, "-c", code], cwd=root, check=True)
+
+    def test_run_converts_and_writes(self, engine, text_files, fake_markitdown):
+        """배치 변환 및 파일 저장"""
+        results = engine.run(text_files)
+
+        assert len(results) == 3
+        assert all(r.status == ConversionStatus.SUCCESS for r in results)
+        for result in results:
+            assert result.output_path.exists()
+            assert "# Converted" in result.output_path.read_text(encoding='utf-8')
+
+    def test_callback_events_in_order(self, engine, text_files, fake_markitdown):
+        """콜백 이벤트 순서"""
+        events = []
+        engine.add_listener(events.append)
+
+        engine.run(text_files[:1])
+
+        types = [e.type for e in events]
+        assert types == [
+            ConversionEventType.PROGRESS,
+            ConversionEventType.FILE_STARTED,
+            ConversionEventType.PROGRESS,
+            ConversionEventType.FILE_COMPLETED,
+            ConversionEventType.PROGRESS,
+            ConversionEventType.BATCH_COMPLETED,
+        ]
+        assert events[-1].is_terminal
+
+    def test_listener_errors_do_not_abort(self, engine, text_files, fake_markitdown):
+        """리스너 오류는 변환을 중단하지 않음"""
+        engine.add_listener(MagicMock(side_effect=RuntimeError("boom")))
+
+        results = engine.run(text_files)
+
+        assert len(results) == 3
+
+    def test_iter_events(self, engine, text_files, fake_markitdown):
+        """동기 이터레이터 API"""
+        events = list(engine.iter_events(text_files))
+
+        completed = [e for e in events if e.type == ConversionEventType.FILE_COMPLETED]
+        assert len(completed) == 3
+        assert events[-1].type == ConversionEventType.BATCH_COMPLETED
+
+    def test_async_stream(self, engine, text_files, fake_markitdown):
+        """비동기 이터레이터 API"""
+        async def collect():
+            return [event async for event in engine.stream(text_files)]
+
+        events = asyncio.run(collect())
+
+        assert events[-1].type == ConversionEventType.BATCH_COMPLETED
+        assert len(events[-1].results) == 3
+
+    def test_cancel_stops_batch(self, engine, text_files, fake_markitdown):
+        """취소 시 남은 파일은 변환하지 않음"""
+        def cancel_after_first(event: ConversionEvent):
+            if event.type == ConversionEventType.FILE_COMPLETED:
+                engine.cancel()
+
+        engine.add_listener(cancel_after_first)
+        events = []
+        engine.add_listener(events.append)
+
+        results = engine.run(text_files)
+
+        assert len(results) == 1
+        assert events[-1].type == ConversionEventType.CANCELLED
+
+    def test_convert_file_without_run(self, engine, text_files, fake_markitdown):
+        """run() 없이 단일 파일 변환"""
+        result = engine.convert_file(text_files[0])
+
+        assert result.is_success
+
+    def test_unavailable_markitdown_reports_error(self, engine, text_files):
+        """MarkItDown이 없으면 오류 이벤트"""
+        events = []
+        engine.add_listener(events.append)
+
+        with patch('markitdown_gui.core.conversion_engine.MARKITDOWN_AVAILABLE', False):
+            results = engine.run(text_files)
+
+        assert results == []
+        assert events[-1].type == ConversionEventType.ERROR
+
+    def test_saved_outputs_are_indexed(self, tmp_path, text_files, fake_markitdown):
+        """저장한 출력은 바로 전문 검색 색인에 반영"""
+        from markitdown_gui.core.search_index import FTS5_AVAILABLE, SearchIndex
+        if not FTS5_AVAILABLE:
+            pytest.skip("SQLite FTS5 not available")
+        index = SearchIndex(tmp_path / "index.db")
+        engine = ConversionEngine(tmp_path / "output", save_to_original_dir=False, search_index=index)
+
+        results = engine.run(text_files)
+
+        hits = index.search("content", root=tmp_path / "output")
+        assert {hit.path for hit in hits} == {r.output_path for r in results}
+        assert all(hit.title == "Converted" for hit in hits)
+        index.close()
+
+    def test_warning_capture_is_per_thread(self):
+        """동시에 수집해도 경고는 발생한 스레드에만 모이고 전역 필터는 그대로"""
+        with capture_warnings():
+            pass
+        filters_before = list(warnings.filters)
+        barrier = threading.Barrier(8)
+        captured = {}
+
+        def convert(i):
+            with capture_warnings() as records:
+                barrier.wait()
+                warnings.warn(f"FontBBox from font descriptor {i}")
+            captured[i] = [str(record.message) for record in records]
+
+        threads = [threading.Thread(target=convert, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert captured == {i: [f"FontBBox from font descriptor {i}"] for i in range(8)}
+        assert warnings.filters == filters_before
@@ -0,0 +1,190 @@
+"""
+Conversion Service Unit Tests
+Tests for the persistent job queue and the local HTTP conversion service
+"""
+
+import json
+import time
+import threading
+import http.client
+import urllib.error
+import urllib.request
+from unittest.mock import patch
+
+import pytest
+
+from markitdown_gui.core.config_manager import ConfigManager
+from markitdown_gui.core.conversion_service import ConversionService, ConversionServer
+from markitdown_gui.core.job_queue import JobQueue, JobItemStatus
+
+
+@pytest.fixture
+def queue(tmp_path):
+    job_queue = JobQueue(tmp_path / "jobs.sqlite3")
+    yield job_queue
+    job_queue.close()
+
+
+@pytest.fixture
+def server(tmp_path, fake_markitdown):
+    """localhost 임의 포트에서 실행 중인 변환 서버"""
+    service = ConversionService(ConfigManager(tmp_path / "config"), tmp_path / "data", workers=2)
+    http_server = ConversionServer(service, "127.0.0.1", 0)
+    service.start()
+    thread = threading.Thread(target=http_server.serve_forever, daemon=True)
+    thread.start()
+    yield http_server
+    http_server.shutdown()
+    http_server.server_close()
+    service.close()
+
+
+def request(server, method, path, body=None, content_type="application/json"):
+    data = json.dumps(body).encode() if isinstance(body, dict) else body
+    req = urllib.request.Request(server.url + path, data=data, method=method)
+    if data is not None:
+        req.add_header("Content-Type", content_type)
+    try:
+        with urllib.request.urlopen(req, timeout=10) as response:
+            return response.status, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.read()
+
+
+def wait_for_job(server, job_id):
+    """이벤트 스트림으로 작업 종료까지 대기"""
+    status, body = request(server, "GET", f"/jobs/{job_id}/events")
+    assert status == 200
+    return [json.loads(line) for line in body.decode().splitlines()]
+
+
+class TestJobQueue:
+    """JobQueue 테스트"""
+
+    def test_claim_in_submission_order(self, queue, tmp_path):
+        """제출 순서대로 항목을 한 번씩만 가져감"""
+        first = queue.submit([tmp_path / "a.txt", tmp_path / "b.txt"])
+        second = queue.submit([tmp_path / "c.txt"])
+
+        claimed = [queue.claim_next() for _ in range(4)]
+
+        assert [(c[0], c[1]) for c in claimed[:3]] == [(first, 0), (first, 1), (second, 0)]
+        assert claimed[3] is None
+
+    def test_job_status_is_derived_from_items(self, queue, tmp_path):
+        """작업 상태는 항목 상태에서 파생"""
+        job_id = queue.submit([tmp_path / "a.txt"])
+        assert queue.get_job(job_id)["status"] == "queued"
+
+        _, idx, _ = queue.claim_next()
+        assert queue.get_job(job_id)["status"] == "running"
+
+        queue.complete_item(job_id, idx, JobItemStatus.SUCCESS, output_path=tmp_path / "a.md")
+        job = queue.get_job(job_id)
+        assert job["status"] == "completed"
+        assert job["counts"]["success"] == 1
+
+    def test_recover_requeues_running_items(self, tmp_path):
+        """재시작 시 진행 중이던 항목을 다시 대기 상태로"""
+        db_path = tmp_path / "jobs.sqlite3"
+        queue = JobQueue(db_path)
+        job_id = queue.submit([tmp_path / "a.txt"])
+        queue.claim_next()
+        queue.close()
+
+        reopened = JobQueue(db_path)
+        try:
+            assert reopened.recover() == 1
+            assert reopened.claim_next()[0] == job_id
+        finally:
+            reopened.close()
+
+    def test_cancel_pending_items(self, queue, tmp_path):
+        """대기 항목 취소"""
+        job_id = queue.submit([tmp_path / "a.txt", tmp_path / "b.txt"])
+
+        assert queue.cancel(job_id)
+        assert queue.get_job(job_id)["status"] == "cancelled"
+        assert queue.claim_next() is None
+        assert not queue.cancel("0" * 32)
+
+
+class TestConversionServer:
+    """HTTP API 테스트"""
+
+    def test_submit_paths_and_fetch_markdown(self, server, tmp_path):
+        """경로 제출 후 결과 조회"""
+        source = tmp_path / "doc.txt"
+        source.write_text("hello service\n")
+
+        status, body = request(server, "POST", "/jobs", {"paths": [str(source)]})
+        assert status == 202
+        job_id = json.loads(body)["id"]
+
+        events = wait_for_job(server, job_id)
+        assert events[-1]["status"] == "completed"
+        assert events[-1]["counts"]["success"] == 1
+
+        status, body = request(server, "GET", f"/jobs/{job_id}/items/0/markdown")
+        assert status == 200
+        assert "hello service" in body.decode()
+
+    def test_upload_bytes(self, server):
+        """업로드한 바이트 변환"""
+        status, body = request(server, "POST", "/jobs/upload?filename=note.txt",
+                               b"uploaded content\n", "application/octet-stream")
+        assert status == 202
+        job_id = json.loads(body)["id"]
+
+        wait_for_job(server, job_id)
+        status, body = request(server, "GET", f"/jobs/{job_id}/items/0/markdown")
+        assert "uploaded content" in body.decode()
+        # 작업이 끝나면 업로드 파일 삭제 (종료 상태 기록 직후 워커가 삭제)
+        deadline = time.monotonic() + 5
+        while any(server.service.upload_dir.iterdir()) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert not any(server.service.upload_dir.iterdir())
+
+    def test_invalid_requests(self, server, tmp_path):
+        """잘못된 요청은 JSON 오류 응답"""
+        status, body = request(server, "POST", "/jobs", {"paths": [str(tmp_path / "missing.txt")]})
+        assert status == 400
+        assert "error" in json.loads(body)
+
+        status, _ = request(server, "GET", "/jobs/" + "0" * 32)
+        assert status == 404
+
+        status, _ = request(server, "POST", "/jobs/upload", b"data", "application/octet-stream")
+        assert status == 400
+
+        # JSON이지만 객체가 아닌 본문
+        for body in (b"[]", b'"x"', b"1"):
+            status, body = request(server, "POST", "/jobs", body)
+            assert status == 400
+            assert "error" in json.loads(body)
+
+    def test_request_body_limits(self, server):
+        """큰 JSON 본문은 413, 숫자가 아닌 Content-Length는 400"""
+        with patch("markitdown_gui.core.conversion_service.SERVICE_MAX_JSON_BODY", 16):
+            status, body = request(server, "POST", "/jobs", {"paths": ["x" * 64]})
+        assert status == 413
+        assert "error" in json.loads(body)
+
+        host, port = server.server_address[:2]
+        for length in ("abc", "-1", "1_0"):
+            conn = http.client.HTTPConnection(host, port, timeout=10)
+            conn.putrequest("POST", "/jobs")
+            conn.putheader("Content-Length", length)
+            conn.endheaders()
+            response = conn.getresponse()
+            assert response.status == 400
+            assert "error" in json.loads(response.read())
+            conn.close()
+
+    def test_health(self, server):
+        """상태 확인"""
+        status, body = request(server, "GET", "/health")
+        payload = json.loads(body)
+        assert status == 200
+        assert payload["status"] == "ok"
+        assert payload["workers"] == 2
@@ -0,0 +1,187 @@
+"""
+Distributed Conversion Unit Tests
+Tests for lease-based work distribution over a shared job directory
+"""
+
+import os
+import json
+import time
+import threading
+from pathlib import Path
+
+from unittest.mock import patch
+
+import pytest
+
+from markitdown_gui.core.config_manager import ConfigManager
+from markitdown_gui.core.distributed import (
+    JobDirectory, DistributedWorker, create_batch, merge_report, REPORT_FILE
+)
+
+
+@pytest.fixture
+def batch_dir(tmp_path):
+    """6개 항목을 가진 공유 배치"""
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    paths = []
+    for i in range(6):
+        path = source_dir / f"doc_{i}.txt"
+        path.write_text(f"content {i}\n")
+        paths.append(path)
+
+    job_dir = tmp_path / "job"
+    create_batch(job_dir, paths, output_directory=tmp_path / "output")
+    return job_dir
+
+
+def make_worker(job_dir, tmp_path, node_id, **kwargs):
+    return DistributedWorker(job_dir, ConfigManager(tmp_path / "config"), node_id=node_id,
+                             workers=1, poll_interval=0.05, heartbeat_interval=0.05, **kwargs)
+
+
+class TestJobDirectory:
+    """JobDirectory 상태 전이 테스트"""
+
+    def test_create_batch_refuses_existing(self, batch_dir, tmp_path):
+        """기존 배치 디렉토리에는 다시 생성하지 않음"""
+        with pytest.raises(FileExistsError):
+            create_batch(batch_dir, [], output_directory=tmp_path / "output")
+
+    def test_each_item_is_claimed_once(self, batch_dir):
+        """여러 노드가 경쟁해도 항목은 한 번씩만 임대"""
+        nodes = [JobDirectory(batch_dir, f"node-{i}") for i in range(3)]
+        claimed = []
+        lock = threading.Lock()
+
+        def drain(node):
+            while True:
+                lease = node.claim()
+                if lease is None:
+                    return
+                with lock:
+                    claimed.append(lease.item_id)
+
+        threads = [threading.Thread(target=drain, args=(node,)) for node in nodes]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(claimed) == sorted(set(claimed))
+        assert len(claimed) == 6
+
+    def test_commit_fails_after_lease_is_reclaimed(self, batch_dir):
+        """만료 회수된 임대의 결과는 커밋되지 않음"""
+        slow = JobDirectory(batch_dir, "slow")
+        lease = slow.claim()
+        past = time.time() - 1000
+        os.utime(lease.path, (past, past))
+
+        other = JobDirectory(batch_dir, "other")
+        assert other.reclaim_expired(lease_timeout=60) == 1
+
+        assert not slow.commit(lease, {"status": "success"})
+        assert not list(slow.results_dir.glob(f"{lease.name}*"))
+        assert not slow.heartbeat(lease)
+
+    def test_fresh_leases_are_not_reclaimed(self, batch_dir):
+        """하트비트 중인 임대는 회수하지 않음"""
+        node = JobDirectory(batch_dir, "node")
+        node.claim()
+
+        assert node.reclaim_expired(lease_timeout=60) == 0
+
+    def test_release_returns_lease_to_pending(self, batch_dir):
+        """반환한 임대는 바로 다시 임대 가능"""
+        node = JobDirectory(batch_dir, "node")
+        lease = node.claim()
+
+        assert node.release(lease)
+        assert not node.release(lease)
+        assert node.count(node.leased_dir) == 0
+        assert node.count(node.pending_dir) == 6
+
+
+class TestDistributedWorker:
+    """DistributedWorker 테스트"""
+
+    def test_nodes_cooperatively_drain_batch(self, batch_dir, tmp_path, fake_markitdown):
+        """여러 노드가 중복 없이 배치를 처리하고 단일 보고서 생성"""
+        workers = [make_worker(batch_dir, tmp_path, f"node-{i}") for i in range(2)]
+        threads = [threading.Thread(target=worker.run) for worker in workers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+
+        report = merge_report(batch_dir)
+        assert report["complete"]
+        assert report["counts"] == {"success": 6}
+        assert [item["index"] for item in report["items"]] == list(range(6))
+        assert sum(w.stats.committed for w in workers) == 6
+        assert (batch_dir / REPORT_FILE).exists()
+
+    def test_recovers_items_from_crashed_node(self, batch_dir, tmp_path, fake_markitdown):
+        """중단된 노드의 임대는 만료 후 다른 노드가 처리"""
+        crashed = JobDirectory(batch_dir, "crashed")
+        lease = crashed.claim()
+        past = time.time() - 1000
+        os.utime(lease.path, (past, past))
+
+        worker = make_worker(batch_dir, tmp_path, "survivor", lease_timeout=60)
+        stats = worker.run()
+
+        report = json.loads((batch_dir / REPORT_FILE).read_text(encoding="utf-8"))
+        assert report["complete"]
+        assert stats.reclaimed == 1
+        assert report["items_per_node"] == {"survivor": 6}
+
+    def test_same_stem_sources_get_distinct_outputs(self, tmp_path, fake_markitdown):
+        """줄기가 같은 원본(a1.csv, a1.txt)의 출력은 서로 덮어쓰지 않음"""
+        source_dir = tmp_path / "src"
+        source_dir.mkdir()
+        paths = [source_dir / "a1.csv", source_dir / "a1.txt"]
+        for path in paths:
+            path.write_text(f"from {path.suffix}\n")
+        job_dir = tmp_path / "job"
+        create_batch(job_dir, paths, output_directory=tmp_path / "dout")
+
+        make_worker(job_dir, tmp_path, "node").run()
+
+        report = merge_report(job_dir)
+        outputs = [Path(item["output_path"]) for item in report["items"]]
+        assert len(set(outputs)) == 2
+        assert "from .csv" in outputs[0].read_text(encoding="utf-8")
+        assert "from .txt" in outputs[1].read_text(encoding="utf-8")
+        assert not list((tmp_path / "dout").rglob("*.tmp"))
+
+    def test_engine_failure_fails_items(self, batch_dir, tmp_path):
+        """엔진 생성 실패는 항목별 실패로 커밋되고 노드는 배치를 끝까지 처리"""
+        worker = make_worker(batch_dir, tmp_path, "node")
+        with patch.object(worker, "_get_engine", side_effect=OSError("disk full")):
+            stats = worker.run()
+
+        report = merge_report(batch_dir)
+        assert report["complete"]
+        assert report["counts"] == {"failed": 6}
+        assert all("disk full" in item["error"] for item in report["items"])
+        assert stats.failed == 6
+
+    def test_commit_failure_releases_lease(self, batch_dir, tmp_path, fake_markitdown):
+        """결과 기록 실패 시 임대를 만료 전에 반환해 다시 처리"""
+        worker = make_worker(batch_dir, tmp_path, "node")
+        commit = worker.directory.commit
+        failures = []
+
+        def flaky_commit(lease, record):
+            if not failures:
+                failures.append(lease.item_id)
+                raise OSError("share unavailable")
+            return commit(lease, record)
+
+        with patch.object(worker.directory, "commit", side_effect=flaky_commit):
+            stats = worker.run()
+
+        assert merge_report(batch_dir)["counts"] == {"success": 6}
+        assert stats.committed == 6 and stats.reclaimed == 0
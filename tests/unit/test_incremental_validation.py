@@ -0,0 +1,109 @@
+"""
+증분 접근성 검증 테스트
+"""
+
+import pytest
+from PyQt6.QtCore import QObject
+from PyQt6.QtGui import QColor, QFont
+from PyQt6.QtWidgets import QLabel, QPushButton, QVBoxLayout, QWidget
+
+from markitdown_gui.core.accessibility_validator import (
+    AccessibilityValidator, ColorContrastValidator, IncrementalValidator
+)
+
+
+class CountingValidator(AccessibilityValidator):
+    """위젯별 검증 횟수를 세는 검증기"""
+
+    def __init__(self):
+        super().__init__()
+        self.validated = []
+
+    def validate_widget(self, widget):
+        self.validated.append(widget)
+        return super().validate_widget(widget)
+
+
+@pytest.fixture
+def window(qtbot):
+    window = QWidget()
+    layout = QVBoxLayout(window)
+    window.button = QPushButton("확인")
+    window.label = QLabel("상태")
+    layout.addWidget(window.button)
+    layout.addWidget(window.label)
+    qtbot.addWidget(window)
+    window.show()
+    qtbot.waitExposed(window)
+    return window
+
+
+class EventForwarder(QObject):
+    """AccessibilityManager의 앱 이벤트 필터 대신 이벤트 전달"""
+
+    def __init__(self, incremental):
+        super().__init__()
+        self.incremental = incremental
+
+    def eventFilter(self, obj, event):
+        self.incremental.handle_event(obj, event)
+        return False
+
+
+@pytest.fixture
+def incremental(qapp, window):
+    validator = IncrementalValidator(CountingValidator(), slice_ms=1, delay_ms=10)
+    forwarder = EventForwarder(validator)
+    qapp.installEventFilter(forwarder)
+    yield validator
+    qapp.removeEventFilter(forwarder)
+    validator.stop()
+
+
+class TestContrastMemo:
+    """대비율 메모이제이션 테스트"""
+
+    def test_same_pair_computed_once(self):
+        """같은 색상 쌍은 다시 계산하지 않음"""
+        ColorContrastValidator._contrast_ratio_rgb.cache_clear()
+        ratio = ColorContrastValidator.calculate_contrast_ratio(QColor("#000000"), QColor("#FFFFFF"))
+        ColorContrastValidator.calculate_contrast_ratio(QColor("#000000"), QColor("#FFFFFF"))
+
+        assert ratio == pytest.approx(21.0)
+        info = ColorContrastValidator._contrast_ratio_rgb.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+
+class TestIncrementalValidator:
+    """변경된 위젯만 검증하는지 테스트"""
+
+    def test_initial_pass_is_time_sliced(self, qtbot, window, incremental):
+        """첫 검증은 여러 차례로 나눠 끝까지 진행"""
+        incremental.start()
+        assert incremental.pending_count >= 3
+
+        with qtbot.waitSignal(incremental.pass_completed, timeout=3000) as blocker:
+            pass
+        assert incremental.pending_count == 0
+        assert blocker.args[0].tested_widgets >= 3
+
+    def test_only_changed_widgets_revalidated(self, qtbot, window, incremental):
+        """이후에는 바뀐 위젯만 다시 검증"""
+        incremental.start()
+        incremental.flush()
+        incremental.validator.validated.clear()
+
+        window.label.setFont(QFont("Monospace", 20))
+        with qtbot.waitSignal(incremental.pass_completed, timeout=3000):
+            pass
+
+        assert window.label in incremental.validator.validated
+        assert window.button not in incremental.validator.validated
+
+    def test_hidden_widget_results_dropped(self, qtbot, window, incremental):
+        """숨겨진 위젯의 결과는 보고서에서 빠짐"""
+        incremental.start()
+        before = incremental.flush().tested_widgets
+
+        window.button.hide()
+        assert incremental.flush().tested_widgets == before - 1
@@ -0,0 +1,93 @@
+"""
+Logging Pipeline Unit Tests
+Tests for the QueueHandler/QueueListener logging setup
+"""
+
+import logging
+import threading
+from logging.handlers import QueueHandler
+from unittest.mock import MagicMock
+
+import pytest
+
+from markitdown_gui.core import logger as logger_module
+from markitdown_gui.core.logger import (
+    setup_logging, stop_queue_logging, add_ui_logging, remove_ui_logging, UILogHandler
+)
+
+
+@pytest.fixture
+def isolated_root_logger(tmp_path):
+    """루트 로거 핸들러/레벨을 테스트 후 원래대로 복원"""
+    root_logger = logging.getLogger()
+    handlers, level = root_logger.handlers[:], root_logger.level
+    yield tmp_path
+    stop_queue_logging()
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+        if handler not in handlers:
+            handler.close()
+    for handler in handlers:
+        root_logger.addHandler(handler)
+    root_logger.setLevel(level)
+
+
+class TestQueueLogging:
+    """큐 기반 로깅 파이프라인 테스트"""
+
+    def test_root_logger_only_enqueues(self, isolated_root_logger):
+        """루트 로거에는 QueueHandler만 있고 파일/콘솔 핸들러는 리스너에서 실행"""
+        setup_logging(config_file=isolated_root_logger / "missing.conf",
+                      log_dir=isolated_root_logger / "logs")
+
+        root_handlers = logging.getLogger().handlers
+        assert len(root_handlers) == 1 and isinstance(root_handlers[0], QueueHandler)
+        listener_types = {type(h).__name__ for h in logger_module._queue_listener.handlers}
+        assert {"StreamHandler", "RotatingFileHandler"} <= listener_types
+
+    def test_worker_thread_records_reach_file(self, isolated_root_logger):
+        """다른 스레드의 로그도 리스너 종료 시 파일에 모두 기록"""
+        log_dir = isolated_root_logger / "logs"
+        setup_logging(config_file=isolated_root_logger / "missing.conf", log_dir=log_dir)
+
+        def work():
+            for i in range(100):
+                logging.getLogger("worker").debug("record %d", i)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stop_queue_logging()
+
+        content = (log_dir / "markitdown_gui.log").read_text(encoding="utf-8")
+        assert content.count("record 99") == 4
+        assert not any(isinstance(h, QueueHandler) for h in logging.getLogger().handlers)
+
+    def test_ui_handler_posts_from_listener_thread(self, isolated_root_logger):
+        """UI 핸들러는 리스너 스레드에서 위젯의 post_log로 전달"""
+        setup_logging(config_file=isolated_root_logger / "missing.conf",
+                      log_dir=isolated_root_logger / "logs")
+        widget = MagicMock()
+        add_ui_logging(widget)
+        try:
+            logging.getLogger("ui").info("hello %s", "world")
+            logging.getLogger("ui").debug("hidden")
+            stop_queue_logging()
+        finally:
+            remove_ui_logging()
+
+        posted = [call.args for call in widget.post_log.call_args_list]
+        message, level, created = posted[-1]
+        assert (message, level) == ("hello world", "INFO")
+        assert created > 0
+        assert all(args[0] != "hidden" for args in posted)
+
+    def test_ui_handler_ignores_widget_errors(self):
+        """위젯 오류는 로깅을 중단시키지 않음"""
+        widget = MagicMock()
+        widget.post_log.side_effect = RuntimeError("deleted")
+        handler = UILogHandler(widget)
+
+        handler.emit(logging.makeLogRecord({"msg": "x", "levelname": "INFO"}))
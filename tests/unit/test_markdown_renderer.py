@@ -0,0 +1,97 @@
+"""
+Markdown Renderer Unit Tests
+Tests for hash-keyed HTML caching and section splitting of large documents
+"""
+
+import threading
+from unittest.mock import patch
+
+import markdown
+
+from markitdown_gui.core.markdown_renderer import MarkdownRenderer, split_sections
+
+
+class TestSplitSections:
+    """섹션 분할 테스트"""
+
+    def test_split_on_top_level_headings(self):
+        """#, ## 제목에서 나누고 이어 붙이면 원문과 같음"""
+        content = "intro\n\n# One\ntext\n### Sub\nmore\n## Two\nend\n"
+
+        sections = split_sections(content)
+
+        assert [s.title for s in sections] == ["intro", "One", "Two"]
+        assert "".join(s.text(content) for s in sections) == content
+
+    def test_headings_inside_code_fence_ignored(self):
+        """코드 블록 안의 # 줄은 제목이 아님"""
+        content = "# Code\n```python\n# comment\n```\n# Next\n"
+
+        assert [s.title for s in split_sections(content)] == ["Code", "Next"]
+
+    def test_long_section_split_at_blank_lines(self):
+        """긴 섹션은 빈 줄에서 추가 분할"""
+        content = "# Big\n" + "paragraph line\n\n" * 100
+
+        sections = split_sections(content, max_chars=200)
+
+        assert len(sections) > 1
+        assert sections[1].title == "Big (2)"
+        assert all(s.end - s.start < 250 for s in sections)
+
+
+class TestMarkdownRenderer:
+    """렌더링 캐시 테스트"""
+
+    def test_render_is_cached_by_content(self):
+        """같은 내용은 다시 변환하지 않음"""
+        renderer = MarkdownRenderer()
+        assert renderer.cached("# Title") is None
+
+        html = renderer.render("# Title\n\n| a | b |\n|---|---|\n| 1 | 2 |\n")
+        assert "<table>" in html
+
+        with patch.object(renderer, "_markdown") as markdown:
+            assert renderer.render("# Title\n\n| a | b |\n|---|---|\n| 1 | 2 |\n") == html
+            markdown.assert_not_called()
+
+    def test_instance_reused_without_state_leak(self):
+        """공유 Markdown 객체를 재사용해도 이전 문서의 목차가 남지 않음"""
+        renderer = MarkdownRenderer()
+        renderer.render("# First")
+
+        assert 'id="second"' in renderer.render("# Second")
+        assert "first" not in renderer.render("# Second")
+
+    def test_instance_shared_across_render_threads(self):
+        """렌더링마다 새 작업 스레드를 써도 Markdown 객체는 한 번만 생성"""
+        renderer = MarkdownRenderer()
+        results = []
+
+        def render(i):
+            results.append(renderer.render(f"# Doc {i}\n\ntext {i}\n"))
+
+        with patch("markitdown_gui.core.markdown_renderer.markdown.Markdown",
+                   wraps=markdown.Markdown) as factory:
+            for i in range(3):
+                thread = threading.Thread(target=render, args=(i,))
+                thread.start()
+                thread.join()
+
+        assert factory.call_count == 1
+        assert all(f"text {i}" in html for i, html in enumerate(results))
+
+    def test_render_not_blocked_by_busy_instance(self):
+        """앞선 렌더링이 Markdown 객체를 쓰는 중이면 기다리지 않고 새 객체로 렌더링"""
+        renderer = MarkdownRenderer()
+        busy = renderer._markdown()
+        results = []
+
+        thread = threading.Thread(target=lambda: results.append(renderer.render("# Next")))
+        thread.start()
+        thread.join(timeout=5)
+
+        assert not thread.is_alive()
+        assert 'id="next"' in results[0]
+        renderer._release_markdown(busy)
+        assert len(renderer._idle_md) == 2
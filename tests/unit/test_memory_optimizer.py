@@ -12,7 +12,8 @@ import pytest
 
 from markitdown_gui.core.memory_optimizer import (
     MemoryTracker, LRUCache, StreamingFileProcessor, 
-    MemoryPool, WeakReferenceManager, MemoryOptimizer
+    MemoryPool, WeakReferenceManager, MemoryOptimizer,
+    NamespacedCache, CompressedLRUCache, estimate_size
 )
 
 
@@ -688,5 +689,182 @@ class TestMemoryOptimizerIntegration:
         optimizer.stop_monitoring()
 
 
+class TestLRUCacheBudget:
+    """바이트 예산 LRUCache 테스트"""
+    
+    def test_size_measured_once_per_insert(self):
+        """삽입 시 한 번만 크기 측정"""
+        sizer = Mock(return_value=10)
+        cache = LRUCache(max_size=2, sizer=sizer)
+        
+        cache.set("key1", "value1")
+        cache.set("key2", "value2")
+        cache.set("key3", "value3")  # key1 제거 시 재측정 없음
+        
+        assert sizer.call_count == 3
+        assert cache.get_stats()['memory_usage'] == 20
+    
+    def test_explicit_size_skips_sizer(self):
+        """명시적 크기는 sizer 호출 생략"""
+        sizer = Mock(return_value=10)
+        cache = LRUCache(sizer=sizer)
+        
+        cache.set("key", "value", size=123)
+        
+        sizer.assert_not_called()
+        assert cache.get_stats()['memory_usage'] == 123
+    
+    def test_byte_budget_eviction(self):
+        """바이트 예산 초과 시 제거"""
+        cache = LRUCache(max_size=100, max_memory_mb=1, sizer=lambda v: 400 * 1024)
+        
+        cache.set("key1", "a")
+        cache.set("key2", "b")
+        cache.set("key3", "c")
+        
+        assert "key1" not in cache
+        assert cache.get_stats()['evictions'] == 1
+        assert cache.get_stats()['memory_usage'] == 800 * 1024
+    
+    def test_oversized_value_rejected(self):
+        """예산보다 큰 값은 캐싱하지 않음"""
+        cache = LRUCache(max_memory_mb=1, sizer=lambda v: 2 * 1024 * 1024)
+        
+        assert cache.set("big", "x") is False
+        assert len(cache) == 0
+        assert cache.get_stats()['rejections'] == 1
+    
+    def test_hit_miss_counters(self):
+        """히트/미스 카운터 테스트"""
+        cache = LRUCache()
+        cache.set("key", "value")
+        
+        cache.get("key")
+        cache.get("key")
+        cache.get("missing")
+        
+        stats = cache.get_stats()
+        assert stats['hits'] == 2
+        assert stats['misses'] == 1
+        assert stats['hit_ratio'] == pytest.approx(2 / 3)
+    
+    def test_replace_updates_usage(self):
+        """같은 키 교체 시 사용량 갱신"""
+        cache = LRUCache()
+        cache.set("key", "value", size=100)
+        cache.set("key", "value", size=40)
+        
+        assert cache.get_stats()['memory_usage'] == 40
+        assert len(cache) == 1
+    
+    def test_estimate_size_objects(self):
+        """일반 객체 크기 추정"""
+        class Holder:
+            def __init__(self):
+                self.text = "x" * 10000
+        
+        assert estimate_size(Holder()) > 10000
+        assert estimate_size(None) == 0
+
+
+class TestNamespacedCache:
+    """NamespacedCache 테스트"""
+    
+    def test_namespaces_are_isolated(self):
+        """네임스페이스 간 제거가 격리됨"""
+        cache = NamespacedCache({'results': (10, 1), 'info': (2, 1)})
+        
+        cache.set("result", "markdown", 'results')
+        for i in range(10):
+            cache.set(f"info_{i}", i, 'info')
+        
+        assert cache.get("result", 'results') == "markdown"
+        assert len(cache.namespace('info')) == 2
+    
+    def test_aggregate_stats(self):
+        """통계 집계 테스트"""
+        cache = NamespacedCache({'a': (10, 1), 'b': (10, 1)})
+        cache.set("k", "v", 'a')
+        cache.get("k", 'a')
+        cache.get("k", 'b')
+        
+        stats = cache.get_stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert set(stats['namespaces']) == {'a', 'b'}
+    
+    def test_memory_statistics_include_cache_stats(self):
+        """메모리 통계에 캐시 통계 포함"""
+        optimizer = MemoryOptimizer()
+        optimizer.cache_result("key", "value")
+        optimizer.get_cached_result("key")
+        
+        stats = optimizer.get_memory_statistics()
+        assert stats['cache_stats']['hits'] == 1
+
+
+class TestCompressedLRUCache:
+    """압축 캐시 계층 테스트"""
+    
+    def test_round_trip_text(self):
+        """텍스트 압축/복원 테스트"""
+        cache = CompressedLRUCache()
+        content = "# Title\n\n" + "| a | b |\n" * 5000
+        
+        cache.set("doc", content)
+        
+        assert cache.get("doc") == content
+        assert cache.get_stats()['decompressions'] == 1
+    
+    def test_round_trip_bytes(self):
+        """바이트 압축/복원 테스트"""
+        cache = CompressedLRUCache()
+        data = b"\x00\x01" * 10000
+        
+        cache.set("blob", data)
+        
+        assert cache.get("blob") == data
+    
+    def test_budget_charged_with_compressed_size(self):
+        """예산은 압축된 크기로 계산"""
+        cache = CompressedLRUCache(max_size=1000, max_memory_mb=1)
+        content = "markdown line\n" * 40000  # ~560KB raw
+        
+        for i in range(10):
+            cache.set(f"doc_{i}", content + str(i))
+        
+        stats = cache.get_stats()
+        assert stats['size'] == 10
+        assert stats['evictions'] == 0
+        assert stats['compression_ratio'] > 10
+    
+    def test_small_values_stored_raw(self):
+        """작은 값은 압축하지 않음"""
+        cache = CompressedLRUCache()
+        cache.set("small", "tiny")
+        
+        assert cache.get("small") == "tiny"
+        assert cache.get_stats()['compressed_entries'] == 0
+    
+    def test_non_text_values_passthrough(self):
+        """텍스트가 아닌 값은 그대로 저장"""
+        cache = CompressedLRUCache()
+        value = {"key": "value"}
+        cache.set("obj", value)
+        
+        assert cache.get("obj") is value
+    
+    def test_conversion_namespace_preserved_on_cleanup(self):
+        """정리 시 변환 결과 캐시 유지"""
+        optimizer = MemoryOptimizer()
+        optimizer.cache_result("result", "x" * 10000, "conversion")
+        optimizer.cache_result("info", "y", "file_info")
+        
+        optimizer.cleanup(preserve_namespaces=("conversion",))
+        
+        assert optimizer.get_cached_result("result", "conversion") == "x" * 10000
+        assert optimizer.get_cached_result("info", "file_info") is None
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
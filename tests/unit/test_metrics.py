@@ -0,0 +1,213 @@
+"""
+Metrics Registry Unit Tests
+Tests for the unified metrics registry and Prometheus text export
+"""
+
+import gc
+import urllib.error
+import urllib.request
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from markitdown_gui.core.conversion_engine import ConversionEngine
+from markitdown_gui.core.error_handling.circuit_breaker import CircuitBreaker
+from markitdown_gui.core.memory_optimizer import MemoryOptimizer
+from markitdown_gui.core.metrics import (
+    MetricsRegistry, MetricsServer, write_prometheus_file, metric_name,
+    collect_circuit_breaker, collect_cache, collect_llm_stats
+)
+from markitdown_gui.core.models import LLMStats
+from markitdown_gui.core.utils import create_file_info
+
+
+def sample_lines(text, name):
+    return [line for line in text.splitlines() if line.startswith(name)]
+
+
+class TestMetricsRegistry:
+    """레지스트리와 Prometheus 텍스트 형식 테스트"""
+
+    def test_counter_gauge_rendering(self):
+        """HELP/TYPE 헤더와 레이블 이스케이프"""
+        registry = MetricsRegistry()
+        registry.counter("jobs_total", "Jobs", ("status",)).inc(2, status='say "hi"')
+        registry.gauge("queue_depth", "Queue depth").set(3.5)
+
+        text = registry.render()
+
+        assert "# TYPE jobs_total counter" in text
+        assert 'jobs_total{status="say \\"hi\\""} 2' in text
+        assert "queue_depth 3.5" in text
+
+    def test_histogram_buckets_are_cumulative(self):
+        """버킷은 누적 개수이고 +Inf 버킷이 _count와 같음"""
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.7, 3.0):
+            histogram.observe(value)
+
+        text = registry.render()
+
+        assert 'latency_seconds_bucket{le="0.1"} 1' in text
+        assert 'latency_seconds_bucket{le="1"} 3' in text
+        assert 'latency_seconds_bucket{le="+Inf"} 4' in text
+        assert "latency_seconds_count 4" in text
+        assert "latency_seconds_sum 4.25" in text
+
+    def test_label_and_type_mismatch_rejected(self):
+        """레이블 불일치와 다른 타입으로의 재등록은 ValueError"""
+        registry = MetricsRegistry()
+        counter = registry.counter("jobs_total", "Jobs", ("status",))
+
+        with pytest.raises(ValueError):
+            counter.inc(format="pdf")
+        with pytest.raises(ValueError):
+            registry.gauge("jobs_total", "Jobs", ("status",))
+        assert registry.counter("jobs_total", "Jobs", ("status",)) is counter
+
+    def test_sources_are_merged_and_weakly_held(self):
+        """같은 이름의 회로 차단기 카운터는 합산, 상태는 최댓값, 사라진 소스는 제외"""
+        registry = MetricsRegistry()
+        first, second = CircuitBreaker("engine"), CircuitBreaker("engine")
+        first.call(lambda: None)
+        second.call(lambda: None)
+        second.force_open()
+        registry.register_source(first, collect_circuit_breaker)
+        registry.register_source(second, collect_circuit_breaker)
+
+        text = registry.render()
+        assert f'{metric_name("circuit_breaker_operations_total")}' \
+               '{breaker="engine",result="success"} 2' in text
+        assert f'{metric_name("circuit_breaker_state")}{{breaker="engine"}} 2' in text
+
+        del first, second
+        gc.collect()
+        assert metric_name("circuit_breaker_state") not in registry.render()
+
+    def test_counters_of_collected_sources_are_retained(self):
+        """사라진 소스의 카운터는 보존 합계로 남아 줄어들지 않음 (게이지는 제외)"""
+        registry = MetricsRegistry()
+        operations = f'{metric_name("circuit_breaker_operations_total")}' \
+                     '{breaker="engine",result="success"}'
+        first, second = CircuitBreaker("engine"), CircuitBreaker("engine")
+        for _ in range(3):
+            first.call(lambda: None)
+        second.call(lambda: None)
+        registry.register_source(first, collect_circuit_breaker)
+        registry.register_source(second, collect_circuit_breaker)
+        assert f"{operations} 4" in registry.render()
+
+        del first
+        gc.collect()
+        second.call(lambda: None)
+        assert f"{operations} 5" in registry.render()
+
+        registry.unregister_source(second)
+        del second
+        gc.collect()
+        text = registry.render()
+        assert f"{operations} 5" in text
+        assert metric_name("circuit_breaker_state") not in text
+
+    def test_failing_source_does_not_break_scrape(self):
+        """수집 중 예외가 난 소스는 건너뜀"""
+        registry = MetricsRegistry()
+        registry.gauge("up", "Up").set(1)
+        broken = MagicMock()
+        broken.cache.get_stats.side_effect = RuntimeError("closed")
+        registry.register_source(broken, collect_cache)
+
+        assert "up 1" in registry.render()
+
+
+class TestComponentCollectors:
+    """구성 요소별 수집기 테스트"""
+
+    def test_cache_hit_ratio_by_namespace(self):
+        """캐시 네임스페이스별 적중/미스와 적중률"""
+        optimizer = MemoryOptimizer()
+        optimizer.cache.set("key", "value", namespace="conversion")
+        optimizer.cache.get("key", namespace="conversion")
+        optimizer.cache.get("missing", namespace="conversion")
+        registry = MetricsRegistry()
+        registry.register_source(optimizer, collect_cache)
+
+        text = registry.render()
+
+        assert f'{metric_name("cache_lookups_total")}{{namespace="conversion",result="hit"}} 1' in text
+        assert f'{metric_name("cache_hit_ratio")}{{namespace="conversion"}} 0.5' in text
+
+    def test_llm_token_spend(self):
+        """LLM(OCR) 토큰 사용량과 비용 추정"""
+        owner = MagicMock()
+        owner.stats = LLMStats(total_requests=3, successful_requests=2, failed_requests=1,
+                               total_tokens_used=1500, total_cost_estimate=0.25)
+        registry = MetricsRegistry()
+        registry.register_source(owner, collect_llm_stats)
+
+        text = registry.render()
+
+        assert f"{metric_name('llm_tokens_total')} 1500" in text
+        assert f"{metric_name('llm_cost_estimate_total')} 0.25" in text
+        assert f'{metric_name("llm_requests_total")}{{result="failure"}} 1' in text
+
+
+class TestEngineMetrics:
+    """ConversionEngine 처리량/지연 시간 기록 테스트"""
+
+    def test_engine_records_conversions(self, tmp_path, fake_markitdown):
+        """파일별 결과 카운터, 입력 바이트, 지연 히스토그램 기록"""
+        source = tmp_path / "doc.txt"
+        source.write_text("metrics\n")
+        registry = MetricsRegistry()
+        engine = ConversionEngine(tmp_path / "out", save_to_original_dir=False, metrics=registry)
+
+        engine.convert_file(create_file_info(source))
+        text = registry.render()
+
+        assert f'{metric_name("conversions_total")}{{format="txt",status="success"}} 1' in text
+        assert f'{metric_name("input_bytes_total")}{{format="txt"}} 8' in text
+        assert sample_lines(text, metric_name("conversion_duration_seconds_count"))
+        assert sample_lines(text, metric_name("circuit_breaker_state"))
+
+
+class TestExporters:
+    """파일/HTTP 내보내기 테스트"""
+
+    def test_write_file(self, tmp_path):
+        """파일로 저장하고 임시 파일은 남기지 않음"""
+        registry = MetricsRegistry()
+        registry.gauge("up", "Up").set(1)
+
+        path = write_prometheus_file(tmp_path / "metrics" / "app.prom", registry)
+
+        assert path.read_text(encoding="utf-8").endswith("up 1\n")
+        assert [p.name for p in path.parent.iterdir()] == ["app.prom"]
+
+    def test_write_file_failure_removes_temp(self, tmp_path):
+        """교체에 실패해도 임시 파일을 남기지 않음"""
+        registry = MetricsRegistry()
+        registry.gauge("up", "Up").set(1)
+        target = tmp_path / "metrics" / "app.prom"
+
+        with patch("markitdown_gui.core.utils.os.replace", side_effect=OSError("busy")):
+            with pytest.raises(OSError):
+                write_prometheus_file(target, registry)
+
+        assert list(target.parent.iterdir()) == []
+
+    def test_localhost_endpoint(self):
+        """GET /metrics는 Prometheus 텍스트, 다른 경로는 404"""
+        registry = MetricsRegistry()
+        registry.gauge("up", "Up").set(1)
+        server = MetricsServer(registry, port=0)
+        server.start()
+        try:
+            with urllib.request.urlopen(server.url, timeout=5) as response:
+                assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+                assert b"up 1" in response.read()
+            with pytest.raises(urllib.error.HTTPError):
+                urllib.request.urlopen(server.url.replace("/metrics", "/other"), timeout=5)
+        finally:
+            server.stop()
@@ -0,0 +1,116 @@
+"""
+Paged Text File Unit Tests
+Tests for mmap-backed paging, charset detection and the background line index
+"""
+
+import codecs
+
+import pytest
+
+from markitdown_gui.core.paged_text import PagedTextFile, detect_encoding
+
+
+def write_lines(path, count, encoding="utf-8", prefix=b""):
+    path.write_bytes(prefix + "".join(f"{i},행 {i}\n" for i in range(count)).encode(encoding))
+    return path
+
+
+class TestDetectEncoding:
+    """샘플 기반 인코딩 추정 테스트"""
+
+    def test_bom_and_utf8(self):
+        """BOM 우선, 끝에서 잘린 UTF-8 문자는 허용"""
+        assert detect_encoding(codecs.BOM_UTF8 + b"abc") == ("utf-8-sig", "utf-8", 3)
+        assert detect_encoding(codecs.BOM_UTF16_LE + "a".encode("utf-16-le"))[1] == "utf-16-le"
+        assert detect_encoding("한글".encode("utf-8")[:-1]) == ("utf-8", "utf-8", 0)
+
+    def test_legacy_encodings(self):
+        """한글 레거시 인코딩은 cp949, 그 밖의 바이트는 통계적 추정 또는 latin-1"""
+        assert detect_encoding("0,행 0\n1,행 1\n".encode("cp949"))[1] == "cp949"
+        assert detect_encoding(bytes([0x80, 0xff, 0x41]))[1] != "utf-8"
+
+
+class TestPagedTextFile:
+    """페이지 분할과 줄 색인 테스트"""
+
+    @pytest.mark.parametrize("encoding,prefix", [
+        ("utf-8", b""), ("utf-8", codecs.BOM_UTF8), ("cp949", b""), ("utf-16-le", codecs.BOM_UTF16_LE),
+    ])
+    def test_pages_concatenate_to_content(self, tmp_path, encoding, prefix):
+        """페이지는 줄 경계에서 나뉘고 이어 붙이면 원문과 같음"""
+        path = write_lines(tmp_path / "data.csv", 2000, encoding, prefix)
+
+        with PagedTextFile(path, page_size=1024) as paged:
+            pages = [paged.read_page(i) for i in range(paged.page_count)]
+
+        assert paged.page_count > 10
+        assert all(page.endswith("\n") for page in pages if page)
+        assert paged.codec == encoding
+        assert "".join(pages) == path.read_bytes()[len(prefix):].decode(encoding)
+
+    def test_long_line_is_cut_at_char_boundary(self, tmp_path):
+        """줄바꿈 없는 긴 줄은 페이지 크기에서 UTF-8 문자 경계로 자름"""
+        path = tmp_path / "minified.json"
+        path.write_text("가" * 5000, encoding="utf-8")
+
+        with PagedTextFile(path, page_size=1000) as paged:
+            pages = [paged.read_page(i) for i in range(paged.page_count)]
+
+        assert "".join(pages) == "가" * 5000
+        assert len(pages) == 15
+        assert all("\ufffd" not in page for page in pages)
+
+    def test_long_cp949_line_is_cut_at_char_boundary(self, tmp_path):
+        """cp949의 긴 줄도 2바이트 문자 중간에서 자르지 않음 (후행 바이트가 ASCII 범위인 문자 포함)"""
+        text = "가A똠b " * 1500
+        path = tmp_path / "minified.txt"
+        path.write_bytes(text.encode("cp949"))
+
+        with PagedTextFile(path, page_size=1000) as paged:
+            assert paged.codec == "cp949"
+            pages = [paged.read_page(i) for i in range(paged.page_count)]
+
+        assert "".join(pages) == text
+        assert all("\ufffd" not in page for page in pages)
+
+    def test_redetects_encoding_past_ascii_sample(self, tmp_path):
+        """앞부분 샘플이 ASCII뿐이어도 뒤쪽 cp949 페이지는 올바르게 디코딩"""
+        head = "".join(f"{i},row\n" for i in range(20000))
+        tail = "".join(f"{i},행 {i}\n" for i in range(200))
+        path = tmp_path / "data.csv"
+        path.write_bytes((head + tail).encode("cp949"))
+
+        with PagedTextFile(path, page_size=4096) as paged:
+            assert paged.codec == "utf-8"
+            last = paged.read_page(paged.page_count - 1)
+            assert paged.codec == "cp949"
+            pages = [paged.read_page(i) for i in range(paged.page_count)]
+
+        assert "\ufffd" not in last
+        assert "".join(pages) == head + tail
+
+    def test_line_index_and_offsets(self, tmp_path):
+        """청크 체크포인트로 줄 수와 줄 위치 계산"""
+        path = write_lines(tmp_path / "log.txt", 5000)
+
+        with PagedTextFile(path) as paged:
+            index = paged.build_line_index(chunk_size=4096)
+            assert index.total_lines == 5000
+            assert len(index.offsets) > 5
+            for line in (0, 1, 2500, 4999):
+                offset = paged.line_offset(index, line)
+                assert paged.read_range(offset, offset + 20).startswith(f"{line},")
+            assert paged.page_of_offset(paged.line_offset(index, 4999)) == paged.page_count - 1
+
+    def test_index_cancel_and_empty_file(self, tmp_path):
+        """취소하면 None, 빈 파일은 한 페이지의 빈 내용"""
+        path = write_lines(tmp_path / "log.txt", 100)
+        empty = tmp_path / "empty.txt"
+        empty.write_bytes(b"")
+
+        with PagedTextFile(path) as paged:
+            assert paged.build_line_index(cancelled=lambda: True) is None
+        with PagedTextFile(empty) as paged:
+            assert paged.page_count == 1
+            assert paged.read_page(0) == ""
+            assert paged.build_line_index().total_lines == 0
@@ -0,0 +1,112 @@
+"""
+Progress Aggregator Unit Tests
+Tests for frame-rate coalescing of per-file progress events
+"""
+
+from unittest.mock import MagicMock
+
+from markitdown_gui.core.conversion_engine import ConversionEvent, ConversionEventType
+from markitdown_gui.core.conversion_manager import ConversionManager, ConversionWorker
+from markitdown_gui.core.models import (
+    ConversionProgress, ConversionResult, ConversionStatus
+)
+from markitdown_gui.core.progress_aggregator import ProgressAggregator
+from markitdown_gui.core.utils import create_file_info
+
+
+def make_files(tmp_path, count):
+    files = []
+    for i in range(count):
+        path = tmp_path / f"doc_{i}.txt"
+        path.write_text("x")
+        files.append(create_file_info(path))
+    return files
+
+
+class TestProgressAggregator:
+    """병합기 테스트"""
+
+    def test_progress_is_merged_and_finals_are_kept(self, tmp_path):
+        """진행률은 최신 스냅샷 하나, 완료 결과는 모두 순서대로 보관"""
+        aggregator = ProgressAggregator()
+        files = make_files(tmp_path, 3)
+        progress = ConversionProgress(total_files=3, completed_files=0)
+
+        assert aggregator.add_progress(progress) is True
+        for i, file_info in enumerate(files):
+            assert aggregator.add_started(file_info) is False
+            aggregator.add_completed(ConversionResult(file_info, ConversionStatus.SUCCESS))
+            progress.completed_files = i + 1
+            aggregator.add_progress(progress)
+
+        batch = aggregator.drain()
+
+        assert batch.progress.completed_files == 3
+        assert batch.merged_updates == 4
+        assert [r.file_info for r in batch.completed] == files
+        assert batch.in_progress == []
+        assert aggregator.drain() is None
+
+    def test_snapshot_is_isolated_from_engine_mutation(self):
+        """엔진이 같은 진행률 객체를 계속 수정해도 보관된 스냅샷은 그대로"""
+        aggregator = ProgressAggregator()
+        progress = ConversionProgress(total_files=2, completed_files=1)
+        aggregator.add_progress(progress)
+
+        progress.completed_files = 2
+
+        assert aggregator.drain().progress.completed_files == 1
+
+    def test_in_progress_excludes_completed(self, tmp_path):
+        """같은 프레임에 시작만 한 파일이 진행 중으로 남음"""
+        aggregator = ProgressAggregator()
+        done, running = make_files(tmp_path, 2)
+        aggregator.add_started(done)
+        aggregator.add_completed(ConversionResult(done, ConversionStatus.FAILED))
+        aggregator.add_started(running)
+
+        assert aggregator.drain().in_progress == [running]
+
+
+class TestCoalescedSignals:
+    """워커/매니저 시그널 병합 테스트"""
+
+    def test_worker_signals_once_per_pending_batch(self, tmp_path, qapp):
+        """병합기가 비어 있을 때만 progress_pending 발생"""
+        aggregator = ProgressAggregator()
+        worker = ConversionWorker([], tmp_path, progress_aggregator=aggregator)
+        pending = MagicMock()
+        worker.progress_pending.connect(pending)
+        progress = ConversionProgress(total_files=1, completed_files=0)
+
+        for _ in range(50):
+            worker._on_engine_event(ConversionEvent(ConversionEventType.PROGRESS,
+                                                    progress=progress))
+        assert pending.call_count == 1
+
+        aggregator.drain()
+        worker._on_engine_event(ConversionEvent(ConversionEventType.PROGRESS, progress=progress))
+        assert pending.call_count == 2
+
+    def test_manager_flush_delivers_every_final_status(self, tmp_path, qapp):
+        """한 번의 전달로 최신 진행률과 모든 파일 완료 시그널 발생"""
+        manager = ConversionManager(tmp_path / "out", save_to_original_dir=False)
+        files = make_files(tmp_path, 5)
+        batches, completed, progress_updates = [], [], []
+        manager.progress_batch_ready.connect(batches.append)
+        manager.file_conversion_completed.connect(completed.append)
+        manager.conversion_progress_updated.connect(progress_updates.append)
+
+        progress = ConversionProgress(total_files=5, completed_files=0)
+        for i, file_info in enumerate(files):
+            manager._progress_aggregator.add_started(file_info)
+            manager._progress_aggregator.add_completed(
+                ConversionResult(file_info, ConversionStatus.SUCCESS))
+            progress.completed_files = i + 1
+            manager._progress_aggregator.add_progress(progress)
+        manager._flush_progress()
+        manager._flush_progress()
+
+        assert len(batches) == 1
+        assert [r.file_info for r in completed] == files
+        assert [p.completed_files for p in progress_updates] == [5]
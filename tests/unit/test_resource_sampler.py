@@ -0,0 +1,105 @@
+"""
+Resource Sampler Unit Tests
+Tests for the background process resource sampler
+"""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from markitdown_gui.core.resource_sampler import (
+    ResourceSampler, ResourceSnapshot, get_resource_sampler, PSUTIL_AVAILABLE
+)
+from markitdown_gui.core.memory_optimizer import MemoryOptimizer
+
+
+class TestResourceSnapshot:
+    """ResourceSnapshot 테스트"""
+
+    def test_default_snapshot_is_invalid(self):
+        """기본 스냅샷은 유효하지 않음"""
+        snapshot = ResourceSnapshot()
+        assert not snapshot.is_valid
+        assert snapshot.rss_mb == 0
+
+    def test_snapshot_is_immutable(self):
+        """스냅샷 불변성 테스트"""
+        snapshot = ResourceSnapshot(rss=1024)
+        with pytest.raises(Exception):
+            snapshot.rss = 0
+
+    def test_to_dict(self):
+        """딕셔너리 변환 테스트"""
+        snapshot = ResourceSnapshot(rss=2 * 1024 * 1024, peak_rss=4 * 1024 * 1024, sample_count=1)
+        data = snapshot.to_dict()
+        assert data['rss_mb'] == 2.0
+        assert data['peak_rss_mb'] == 4.0
+
+
+@pytest.mark.skipif(not PSUTIL_AVAILABLE, reason="psutil not installed")
+class TestResourceSampler:
+    """ResourceSampler 테스트"""
+
+    def test_sample_now_publishes_snapshot(self):
+        """즉시 샘플링 테스트"""
+        sampler = ResourceSampler(interval=10)
+        snapshot = sampler.sample_now()
+
+        assert snapshot.is_valid
+        assert snapshot.rss > 0
+        assert snapshot.peak_rss >= snapshot.rss
+        assert sampler.snapshot() is snapshot
+
+    def test_peak_is_monotonic(self):
+        """피크 메모리는 감소하지 않음"""
+        sampler = ResourceSampler(interval=10)
+        first = sampler.sample_now()
+        second = sampler.sample_now()
+
+        assert second.peak_rss >= first.peak_rss
+        assert second.sample_count == first.sample_count + 1
+
+    def test_background_thread_samples(self):
+        """백그라운드 스레드 샘플링 테스트"""
+        sampler = ResourceSampler(interval=0.01)
+        sampler.start()
+        try:
+            assert sampler.is_running()
+            initial_count = sampler.snapshot().sample_count
+            time.sleep(0.1)
+            assert sampler.snapshot().sample_count > initial_count
+        finally:
+            sampler.stop()
+
+        assert not sampler.is_running()
+
+    def test_global_sampler_is_shared(self):
+        """전역 샘플러 공유 테스트"""
+        assert get_resource_sampler() is get_resource_sampler()
+
+
+class TestMemoryOptimizerSampling:
+    """MemoryOptimizer 샘플러 연동 테스트"""
+
+    def test_statistics_use_true_peak(self):
+        """peak_memory_mb는 현재 RSS가 아닌 실제 피크를 보고"""
+        optimizer = MemoryOptimizer()
+        snapshot = ResourceSnapshot(rss=100 * 1024 * 1024, peak_rss=300 * 1024 * 1024, sample_count=1)
+
+        with patch.object(optimizer.sampler, 'snapshot', return_value=snapshot):
+            stats = optimizer.get_memory_statistics()
+
+        assert stats['current_memory_mb'] == 100.0
+        assert stats['peak_memory_mb'] == 300.0
+
+    def test_should_trigger_gc_uses_snapshot(self):
+        """GC 트리거는 스냅샷의 메모리 비율 사용"""
+        optimizer = MemoryOptimizer()
+        low = ResourceSnapshot(memory_percent=10.0, sample_count=1)
+        high = ResourceSnapshot(memory_percent=90.0, sample_count=1)
+
+        with patch.object(optimizer.sampler, 'snapshot', return_value=low):
+            assert not optimizer.should_trigger_gc()
+        with patch.object(optimizer.sampler, 'snapshot', return_value=high):
+            assert optimizer.should_trigger_gc()
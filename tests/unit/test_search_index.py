@@ -0,0 +1,133 @@
+"""
+전문 검색 색인 테스트
+"""
+
+import os
+
+import pytest
+
+from markitdown_gui.core.search_index import (
+    FTS5_AVAILABLE, SearchIndex, build_match_query, extract_title, query_terms, strip_metadata_header
+)
+
+
+pytestmark = pytest.mark.skipif(not FTS5_AVAILABLE, reason="SQLite FTS5 not available")
+
+HEADER = "---\n# 변환 정보\n- **원본 파일**: report.docx\n---\n\n"
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = SearchIndex(tmp_path / "index.db")
+    yield index
+    index.close()
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    root = tmp_path / "output"
+    (root / "sub").mkdir(parents=True)
+    (root / "budget.md").write_text(HEADER + "# 예산 보고서\n\n올해 예산을 검토했습니다.", encoding='utf-8')
+    (root / "minutes.md").write_text(HEADER + "# 회의록\n\n예산 회의에서 일정을 정했습니다.", encoding='utf-8')
+    (root / "sub" / "notes.md").write_text("# Notes\n\nPerformance <b>tuning</b> notes.", encoding='utf-8')
+    return root
+
+
+class TestQueryHelpers:
+    """검색어 처리 테스트"""
+
+    def test_match_query_uses_prefixes(self):
+        """단어마다 접두어 검색, FTS 연산자는 무시"""
+        assert build_match_query('예산 "보고서" OR') == '"예산"* "보고서"* "OR"*'
+        assert build_match_query('  "* -') is None
+        assert query_terms("예산, 회의") == ["예산", "회의"]
+
+    def test_title_skips_metadata_header(self):
+        """변환 정보 머리글은 제목/본문에서 제외"""
+        body = strip_metadata_header(HEADER + "# 실제 제목\n\n본문")
+        assert body.startswith("# 실제 제목")
+        assert extract_title(body, "fallback") == "실제 제목"
+        assert extract_title("제목 없음", "fallback") == "fallback"
+
+
+class TestSearchIndex:
+    """SearchIndex 테스트"""
+
+    def test_sync_and_search(self, index, corpus):
+        """디렉토리 동기화 후 한국어 접두어 검색"""
+        assert index.sync_directory(corpus) == (3, 0)
+
+        hits = index.search("예산")
+        assert {hit.path.name for hit in hits} == {"budget.md", "minutes.md"}
+        # 제목 일치가 더 높은 순위
+        assert hits[0].path.name == "budget.md"
+        assert hits[0].title == "예산 보고서"
+        assert "올해 <b>예산을</b> 검토" in hits[0].snippet_html()
+        assert "변환 정보" not in hits[0].snippet_text
+
+    def test_all_terms_required(self, index, corpus):
+        """모든 단어를 포함한 문서만"""
+        index.sync_directory(corpus)
+        assert [hit.path.name for hit in index.search("예산 회의")] == ["minutes.md"]
+        assert index.search("없는단어") == []
+
+    def test_snippet_html_is_escaped(self, index, corpus):
+        """본문의 태그는 이스케이프"""
+        index.sync_directory(corpus)
+        html = index.search("tuning")[0].snippet_html()
+        assert "&lt;b&gt;<b>tuning</b>&lt;/b&gt;" in html
+
+    def test_root_filter(self, index, corpus, tmp_path):
+        """검색 범위 디렉토리 밖의 문서 제외"""
+        other = tmp_path / "output-old"
+        other.mkdir()
+        (other / "old.md").write_text("# 예산\n", encoding='utf-8')
+        index.sync_directory(corpus)
+        index.sync_directory(other)
+
+        assert {hit.path.name for hit in index.search("예산", root=corpus)} == {"budget.md", "minutes.md"}
+        assert [hit.path.name for hit in index.search("notes", root=corpus / "sub")] == ["notes.md"]
+
+    def test_sync_is_incremental(self, index, corpus):
+        """바뀐 파일만 다시 색인하고 사라진 파일은 제거"""
+        index.sync_directory(corpus)
+        assert index.sync_directory(corpus) == (0, 0)
+
+        minutes = corpus / "minutes.md"
+        minutes.write_text("# 회의록\n\n다음 분기 채용 계획.", encoding='utf-8')
+        stat = minutes.stat()
+        os.utime(minutes, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        (corpus / "budget.md").unlink()
+
+        assert index.sync_directory(corpus) == (1, 1)
+        assert index.document_count() == 2
+        assert index.search("예산") == []
+        assert [hit.path.name for hit in index.search("채용")] == ["minutes.md"]
+
+    def test_index_document_replaces(self, index, tmp_path):
+        """같은 경로를 다시 색인하면 교체"""
+        path = tmp_path / "doc.md"
+        path.write_text("# 첫 버전\n", encoding='utf-8')
+        index.index_document(path)
+        path.write_text("# 둘째 버전\n", encoding='utf-8')
+        index.index_document(path, "# 둘째 버전\n")
+
+        assert index.document_count() == 1
+        assert index.search("첫") == []
+        assert index.search("둘째")[0].title == "둘째 버전"
+
+        index.remove_document(path)
+        assert index.document_count() == 0
+
+    def test_index_persists(self, corpus, tmp_path):
+        """다시 열어도 색인 유지"""
+        first = SearchIndex(tmp_path / "persist.db")
+        first.sync_directory(corpus)
+        first.close()
+
+        second = SearchIndex(tmp_path / "persist.db")
+        try:
+            assert second.document_count() == 3
+            assert len(second.search("예산")) == 2
+        finally:
+            second.close()
@@ -0,0 +1,91 @@
+"""
+스타일시트 컴파일러 테스트
+"""
+
+import os
+from dataclasses import dataclass
+
+import pytest
+
+from markitdown_gui.core.stylesheet_compiler import StylesheetCache, StylesheetTemplate, theme_variables
+
+
+@dataclass
+class Colors:
+    primary: str = "#111111"
+    primary_variant: str = "#222222"
+    on_primary: str = "#333333"
+    accent: str = "#3B82F6"
+
+
+@pytest.fixture
+def styles_dir(tmp_path):
+    styles = tmp_path / "styles"
+    styles.mkdir()
+    (styles / "light_theme.qss").write_text(
+        "QPushButton { color: @on-primary; background: @primary; border: 1px solid @primary-variant; }\n"
+        "QLineEdit:focus { border-color: @accent; }\n",
+        encoding='utf-8'
+    )
+    return styles
+
+
+class TestStylesheetTemplate:
+    """템플릿 치환 테스트"""
+
+    def test_longest_variable_wins(self):
+        """@primary가 @primary-variant를 덮어쓰지 않음"""
+        template = StylesheetTemplate("a: @primary; b: @primary-variant; c: @on-primary;")
+        result = template.render(theme_variables(Colors()))
+        assert result == "a: #111111; b: #222222; c: #333333;"
+
+    def test_unknown_variables_untouched(self):
+        """모르는 변수는 그대로"""
+        template = StylesheetTemplate("x: @unknown; y: @accent")
+        assert template.render({"accent": "#FFF"}) == "x: @unknown; y: #FFF"
+        assert template.variables == ["accent", "unknown"]
+
+
+class TestStylesheetCache:
+    """컴파일 캐시 테스트"""
+
+    def test_memory_and_disk_cache(self, styles_dir, tmp_path):
+        """같은 (테마, 색상)은 다시 컴파일하지 않고, 새 인스턴스는 디스크에서 읽음"""
+        cache_dir = tmp_path / "cache"
+        cache = StylesheetCache(styles_dir, cache_dir)
+        first = cache.get("light_theme.qss", Colors())
+        assert cache.get("light_theme.qss", Colors()) is first
+        assert cache.compile_count == 1
+        assert "@" not in first
+
+        restarted = StylesheetCache(styles_dir, cache_dir)
+        assert restarted.get("light_theme.qss", Colors()) == first
+        assert restarted.compile_count == 0
+
+    def test_accent_change_recompiles(self, styles_dir, tmp_path):
+        """색상이 바뀌면 다시 컴파일하고 이전 디스크 캐시는 교체"""
+        cache_dir = tmp_path / "cache"
+        cache = StylesheetCache(styles_dir, cache_dir)
+        cache.get("light_theme.qss", Colors())
+        result = cache.get("light_theme.qss", Colors(accent="#FF0000"))
+
+        assert "border-color: #FF0000" in result
+        assert cache.compile_count == 2
+        assert len(list(cache_dir.glob("light_theme-*.qss"))) == 1
+
+    def test_source_change_invalidates(self, styles_dir, tmp_path):
+        """원본 QSS가 바뀌면 다시 컴파일"""
+        cache = StylesheetCache(styles_dir, tmp_path / "cache")
+        cache.get("light_theme.qss", Colors())
+
+        source = styles_dir / "light_theme.qss"
+        source.write_text("QWidget { background: @primary; }", encoding='utf-8')
+        stat = source.stat()
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert StylesheetCache(styles_dir, tmp_path / "cache").get(
+            "light_theme.qss", Colors()) == "QWidget { background: #111111; }"
+
+    def test_missing_stylesheet(self, styles_dir):
+        """원본이 없으면 None"""
+        assert StylesheetCache(styles_dir).get("missing.qss", Colors()) is None
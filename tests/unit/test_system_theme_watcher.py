@@ -0,0 +1,83 @@
+"""
+시스템 테마 감시기 테스트
+"""
+
+import threading
+
+import pytest
+
+from markitdown_gui.core.system_theme_watcher import SystemThemeWatcher
+
+
+class FakeDetector:
+    """호출 횟수를 세는 감지기"""
+
+    system = "test"
+
+    def __init__(self, theme="light"):
+        self.theme = theme
+        self.calls = 0
+        self.threads = set()
+
+    def get_system_theme(self):
+        self.calls += 1
+        self.threads.add(threading.current_thread().name)
+        return self.theme
+
+
+@pytest.fixture
+def watcher(qapp):
+    watcher = SystemThemeWatcher(FakeDetector(), poll_interval=0.02)
+    yield watcher
+    watcher.stop()
+
+
+class TestSystemThemeWatcher:
+    """테마 변경 알림 테스트"""
+
+    def test_start_detects_once(self, watcher):
+        """시작할 때 한 번만 감지하고 이후에는 캐시된 값 사용"""
+        if watcher._style_hints_theme() is not None:
+            pytest.skip("플랫폼이 색 구성을 직접 알려줌")
+        assert watcher.start() == "light"
+        assert watcher.source == "polling"
+        assert watcher.current_theme == "light"
+        assert watcher.detector.calls == 1
+        assert watcher.start() == "light"
+
+    def test_polling_runs_off_ui_thread(self, qtbot, watcher):
+        """폴링 감지는 작업 스레드에서 실행되고 바뀐 경우에만 알림"""
+        if watcher._style_hints_theme() is not None:
+            pytest.skip("플랫폼이 색 구성을 직접 알려줌")
+        received = []
+        watcher.theme_changed.connect(received.append)
+        watcher.start()
+
+        watcher.detector.theme = "dark"
+        with qtbot.waitSignal(watcher.theme_changed, timeout=2000):
+            pass
+        qtbot.wait(100)
+
+        assert received == ["dark"]
+        assert watcher.current_theme == "dark"
+        assert "SystemThemePoll" in watcher.detector.threads
+
+    def test_stop_halts_notifications(self, qtbot, watcher):
+        """중지 후에는 알림 없음"""
+        received = []
+        watcher.theme_changed.connect(received.append)
+        watcher.start()
+        watcher.stop()
+        assert watcher.source is None
+
+        watcher.detector.theme = "dark"
+        qtbot.wait(100)
+        assert received == []
+
+    def test_duplicate_detection_ignored(self, watcher):
+        """같은 테마가 다시 감지되면 알리지 않음"""
+        received = []
+        watcher.theme_changed.connect(received.append)
+        watcher.start()
+        watcher._on_detected(watcher.current_theme)
+        assert received == []
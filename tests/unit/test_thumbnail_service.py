@@ -0,0 +1,129 @@
+"""
+썸네일 서비스 테스트
+"""
+
+import os
+import sys
+import shutil
+import subprocess
+import pytest
+from pathlib import Path
+
+PIL = pytest.importorskip("PIL")
+from PIL import Image
+
+from markitdown_gui.core.thumbnail_service import ThumbnailService, file_digest, render_thumbnail
+
+
+def _make_image(path: Path, size=(640, 480), mode='RGB', color=(200, 30, 30)):
+    Image.new(mode, size, color).save(path)
+    return path
+
+
+@pytest.fixture
+def service(tmp_path):
+    service = ThumbnailService(cache_dir=tmp_path / "cache", max_workers=2)
+    yield service
+    service.shutdown(wait=True)
+
+
+class TestRenderThumbnail:
+    """썸네일 생성 테스트"""
+
+    def test_keeps_aspect_ratio(self, tmp_path):
+        """비율을 유지하며 축소"""
+        source = _make_image(tmp_path / "photo.jpg", size=(1600, 800))
+        target = render_thumbnail(source, tmp_path / "out" / "thumb.jpg", (200, 200))
+        with Image.open(target) as image:
+            assert image.size == (200, 100)
+            assert image.format == 'JPEG'
+
+    def test_import_does_not_load_pillow(self):
+        """모듈 import만으로는 Pillow를 로드하지 않음 (GUI 시작 경로)"""
+        code = ("import sys, markitdown_gui.core.thumbnail_service as t; "
+                "assert t.PILLOW_AVAILABLE; assert 'PIL' not in sys.modules")
+        root = Path(__file__).resolve().parents[2]
+        subprocess.run([sys.executable, "-c", code], cwd=root, check=True)
+
+    def test_flattens_alpha(self, tmp_path):
+        """투명 영역은 흰 배경으로 합성"""
+        source = _make_image(tmp_path / "clear.png", mode='RGBA', color=(0, 0, 0, 0))
+        target = render_thumbnail(source, tmp_path / "thumb.jpg", (64, 64))
+        with Image.open(target) as image:
+            assert image.mode == 'RGB'
+            assert all(channel > 240 for channel in image.getpixel((10, 10)))
+
+
+class TestThumbnailService:
+    """디스크 캐시 테스트"""
+
+    def test_cache_hit_does_not_regenerate(self, service, tmp_path):
+        """두 번째 요청은 캐시에서 반환"""
+        source = _make_image(tmp_path / "photo.jpg")
+        first = service.get_thumbnail(source, (64, 64))
+        second = service.get_thumbnail(source, (64, 64))
+        assert first == second
+        assert service.generated == 1
+        assert service.cached_thumbnail(source, (64, 64)) == first
+
+    def test_content_key_survives_copy(self, service, tmp_path):
+        """내용 해시로 식별하므로 복사/이동한 파일도 캐시 적중"""
+        source = _make_image(tmp_path / "photo.jpg")
+        service.get_thumbnail(source, (64, 64))
+        copy = tmp_path / "renamed.jpg"
+        shutil.copyfile(source, copy)
+
+        path = service.get_thumbnail(copy, (64, 64))
+        assert service.generated == 1
+        assert path.name.startswith(file_digest(source))
+
+    def test_sizes_are_cached_separately(self, service, tmp_path):
+        """크기마다 별도 썸네일"""
+        source = _make_image(tmp_path / "photo.jpg")
+        small = service.get_thumbnail(source, (32, 32))
+        large = service.get_thumbnail(source, (320, 240))
+        assert small != large
+        assert service.generated == 2
+
+    def test_cached_thumbnail_unknown_source(self, service, tmp_path):
+        """해시를 모르는 원본은 읽지 않고 None"""
+        source = _make_image(tmp_path / "photo.jpg")
+        assert service.cached_thumbnail(source, (64, 64)) is None
+        assert service.cached_thumbnail(tmp_path / "missing.jpg", (64, 64)) is None
+
+    def test_request_runs_in_background(self, service, tmp_path):
+        """백그라운드 요청 결과는 캐시 경로"""
+        source = _make_image(tmp_path / "photo.png")
+        path = service.request(source, (48, 48)).result(timeout=10)
+        assert path.exists()
+        assert path.parent.parent == service.cache_dir
+
+    def test_cache_hit_refreshes_last_use(self, service, tmp_path):
+        """캐시 적중은 정리 순서를 위해 썸네일의 수정 시각을 갱신"""
+        source = _make_image(tmp_path / "photo.png")
+        path = service.get_thumbnail(source, (64, 64))
+        os.utime(path, (1000, 1000))
+
+        assert service.get_thumbnail(source, (64, 64)) == path
+        assert path.stat().st_mtime > 1000
+
+        os.utime(path, (1000, 1000))
+        assert service.cached_thumbnail(source, (64, 64)) == path
+        assert path.stat().st_mtime > 1000
+
+    def test_prune_removes_oldest(self, tmp_path):
+        """예산을 넘으면 오래된 썸네일부터 삭제"""
+        service = ThumbnailService(cache_dir=tmp_path / "cache", max_workers=1, max_cache_mb=1)
+        try:
+            paths = []
+            for i in range(4):
+                path = service.cache_path(f"{i:02d}" * 20, (8, 8))
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(b"x" * 300 * 1024)
+                os.utime(path, (1000 + i, 1000 + i))
+                paths.append(path)
+            service.prune()
+            assert [path.exists() for path in paths] == [False, False, True, True]
+            assert sum(path.stat().st_size for path in paths if path.exists()) <= 0.8 * 1024 * 1024
+        finally:
+            service.shutdown(wait=True)
@@ -0,0 +1,140 @@
+"""
+Pipeline Tracing Unit Tests
+Tests for per-stage spans and Chrome trace export
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from markitdown_gui.core.conversion_engine import ConversionEngine
+from markitdown_gui.core.tracing import (
+    Tracer, NULL_SPAN, activate_tracer, current_tracer, trace_span
+)
+from markitdown_gui.core.utils import create_file_info
+
+
+def span_names(tracer):
+    return [event["name"] for event in tracer.events if event["ph"] == "X"]
+
+
+class TestTracer:
+    """Tracer 테스트"""
+
+    def test_trace_span_is_noop_without_tracer(self):
+        """활성 Tracer가 없으면 공유 no-op 구간"""
+        assert current_tracer() is None
+        assert trace_span("stage") is NULL_SPAN
+
+    def test_spans_record_duration_and_args(self):
+        """구간은 완료 이벤트로 기록되고 인자/예외 이름 포함"""
+        tracer = Tracer()
+        with activate_tracer(tracer):
+            with trace_span("outer", size=3) as span:
+                span.set(hit=True)
+                with pytest.raises(ValueError):
+                    with trace_span("inner"):
+                        raise ValueError("boom")
+
+        outer, = [e for e in tracer.events if e["name"] == "outer"]
+        inner, = [e for e in tracer.events if e["name"] == "inner"]
+        assert outer["args"] == {"size": 3, "hit": True}
+        assert inner["args"]["error"] == "ValueError"
+        assert outer["ts"] <= inner["ts"] and outer["dur"] >= inner["dur"]
+        assert current_tracer() is None
+
+    def test_tracer_propagates_into_asyncio_run(self):
+        """asyncio.run 안의 코루틴(OCR 서비스)도 같은 Tracer에 기록"""
+        async def ocr_stage():
+            with trace_span("ocr.llm_api"):
+                await asyncio.sleep(0)
+
+        tracer = Tracer()
+        with activate_tracer(tracer):
+            asyncio.run(ocr_stage())
+
+        assert span_names(tracer) == ["ocr.llm_api"]
+
+    def test_chrome_trace_export(self, tmp_path):
+        """Chrome trace JSON에 스레드 이름 메타데이터와 단계 요약 포함"""
+        tracer = Tracer("test")
+        with tracer.span("write"):
+            pass
+
+        data = json.loads(tracer.export(tmp_path / "trace.json").read_text(encoding="utf-8"))
+
+        phases = {event["ph"] for event in data["traceEvents"]}
+        assert phases == {"M", "X"}
+        assert data["otherData"]["stage_summary"]["write"]["count"] == 1
+
+    def test_event_limit(self):
+        """최대 이벤트 수를 넘으면 버리고 개수만 기록"""
+        tracer = Tracer(max_events=2)
+        for _ in range(5):
+            tracer.instant("tick")
+
+        assert len(tracer.events) == 2
+        assert tracer.dropped_events == 3
+
+
+class TestEngineTracing:
+    """ConversionEngine 단계 추적 테스트"""
+
+    def test_conversion_stages_are_traced(self, tmp_path, fake_markitdown):
+        """검증, 충돌, 캐시, 변환, 메타데이터, 저장 단계 기록"""
+        source = tmp_path / "doc.txt"
+        source.write_text("traced\n")
+        tracer = Tracer()
+        engine = ConversionEngine(tmp_path / "out", save_to_original_dir=False, tracer=tracer)
+
+        engine.convert_file(create_file_info(source))
+        engine.convert_file(create_file_info(source))
+
+        names = span_names(tracer)
+        for stage in ("markitdown_init", "validation", "conflicts", "cache_lookup",
+                      "markitdown", "metadata", "write", "convert_file"):
+            assert stage in names
+        lookups = [e["args"]["hit"] for e in tracer.events if e["name"] == "cache_lookup"]
+        assert lookups == [False, True]
+        files = [e for e in tracer.events if e["name"] == "convert_file"]
+        assert [f["args"]["status"] for f in files] == ["success", "success"]
+
+    def test_engine_without_tracer_records_nothing(self, tmp_path, fake_markitdown):
+        """tracer가 없으면 추적하지 않음"""
+        source = tmp_path / "doc.txt"
+        source.write_text("untraced\n")
+        engine = ConversionEngine(tmp_path / "out", save_to_original_dir=False)
+
+        result = engine.convert_file(create_file_info(source))
+
+        assert result.is_success
+        assert current_tracer() is None
+
+
+class TestManagerTracing:
+    """ConversionManager 배치 추적 테스트"""
+
+    def test_trace_path_is_fixed_at_batch_start(self, qapp, tmp_path, fake_markitdown):
+        """배치 중에 추적을 꺼도 시작 시 경로로 저장하고 워커를 정리"""
+        import time
+        from markitdown_gui.core.conversion_manager import ConversionManager
+
+        source = tmp_path / "doc.txt"
+        source.write_text("traced batch\n")
+        trace_path = tmp_path / "batch_trace.json"
+        manager = ConversionManager(tmp_path / "out", save_to_original_dir=False,
+                                    enable_monitoring=False)
+        manager.set_batch_tracing(trace_path)
+
+        assert manager.convert_files_async([create_file_info(source)])
+        manager.set_batch_tracing(None)
+
+        deadline = time.monotonic() + 10
+        while manager._conversion_worker is not None and time.monotonic() < deadline:
+            qapp.processEvents()
+            time.sleep(0.01)
+
+        assert manager._conversion_worker is None
+        assert manager.last_tracer is not None
+        assert json.loads(trace_path.read_text(encoding="utf-8"))["traceEvents"]
@@ -0,0 +1,72 @@
+"""
+번역 카탈로그 테스트
+"""
+
+from markitdown_gui.core.translation_catalog import TranslationCatalog, flatten_translations
+
+
+EN = {
+    "title": "MarkItDown",
+    "settings": {
+        "general": {"language_label": "Language:", "theme_label": "Theme:"},
+        "empty": None,
+    },
+}
+KO = {
+    "title": "마크잇다운",
+    "settings": {"general": {"language_label": "언어:"}},
+}
+
+
+class TestFlattenTranslations:
+    """평탄화 테스트"""
+
+    def test_context_is_dotted_path(self):
+        """컨텍스트는 키까지의 경로, None 값은 제외"""
+        flat = flatten_translations(EN)
+        assert flat[("", "title")] == "MarkItDown"
+        assert flat[("settings.general", "language_label")] == "Language:"
+        assert ("settings", "empty") not in flat
+        assert len(flat) == 3
+
+
+class TestTranslationCatalog:
+    """카탈로그 컴파일 테스트"""
+
+    def test_fallback_precomputed(self):
+        """현재 언어에 없는 항목은 영어로 미리 채워짐"""
+        catalog = TranslationCatalog()
+        catalog.add_language("en_US", EN)
+        catalog.add_language("ko_KR", KO)
+
+        table = catalog.compiled("ko_KR")
+        assert table[("", "title")] == "마크잇다운"
+        assert table[("settings.general", "language_label")] == "언어:"
+        assert table[("settings.general", "theme_label")] == "Theme:"
+        assert catalog.compiled("ko_KR") is table
+
+    def test_fallback_reload_recompiles(self):
+        """대체 언어가 바뀌면 다른 언어의 컴파일 결과도 갱신"""
+        catalog = TranslationCatalog()
+        catalog.add_language("ko_KR", KO)
+        assert ("settings.general", "theme_label") not in catalog.compiled("ko_KR")
+
+        catalog.add_language("en_US", EN)
+        assert catalog.compiled("ko_KR")[("settings.general", "theme_label")] == "Theme:"
+
+
+class TestI18nManagerLookup:
+    """I18nManager 조회 테스트"""
+
+    def test_tr_uses_compiled_catalog(self, qapp):
+        """언어 전환 후에도 대체 항목과 포매팅이 동작"""
+        from markitdown_gui.core.i18n_manager import I18nManager
+
+        manager = I18nManager(qapp)
+        assert manager.set_language("ko_KR")
+        assert manager.tr("language_label", "settings.general") != "language_label"
+
+        assert manager.set_language("en_US")
+        assert manager.tr("title", "window") == manager.loaded_translations["en_US"]["window"]["title"]
+        assert manager.tr("no_such_key", "window") == "no_such_key"
+        assert "window.no_such_key" in manager.get_missing_keys()
@@ -0,0 +1,67 @@
+"""
+Startup Warm-up Unit Tests
+Tests for deferred heavy imports and the background warm-up thread
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+from markitdown_gui.core.warmup import BackgroundWarmup
+
+
+def imported_modules(statement):
+    """새 인터프리터에서 statement 실행 후 로드된 모듈 목록"""
+    code = f"{statement}\nimport sys\nprint('\\n'.join(sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                            check=True, env={"QT_QPA_PLATFORM": "offscreen", "PATH": ""})
+    return set(result.stdout.split())
+
+
+class TestDeferredImports:
+    """시작 경로에서 무거운 모듈을 로드하지 않는지 확인"""
+
+    def test_conversion_engine_does_not_import_markitdown(self):
+        """conversion_engine import만으로 markitdown/aiohttp를 로드하지 않음"""
+        modules = imported_modules("import markitdown_gui.core.conversion_engine")
+
+        assert "markitdown" not in modules
+        assert "aiohttp" not in modules
+        assert "markitdown_gui.core.llm_manager" not in modules
+
+    def test_main_window_does_not_import_dialogs(self):
+        """메인 윈도우 import만으로 설정/미리보기 다이얼로그와 검색 색인을 로드하지 않음"""
+        pytest.importorskip("PyQt6.QtWidgets")
+        modules = imported_modules("import markitdown_gui.ui.main_window")
+
+        assert "markitdown_gui.ui.settings_dialog" not in modules
+        assert "markitdown_gui.ui.preview_dialog" not in modules
+        assert "markitdown" not in modules
+        # 검색 색인은 FTS5 확인으로 sqlite 연결을 열므로 창 생성 시 로드
+        assert "markitdown_gui.core.search_index" not in modules
+
+
+class TestBackgroundWarmup:
+    """BackgroundWarmup 테스트"""
+
+    def test_runs_targets_and_records_timings(self):
+        """대상을 순서대로 실행하고 소요 시간 기록"""
+        calls = []
+        warmup = BackgroundWarmup([lambda: calls.append(1), "json", "json:dumps"])
+
+        # "json:dumps" 는 인자 없이 호출되어 실패하지만 나머지는 계속 진행
+        assert warmup.start().wait(timeout=10)
+        assert calls == [1]
+        assert "json" in warmup.timings
+        assert "json:dumps" in warmup.errors
+
+    def test_start_is_idempotent(self):
+        """start를 여러 번 호출해도 한 번만 실행"""
+        calls = []
+        warmup = BackgroundWarmup([lambda: calls.append(1)])
+        warmup.start()
+        warmup.start()
+
+        assert warmup.wait(timeout=10)
+        assert calls == [1]